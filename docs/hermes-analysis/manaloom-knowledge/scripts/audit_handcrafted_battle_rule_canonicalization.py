@@ -263,7 +263,7 @@ def build_entries(sqlite_db: str | Path) -> dict[str, Any]:
 
     entries: list[dict[str, Any]] = []
     for card_name in card_names:
-        manual_effect = dict(battle.KNOWN_CARDS[card_name])
+        manual_effect = dict(battle.known_card_entry(card_name))
         normalized_name = normalize_card_name(card_name)
         pg_row = pg_rows.get(normalized_name)
         sqlite_row = sqlite_rules.get(normalized_name)
@@ -106,6 +106,11 @@ def main() -> int:
     args = parse_args()
     battle = load_module(BATTLE_PATH, "battle_runtime_environment_audit")
     repo_root = SCRIPT_DIR.parents[3]
+    # The runtime decodes snapshot cards lazily; count the whole snapshot.
+    if hasattr(battle, "canonical_fallback_known_card_names"):
+        canonical_names = battle.canonical_fallback_known_card_names()
+    else:
+        canonical_names = set(getattr(battle, "CANONICAL_FALLBACK_KNOWN_CARDS", []))
 
     summary = build_summary(
         git_branch=git_value(["rev-parse", "--abbrev-ref", "HEAD"], repo_root),
@@ -115,10 +120,8 @@ def main() -> int:
         manual_waiver_names=sorted(
             getattr(battle, "MANUAL_RULE_RUNTIME_WAIVERS", [])
         ),
-        canonical_fallback_count=len(
-            getattr(battle, "CANONICAL_FALLBACK_KNOWN_CARDS", [])
-        ),
-        known_cards_count=len(getattr(battle, "KNOWN_CARDS", {})),
+        canonical_fallback_count=len(canonical_names),
+        known_cards_count=len(set(getattr(battle, "KNOWN_CARDS", {})) | canonical_names),
         canonical_snapshot_exists=CANONICAL_PATH.exists(),
         generated_exists=GENERATED_PATH.exists(),
     )
@@ -11,7 +11,6 @@ from __future__ import annotations
 import argparse
 import json
 import re
-import sqlite3
 import unicodedata
 from collections import Counter
 from pathlib import Path
@@ -19,6 +18,7 @@ from typing import Any
 
 from battle_rule_registry import DEFAULT_DB, normalize_card_name
 from db_helper import connect, sanitized_database_target
+from knowledge_db_access import LEARNED_OPPONENT_SELECTION_SQL, connect_knowledge_db
 
 
 def parse_args() -> argparse.Namespace:
@@ -248,24 +248,10 @@ def load_learned_rows(
     deck_limit: int,
     min_cards: int,
 ) -> list[dict[str, Any]]:
-    conn = sqlite3.connect(sqlite_db)
-    conn.row_factory = sqlite3.Row
+    conn = connect_knowledge_db(sqlite_db, profile="runtime")
     try:
         rows = conn.execute(
-            """
-            SELECT id, commander, source, archetype, card_count, card_list
-            FROM learned_decks
-            WHERE COALESCE(commander, '') != ''
-              AND commander NOT LIKE '%Lorehold%'
-              AND COALESCE(card_list, '') != ''
-              AND length(card_list) >= 500
-              AND COALESCE(card_count, 0) >= ?
-            ORDER BY
-              CASE WHEN source = 'pg_meta_decks' THEN 0 ELSE 1 END,
-              COALESCE(card_count, 0) DESC,
-              id DESC
-            LIMIT ?
-            """,
+            LEARNED_OPPONENT_SELECTION_SQL,
             (min_cards, candidate_limit),
         ).fetchall()
     finally:
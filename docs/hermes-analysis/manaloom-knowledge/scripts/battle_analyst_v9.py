@@ -19,7 +19,7 @@ Regras implementadas agora:
 - Haste: Lorehold nao tem summoning sickness
 """
 import argparse
-import sqlite3, random, json, os, re, copy, sys
+import random, json, os, re, copy, sys
 import tempfile
 from datetime import datetime, timezone
 from collections import defaultdict
@@ -106,9 +106,10 @@ try:
 except Exception:
     battle_rule_registry = None
 
+from knowledge_db_access import LEARNED_OPPONENT_SELECTION_SQL, connect_knowledge_db
 from known_cards_fallback_snapshot import (
     extract_snapshot_effect_and_metadata,
-    load_snapshot_file,
+    open_snapshot_file,
     resolve_canonical_snapshot_path,
 )
 
@@ -11957,8 +11958,7 @@ def build_deck_construction_report(commanders, deck, expected_format="commander"
 
 
 def load_deck_cards(deck_id=6):
-    conn = sqlite3.connect(DB)
-    conn.row_factory = sqlite3.Row
+    conn = connect_knowledge_db(DB, profile="runtime")
     columns = {row[1] for row in conn.execute("PRAGMA table_info(deck_cards)")}
     functional_tags_expr = (
         "functional_tags_json"
@@ -14291,6 +14291,11 @@ def replay_rule_fields(effect_data):
 
 
 CANONICAL_FALLBACK_KNOWN_CARDS = set()
+# Snapshots behind KNOWN_CARDS, in load order, paired with the bucket that
+# records which of their cards have been materialized. Cards are decoded on
+# first lookup (see _materialize_known_card), not at import.
+_KNOWN_CARD_SNAPSHOTS = []
+_KNOWN_CARD_MISSES = set()
 
 
 CANONICAL_RUNTIME_ENRICHMENT_KEYS = {
@@ -14566,6 +14571,7 @@ def _annotated_battle_rule_effect(rule):
 
 def _canonical_runtime_annotations_for_lookup(lookup_name, effect):
     """Fill missing runtime annotations from the canonical snapshot only."""
+    _materialize_known_card(lookup_name)
     if lookup_name not in CANONICAL_FALLBACK_KNOWN_CARDS:
         return {}
     try:
@@ -14818,15 +14824,45 @@ def _build_primary_effect_with_executable_activated_abilities(card, rules):
 
 def _load_known_cards_into_runtime(path: str | os.PathLike[str], *, bucket: set[str] | None = None) -> None:
     try:
-        decoded = load_snapshot_file(path)
+        snapshot = open_snapshot_file(path)
     except Exception:
         return
-    for card_name, entry in decoded.items():
-        if card_name in KNOWN_CARDS:
+    if snapshot:
+        _KNOWN_CARD_SNAPSHOTS.append((snapshot, bucket))
+        _KNOWN_CARD_MISSES.clear()
+
+
+def _materialize_known_card(card_name):
+    """Copy a snapshot card into KNOWN_CARDS (and its bucket) on first lookup."""
+    if card_name in KNOWN_CARDS or card_name in _KNOWN_CARD_MISSES:
+        return
+    for snapshot, bucket in _KNOWN_CARD_SNAPSHOTS:
+        if card_name not in snapshot:
+            continue
+        try:
+            entry = snapshot[card_name]
+        except Exception:
             continue
         KNOWN_CARDS[card_name] = entry
         if bucket is not None:
             bucket.add(card_name)
+        return
+    _KNOWN_CARD_MISSES.add(card_name)
+
+
+def known_card_entry(card_name):
+    """KNOWN_CARDS[card_name], decoding it from the snapshot if needed."""
+    _materialize_known_card(card_name)
+    return KNOWN_CARDS[card_name]
+
+
+def canonical_fallback_known_card_names():
+    """All canonical snapshot card names, materialized or not."""
+    names = set(CANONICAL_FALLBACK_KNOWN_CARDS)
+    for snapshot, bucket in _KNOWN_CARD_SNAPSHOTS:
+        if bucket is CANONICAL_FALLBACK_KNOWN_CARDS:
+            names.update(snapshot)
+    return names
 
 
 def _resolve_battle_card_rule_effect(card, lookup_names, *, source_allowlist=None):
@@ -15041,6 +15077,7 @@ def get_card_effect(card):
                 ),
             )
     for lookup_name in lookup_names:
+        _materialize_known_card(lookup_name)
         if lookup_name in CANONICAL_FALLBACK_KNOWN_CARDS:
             effect_json, metadata = extract_snapshot_effect_and_metadata(KNOWN_CARDS[lookup_name])
             if not (
@@ -15196,6 +15233,7 @@ def is_instant(card):
         return False
     if get_card_effect(card).get("instant"):
         return True
+    _materialize_known_card(name)
     if name in KNOWN_CARDS and KNOWN_CARDS[name].get("instant"):
         return True
     return False
@@ -34791,8 +34829,7 @@ def conjure_random_named_pool_card_to_exile(player, source_card, effect_data, tu
             **replay_rule_fields(effect_data),
         )
         return None
-    conn = sqlite3.connect(DB)
-    conn.row_factory = sqlite3.Row
+    conn = connect_knowledge_db(DB, profile="runtime")
     try:
         oracle_cache = load_card_oracle_cache(conn, pool_names)
     finally:
@@ -88946,26 +88983,12 @@ def simulate_game_v8(my_commander, my_deck, opp_profile, rng, game_id=0):
 def load_learned_opponents():
     """Load real opponent decklists from learned_decks table."""
     try:
-        conn = sqlite3.connect(DB)
-        conn.row_factory = sqlite3.Row
+        conn = connect_knowledge_db(DB, profile="runtime")
         candidate_limit = int(os.environ.get("MANALOOM_BATTLE_REAL_OPPONENT_CANDIDATES", "96"))
         opponent_limit = int(os.environ.get("MANALOOM_BATTLE_REAL_OPPONENT_LIMIT", "12"))
         min_cards = int(os.environ.get("MANALOOM_BATTLE_REAL_OPPONENT_MIN_CARDS", "80"))
         rows = conn.execute(
-            """
-            SELECT *
-            FROM learned_decks
-            WHERE COALESCE(commander, '') != ''
-              AND commander NOT LIKE '%Lorehold%'
-              AND COALESCE(card_list, '') != ''
-              AND length(card_list) >= 500
-              AND COALESCE(card_count, 0) >= ?
-            ORDER BY
-              CASE WHEN source = 'pg_meta_decks' THEN 0 ELSE 1 END,
-              COALESCE(card_count, 0) DESC,
-              id DESC
-            LIMIT ?
-            """,
+            LEARNED_OPPONENT_SELECTION_SQL,
             (min_cards, candidate_limit),
         ).fetchall()
         decoded_rows = []
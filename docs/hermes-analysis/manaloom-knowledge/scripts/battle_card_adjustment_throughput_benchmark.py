@@ -34,6 +34,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parents[3]
 REPORT_DIR = REPO_ROOT / "docs/hermes-analysis/master_optimizer_reports"
 PLANNER_PATH = REPO_ROOT / "server/bin/plan_oracle_text_backfill.py"
+BULK_CACHE_PATH = REPO_ROOT / "server/bin/scryfall_bulk_cache.py"
 ACCELERATION_AUDIT_PATH = SCRIPT_DIR / "battle_card_acceleration_source_audit.py"
 SCRYFALL_COLLECTION_URL = "https://api.scryfall.com/cards/collection"
 SCRYFALL_BULK_ORACLE_URL = "https://api.scryfall.com/bulk-data/oracle-cards"
@@ -115,6 +116,10 @@ def load_planner():
     return load_module(PLANNER_PATH, "plan_oracle_text_backfill_for_throughput")
 
 
+def load_bulk_cache():
+    return load_module(BULK_CACHE_PATH, "scryfall_bulk_cache")
+
+
 def load_acceleration_audit():
     return load_module(ACCELERATION_AUDIT_PATH, "battle_card_acceleration_source_audit_for_throughput")
 
@@ -273,6 +278,9 @@ def refresh_bulk_oracle_cache(cache_path: Path, timeout_seconds: int) -> dict[st
             "error": result.stderr.strip() or f"curl returned {result.returncode}",
         }
     os.replace(temp_path, cache_path)
+    bulk_metadata_path(cache_path).write_text(
+        json.dumps(metadata, sort_keys=True) + "\n", encoding="utf-8"
+    )
     return {
         "ok": True,
         "metadata": metadata,
@@ -281,6 +289,18 @@ def refresh_bulk_oracle_cache(cache_path: Path, timeout_seconds: int) -> dict[st
     }
 
 
+def bulk_metadata_path(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".metadata.json")
+
+
+def read_bulk_metadata(cache_path: Path) -> dict[str, Any]:
+    try:
+        decoded = json.loads(bulk_metadata_path(cache_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return decoded if isinstance(decoded, dict) else {}
+
+
 def load_bulk_cards(cache_path: Path) -> list[dict[str, Any]]:
     with cache_path.open("rb") as raw:
         prefix = raw.read(2)
@@ -459,34 +479,38 @@ def benchmark_bulk_cache_lookup(
                 details=refresh_details,
             )
 
+    bulk_cache = load_bulk_cache()
     load_start = time.perf_counter()
-    cards = load_bulk_cards(cache_path)
-    index = index_bulk_cards(cards)
+    store = bulk_cache.open_bulk_store(
+        cache_path,
+        updated_at=read_bulk_metadata(cache_path).get("updated_at"),
+    )
     load_elapsed = time.perf_counter() - load_start
 
     lookup_start = time.perf_counter()
     resolved: list[dict[str, Any]] = []
     missing: list[str] = []
-    for name in names:
-        match = None
-        for attempt in planner.scryfall_lookup_attempts(name):
-            if attempt["mode"] != "exact":
-                continue
-            match = index.get(normalize_scryfall_name(attempt["query"]))
+    with store:
+        for name in names:
+            match = None
+            for attempt in planner.scryfall_lookup_attempts(name):
+                if attempt["mode"] != "exact":
+                    continue
+                match = store.by_name(attempt["query"])
+                if match:
+                    break
             if match:
-                break
-        if match:
-            resolved.append(
-                {
-                    "input_name": name,
-                    "resolved_name": match.get("name"),
-                    "oracle_id": match.get("oracle_id"),
-                    "layout": match.get("layout"),
-                    "card_faces_present": isinstance(match.get("card_faces"), list),
-                }
-            )
-        else:
-            missing.append(name)
+                resolved.append(
+                    {
+                        "input_name": name,
+                        "resolved_name": match.get("name"),
+                        "oracle_id": match.get("oracle_id"),
+                        "layout": match.get("layout"),
+                        "card_faces_present": isinstance(match.get("card_faces"), list),
+                    }
+                )
+            else:
+                missing.append(name)
     lookup_elapsed = time.perf_counter() - lookup_start
 
     return TimedResult(
@@ -496,15 +520,15 @@ def benchmark_bulk_cache_lookup(
         elapsed_seconds=lookup_elapsed,
         success_count=len(resolved),
         failure_count=len(missing),
-        notes="Local Scryfall Oracle Cards cache lookup after one-time cache load/index.",
+        notes="Indexed Scryfall Oracle Cards store lookup; the store converts only when the bulk file changes.",
         details={
             "cache_path": str(cache_path),
             "cache_exists": cache_path.exists(),
             "cache_size_bytes": cache_path.stat().st_size if cache_path.exists() else 0,
             "download_elapsed_seconds": round(download_elapsed, 6),
             "load_and_index_elapsed_seconds": round(load_elapsed, 6),
-            "bulk_card_count": len(cards),
-            "index_size": len(index),
+            "bulk_card_count": len(store),
+            "bulk_store": store.summary(),
             "refreshed": bool(refresh_details),
             "bulk_updated_at": (refresh_details or {}).get("metadata", {}).get("updated_at"),
             "bulk_source_size_bytes": (refresh_details or {}).get("metadata", {}).get("size"),
@@ -2,17 +2,22 @@
 """Read-only MTG Arena Player.log parser for battle telemetry.
 
 The parser extracts aggregate GRE/GameStateMessage signals from local logs
-without persisting raw log lines or personal account identifiers.
+without persisting raw log lines or personal account identifiers. Arena logs
+only grow, so an optional cursor state file records per-file byte offsets and
+running aggregates; later runs (or ``--follow``) parse only appended lines.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import time
 from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 
 GRE_KEYWORDS = (
@@ -22,6 +27,20 @@ GRE_KEYWORDS = (
     "GameStateMessage",
     "ClientToGREMessage",
 )
+# Substrings classify_payload needs to return anything but json_other; lines
+# without one of them skip the classification walk.
+GRE_PAYLOAD_MARKERS = (
+    "GameStateMessage",
+    "gameStateMessage",
+    "turnInfo",
+    "ClientToGREMessage",
+    "clientToGreMessage",
+    "GreToClientEvent",
+    "greToClientEvent",
+)
+CURSOR_SCHEMA_VERSION = "manaloom_mtga_player_log_cursor_v1"
+READ_CHUNK_BYTES = 1 << 20
+FOLLOW_POLL_SECONDS = 1.0
 SENSITIVE_KEYS = {
     "authToken",
     "clientId",
@@ -168,54 +187,229 @@ def game_state_sample(value: Any, *, source_path: Path, line_number: int) -> dic
     }
 
 
-def parse_log_file(path: Path, *, max_state_samples: int = 25) -> dict[str, Any]:
-    message_counts: Counter[str] = Counter()
-    turn_counts: Counter[str] = Counter()
-    phase_counts: Counter[str] = Counter()
-    samples: list[dict[str, Any]] = []
-    json_objects_seen = 0
-    gre_hint_lines = 0
+@dataclass
+class LogCursor:
+    """Resume point and running aggregates for one Player.log.
+
+    ``offset`` always sits just after the last complete line, so only counts
+    and sanitized samples are persisted; an unterminated tail stays in memory
+    as ``partial`` and is re-read by the next run.
+    """
+
+    device: int = 0
+    inode: int = 0
+    offset: int = 0
+    line_number: int = 0
+    json_objects_seen: int = 0
+    gre_hint_lines: int = 0
+    message_counts: Counter[str] = field(default_factory=Counter)
+    turn_counts: Counter[str] = field(default_factory=Counter)
+    phase_counts: Counter[str] = field(default_factory=Counter)
+    samples: list[dict[str, Any]] = field(default_factory=list)
+    partial: bytes = b""
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "LogCursor":
+        return cls(
+            device=int(state["device"]),
+            inode=int(state["inode"]),
+            offset=int(state["offset"]),
+            line_number=int(state["line_number"]),
+            json_objects_seen=int(state["json_objects_seen"]),
+            gre_hint_lines=int(state["gre_hint_lines"]),
+            message_counts=Counter(state["message_counts"]),
+            turn_counts=Counter(state["turn_counts"]),
+            phase_counts=Counter(state["phase_counts"]),
+            samples=list(state["samples"]),
+        )
 
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            if any(keyword in line for keyword in GRE_KEYWORDS):
-                gre_hint_lines += 1
-            for value in iter_json_values(line):
-                json_objects_seen += 1
-                classification = classify_payload(value, line)
-                message_counts[classification] += 1
-                if classification == "game_state_message":
-                    sample = game_state_sample(
-                        value,
-                        source_path=path,
-                        line_number=line_number,
-                    )
-                    turn = sample.get("turn_number")
-                    phase = sample.get("phase")
-                    if turn:
-                        turn_counts[str(turn)] += 1
-                    if phase:
-                        phase_counts[str(phase)] += 1
-                    if len(samples) < max_state_samples:
-                        samples.append(sample)
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "device": self.device,
+            "inode": self.inode,
+            "offset": self.offset,
+            "line_number": self.line_number,
+            "json_objects_seen": self.json_objects_seen,
+            "gre_hint_lines": self.gre_hint_lines,
+            "message_counts": dict(self.message_counts),
+            "turn_counts": dict(self.turn_counts),
+            "phase_counts": dict(self.phase_counts),
+            "samples": self.samples,
+        }
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def reset_reason(self, stat: os.stat_result) -> str | None:
+        if not self.inode:
+            return None
+        if (stat.st_dev, stat.st_ino) != (self.device, self.inode):
+            return "rotated"
+        if stat.st_size < self.offset + len(self.partial):
+            return "truncated"
+        return None
+
+    def scan_line(self, line: str, *, path: Path, max_state_samples: int) -> None:
+        self.line_number += 1
+        if any(keyword in line for keyword in GRE_KEYWORDS):
+            self.gre_hint_lines += 1
+        if "{" not in line and "[" not in line:
+            return
+        gre_payload = any(marker in line for marker in GRE_PAYLOAD_MARKERS)
+        for value in iter_json_values(line):
+            self.json_objects_seen += 1
+            classification = classify_payload(value, line) if gre_payload else "json_other"
+            self.message_counts[classification] += 1
+            if classification != "game_state_message":
+                continue
+            sample = game_state_sample(value, source_path=path, line_number=self.line_number)
+            turn = sample.get("turn_number")
+            phase = sample.get("phase")
+            if turn:
+                self.turn_counts[str(turn)] += 1
+            if phase:
+                self.phase_counts[str(phase)] += 1
+            if len(self.samples) < max_state_samples:
+                self.samples.append(sample)
+
+
+def consume_log(
+    cursor: LogCursor,
+    path: Path,
+    *,
+    max_state_samples: int = 25,
+    final: bool = False,
+) -> dict[str, Any]:
+    """Parse lines appended to ``path`` since ``cursor`` and advance it.
+
+    With ``final`` the unterminated tail is parsed too; use it only when the
+    cursor is not persisted, since its offset does not move past the tail.
+    """
+
+    stat = path.stat()
+    reset_reason = cursor.reset_reason(stat)
+    if reset_reason:
+        cursor.reset()
+    resumed = cursor.inode != 0
+    cursor.device, cursor.inode = stat.st_dev, stat.st_ino
+    start_offset = cursor.offset
+    bytes_read = 0
+    with path.open("rb") as handle:
+        handle.seek(cursor.offset + len(cursor.partial))
+        while chunk := handle.read(READ_CHUNK_BYTES):
+            bytes_read += len(chunk)
+            *lines, cursor.partial = (cursor.partial + chunk).split(b"\n")
+            for raw in lines:
+                cursor.offset += len(raw) + 1
+                cursor.scan_line(
+                    raw.decode("utf-8", errors="ignore") + "\n",
+                    path=path,
+                    max_state_samples=max_state_samples,
+                )
+    if final and cursor.partial:
+        cursor.scan_line(
+            cursor.partial.decode("utf-8", errors="ignore"),
+            path=path,
+            max_state_samples=max_state_samples,
+        )
+    return {
+        "resumed": resumed,
+        "reset_reason": reset_reason,
+        "start_offset": start_offset,
+        "bytes_read": bytes_read,
+        "pending_partial_bytes": len(cursor.partial),
+    }
 
+
+def file_result(cursor: LogCursor, path: Path) -> dict[str, Any]:
     return {
         "path": str(path),
         "exists": path.exists(),
-        "json_objects_seen": json_objects_seen,
-        "gre_hint_lines": gre_hint_lines,
-        "message_counts": dict(sorted(message_counts.items())),
-        "turn_counts": dict(sorted(turn_counts.items(), key=lambda item: str(item[0]))),
-        "phase_counts": dict(sorted(phase_counts.items())),
-        "game_state_samples": samples,
+        "json_objects_seen": cursor.json_objects_seen,
+        "gre_hint_lines": cursor.gre_hint_lines,
+        "message_counts": dict(sorted(cursor.message_counts.items())),
+        "turn_counts": dict(sorted(cursor.turn_counts.items(), key=lambda item: str(item[0]))),
+        "phase_counts": dict(sorted(cursor.phase_counts.items())),
+        "game_state_samples": list(cursor.samples),
     }
 
 
-def build_report(paths: list[Path], *, max_state_samples: int = 25) -> dict[str, Any]:
-    files = [
-        parse_log_file(path, max_state_samples=max_state_samples)
-        for path in paths
-    ]
+def parse_log_file(path: Path, *, max_state_samples: int = 25) -> dict[str, Any]:
+    cursor = LogCursor()
+    consume_log(cursor, path, max_state_samples=max_state_samples, final=True)
+    return file_result(cursor, path)
+
+
+def cursor_key(path: Path) -> str:
+    return str(path.expanduser().resolve())
+
+
+def load_cursors(state_path: Path) -> dict[str, LogCursor]:
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if payload.get("schema_version") != CURSOR_SCHEMA_VERSION:
+        return {}
+    try:
+        return {key: LogCursor.from_state(state) for key, state in payload["files"].items()}
+    except (KeyError, TypeError, ValueError):
+        return {}
+
+
+def write_cursors(state_path: Path, cursors: dict[str, LogCursor]) -> None:
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+    temporary.write_text(
+        stable_json(
+            {
+                "schema_version": CURSOR_SCHEMA_VERSION,
+                "files": {key: cursor.to_state() for key, cursor in sorted(cursors.items())},
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    temporary.replace(state_path)
+
+
+def parse_incremental(
+    paths: list[Path],
+    cursors: dict[str, LogCursor],
+    *,
+    max_state_samples: int = 25,
+) -> list[dict[str, Any]]:
+    """Advance ``cursors`` over ``paths`` and return cumulative file results."""
+
+    files: list[dict[str, Any]] = []
+    for path in paths:
+        cursor = cursors.setdefault(cursor_key(path), LogCursor())
+        incremental = consume_log(cursor, path, max_state_samples=max_state_samples)
+        files.append({**file_result(cursor, path), "incremental": incremental})
+    return files
+
+
+def build_report(
+    paths: list[Path],
+    *,
+    max_state_samples: int = 25,
+    cursor_state: Path | None = None,
+) -> dict[str, Any]:
+    """Summarize ``paths``; with ``cursor_state`` only appended lines are parsed."""
+
+    if cursor_state is None:
+        files = [
+            parse_log_file(path, max_state_samples=max_state_samples)
+            for path in paths
+        ]
+    else:
+        cursors = load_cursors(cursor_state)
+        files = parse_incremental(paths, cursors, max_state_samples=max_state_samples)
+        write_cursors(cursor_state, cursors)
+    return summarize_files(files, max_state_samples=max_state_samples)
+
+
+def summarize_files(files: list[dict[str, Any]], *, max_state_samples: int = 25) -> dict[str, Any]:
     aggregate_message_counts: Counter[str] = Counter()
     aggregate_turn_counts: Counter[str] = Counter()
     aggregate_phase_counts: Counter[str] = Counter()
@@ -259,10 +453,50 @@ def build_report(paths: list[Path], *, max_state_samples: int = 25) -> dict[str,
             "This parser treats Player.log as local telemetry, not rules authority.",
             "Use with explicit input paths; the script does not auto-scan user directories.",
             "Detailed Logs/GRE payload shapes can change, so parser tests use resilient JSON extraction and aggregate assertions.",
+            "Cursor state files keep byte offsets and aggregates only; an unterminated last line is re-read on the next run.",
         ],
     }
 
 
+def follow_logs(
+    paths: list[Path],
+    *,
+    on_update: Callable[[dict[str, Any]], None],
+    max_state_samples: int = 25,
+    cursor_state: Path | None = None,
+    poll_seconds: float = FOLLOW_POLL_SECONDS,
+    max_polls: int = 0,
+) -> dict[str, Any]:
+    """Poll ``paths`` for appended lines and report each change live.
+
+    The partial-line buffer stays in memory between polls; ``cursor_state``
+    is rewritten after every poll that parsed new bytes. ``max_polls`` of 0
+    follows until interrupted.
+    """
+
+    cursors = load_cursors(cursor_state) if cursor_state is not None else {}
+    report: dict[str, Any] | None = None
+    polls = 0
+    try:
+        while True:
+            files = parse_incremental(paths, cursors, max_state_samples=max_state_samples)
+            polls += 1
+            changed = report is None or any(
+                item["incremental"]["bytes_read"] or item["incremental"]["reset_reason"]
+                for item in files
+            )
+            if changed:
+                report = summarize_files(files, max_state_samples=max_state_samples)
+                if cursor_state is not None:
+                    write_cursors(cursor_state, cursors)
+                on_update(report)
+            if max_polls and polls >= max_polls:
+                return report
+            time.sleep(poll_seconds)
+    except KeyboardInterrupt:
+        return report or summarize_files([], max_state_samples=max_state_samples)
+
+
 def render_markdown(report: dict[str, Any]) -> str:
     summary = report["summary"]
     lines = [
@@ -313,12 +547,18 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--json-output", type=Path)
     parser.add_argument("--output", type=Path)
     parser.add_argument("--max-state-samples", type=int, default=25)
+    parser.add_argument(
+        "--cursor-state",
+        type=Path,
+        help="JSON file of per-log byte offsets and aggregates; only appended lines are parsed.",
+    )
+    parser.add_argument("--follow", action="store_true", help="Keep polling the inputs and rewrite outputs on change.")
+    parser.add_argument("--poll-seconds", type=float, default=FOLLOW_POLL_SECONDS)
+    parser.add_argument("--max-polls", type=int, default=0, help="Stop following after N polls; 0 follows until interrupted.")
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-    report = build_report(args.input, max_state_samples=args.max_state_samples)
+def write_outputs(report: dict[str, Any], args: argparse.Namespace) -> None:
     markdown = render_markdown(report)
 
     if args.json_output:
@@ -329,6 +569,26 @@ def main() -> int:
         args.output.write_text(markdown, encoding="utf-8")
     if not args.output and not args.json_output:
         print(markdown)
+
+
+def main() -> int:
+    args = parse_args()
+    if args.follow:
+        follow_logs(
+            args.input,
+            on_update=lambda report: write_outputs(report, args),
+            max_state_samples=args.max_state_samples,
+            cursor_state=args.cursor_state,
+            poll_seconds=args.poll_seconds,
+            max_polls=args.max_polls,
+        )
+        return 0
+    report = build_report(
+        args.input,
+        max_state_samples=args.max_state_samples,
+        cursor_state=args.cursor_state,
+    )
+    write_outputs(report, args)
     return 0
 
 
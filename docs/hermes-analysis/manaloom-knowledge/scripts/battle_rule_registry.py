@@ -19,6 +19,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from knowledge_db_access import connect_knowledge_db
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_DB = Path(os.environ.get("MANALOOM_KNOWLEDGE_DB", SCRIPT_DIR / "knowledge.db"))
@@ -558,8 +560,7 @@ def _load_active_battle_card_rule_lists_cached(
         return mtime, {}
 
     try:
-        with closing(sqlite3.connect(path)) as conn:
-            conn.row_factory = sqlite3.Row
+        with closing(connect_knowledge_db(path, profile="runtime")) as conn:
             if not table_exists(conn, "battle_card_rules"):
                 _RULE_LIST_CACHE[cache_key] = (mtime, {})
                 return mtime, {}
@@ -9,31 +9,31 @@ and restores the battle module's configured database afterwards.
 
 from __future__ import annotations
 
-import json
 import sqlite3
 import tempfile
+from collections.abc import Mapping
 from contextlib import closing, contextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Iterator
 
+from known_cards_fallback_snapshot import open_snapshot_file
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 CANONICAL_SNAPSHOT_PATH = SCRIPT_DIR / "known_cards_canonical_snapshot.json"
 
 
 @lru_cache(maxsize=1)
-def _canonical_snapshot() -> dict[str, dict[str, Any]]:
-    decoded = json.loads(CANONICAL_SNAPSHOT_PATH.read_text(encoding="utf-8"))
-    if not isinstance(decoded, dict):
+def _canonical_snapshot() -> Mapping[str, dict[str, Any]]:
+    if not CANONICAL_SNAPSHOT_PATH.exists():
+        raise AssertionError(f"Canonical battle-rule snapshot is missing: {CANONICAL_SNAPSHOT_PATH}")
+    snapshot = open_snapshot_file(CANONICAL_SNAPSHOT_PATH)
+    if not snapshot:
         raise AssertionError(
-            f"Canonical battle-rule snapshot must be an object: {CANONICAL_SNAPSHOT_PATH}"
+            f"Canonical battle-rule snapshot must be a non-empty object: {CANONICAL_SNAPSHOT_PATH}"
         )
-    return {
-        str(card_name): dict(entry)
-        for card_name, entry in decoded.items()
-        if isinstance(card_name, str) and isinstance(entry, dict)
-    }
+    return snapshot
 
 
 @contextmanager
@@ -392,6 +392,8 @@ FOCUSED_EVIDENCE_BASENAMES = {
     "test_seventeenlands_general_absorption_audit.py",
     "seventeenlands_history_learning.py",
     "test_seventeenlands_history_learning.py",
+    "seventeenlands_replay_columns.py",
+    "test_seventeenlands_replay_columns.py",
     "seventeenlands_replay_profile.py",
     "test_seventeenlands_replay_profile.py",
     "xmage_current_replay_batch_pipeline.py",
@@ -13,21 +13,30 @@ import argparse
 import base64
 import gzip
 import hashlib
+import http.client
 import json
+import os
 import re
+import select
+import threading
 import time
 import unicodedata
-import urllib.error
-import urllib.request
+import urllib.parse
+import uuid
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 
 REGISTRY_SCHEMA = "external_battle_async_registry_v2"
 CHECKPOINT_SCHEMA = "external_battle_async_checkpoint_v2"
+CHECKPOINT_JOURNAL_SCHEMA = "external_battle_async_checkpoint_journal_v1"
+DEFAULT_JOURNAL_COMPACT_EVERY = 64
+HTTP_GZIP_MIN_BYTES = 1024
+HTTP_GZIP_LEVEL = 5
+IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD"})
 LEARNING_SCHEMA = "external_battle_learning_v1"
 EXECUTION_SCHEMA = "external_battle_execution_v2"
 REQUEST_SCHEMA = "external_battle_request_v2"
@@ -144,15 +153,114 @@ def atomic_write_gzip_json(path: Path, payload: Mapping[str, Any]) -> None:
 class HttpResult:
     status: int
     body: dict[str, Any]
+    timing: dict[str, Any] = dataclass_field(default_factory=dict)
+
+
+def _server_timing_ms(header: str | None) -> float | None:
+    """Return the ``app`` duration from a Server-Timing header, if present."""
+
+    for metric in str(header or "").split(","):
+        name, _, params = metric.strip().partition(";")
+        if name.strip() != "app":
+            continue
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur":
+                try:
+                    return round(float(value), 1)
+                except ValueError:
+                    return None
+    return None
+
+
+class _StaleConnectionError(Exception):
+    """A reused keep-alive socket failed before the request was sent."""
+
+
+def _idle_socket_is_usable(connection: http.client.HTTPConnection) -> bool:
+    """An idle keep-alive socket must have nothing to read.
+
+    A readable one has seen EOF (server restart or keep-alive timeout) or
+    stray bytes; either way a request sent on it would not get a clean
+    response.
+    """
+
+    if connection.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+    return not readable
 
 
 class JsonHttpClient:
+    """Keep-alive JSON client shared by the XMage, Forge and native sidecars.
+
+    Idle HTTP/1.1 connections are pooled per origin. Responses are requested
+    with ``accept-encoding: gzip``; request bodies are gzip-compressed only
+    after the origin advertised ``accept-encoding: gzip`` on a response, so
+    older sidecars keep receiving plain JSON.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_origin: int = 2,
+        gzip_min_bytes: int = HTTP_GZIP_MIN_BYTES,
+    ) -> None:
+        self.max_idle_per_origin = max(0, max_idle_per_origin)
+        self.gzip_min_bytes = max(0, gzip_min_bytes)
+        self._idle: defaultdict[tuple[str, str, int], list[http.client.HTTPConnection]] = defaultdict(list)
+        self._gzip_origins: set[tuple[str, str, int]] = set()
+        self._lock = threading.Lock()
+
     def post(self, url: str, payload: Mapping[str, Any], timeout: float) -> HttpResult:
         return self._request("POST", url, payload=payload, timeout=timeout)
 
     def get(self, url: str, timeout: float) -> HttpResult:
         return self._request("GET", url, payload=None, timeout=timeout)
 
+    def close(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+    def _acquire(
+        self,
+        origin: tuple[str, str, int],
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                idle = self._idle.get(origin)
+                connection = idle.pop() if idle else None
+            if connection is None:
+                break
+            if not _idle_socket_is_usable(connection):
+                connection.close()
+                continue
+            connection.timeout = timeout
+            connection.sock.settimeout(timeout)
+            return connection, True
+        scheme, host, port = origin
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return factory(host, port, timeout=timeout), False
+
+    def _release(
+        self,
+        origin: tuple[str, str, int],
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        with self._lock:
+            idle = self._idle[origin]
+            if len(idle) < self.max_idle_per_origin:
+                idle.append(connection)
+                return
+        connection.close()
+
     def _request(
         self,
         method: str,
@@ -161,17 +269,111 @@ class JsonHttpClient:
         payload: Mapping[str, Any] | None,
         timeout: float,
     ) -> HttpResult:
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme or "http"
+        origin = (
+            scheme,
+            parsed.hostname or "localhost",
+            parsed.port or (443 if scheme == "https" else 80),
+        )
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
         data = None
-        headers: dict[str, str] = {}
+        headers = {"accept-encoding": "gzip", "accept": "application/json"}
+        raw_bytes = 0
         if payload is not None:
             data = json.dumps(payload, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+            raw_bytes = len(data)
             headers["content-type"] = "application/json"
-        request = urllib.request.Request(url, data=data, headers=headers, method=method)
+            with self._lock:
+                gzip_request = origin in self._gzip_origins
+            if gzip_request and raw_bytes >= self.gzip_min_bytes:
+                data = gzip.compress(data, compresslevel=HTTP_GZIP_LEVEL, mtime=0)
+                headers["content-encoding"] = "gzip"
+        for attempt in range(2):
+            connection, reused = self._acquire(origin, timeout)
+            try:
+                return self._exchange(
+                    connection,
+                    origin,
+                    method,
+                    path,
+                    data=data,
+                    headers=headers,
+                    reused=reused,
+                    raw_request_bytes=raw_bytes,
+                )
+            except _StaleConnectionError as error:
+                connection.close()
+                # The pooled socket was closed by the server while idle and the
+                # request could not be sent, so the server never saw it.
+                if attempt:
+                    raise error.__cause__ from None
+            except http.client.RemoteDisconnected:
+                connection.close()
+                # Sent but unanswered: the server may have accepted the request,
+                # so only idempotent methods are retried.
+                if not reused or attempt or method not in IDEMPOTENT_HTTP_METHODS:
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+        raise AssertionError("unreachable")
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        origin: tuple[str, str, int],
+        method: str,
+        path: str,
+        *,
+        data: bytes | None,
+        headers: Mapping[str, str],
+        reused: bool,
+        raw_request_bytes: int,
+    ) -> HttpResult:
+        started = time.perf_counter()
+        if connection.sock is None:
+            connection.connect()
+        connected = time.perf_counter()
         try:
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                return HttpResult(response.status, _decode_json(response.read()))
-        except urllib.error.HTTPError as error:
-            return HttpResult(error.code, _decode_json(error.read()))
+            connection.request(method, path, body=data, headers=dict(headers))
+        except (BrokenPipeError, ConnectionResetError) as error:
+            if reused:
+                raise _StaleConnectionError() from error
+            raise
+        uploaded = time.perf_counter()
+        response = connection.getresponse()
+        first_byte = time.perf_counter()
+        raw = response.read()
+        downloaded = time.perf_counter()
+        response_gzip = response.getheader("content-encoding", "").strip().lower() == "gzip"
+        body = gzip.decompress(raw) if response_gzip else raw
+        if "gzip" in response.getheader("accept-encoding", "").lower():
+            with self._lock:
+                self._gzip_origins.add(origin)
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(origin, connection)
+        server_ms = _server_timing_ms(response.getheader("server-timing"))
+        wait_ms = round((first_byte - uploaded) * 1000, 1)
+        timing = {
+            "connect_ms": round((connected - started) * 1000, 1),
+            "upload_ms": round((uploaded - connected) * 1000, 1),
+            "wait_ms": wait_ms,
+            "server_ms": server_ms,
+            "download_ms": round((downloaded - first_byte) * 1000, 1),
+            "reused_connection": reused,
+            "request_bytes": len(data or b""),
+            "request_uncompressed_bytes": raw_request_bytes,
+            "request_gzip": "content-encoding" in headers,
+            "response_bytes": len(raw),
+            "response_uncompressed_bytes": len(body),
+            "response_gzip": response_gzip,
+        }
+        return HttpResult(response.status, _decode_json(body), timing)
 
 
 def _decode_json(raw: bytes) -> dict[str, Any]:
@@ -519,19 +721,117 @@ def new_checkpoint(registry: Mapping[str, Any]) -> dict[str, Any]:
     return {
         "schema_version": CHECKPOINT_SCHEMA,
         "registry_hash": stable_registry_hash(registry),
+        # Ties journal records to this checkpoint, so a journal left behind
+        # by a deleted checkpoint is never replayed onto a fresh run.
+        "run_id": uuid.uuid4().hex,
         "created_at": utc_now(),
         "updated_at": utc_now(),
         "status": "pending",
         "jobs": {},
         "comparison_gates": {},
+        "journal_sequence": 0,
+    }
+
+
+def checkpoint_journal_path(checkpoint_path: Path) -> Path:
+    return checkpoint_path.with_name(checkpoint_path.name + ".journal.jsonl")
+
+
+def checkpoint_status(states: Iterable[Any]) -> str:
+    states = list(states)
+    return "completed" if states and all(
+        isinstance(state, Mapping)
+        and state.get("status") in TERMINAL_JOB_STATUSES
+        for state in states
+    ) else "running"
+
+
+def journal_record(
+    *,
+    registry_hash: str,
+    run_id: str | None,
+    sequence: int,
+    job_id: str,
+    state: Mapping[str, Any],
+    recorded_at: str,
+) -> dict[str, Any]:
+    return {
+        "schema_version": CHECKPOINT_JOURNAL_SCHEMA,
+        "registry_hash": registry_hash,
+        "run_id": run_id,
+        "sequence": sequence,
+        "recorded_at": recorded_at,
+        "job_id": job_id,
+        "state": state,
     }
 
 
+def read_checkpoint_journal(path: Path, registry_hash: str) -> list[dict[str, Any]]:
+    """Read journal records in append order.
+
+    Only the final line may be torn (an append interrupted by a crash); it is
+    dropped because its transition was never acknowledged. Any other invalid
+    line means the journal cannot reproduce the checkpoint and is rejected.
+    """
+
+    if not path.exists():
+        return []
+    lines = path.read_text(encoding="utf-8").splitlines()
+    records: list[dict[str, Any]] = []
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            if index == len(lines) - 1:
+                break
+            raise ValueError(f"checkpoint journal line {index + 1} is not valid JSON")
+        if not isinstance(record, dict) or record.get("schema_version") != CHECKPOINT_JOURNAL_SCHEMA:
+            raise ValueError("checkpoint journal schema is not supported")
+        if record.get("registry_hash") != registry_hash:
+            raise ValueError("checkpoint journal belongs to a different battle registry")
+        if not isinstance(record.get("state"), dict) or not str(record.get("job_id") or ""):
+            raise ValueError(f"checkpoint journal line {index + 1} has no job state")
+        records.append(record)
+    return records
+
+
+def replay_checkpoint_journal(
+    checkpoint: dict[str, Any],
+    records: Sequence[Mapping[str, Any]],
+    registry: Mapping[str, Any],
+) -> int:
+    """Apply journal records newer than the checkpoint's compacted sequence.
+
+    Records written for another checkpoint generation (a different
+    ``run_id``) are skipped. Derived fields are recomputed exactly as a full save would have written
+    them after the last applied transition. Returns the number applied.
+    """
+
+    sequence = int(checkpoint.get("journal_sequence") or 0)
+    applied = 0
+    for record in records:
+        record_sequence = int(record.get("sequence") or 0)
+        if record_sequence <= sequence or record.get("run_id") != checkpoint.get("run_id"):
+            continue
+        checkpoint["jobs"][str(record["job_id"])] = record["state"]
+        checkpoint["updated_at"] = record.get("recorded_at") or checkpoint.get("updated_at")
+        sequence = record_sequence
+        applied += 1
+    if applied:
+        checkpoint["journal_sequence"] = sequence
+        checkpoint["comparison_gates"] = evaluate_comparisons(registry, checkpoint)
+        checkpoint["status"] = checkpoint_status(checkpoint["jobs"].values())
+    return applied
+
+
 def load_checkpoint(path: Path, registry: Mapping[str, Any]) -> dict[str, Any]:
     expected_hash = stable_registry_hash(registry)
-    if not path.exists():
-        return new_checkpoint(registry)
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    if path.exists():
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        payload = new_checkpoint(registry)
     if not isinstance(payload, dict) or payload.get("schema_version") != CHECKPOINT_SCHEMA:
         raise ValueError("checkpoint schema is not supported")
     if payload.get("registry_hash") != expected_hash:
@@ -539,6 +839,11 @@ def load_checkpoint(path: Path, registry: Mapping[str, Any]) -> dict[str, Any]:
     jobs = payload.get("jobs")
     if not isinstance(jobs, dict):
         payload["jobs"] = {}
+    replay_checkpoint_journal(
+        payload,
+        read_checkpoint_journal(checkpoint_journal_path(path), expected_hash),
+        registry,
+    )
     for state in payload["jobs"].values():
         if isinstance(state, dict) and state.get("status") == "running":
             state["status"] = "pending"
@@ -1172,336 +1477,349 @@ def validate_registry(registry: Mapping[str, Any]) -> None:
             )
 
 
-def evaluate_comparisons(
+def evaluate_comparison(
     registry: Mapping[str, Any],
-    checkpoint: Mapping[str, Any],
+    comparison_id: str,
+    entries: Sequence[tuple[Mapping[str, Any], Mapping[str, Any]]],
+    *,
+    preflight: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    groups: defaultdict[str, list[tuple[Mapping[str, Any], Mapping[str, Any]]]] = defaultdict(list)
-    states = checkpoint.get("jobs") or {}
-    for job in registry.get("jobs") or []:
-        if not isinstance(job, Mapping):
-            continue
-        comparison_id = str(job.get("comparison_id") or "").strip()
-        state = states.get(str(job.get("job_id") or ""), {})
-        if comparison_id and isinstance(state, Mapping):
-            groups[comparison_id].append((job, state))
+    """Evaluate one comparison gate from its registry jobs and job states."""
 
-    minimum = max(1, int(registry.get("minimum_completed_per_variant") or 3))
-    result: dict[str, Any] = {}
-    for comparison_id, entries in sorted(groups.items()):
+    if preflight is None:
         preflight = comparison_preflight(registry, comparison_id)
-        variants: defaultdict[str, list[tuple[Mapping[str, Any], Mapping[str, Any]]]] = defaultdict(list)
-        for job, state in entries:
-            variants[str(job.get("variant") or "unknown")].append((job, state))
-        base = variants.get("base", [])
-        candidate = variants.get("candidate", [])
-
-        def completed(values: Sequence[tuple[Mapping[str, Any], Mapping[str, Any]]]) -> list[tuple[Mapping[str, Any], Mapping[str, Any]]]:
-            return [entry for entry in values if entry[1].get("status") == "completed"]
-
-        def exposure_ready(
-            entry: tuple[Mapping[str, Any], Mapping[str, Any]],
-        ) -> bool:
-            evidence = entry[1].get("evidence")
-            return (
-                isinstance(evidence, Mapping)
-                and evidence.get("positive_exposure_ready") is True
-                and int(evidence.get("typed_positive_event_count") or 0) > 0
-                and evidence.get("natural_sample") is True
-                and entry[1].get("sample_classification") == "natural"
-                and all(
-                    isinstance(row, Mapping)
-                    and row.get("positive_exposure") is True
-                    and row.get("evidence_kind") == "typed_event"
-                    for row in evidence.get("focus_cards") or []
-                )
-            )
+    minimum = max(1, int(registry.get("minimum_completed_per_variant") or 3))
+    variants: defaultdict[str, list[tuple[Mapping[str, Any], Mapping[str, Any]]]] = defaultdict(list)
+    for job, state in entries:
+        variants[str(job.get("variant") or "unknown")].append((job, state))
+    base = variants.get("base", [])
+    candidate = variants.get("candidate", [])
 
-        base_completed = completed(base)
-        candidate_completed = completed(candidate)
-        completed_entries = [*base_completed, *candidate_completed]
-        outcomes_valid = bool(completed_entries) and all(
-            isinstance(state.get("comparison_outcome"), Mapping)
-            and state["comparison_outcome"].get("schema_version")
-            == COMPARISON_OUTCOME_SCHEMA
-            and state["comparison_outcome"].get("valid") is True
-            and state["comparison_outcome"].get("classification")
-            in {"win", "loss", "draw"}
-            and state["comparison_outcome"].get("seed_pairing_claim") is False
-            for _job, state in completed_entries
+    def completed(values: Sequence[tuple[Mapping[str, Any], Mapping[str, Any]]]) -> list[tuple[Mapping[str, Any], Mapping[str, Any]]]:
+        return [entry for entry in values if entry[1].get("status") == "completed"]
+
+    def exposure_ready(
+        entry: tuple[Mapping[str, Any], Mapping[str, Any]],
+    ) -> bool:
+        evidence = entry[1].get("evidence")
+        return (
+            isinstance(evidence, Mapping)
+            and evidence.get("positive_exposure_ready") is True
+            and int(evidence.get("typed_positive_event_count") or 0) > 0
+            and evidence.get("natural_sample") is True
+            and entry[1].get("sample_classification") == "natural"
+            and all(
+                isinstance(row, Mapping)
+                and row.get("positive_exposure") is True
+                and row.get("evidence_kind") == "typed_event"
+                for row in evidence.get("focus_cards") or []
+            )
         )
 
-        def outcome_counts(
-            values: Sequence[tuple[Mapping[str, Any], Mapping[str, Any]]],
-        ) -> dict[str, int]:
-            counts = Counter(
-                str(state.get("comparison_outcome", {}).get("classification") or "invalid")
-                for _job, state in values
-            )
-            return {
-                "win": counts["win"],
-                "loss": counts["loss"],
-                "draw": counts["draw"],
-                "invalid": counts["invalid"],
-            }
+    base_completed = completed(base)
+    candidate_completed = completed(candidate)
+    completed_entries = [*base_completed, *candidate_completed]
+    outcomes_valid = bool(completed_entries) and all(
+        isinstance(state.get("comparison_outcome"), Mapping)
+        and state["comparison_outcome"].get("schema_version")
+        == COMPARISON_OUTCOME_SCHEMA
+        and state["comparison_outcome"].get("valid") is True
+        and state["comparison_outcome"].get("classification")
+        in {"win", "loss", "draw"}
+        and state["comparison_outcome"].get("seed_pairing_claim") is False
+        for _job, state in completed_entries
+    )
 
-        base_outcomes = outcome_counts(base_completed)
-        candidate_outcomes = outcome_counts(candidate_completed)
-        base_exposure_eligible = [
-            entry
-            for entry in base_completed
-            if exposure_ready(entry)
-        ]
-        candidate_exposure_eligible = [
-            entry
-            for entry in candidate_completed
-            if exposure_ready(entry)
-        ]
-        base_seeds = {entry[0].get("request", {}).get("seed") for entry in base_completed}
-        candidate_seeds = {entry[0].get("request", {}).get("seed") for entry in candidate_completed}
-        base_exposure_seeds = {
-            entry[0].get("request", {}).get("seed") for entry in base_exposure_eligible
-        }
-        candidate_exposure_seeds = {
-            entry[0].get("request", {}).get("seed")
-            for entry in candidate_exposure_eligible
-        }
-        base_exposed = {
-            normalize_name(row.get("card_name"))
-            for _job, state in base_completed
-            for row in (state.get("evidence", {}).get("focus_cards") or [])
-            if row.get("positive_exposure") is True
-            and row.get("evidence_kind") == "typed_event"
-        }
-        candidate_exposed = {
-            normalize_name(row.get("card_name"))
-            for _job, state in candidate_completed
-            for row in (state.get("evidence", {}).get("focus_cards") or [])
-            if row.get("positive_exposure") is True
-            and row.get("evidence_kind") == "typed_event"
-        }
-        removed = {normalize_name(name) for name in preflight["actual_removed_cards"]}
-        added = {normalize_name(name) for name in preflight["actual_added_cards"]}
-        same_lane = preflight["same_lane_hypothesis_verified"] is True
-        natural = bool(entries) and all(
-            state.get("sample_classification") == "natural"
-            and isinstance(state.get("evidence"), Mapping)
-            and state["evidence"].get("natural_sample") is True
-            for _job, state in entries
-            if state.get("status") == "completed"
-        )
-        forced_access_diagnostic = any(
-            job.get("forced_access") is True
-            or job.get("natural_sample") is False
-            or state.get("sample_classification") == "forced_access_diagnostic"
-            for job, state in entries
-        )
-        completed_enough = (
-            len(base_completed) >= minimum
-            and len(candidate_completed) >= minimum
-            and len(base_seeds) >= minimum
-            and len(candidate_seeds) >= minimum
-        )
-        equal_seed_set = bool(base_seeds) and base_seeds == candidate_seeds
-        exposure_qualified_enough = (
-            len(base_exposure_seeds) >= minimum
-            and len(candidate_exposure_seeds) >= minimum
-        )
-        equal_exposure_seed_set = (
-            bool(base_exposure_seeds)
-            and base_exposure_seeds == candidate_exposure_seeds
-        )
-        focus_exposed = bool(removed) and bool(added) and removed <= base_exposed and added <= candidate_exposed
-        timeout_censored = any(
-            state.get("status") == "timeout"
-            or any(
-                attempt.get("http_status") == 504
-                or attempt.get("status") == "timeout"
-                for attempt in state.get("attempts") or []
-                if isinstance(attempt, Mapping)
-            )
-            for _job, state in entries
-        )
-        expected_seed_set = set(preflight["seed_set"])
-        completed_seed_set_matches_contract = (
-            bool(expected_seed_set)
-            and base_seeds == expected_seed_set
-            and candidate_seeds == expected_seed_set
-        )
-        result_identity_rows = [
-            state.get("result_identity")
-            for _job, state in [*base_completed, *candidate_completed]
-        ]
-        result_identity_complete = bool(result_identity_rows) and all(
-            isinstance(identity, Mapping)
-            and str(identity.get("engine") or "") in ENGINE_IDENTITIES
-            and external_execution_identity_error(
-                identity,
-                engine=str(identity.get("engine")),
-            )
-            is None
-            and bool(str(identity.get("request_id") or "").strip())
-            and bool(str(identity.get("request_hash") or "").strip())
-            for identity in result_identity_rows
+    def outcome_counts(
+        values: Sequence[tuple[Mapping[str, Any], Mapping[str, Any]]],
+    ) -> dict[str, int]:
+        counts = Counter(
+            str(state.get("comparison_outcome", {}).get("classification") or "invalid")
+            for _job, state in values
         )
-        engine_identities = {
-            (
-                str(identity.get("engine") or ""),
-                str(identity.get("engine_commit") or ""),
-                str(identity.get("engine_version") or ""),
-                str(identity.get("sidecar_protocol_version") or ""),
-                str(identity.get("sidecar_build_identity") or ""),
-                str(identity.get("seed_semantics") or ""),
-                identity.get("deterministic"),
-            )
-            for identity in result_identity_rows
-            if isinstance(identity, Mapping)
+        return {
+            "win": counts["win"],
+            "loss": counts["loss"],
+            "draw": counts["draw"],
+            "invalid": counts["invalid"],
         }
-        same_engine_identity = result_identity_complete and len(engine_identities) == 1
-        result_seed_match = all(
-            isinstance(state.get("result_identity"), Mapping)
-            and state["result_identity"].get("seed")
-            == job.get("request", {}).get("seed")
-            for job, state in [*base_completed, *candidate_completed]
+
+    base_outcomes = outcome_counts(base_completed)
+    candidate_outcomes = outcome_counts(candidate_completed)
+    base_exposure_eligible = [
+        entry
+        for entry in base_completed
+        if exposure_ready(entry)
+    ]
+    candidate_exposure_eligible = [
+        entry
+        for entry in candidate_completed
+        if exposure_ready(entry)
+    ]
+    base_seeds = {entry[0].get("request", {}).get("seed") for entry in base_completed}
+    candidate_seeds = {entry[0].get("request", {}).get("seed") for entry in candidate_completed}
+    base_exposure_seeds = {
+        entry[0].get("request", {}).get("seed") for entry in base_exposure_eligible
+    }
+    candidate_exposure_seeds = {
+        entry[0].get("request", {}).get("seed")
+        for entry in candidate_exposure_eligible
+    }
+    base_exposed = {
+        normalize_name(row.get("card_name"))
+        for _job, state in base_completed
+        for row in (state.get("evidence", {}).get("focus_cards") or [])
+        if row.get("positive_exposure") is True
+        and row.get("evidence_kind") == "typed_event"
+    }
+    candidate_exposed = {
+        normalize_name(row.get("card_name"))
+        for _job, state in candidate_completed
+        for row in (state.get("evidence", {}).get("focus_cards") or [])
+        if row.get("positive_exposure") is True
+        and row.get("evidence_kind") == "typed_event"
+    }
+    removed = {normalize_name(name) for name in preflight["actual_removed_cards"]}
+    added = {normalize_name(name) for name in preflight["actual_added_cards"]}
+    same_lane = preflight["same_lane_hypothesis_verified"] is True
+    natural = bool(entries) and all(
+        state.get("sample_classification") == "natural"
+        and isinstance(state.get("evidence"), Mapping)
+        and state["evidence"].get("natural_sample") is True
+        for _job, state in entries
+        if state.get("status") == "completed"
+    )
+    forced_access_diagnostic = any(
+        job.get("forced_access") is True
+        or job.get("natural_sample") is False
+        or state.get("sample_classification") == "forced_access_diagnostic"
+        for job, state in entries
+    )
+    completed_enough = (
+        len(base_completed) >= minimum
+        and len(candidate_completed) >= minimum
+        and len(base_seeds) >= minimum
+        and len(candidate_seeds) >= minimum
+    )
+    equal_seed_set = bool(base_seeds) and base_seeds == candidate_seeds
+    exposure_qualified_enough = (
+        len(base_exposure_seeds) >= minimum
+        and len(candidate_exposure_seeds) >= minimum
+    )
+    equal_exposure_seed_set = (
+        bool(base_exposure_seeds)
+        and base_exposure_seeds == candidate_exposure_seeds
+    )
+    focus_exposed = bool(removed) and bool(added) and removed <= base_exposed and added <= candidate_exposed
+    timeout_censored = any(
+        state.get("status") == "timeout"
+        or any(
+            attempt.get("http_status") == 504
+            or attempt.get("status") == "timeout"
+            for attempt in state.get("attempts") or []
+            if isinstance(attempt, Mapping)
         )
-        result_deck_hashes_match = all(
-            deck_hashes_match(
-                state.get("result_deck_hashes"),
-                job.get("request", {}).get("deck_hashes", {}),
-            )
-            for job, state in [*base_completed, *candidate_completed]
+        for _job, state in entries
+    )
+    expected_seed_set = set(preflight["seed_set"])
+    completed_seed_set_matches_contract = (
+        bool(expected_seed_set)
+        and base_seeds == expected_seed_set
+        and candidate_seeds == expected_seed_set
+    )
+    result_identity_rows = [
+        state.get("result_identity")
+        for _job, state in [*base_completed, *candidate_completed]
+    ]
+    result_identity_complete = bool(result_identity_rows) and all(
+        isinstance(identity, Mapping)
+        and str(identity.get("engine") or "") in ENGINE_IDENTITIES
+        and external_execution_identity_error(
+            identity,
+            engine=str(identity.get("engine")),
         )
-        result_request_correlation_match = all(
-            isinstance(state.get("result_identity"), Mapping)
-            and isinstance(state.get("request_identity"), Mapping)
-            and state["result_identity"].get("request_id")
-            == state["request_identity"].get("request_id")
-            and state["result_identity"].get("request_hash")
-            == state["request_identity"].get("request_hash")
-            and state["result_identity"].get("timeout_ms")
-            == state["request_identity"].get("timeout_ms")
-            and state["result_identity"].get("engine")
-            == state["request_identity"].get("expected_engine")
-            and state["result_identity"].get("engine_version")
-            == state["request_identity"].get("expected_engine_version")
-            and state["result_identity"].get("engine_commit")
-            == state["request_identity"].get("expected_engine_commit")
-            for _job, state in [*base_completed, *candidate_completed]
+        is None
+        and bool(str(identity.get("request_id") or "").strip())
+        and bool(str(identity.get("request_hash") or "").strip())
+        for identity in result_identity_rows
+    )
+    engine_identities = {
+        (
+            str(identity.get("engine") or ""),
+            str(identity.get("engine_commit") or ""),
+            str(identity.get("engine_version") or ""),
+            str(identity.get("sidecar_protocol_version") or ""),
+            str(identity.get("sidecar_build_identity") or ""),
+            str(identity.get("seed_semantics") or ""),
+            identity.get("deterministic"),
         )
-        runtime_blockers: list[str] = []
-        if not completed_enough:
-            runtime_blockers.append("minimum_completed_samples_missing")
-        if not completed_seed_set_matches_contract:
-            runtime_blockers.append("completed_seed_set_mismatch")
-        if not equal_seed_set:
-            runtime_blockers.append("base_candidate_seed_set_mismatch")
-        if not exposure_qualified_enough or not equal_exposure_seed_set or not focus_exposed:
-            runtime_blockers.append("typed_focus_exposure_missing_or_unknown")
-        if not natural or forced_access_diagnostic:
-            runtime_blockers.append("forced_access_or_non_natural_sample")
-        if timeout_censored:
-            runtime_blockers.append("timeout_censored_sample")
-        if not same_engine_identity:
-            runtime_blockers.append("engine_identity_mismatch_or_incomplete")
-        if not result_request_correlation_match:
-            runtime_blockers.append("engine_request_correlation_mismatch")
-        if not result_seed_match:
-            runtime_blockers.append("engine_result_seed_mismatch")
-        if not result_deck_hashes_match:
-            runtime_blockers.append("engine_result_deck_hashes_mismatch")
-        if not outcomes_valid:
-            runtime_blockers.append("comparison_outcome_missing_or_invalid")
-        blockers = sorted(set([*preflight["blockers"], *runtime_blockers]))
-        ready = (
-            not blockers
-            and completed_enough
-            and equal_seed_set
-            and completed_seed_set_matches_contract
-            and exposure_qualified_enough
-            and equal_exposure_seed_set
-            and focus_exposed
-            and same_lane
-            and natural
-            and not forced_access_diagnostic
-            and not timeout_censored
-            and same_engine_identity
-            and result_request_correlation_match
-            and result_seed_match
-            and result_deck_hashes_match
-            and outcomes_valid
+        for identity in result_identity_rows
+        if isinstance(identity, Mapping)
+    }
+    same_engine_identity = result_identity_complete and len(engine_identities) == 1
+    result_seed_match = all(
+        isinstance(state.get("result_identity"), Mapping)
+        and state["result_identity"].get("seed")
+        == job.get("request", {}).get("seed")
+        for job, state in [*base_completed, *candidate_completed]
+    )
+    result_deck_hashes_match = all(
+        deck_hashes_match(
+            state.get("result_deck_hashes"),
+            job.get("request", {}).get("deck_hashes", {}),
         )
-        if ready:
-            next_gate = "statistical_and_strategy_evaluation"
-        elif timeout_censored:
-            next_gate = "rerun_uncensored_same_policy_seed_set"
-        elif forced_access_diagnostic or not natural:
-            next_gate = "collect_natural_samples_without_forced_access"
-        elif preflight["blockers"]:
-            next_gate = "repair_canonical_comparison_contract"
-        elif not exposure_qualified_enough or not focus_exposed:
-            next_gate = "collect_typed_natural_focus_card_exposure"
-        elif not result_deck_hashes_match:
-            next_gate = "repair_engine_result_deck_correlation"
-        else:
-            next_gate = "repair_engine_identity_or_seed_mismatch"
-        result[comparison_id] = {
-            "schema_version": COMPARISON_GATE_SCHEMA,
-            "status": "comparison_input_ready" if ready else "insufficient_evidence",
-            "blockers": blockers,
-            "minimum_completed_per_variant": minimum,
-            "base_completed": len(base_completed),
-            "candidate_completed": len(candidate_completed),
-            "base_exposure_eligible": len(base_exposure_seeds),
-            "candidate_exposure_eligible": len(candidate_exposure_seeds),
-            "equal_seed_set": equal_seed_set,
-            "seed_set_role": "balanced_schedule_correlation_only",
-            "seed_pairing_claim": False,
-            "statistical_design_required": "engine_semantics_aware_independent_samples",
-            "completed_seed_set_matches_contract": completed_seed_set_matches_contract,
-            "equal_exposure_seed_set": equal_exposure_seed_set,
-            "exposure_qualified_enough": exposure_qualified_enough,
-            "same_lane": same_lane,
-            "same_lane_source": "canonical_reviewed_hypothesis",
-            "natural_samples": natural,
-            "forced_access_diagnostic": forced_access_diagnostic,
-            "focus_cards_exposed": focus_exposed,
-            "timeout_censored": timeout_censored,
-            "postgresql_legality_attestation_valid": preflight[
-                "postgresql_legality_attestation_valid"
-            ],
-            "base_deck_hash": preflight["base_deck_hash"],
-            "candidate_deck_hash": preflight["candidate_deck_hash"],
-            "opponent_deck_hash": preflight["opponent_deck_hash"],
-            "commander_identity": preflight["commander_identity"],
-            "opponent_commander_identity": preflight["opponent_commander_identity"],
-            "timeout_ms": preflight["timeout_ms"],
-            "same_engine_commit_and_version": same_engine_identity,
-            "engine_identity_and_contract_complete": result_identity_complete,
-            "engine_request_correlation_match": result_request_correlation_match,
-            "engine_identity": (
-                {
-                    "engine": next(iter(engine_identities))[0],
-                    "engine_commit": next(iter(engine_identities))[1],
-                    "engine_version": next(iter(engine_identities))[2],
-                    "sidecar_protocol_version": next(iter(engine_identities))[3],
-                    "sidecar_build_identity": next(iter(engine_identities))[4],
-                    "seed_semantics": next(iter(engine_identities))[5],
-                    "deterministic": next(iter(engine_identities))[6],
-                }
-                if same_engine_identity
-                else None
-            ),
-            "engine_result_seed_match": result_seed_match,
-            "engine_result_deck_hashes_match": result_deck_hashes_match,
-            "comparison_outcomes_valid": outcomes_valid,
-            "base_outcomes": base_outcomes,
-            "candidate_outcomes": candidate_outcomes,
-            "comparison_input_ready": ready,
-            "swap_superiority_proven": False,
-            "promotion_allowed": False,
-            "next_gate": next_gate,
-        }
-    return result
+        for job, state in [*base_completed, *candidate_completed]
+    )
+    result_request_correlation_match = all(
+        isinstance(state.get("result_identity"), Mapping)
+        and isinstance(state.get("request_identity"), Mapping)
+        and state["result_identity"].get("request_id")
+        == state["request_identity"].get("request_id")
+        and state["result_identity"].get("request_hash")
+        == state["request_identity"].get("request_hash")
+        and state["result_identity"].get("timeout_ms")
+        == state["request_identity"].get("timeout_ms")
+        and state["result_identity"].get("engine")
+        == state["request_identity"].get("expected_engine")
+        and state["result_identity"].get("engine_version")
+        == state["request_identity"].get("expected_engine_version")
+        and state["result_identity"].get("engine_commit")
+        == state["request_identity"].get("expected_engine_commit")
+        for _job, state in [*base_completed, *candidate_completed]
+    )
+    runtime_blockers: list[str] = []
+    if not completed_enough:
+        runtime_blockers.append("minimum_completed_samples_missing")
+    if not completed_seed_set_matches_contract:
+        runtime_blockers.append("completed_seed_set_mismatch")
+    if not equal_seed_set:
+        runtime_blockers.append("base_candidate_seed_set_mismatch")
+    if not exposure_qualified_enough or not equal_exposure_seed_set or not focus_exposed:
+        runtime_blockers.append("typed_focus_exposure_missing_or_unknown")
+    if not natural or forced_access_diagnostic:
+        runtime_blockers.append("forced_access_or_non_natural_sample")
+    if timeout_censored:
+        runtime_blockers.append("timeout_censored_sample")
+    if not same_engine_identity:
+        runtime_blockers.append("engine_identity_mismatch_or_incomplete")
+    if not result_request_correlation_match:
+        runtime_blockers.append("engine_request_correlation_mismatch")
+    if not result_seed_match:
+        runtime_blockers.append("engine_result_seed_mismatch")
+    if not result_deck_hashes_match:
+        runtime_blockers.append("engine_result_deck_hashes_mismatch")
+    if not outcomes_valid:
+        runtime_blockers.append("comparison_outcome_missing_or_invalid")
+    blockers = sorted(set([*preflight["blockers"], *runtime_blockers]))
+    ready = (
+        not blockers
+        and completed_enough
+        and equal_seed_set
+        and completed_seed_set_matches_contract
+        and exposure_qualified_enough
+        and equal_exposure_seed_set
+        and focus_exposed
+        and same_lane
+        and natural
+        and not forced_access_diagnostic
+        and not timeout_censored
+        and same_engine_identity
+        and result_request_correlation_match
+        and result_seed_match
+        and result_deck_hashes_match
+        and outcomes_valid
+    )
+    if ready:
+        next_gate = "statistical_and_strategy_evaluation"
+    elif timeout_censored:
+        next_gate = "rerun_uncensored_same_policy_seed_set"
+    elif forced_access_diagnostic or not natural:
+        next_gate = "collect_natural_samples_without_forced_access"
+    elif preflight["blockers"]:
+        next_gate = "repair_canonical_comparison_contract"
+    elif not exposure_qualified_enough or not focus_exposed:
+        next_gate = "collect_typed_natural_focus_card_exposure"
+    elif not result_deck_hashes_match:
+        next_gate = "repair_engine_result_deck_correlation"
+    else:
+        next_gate = "repair_engine_identity_or_seed_mismatch"
+    return {
+        "schema_version": COMPARISON_GATE_SCHEMA,
+        "status": "comparison_input_ready" if ready else "insufficient_evidence",
+        "blockers": blockers,
+        "minimum_completed_per_variant": minimum,
+        "base_completed": len(base_completed),
+        "candidate_completed": len(candidate_completed),
+        "base_exposure_eligible": len(base_exposure_seeds),
+        "candidate_exposure_eligible": len(candidate_exposure_seeds),
+        "equal_seed_set": equal_seed_set,
+        "seed_set_role": "balanced_schedule_correlation_only",
+        "seed_pairing_claim": False,
+        "statistical_design_required": "engine_semantics_aware_independent_samples",
+        "completed_seed_set_matches_contract": completed_seed_set_matches_contract,
+        "equal_exposure_seed_set": equal_exposure_seed_set,
+        "exposure_qualified_enough": exposure_qualified_enough,
+        "same_lane": same_lane,
+        "same_lane_source": "canonical_reviewed_hypothesis",
+        "natural_samples": natural,
+        "forced_access_diagnostic": forced_access_diagnostic,
+        "focus_cards_exposed": focus_exposed,
+        "timeout_censored": timeout_censored,
+        "postgresql_legality_attestation_valid": preflight[
+            "postgresql_legality_attestation_valid"
+        ],
+        "base_deck_hash": preflight["base_deck_hash"],
+        "candidate_deck_hash": preflight["candidate_deck_hash"],
+        "opponent_deck_hash": preflight["opponent_deck_hash"],
+        "commander_identity": preflight["commander_identity"],
+        "opponent_commander_identity": preflight["opponent_commander_identity"],
+        "timeout_ms": preflight["timeout_ms"],
+        "same_engine_commit_and_version": same_engine_identity,
+        "engine_identity_and_contract_complete": result_identity_complete,
+        "engine_request_correlation_match": result_request_correlation_match,
+        "engine_identity": (
+            {
+                "engine": next(iter(engine_identities))[0],
+                "engine_commit": next(iter(engine_identities))[1],
+                "engine_version": next(iter(engine_identities))[2],
+                "sidecar_protocol_version": next(iter(engine_identities))[3],
+                "sidecar_build_identity": next(iter(engine_identities))[4],
+                "seed_semantics": next(iter(engine_identities))[5],
+                "deterministic": next(iter(engine_identities))[6],
+            }
+            if same_engine_identity
+            else None
+        ),
+        "engine_result_seed_match": result_seed_match,
+        "engine_result_deck_hashes_match": result_deck_hashes_match,
+        "comparison_outcomes_valid": outcomes_valid,
+        "base_outcomes": base_outcomes,
+        "candidate_outcomes": candidate_outcomes,
+        "comparison_input_ready": ready,
+        "swap_superiority_proven": False,
+        "promotion_allowed": False,
+        "next_gate": next_gate,
+    }
+
+
+def evaluate_comparisons(
+    registry: Mapping[str, Any],
+    checkpoint: Mapping[str, Any],
+) -> dict[str, Any]:
+    groups: defaultdict[str, list[tuple[Mapping[str, Any], Mapping[str, Any]]]] = defaultdict(list)
+    states = checkpoint.get("jobs") or {}
+    for job in registry.get("jobs") or []:
+        if not isinstance(job, Mapping):
+            continue
+        comparison_id = str(job.get("comparison_id") or "").strip()
+        state = states.get(str(job.get("job_id") or ""), {})
+        if comparison_id and isinstance(state, Mapping):
+            groups[comparison_id].append((job, state))
+
+    return {
+        comparison_id: evaluate_comparison(registry, comparison_id, entries)
+        for comparison_id, entries in sorted(groups.items())
+    }
 
 
 class BattleQueueRunner:
@@ -1518,30 +1836,124 @@ class BattleQueueRunner:
         max_attempts: int,
         client: JsonHttpClient | None = None,
         sleeper: Callable[[float], None] = time.sleep,
+        journal_compact_every: int = DEFAULT_JOURNAL_COMPACT_EVERY,
     ) -> None:
         validate_registry(registry)
         self.registry = registry
         self.checkpoint_path = checkpoint_path
+        self.journal_path = checkpoint_journal_path(checkpoint_path)
         self.result_dir = result_dir
         self.xmage_url = xmage_url.rstrip("/")
         self.forge_url = forge_url.rstrip("/")
         self.request_timeout = max(1.0, request_timeout)
         self.recovery_timeout = max(1.0, recovery_timeout)
         self.max_attempts = max(1, max_attempts)
+        self.journal_compact_every = max(1, journal_compact_every)
         self.client = client or JsonHttpClient()
         self.sleeper = sleeper
+        self.registry_hash = stable_registry_hash(registry)
         self.checkpoint = load_checkpoint(checkpoint_path, registry)
+        self.journal_sequence = int(self.checkpoint.get("journal_sequence") or 0)
+        self.journal_pending = 0
+        self.comparison_jobs: defaultdict[str, list[Mapping[str, Any]]] = defaultdict(list)
+        self.job_comparisons: dict[str, str] = {}
+        for job in registry.get("jobs") or []:
+            if not isinstance(job, Mapping):
+                continue
+            comparison_id = str(job.get("comparison_id") or "").strip()
+            if comparison_id:
+                self.comparison_jobs[comparison_id].append(job)
+                self.job_comparisons[str(job.get("job_id") or "")] = comparison_id
+        self.comparison_preflights = {
+            comparison_id: comparison_preflight(registry, comparison_id)
+            for comparison_id in self.comparison_jobs
+        }
+        self.open_job_ids = {
+            job_id
+            for job_id, state in self.checkpoint["jobs"].items()
+            if not (
+                isinstance(state, Mapping)
+                and state.get("status") in TERMINAL_JOB_STATUSES
+            )
+        }
+
+    def _refresh_comparison_gate(self, comparison_id: str) -> None:
+        states = self.checkpoint["jobs"]
+        gates = self.checkpoint.setdefault("comparison_gates", {})
+        known = comparison_id in gates
+        gates[comparison_id] = evaluate_comparison(
+            self.registry,
+            comparison_id,
+            [
+                (job, states.get(str(job.get("job_id") or ""), {}))
+                for job in self.comparison_jobs[comparison_id]
+            ],
+            preflight=self.comparison_preflights[comparison_id],
+        )
+        if not known:
+            self.checkpoint["comparison_gates"] = dict(sorted(gates.items()))
+
+    def _compact(self) -> None:
+        """Write the full checkpoint, then drop the journal it now covers.
+
+        Every comparison gate is re-evaluated first, so the file matches what
+        a replay of the journal would derive. The checkpoint records the last
+        journal sequence it contains, so a crash between the two steps
+        replays nothing twice.
+        """
 
-    def _save(self) -> None:
         self.checkpoint["comparison_gates"] = evaluate_comparisons(self.registry, self.checkpoint)
-        self.checkpoint["updated_at"] = utc_now()
-        states = list((self.checkpoint.get("jobs") or {}).values())
-        self.checkpoint["status"] = "completed" if states and all(
-            isinstance(state, Mapping)
-            and state.get("status") in TERMINAL_JOB_STATUSES
-            for state in states
-        ) else "running"
+        self.checkpoint["status"] = checkpoint_status(self.checkpoint["jobs"].values())
         atomic_write_json(self.checkpoint_path, self.checkpoint)
+        self.journal_path.unlink(missing_ok=True)
+        self.journal_pending = 0
+
+    def _save(self, job_id: str | None = None) -> None:
+        """Persist a job transition, or compact everything when job_id is None.
+
+        A transition appends the job's state to the journal and re-evaluates
+        only the comparison gate that job belongs to; the full checkpoint is
+        rewritten every ``journal_compact_every`` transitions.
+        """
+
+        self.checkpoint["updated_at"] = utc_now()
+        if job_id is None:
+            self._compact()
+            return
+        state = self.checkpoint["jobs"][job_id]
+        if state.get("status") in TERMINAL_JOB_STATUSES:
+            self.open_job_ids.discard(job_id)
+        else:
+            self.open_job_ids.add(job_id)
+        comparison_id = self.job_comparisons.get(job_id)
+        if comparison_id:
+            self._refresh_comparison_gate(comparison_id)
+        self.checkpoint["status"] = (
+            "running"
+            if self.open_job_ids or not self.checkpoint["jobs"]
+            else "completed"
+        )
+        self.journal_sequence += 1
+        self.journal_pending += 1
+        self.checkpoint["journal_sequence"] = self.journal_sequence
+        if (
+            not self.checkpoint_path.exists()
+            or self.journal_pending >= self.journal_compact_every
+        ):
+            self._compact()
+            return
+        record = journal_record(
+            registry_hash=self.registry_hash,
+            run_id=self.checkpoint.get("run_id"),
+            sequence=self.journal_sequence,
+            job_id=job_id,
+            state=state,
+            recorded_at=self.checkpoint["updated_at"],
+        )
+        with self.journal_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
 
     def _wait_for_xmage_recovery(self, previous_process_id: str) -> bool:
         deadline = time.monotonic() + self.recovery_timeout
@@ -1587,11 +1999,11 @@ class BattleQueueRunner:
         if not isinstance(attempts, list):
             raise ValueError(f"checkpoint attempts must be a list for job {job_id!r}")
         state["status"] = "running"
-        self._save()
+        self._save(job_id)
 
         comparison_id = str(job.get("comparison_id") or "").strip()
         comparison_contract = (
-            comparison_preflight(self.registry, comparison_id)
+            self.comparison_preflights[comparison_id]
             if comparison_id
             else {}
         )
@@ -1622,7 +2034,7 @@ class BattleQueueRunner:
                 )
                 state["status"] = "failed"
                 state["error"] = str(error)
-                self._save()
+                self._save(job_id)
                 return state
             elapsed_ms = round((time.monotonic() - started) * 1000)
             attempt = {
@@ -1630,6 +2042,7 @@ class BattleQueueRunner:
                 "engine": engine,
                 "http_status": response.status,
                 "elapsed_ms": elapsed_ms,
+                **({"transport_timing": response.timing} if response.timing else {}),
                 "error": response.body.get("error"),
                 "request_schema_version": REQUEST_SCHEMA,
                 "request_id": engine_request["request_id"],
@@ -1672,7 +2085,7 @@ class BattleQueueRunner:
                         "completed_at": utc_now(),
                     }
                 )
-                self._save()
+                self._save(job_id)
                 return state
             if response.status == 200:
                 result_path = self.result_dir / f"{_safe_job_id(job_id)}.json.gz"
@@ -1756,7 +2169,7 @@ class BattleQueueRunner:
                             "completed_at": utc_now(),
                         }
                     )
-                    self._save()
+                    self._save(job_id)
                     return state
                 state.update(
                     {
@@ -1784,7 +2197,7 @@ class BattleQueueRunner:
                     }
                 )
                 attempt["status"] = "completed"
-                self._save()
+                self._save(job_id)
                 return state
             if (
                 engine == "xmage"
@@ -1800,13 +2213,13 @@ class BattleQueueRunner:
                     attempt["status"] = "invalid_fallback_contract"
                     state["status"] = "failed"
                     state["error"] = "xmage_coverage_response_not_fallback_eligible"
-                    self._save()
+                    self._save(job_id)
                     return state
                 engine = "forge"
                 attempt["next_engine"] = "forge"
                 attempt["status"] = "coverage_incomplete"
                 attempt["fallback_reason"] = "xmage_coverage_incomplete"
-                self._save()
+                self._save(job_id)
                 continue
             if response.status == 504:
                 attempt["status"] = "timeout"
@@ -1814,7 +2227,7 @@ class BattleQueueRunner:
                     if response.body.get("restart_required") is not True:
                         state["status"] = "timeout"
                         state["error"] = "xmage_timeout_restart_not_declared"
-                        self._save()
+                        self._save(job_id)
                         return state
                     previous = str(response.body.get("sidecar_process_id") or "")
                     recovered = bool(previous) and self._wait_for_xmage_recovery(previous)
@@ -1822,9 +2235,9 @@ class BattleQueueRunner:
                     if not recovered:
                         state["status"] = "timeout"
                         state["error"] = "xmage_recovery_not_observed"
-                        self._save()
+                        self._save(job_id)
                         return state
-                self._save()
+                self._save(job_id)
                 continue
             if response.status == 422:
                 state["status"] = "coverage_incomplete"
@@ -1832,14 +2245,14 @@ class BattleQueueRunner:
             else:
                 state["status"] = "failed"
             state["error"] = response.body.get("message") or response.body.get("error")
-            self._save()
+            self._save(job_id)
             return state
 
         state["status"] = "timeout" if any(
             attempt.get("http_status") == 504 for attempt in state["attempts"]
         ) else "failed"
         state["error"] = "maximum_attempts_exhausted"
-        self._save()
+        self._save(job_id)
         return state
 
     def run(self, *, max_jobs: int = 0) -> dict[str, Any]:
@@ -1877,6 +2290,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--recovery-timeout-seconds", type=float, default=180.0)
     parser.add_argument("--max-attempts", type=int, default=3)
     parser.add_argument("--max-jobs", type=int, default=0)
+    parser.add_argument(
+        "--journal-compact-every",
+        type=int,
+        default=DEFAULT_JOURNAL_COMPACT_EVERY,
+        help="job transitions appended to the checkpoint journal between full rewrites",
+    )
     return parser.parse_args()
 
 
@@ -1891,6 +2310,7 @@ def main() -> int:
         request_timeout=args.request_timeout_seconds,
         recovery_timeout=args.recovery_timeout_seconds,
         max_attempts=args.max_attempts,
+        journal_compact_every=args.journal_compact_every,
     )
     checkpoint = runner.run(max_jobs=max(0, args.max_jobs))
     print(
@@ -11,12 +11,13 @@ Uso:
   python3 knowledge_db.py --stats
 """
 
-import sqlite3
 import json
 import sys
 import os
 from datetime import datetime, timezone
 
+from knowledge_db_access import connect_knowledge_db, ensure_hot_query_indexes
+
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'knowledge.db')
 
 SCHEMA = """
@@ -280,9 +281,7 @@ def functional_tags_json_for_card(card):
 
 
 def get_conn():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = connect_knowledge_db(DB_PATH, profile="batch")
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
@@ -301,6 +300,7 @@ def cmd_create():
     conn = get_conn()
     conn.executescript(SCHEMA)
     ensure_schema_migrations(conn)
+    ensure_hot_query_indexes(conn)
     conn.commit()
     conn.close()
     tables = ["commanders", "sources", "decks", "deck_cards", "card_tags", "card_analyses",
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""Shared connection profiles and hot-query indexes for Hermes ``knowledge.db``.
+
+Battle runtime, optimizer crons and sidecars read the same SQLite file while
+sync jobs write to it. The hot openers (battle runtime, rule registry, native
+battle sidecar and the PG sync writers) go through ``connect_knowledge_db``
+with a workload profile:
+
+- ``runtime``: read-only, large page cache and mmap for simulations.
+- ``sidecar``: read-only with a smaller footprint for long-lived services.
+- ``batch``: read-write WAL with ``synchronous=NORMAL`` for cron writers.
+
+Writers keep the file in WAL mode, so readers never block them, and every
+profile waits on ``busy_timeout`` instead of failing with "database is
+locked". The hot-query index set is owned here; ``check_query_plans`` is the
+``EXPLAIN QUERY PLAN`` regression check for the queries it serves:
+
+    python3 knowledge_db_access.py --ensure-indexes --check-plans
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+KNOWLEDGE_DB_ENV = "MANALOOM_KNOWLEDGE_DB"
+
+LEARNED_OPPONENT_SELECTION_SQL = """
+    SELECT *
+    FROM learned_decks
+    WHERE COALESCE(commander, '') != ''
+      AND commander NOT LIKE '%Lorehold%'
+      AND COALESCE(card_list, '') != ''
+      AND length(card_list) >= 500
+      AND COALESCE(card_count, 0) >= ?
+    ORDER BY
+      CASE WHEN source = 'pg_meta_decks' THEN 0 ELSE 1 END,
+      COALESCE(card_count, 0) DESC,
+      id DESC
+    LIMIT ?
+"""
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    read_only: bool
+    busy_timeout_ms: int
+    cache_size_kib: int
+    mmap_size: int
+    synchronous: str = "NORMAL"
+    temp_store: str = "MEMORY"
+
+
+PROFILES = {
+    "runtime": ConnectionProfile(
+        read_only=True,
+        busy_timeout_ms=5_000,
+        cache_size_kib=65_536,
+        mmap_size=268_435_456,
+    ),
+    "sidecar": ConnectionProfile(
+        read_only=True,
+        busy_timeout_ms=2_000,
+        cache_size_kib=16_384,
+        mmap_size=67_108_864,
+    ),
+    "batch": ConnectionProfile(
+        read_only=False,
+        busy_timeout_ms=30_000,
+        cache_size_kib=131_072,
+        mmap_size=268_435_456,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class HotIndex:
+    name: str
+    table: str
+    columns: tuple[str, ...]
+    ddl: str
+    # Skip when another index already starts with this column, e.g. the
+    # UNIQUE(deck_id, card_name) autoindex or a TEXT primary key.
+    leading_column: str | None = None
+
+
+HOT_INDEXES = (
+    HotIndex(
+        name="idx_learned_decks_opponent_order",
+        table="learned_decks",
+        columns=("source", "card_count", "id"),
+        ddl="""
+            CREATE INDEX IF NOT EXISTS idx_learned_decks_opponent_order
+            ON learned_decks (
+              (CASE WHEN source = 'pg_meta_decks' THEN 0 ELSE 1 END),
+              COALESCE(card_count, 0) DESC,
+              id DESC
+            )
+        """,
+    ),
+    HotIndex(
+        name="idx_card_oracle_cache_normalized_name",
+        table="card_oracle_cache",
+        columns=("normalized_name",),
+        ddl="""
+            CREATE INDEX IF NOT EXISTS idx_card_oracle_cache_normalized_name
+            ON card_oracle_cache (normalized_name)
+        """,
+        leading_column="normalized_name",
+    ),
+    HotIndex(
+        name="idx_deck_cards_deck_id",
+        table="deck_cards",
+        columns=("deck_id",),
+        ddl="CREATE INDEX IF NOT EXISTS idx_deck_cards_deck_id ON deck_cards (deck_id)",
+        leading_column="deck_id",
+    ),
+    HotIndex(
+        name="idx_deck_cards_normalized_card_name",
+        table="deck_cards",
+        columns=("card_name",),
+        ddl="""
+            CREATE INDEX IF NOT EXISTS idx_deck_cards_normalized_card_name
+            ON deck_cards (lower(trim(card_name)))
+        """,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    table: str
+    sql: str
+    params: tuple[Any, ...]
+    expected_index: str | None = None
+
+
+HOT_QUERIES = (
+    HotQuery(
+        name="learned_decks_opponent_selection",
+        table="learned_decks",
+        sql=LEARNED_OPPONENT_SELECTION_SQL,
+        params=(80, 96),
+        expected_index="idx_learned_decks_opponent_order",
+    ),
+    HotQuery(
+        name="card_oracle_cache_by_normalized_name",
+        table="card_oracle_cache",
+        sql="SELECT * FROM card_oracle_cache WHERE normalized_name IN (?, ?)",
+        params=("sol ring", "arcane signet"),
+    ),
+    HotQuery(
+        name="deck_cards_by_deck_id",
+        table="deck_cards",
+        sql="SELECT * FROM deck_cards WHERE deck_id=?",
+        params=(6,),
+    ),
+    HotQuery(
+        name="deck_cards_by_normalized_card_name",
+        table="deck_cards",
+        sql="SELECT deck_id FROM deck_cards WHERE lower(trim(card_name)) IN (?, ?)",
+        params=("sol ring", "arcane signet"),
+        expected_index="idx_deck_cards_normalized_card_name",
+    ),
+)
+
+
+def default_knowledge_db() -> Path:
+    return Path(os.environ.get(KNOWLEDGE_DB_ENV) or SCRIPT_DIR / "knowledge.db")
+
+
+def connect_knowledge_db(
+    path: str | Path | None = None,
+    *,
+    profile: str = "runtime",
+    row_factory: Any = sqlite3.Row,
+) -> sqlite3.Connection:
+    """Open ``knowledge.db`` tuned for ``profile``.
+
+    Read-only profiles open the file with ``mode=ro`` and ``query_only``, so a
+    missing database raises instead of being created empty.
+    """
+
+    settings = PROFILES[profile]
+    db_path = Path(path) if path is not None else default_knowledge_db()
+    in_memory = str(db_path) == ":memory:"
+    if settings.read_only and not in_memory:
+        conn = sqlite3.connect(
+            f"{db_path.expanduser().resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=settings.busy_timeout_ms / 1000,
+        )
+    else:
+        conn = sqlite3.connect(db_path, timeout=settings.busy_timeout_ms / 1000)
+    conn.row_factory = row_factory
+    conn.execute(f"PRAGMA busy_timeout={settings.busy_timeout_ms}")
+    conn.execute(f"PRAGMA cache_size=-{settings.cache_size_kib}")
+    conn.execute(f"PRAGMA mmap_size={settings.mmap_size}")
+    conn.execute(f"PRAGMA temp_store={settings.temp_store}")
+    if settings.read_only:
+        conn.execute("PRAGMA query_only=ON")
+    else:
+        if not in_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={settings.synchronous}")
+    return conn
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {str(row[1]) for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _leading_index_columns(conn: sqlite3.Connection, table: str) -> dict[str, str]:
+    leading: dict[str, str] = {}
+    for index_row in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        index_name = str(index_row[1])
+        columns = conn.execute(f"PRAGMA index_info({index_name})").fetchall()
+        if columns and columns[0][2] is not None:
+            leading.setdefault(str(columns[0][2]), index_name)
+    return leading
+
+
+def ensure_hot_query_indexes(
+    conn: sqlite3.Connection,
+    *,
+    tables: tuple[str, ...] | None = None,
+) -> list[str]:
+    """Create the hot-query indexes whose tables and columns exist.
+
+    Returns the names of indexes present afterwards. The caller commits.
+    """
+
+    present: list[str] = []
+    for index in HOT_INDEXES:
+        if tables is not None and index.table not in tables:
+            continue
+        columns = _table_columns(conn, index.table)
+        if not columns or not set(index.columns).issubset(columns):
+            continue
+        if index.leading_column is not None:
+            existing = _leading_index_columns(conn, index.table).get(index.leading_column)
+            if existing is not None and existing != index.name:
+                present.append(existing)
+                continue
+        conn.execute(index.ddl)
+        present.append(index.name)
+    return present
+
+
+def check_query_plans(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """``EXPLAIN QUERY PLAN`` every hot query whose table exists.
+
+    A plan regresses when it scans the table without an index, sorts through
+    a temp B-tree, or skips its expected index.
+    """
+
+    results: list[dict[str, Any]] = []
+    for query in HOT_QUERIES:
+        if not _table_columns(conn, query.table):
+            continue
+        details = [
+            str(row[3])
+            for row in conn.execute(f"EXPLAIN QUERY PLAN {query.sql}", query.params)
+        ]
+        full_scan = re.compile(rf"\bSCAN (TABLE )?{re.escape(query.table)}\b(?!.*\bUSING\b)")
+        problems = [detail for detail in details if full_scan.search(detail)]
+        problems.extend(detail for detail in details if "USE TEMP B-TREE" in detail)
+        if query.expected_index and not any(query.expected_index in detail for detail in details):
+            problems.append(f"expected index {query.expected_index} unused")
+        results.append(
+            {"query": query.name, "ok": not problems, "plan": details, "problems": problems}
+        )
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sqlite-db", type=Path, default=default_knowledge_db())
+    parser.add_argument("--ensure-indexes", action="store_true")
+    parser.add_argument("--check-plans", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    report: dict[str, Any] = {"sqlite_db": str(args.sqlite_db)}
+    conn = connect_knowledge_db(args.sqlite_db, profile="batch")
+    try:
+        if args.ensure_indexes:
+            report["indexes"] = ensure_hot_query_indexes(conn)
+            conn.execute("ANALYZE")
+            conn.commit()
+        if args.check_plans:
+            report["plans"] = check_query_plans(conn)
+    finally:
+        conn.close()
+    print(json.dumps(report, indent=2, ensure_ascii=True))
+    return 1 if any(not plan["ok"] for plan in report.get("plans", [])) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
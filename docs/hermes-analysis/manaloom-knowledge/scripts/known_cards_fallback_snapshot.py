@@ -4,12 +4,24 @@
 These snapshots are generated from canonical `battle_card_rules` rows so the
 runtime can degrade to a source-backed JSON snapshot instead of the older,
 weaker `known_cards_generated.json`.
+
+The JSON stays the reviewable source of truth. Next to it we keep a compact
+binary index (`<snapshot>.idx`): a sorted offset table keyed by normalized
+card name plus one zlib-compressed JSON record per card. The runtime
+memory-maps it and decodes a card only when it is first looked up, so start-up
+and RSS no longer scale with the whole snapshot.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
 import os
+import struct
+import zlib
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -85,6 +97,220 @@ def load_snapshot_file(path: str | Path) -> dict[str, dict[str, Any]]:
     }
 
 
+SNAPSHOT_INDEX_MAGIC = b"MLKCIDX1"
+SNAPSHOT_INDEX_SUFFIX = ".idx"
+_INDEX_HEADER = struct.Struct("!8sI")
+# key blob offset, normalized-name length, card-name length, record offset, record length
+_INDEX_ENTRY = struct.Struct("!IHHII")
+
+
+def snapshot_index_path(path: str | Path) -> Path:
+    return Path(path).with_suffix(SNAPSHOT_INDEX_SUFFIX)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_snapshot_index(
+    index_path: str | Path,
+    payload: dict[str, dict[str, Any]],
+    *,
+    source_path: str | Path,
+) -> int:
+    """Write the lazy-load index for `payload`, the decoded `source_path` JSON."""
+    source = Path(source_path)
+    stat = source.stat()
+    entries = sorted(
+        (normalize_card_name(name).encode("utf-8"), name.encode("utf-8"), name)
+        for name in payload
+    )
+    meta = json.dumps(
+        {
+            "count": len(entries),
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_sha256": _file_sha256(source),
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    keys_offset = _INDEX_HEADER.size + len(meta) + _INDEX_ENTRY.size * len(entries)
+    records_offset = keys_offset + sum(len(key) + len(raw) for key, raw, _name in entries)
+    table = bytearray()
+    keys = bytearray()
+    records = bytearray()
+    for key, raw_name, name in entries:
+        record = zlib.compress(
+            json.dumps(payload[name], ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+        )
+        table += _INDEX_ENTRY.pack(
+            keys_offset + len(keys),
+            len(key),
+            len(raw_name),
+            records_offset + len(records),
+            len(record),
+        )
+        keys += key + raw_name
+        records += record
+
+    target = Path(index_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(_INDEX_HEADER.pack(SNAPSHOT_INDEX_MAGIC, len(meta)))
+            handle.write(meta)
+            handle.write(table)
+            handle.write(keys)
+            handle.write(records)
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return len(entries)
+
+
+class IndexedSnapshot(Mapping):
+    """Read-only, memory-mapped view of a snapshot index.
+
+    Membership only touches the offset table; an entry is decoded on first
+    access and cached.
+    """
+
+    def __init__(self, index_path: str | Path) -> None:
+        self.path = Path(index_path)
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, meta_len = _INDEX_HEADER.unpack_from(self._mmap, 0)
+            if magic != SNAPSHOT_INDEX_MAGIC:
+                raise ValueError(f"not a known-cards snapshot index: {self.path}")
+            self.meta = json.loads(
+                self._mmap[_INDEX_HEADER.size:_INDEX_HEADER.size + meta_len].decode("utf-8")
+            )
+        except Exception:
+            self._mmap.close()
+            raise
+        self._table_offset = _INDEX_HEADER.size + meta_len
+        self._count = int(self.meta["count"])
+        self._decoded: dict[str, dict[str, Any]] = {}
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def matches_source(self, source_path: str | Path) -> bool:
+        source = Path(source_path)
+        try:
+            stat = source.stat()
+        except OSError:
+            return False
+        if stat.st_size != self.meta.get("source_size"):
+            return False
+        if stat.st_mtime_ns == self.meta.get("source_mtime_ns"):
+            return True
+        if _file_sha256(source) != self.meta.get("source_sha256"):
+            return False
+        self._record_source_mtime(stat.st_mtime_ns)
+        return True
+
+    def _record_source_mtime(self, mtime_ns: int) -> None:
+        """Best-effort: store a touched-but-unchanged source's mtime so later
+        opens take the stat fast path instead of hashing again."""
+        _magic, meta_len = _INDEX_HEADER.unpack_from(self._mmap, 0)
+        meta = json.dumps({**self.meta, "source_mtime_ns": mtime_ns}, sort_keys=True).encode("utf-8")
+        if len(meta) > meta_len:
+            return
+        data = bytearray(self._mmap)
+        # Trailing spaces keep the header length, so record offsets stay valid.
+        data[_INDEX_HEADER.size:_INDEX_HEADER.size + meta_len] = meta.ljust(meta_len)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.meta["source_mtime_ns"] = mtime_ns
+
+    def _entry(self, position: int) -> tuple[int, int, int, int, int]:
+        return _INDEX_ENTRY.unpack_from(self._mmap, self._table_offset + position * _INDEX_ENTRY.size)
+
+    def _key(self, position: int) -> bytes:
+        key_offset, key_len, _name_len, _record_offset, _record_len = self._entry(position)
+        return self._mmap[key_offset:key_offset + key_len]
+
+    def _name(self, position: int) -> str:
+        key_offset, key_len, name_len, _record_offset, _record_len = self._entry(position)
+        start = key_offset + key_len
+        return self._mmap[start:start + name_len].decode("utf-8")
+
+    def _find(self, card_name: object) -> int:
+        if not isinstance(card_name, str):
+            return -1
+        key = normalize_card_name(card_name).encode("utf-8")
+        position = bisect_left(range(self._count), key, key=self._key)
+        while position < self._count and self._key(position) == key:
+            if self._name(position) == card_name:
+                return position
+            position += 1
+        return -1
+
+    def __contains__(self, card_name: object) -> bool:
+        return card_name in self._decoded or self._find(card_name) >= 0
+
+    def __getitem__(self, card_name: str) -> dict[str, Any]:
+        cached = self._decoded.get(card_name)
+        if cached is not None:
+            return cached
+        position = self._find(card_name)
+        if position < 0:
+            raise KeyError(card_name)
+        _key_offset, _key_len, _name_len, record_offset, record_len = self._entry(position)
+        entry = json.loads(
+            zlib.decompress(self._mmap[record_offset:record_offset + record_len]).decode("utf-8")
+        )
+        self._decoded[card_name] = entry
+        return entry
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._name(position)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def open_snapshot_file(path: str | Path) -> Mapping[str, dict[str, Any]]:
+    """Lazy view of a snapshot JSON, served from its index when fresh.
+
+    A missing or stale index is rebuilt from the JSON when the directory is
+    writable; this call then returns the fully decoded payload.
+    """
+    snapshot_path = Path(path)
+    if not snapshot_path.exists():
+        return {}
+    index_path = snapshot_index_path(snapshot_path)
+    try:
+        index = IndexedSnapshot(index_path)
+    except (OSError, ValueError, KeyError, struct.error):
+        index = None
+    if index is not None:
+        if index.matches_source(snapshot_path):
+            return index
+        index.close()
+    payload = load_snapshot_file(snapshot_path)
+    if payload:
+        try:
+            write_snapshot_index(index_path, payload, source_path=snapshot_path)
+        except OSError:
+            pass
+    return payload
+
+
 def load_layered_known_cards(
     *,
     canonical_path: str | Path | None = None,
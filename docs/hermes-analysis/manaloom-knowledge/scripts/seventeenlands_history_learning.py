@@ -11,12 +11,15 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import sys
 from collections import Counter, defaultdict
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
+import seventeenlands_replay_columns as replay_columns
 import seventeenlands_replay_profile as profile
 
 
@@ -348,8 +351,12 @@ def learn_rows(
     top_card_limit: int,
     top_sequence_limit: int,
     turn_prefix_limit: int,
+    columnar: bool = False,
+    columns_cache_dir: Path | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     rows_processed = 0
+    columns_info: dict[str, Any] | None = None
     outcomes: Counter[str] = Counter()
     turn_count_distribution: Counter[str] = Counter()
     turn_metrics: dict[str, Counter[str]] = defaultdict(empty_turn_counter)
@@ -357,15 +364,28 @@ def learn_rows(
     game_sequence_counts: Counter[str] = Counter()
     card_counters: dict[str, Counter[str]] = defaultdict(Counter)
 
-    with profile.open_text_source(source) as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
-            raise ValueError("CSV source has no header")
-        fieldnames = list(reader.fieldnames)
-        turn_fieldnames = sorted_turn_fieldnames(fieldnames)
+    with ExitStack() as stack:
+        rows: Iterable[dict[str, str]]
+        if columnar:
+            columns, columns_info = replay_columns.load_replay_columns(
+                source,
+                cache_dir=columns_cache_dir,
+                workers=workers,
+            )
+            fieldnames = columns.fieldnames
+            rows = columns.iter_rows(max_rows)
+        else:
+            reader = csv.DictReader(stack.enter_context(profile.open_text_source(source)))
+            if reader.fieldnames is None:
+                raise ValueError("CSV source has no header")
+            fieldnames = list(reader.fieldnames)
+            rows = reader
+        turn_columns = [
+            (name, profile.turn_column_parts(name)) for name in sorted_turn_fieldnames(fieldnames)
+        ]
         header = profile.classify_header(fieldnames)
 
-        for row_index, row in enumerate(reader):
+        for row_index, row in enumerate(rows):
             if max_rows > 0 and row_index >= max_rows:
                 break
             row = {key: value for key, value in row.items() if key is not None}
@@ -387,14 +407,10 @@ def learn_rows(
                         turn=0,
                     )
 
-            for name in turn_fieldnames:
+            for name, (active_side, turn, suffix) in turn_columns:
                 raw = row.get(name)
                 if raw is None or str(raw).strip() == "":
                     continue
-                parts = profile.turn_column_parts(name)
-                if parts is None:
-                    continue
-                active_side, turn, suffix = parts
                 if not profile.turn_reached(row, turn) or not profile.is_meaningful_turn_value(suffix, raw):
                     continue
                 turn_bucket = turn_metrics[str(turn)]
@@ -434,7 +450,7 @@ def learn_rows(
                 game_sequence_counts[" | ".join(sequence_parts)] += 1
 
     card_lifecycle = finalize_cards(card_counters, top_card_limit)
-    report = {
+    report: dict[str, Any] = {
         "card_lifecycle": card_lifecycle,
         "generated_at": utc_now(),
         "header": header,
@@ -478,6 +494,8 @@ def learn_rows(
             "turn_prefix_limit": turn_prefix_limit,
         },
     }
+    if columns_info is not None:
+        report["columnar_cache"] = columns_info
     return report
 
 
@@ -535,6 +553,13 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="0 means stream the whole source.",
     )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Read games through the cached columnar view of the source.",
+    )
+    parser.add_argument("--columns-cache-dir", type=Path)
+    parser.add_argument("--workers", type=int, default=min(8, os.cpu_count() or 1))
     parser.add_argument("--top-card-limit", type=int, default=40)
     parser.add_argument("--top-sequence-limit", type=int, default=40)
     parser.add_argument("--turn-prefix-limit", type=int, default=6)
@@ -554,6 +579,9 @@ def main(argv: list[str] | None = None) -> int:
         top_card_limit=args.top_card_limit,
         top_sequence_limit=args.top_sequence_limit,
         turn_prefix_limit=args.turn_prefix_limit,
+        columnar=args.columnar,
+        columns_cache_dir=args.columns_cache_dir,
+        workers=args.workers,
     )
     if args.output_json:
         args.output_json.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""Columnar, cached view of a 17Lands replay_data file.
+
+The CSV is decompressed once and parsed in row chunks across worker
+processes. Turn columns are stored sparsely as typed arrays (game index plus
+float values or Arena ID lists), base columns as text. A local source is
+persisted per content sha256, so full-file analyses re-read typed arrays
+instead of re-parsing thousands of CSV columns per game. Read-only evidence;
+nothing here writes PostgreSQL or Hermes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator
+
+import seventeenlands_replay_profile as profile
+
+
+SCHEMA_VERSION = "manaloom_17lands_replay_columns_v1"
+CACHE_DIR_ENV = "MANALOOM_17LANDS_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "manaloom" / "17lands"
+CHUNK_ROWS = 2000
+ROW_BLOCK_GAMES = 4096
+COLUMN_WORKERS = min(8, os.cpu_count() or 1)
+
+_WORKER_FIELDNAMES: list[str] = []
+
+
+class ReplayColumns:
+    """Base columns as text, turn columns as sparse typed arrays."""
+
+    def __init__(
+        self,
+        *,
+        fieldnames: list[str],
+        games: int,
+        text: dict[str, list[str]],
+        scalars: dict[str, tuple[array, array]],
+        ids: dict[str, tuple[array, array, array]],
+        raw: dict[str, tuple[array, list[str]]],
+    ) -> None:
+        self.fieldnames = fieldnames
+        self.games = games
+        self.text = text
+        self.scalars = scalars
+        self.ids = ids
+        self.raw = raw
+
+    def cell(self, name: str, game: int) -> str | None:
+        """The CSV cell as the analyses expect it, or None when empty."""
+
+        if name in self.text:
+            return self.text[name][game]
+        for rendered in self._render_slice(name, game, game + 1):
+            return rendered[1]
+        return None
+
+    def iter_rows(self, limit: int = 0) -> Iterator[dict[str, str]]:
+        """Yield sparse per-game rows in file order, in ``fieldnames`` key order."""
+
+        total = min(self.games, limit) if limit > 0 else self.games
+        for low in range(0, total, ROW_BLOCK_GAMES):
+            high = min(total, low + ROW_BLOCK_GAMES)
+            rows: list[dict[str, str]] = [{} for _ in range(high - low)]
+            for name in self.fieldnames:
+                values = self.text.get(name)
+                if values is not None:
+                    for offset, row in enumerate(rows):
+                        row[name] = values[low + offset]
+                    continue
+                for game, rendered in self._render_slice(name, low, high):
+                    rows[game - low][name] = rendered
+            yield from rows
+
+    def _render_slice(self, name: str, low: int, high: int) -> Iterator[tuple[int, str]]:
+        if name in self.scalars:
+            games, values = self.scalars[name]
+            for index in range(bisect_left(games, low), bisect_left(games, high)):
+                yield games[index], repr(values[index])
+        elif name in self.ids:
+            games, ends, values = self.ids[name]
+            for index in range(bisect_left(games, low), bisect_left(games, high)):
+                start = ends[index - 1] if index else 0
+                yield games[index], "|".join(str(value) for value in values[start : ends[index]])
+        elif name in self.raw:
+            games, texts = self.raw[name]
+            for index in range(bisect_left(games, low), bisect_left(games, high)):
+                yield games[index], texts[index]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "games": self.games,
+            "field_count": len(self.fieldnames),
+            "text_columns": len(self.text),
+            "scalar_columns": len(self.scalars),
+            "id_list_columns": len(self.ids),
+            "raw_turn_columns": len(self.raw),
+        }
+
+
+def _column_kind(name: str) -> str:
+    parts = profile.turn_column_parts(name)
+    if parts is None:
+        return "text"
+    suffix = parts[2]
+    if suffix in profile.ID_LIST_SUFFIXES or suffix in profile.EOT_LIST_SUFFIXES:
+        return "ids"
+    return "scalar"
+
+
+def _init_worker(fieldnames: list[str]) -> None:
+    _WORKER_FIELDNAMES[:] = fieldnames
+
+
+def _parse_chunk(lines: list[str], fieldnames: list[str] | None = None) -> tuple[int, dict[str, Any]]:
+    """Parse CSV records into per-column partials with chunk-local game indices."""
+
+    names = fieldnames if fieldnames is not None else _WORKER_FIELDNAMES
+    kinds = [_column_kind(name) for name in names]
+    columns: dict[str, Any] = {}
+    for name, kind in zip(names, kinds):
+        if kind == "text":
+            columns[name] = ("text", [])
+        elif kind == "scalar":
+            columns[name] = ("scalar", array("I"), array("d"))
+        else:
+            columns[name] = ("ids", array("I"), array("Q"), array("q"), [])
+    games = 0
+    for game, record in enumerate(csv.reader(lines)):
+        games += 1
+        for index, name in enumerate(names):
+            raw = record[index] if index < len(record) else ""
+            column = columns[name]
+            kind = column[0]
+            if kind == "text":
+                column[1].append(raw)
+                continue
+            if not raw.strip():
+                continue
+            if kind == "scalar":
+                value = profile.parse_float(raw)
+                if value is not None:
+                    column[1].append(game)
+                    column[2].append(value)
+                continue
+            tokens = profile.split_id_list(raw)
+            if not tokens:
+                continue
+            _, id_games, ends, values, texts = column
+            if texts or not all(token.isdigit() for token in tokens):
+                texts.append((game, raw))
+                continue
+            id_games.append(game)
+            values.extend(int(token) for token in tokens)
+            ends.append(len(values))
+    return games, columns
+
+
+class _ColumnBuilder:
+    def __init__(self, fieldnames: list[str]) -> None:
+        self.fieldnames = fieldnames
+        self.games = 0
+        self.text: dict[str, list[str]] = {}
+        self.scalars: dict[str, tuple[array, array]] = {}
+        self.ids: dict[str, tuple[array, array, array]] = {}
+        self.raw: dict[str, tuple[array, list[str]]] = {}
+
+    def merge(self, games: int, columns: dict[str, Any]) -> None:
+        base = self.games
+        for name, column in columns.items():
+            kind = column[0]
+            if kind == "text":
+                self.text.setdefault(name, []).extend(column[1])
+            elif kind == "scalar":
+                target_games, target_values = self.scalars.setdefault(name, (array("I"), array("d")))
+                target_games.extend(base + game for game in column[1])
+                target_values.extend(column[2])
+            else:
+                self._merge_ids(name, base, column)
+        self.games += games
+
+    def _merge_ids(self, name: str, base: int, column: tuple[Any, ...]) -> None:
+        _, games, ends, values, texts = column
+        if texts or name in self.raw:
+            # A non-numeric token anywhere demotes the column to raw text cells.
+            target_games, target_texts = self.raw.setdefault(name, (array("I"), []))
+            if name in self.ids:
+                old_games, old_ends, old_values = self.ids.pop(name)
+                target_games.extend(old_games)
+                target_texts.extend(_render_ids(old_ends, old_values))
+            pending = sorted(
+                [(game, text) for game, text in zip(games, _render_ids(ends, values))] + texts
+            )
+            target_games.extend(base + game for game, _text in pending)
+            target_texts.extend(text for _game, text in pending)
+            return
+        target_games, target_ends, target_values = self.ids.setdefault(name, (array("I"), array("Q"), array("q")))
+        offset = len(target_values)
+        target_games.extend(base + game for game in games)
+        target_ends.extend(offset + end for end in ends)
+        target_values.extend(values)
+
+    def build(self) -> ReplayColumns:
+        return ReplayColumns(
+            fieldnames=self.fieldnames,
+            games=self.games,
+            text=self.text,
+            scalars=self.scalars,
+            ids=self.ids,
+            raw=self.raw,
+        )
+
+
+def _render_ids(ends: array, values: array) -> list[str]:
+    rendered: list[str] = []
+    start = 0
+    for end in ends:
+        rendered.append("|".join(str(value) for value in values[start:end]))
+        start = end
+    return rendered
+
+
+def _record_chunks(handle: Any, chunk_rows: int) -> Iterator[list[str]]:
+    """Group physical lines into whole CSV records, ``chunk_rows`` at a time."""
+
+    chunk: list[str] = []
+    records = 0
+    open_quotes = 0
+    for line in handle:
+        chunk.append(line)
+        open_quotes += line.count('"')
+        if open_quotes % 2:
+            continue
+        open_quotes = 0
+        records += 1
+        if records >= chunk_rows:
+            yield chunk
+            chunk = []
+            records = 0
+    if chunk:
+        yield chunk
+
+
+def build_columns(source: str, *, workers: int = COLUMN_WORKERS, chunk_rows: int = CHUNK_ROWS) -> ReplayColumns:
+    with profile.open_text_source(source) as handle:
+        header = next(csv.reader([handle.readline()]), None)
+        if not header:
+            raise ValueError("CSV source has no header")
+        builder = _ColumnBuilder(list(header))
+        chunks = _record_chunks(handle, chunk_rows)
+        if workers <= 1:
+            for chunk in chunks:
+                builder.merge(*_parse_chunk(chunk, builder.fieldnames))
+            return builder.build()
+        in_flight: deque[Future[tuple[int, dict[str, Any]]]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(builder.fieldnames,),
+        ) as executor:
+            for chunk in chunks:
+                in_flight.append(executor.submit(_parse_chunk, chunk))
+                if len(in_flight) >= workers * 2:
+                    builder.merge(*in_flight.popleft().result())
+            while in_flight:
+                builder.merge(*in_flight.popleft().result())
+    return builder.build()
+
+
+def profile_columns(
+    columns: ReplayColumns,
+    *,
+    source: str,
+    source_label: str,
+    top_card_metric_limit: int = 25,
+) -> dict[str, Any]:
+    """Replay profile of every game, aggregated one typed column at a time.
+
+    Produces the same report as ``profile.profile_rows`` over
+    ``columns.iter_rows()`` without rendering or re-parsing cells; only the
+    order of equally ranked cards may differ.
+    """
+
+    games = columns.games
+    counts = profile.ProfileCounts(rows_seen=games, first_game=next(columns.iter_rows(1), {}))
+    empty = [""] * games
+    for name, target in (
+        ("main_colors", counts.colors),
+        ("opp_colors", counts.opp_colors),
+        ("won", counts.outcomes),
+        ("num_turns", counts.turn_count_distribution),
+    ):
+        target.update(value or "(empty)" for value in columns.text.get(name, empty))
+    turn_limits = [
+        None if value is None else int(value)
+        for value in map(profile.parse_float, columns.text.get("num_turns", empty))
+    ]
+
+    for base_column in profile.BASE_ID_LIST_COLUMNS:
+        if base_column not in columns.text:
+            continue
+        arena_ids = Counter(
+            arena_id
+            for value in columns.text[base_column]
+            for arena_id in profile.split_id_list(value)
+        )
+        _fold_arena_ids(counts, arena_ids, base_column=base_column)
+
+    for name in columns.fieldnames:
+        parts = profile.turn_column_parts(name)
+        if parts is None:
+            continue
+        active_side, turn, suffix = parts
+        reached = [limit is None or turn <= limit for limit in turn_limits]
+        if name in columns.scalars:
+            games_index, values = columns.scalars[name]
+            keep_zero = suffix in profile.EOT_SCALAR_SUFFIXES
+            meaningful = [
+                value
+                for game, value in zip(games_index, values)
+                if reached[game] and (keep_zero or value != 0.0)
+            ]
+            if not meaningful:
+                continue
+            counts.nonempty_suffix_counts[suffix] += len(meaningful)
+            if suffix in profile.IMPORTANT_SUFFIXES:
+                profile.add_turn_metric(
+                    counts.turn_metrics, active_side, turn, suffix, id_count=0, values=meaningful
+                )
+        elif name in columns.ids:
+            games_index, ends, values = columns.ids[name]
+            arena_ids: Counter[str] = Counter()
+            cells = 0
+            start = 0
+            for game, end in zip(games_index, ends):
+                if reached[game]:
+                    cells += 1
+                    arena_ids.update(values[start:end])
+                start = end
+            if not cells:
+                continue
+            counts.nonempty_suffix_counts[suffix] += cells
+            _fold_arena_ids(
+                counts,
+                Counter({str(arena_id): count for arena_id, count in arena_ids.items()}),
+                suffix=suffix,
+                turn=turn,
+            )
+            if suffix in profile.IMPORTANT_SUFFIXES:
+                profile.add_turn_metric(
+                    counts.turn_metrics,
+                    active_side,
+                    turn,
+                    suffix,
+                    id_count=sum(arena_ids.values()) if suffix in profile.ID_LIST_SUFFIXES else 0,
+                    values=(),
+                )
+        elif name in columns.raw:
+            games_index, texts = columns.raw[name]
+            for game, raw in zip(games_index, texts):
+                if not reached[game] or not profile.is_meaningful_turn_value(suffix, raw):
+                    continue
+                counts.nonempty_suffix_counts[suffix] += 1
+                _fold_arena_ids(counts, Counter(profile.split_id_list(raw)), suffix=suffix, turn=turn)
+                if suffix in profile.IMPORTANT_SUFFIXES:
+                    profile.update_turn_metric(counts.turn_metrics, active_side, turn, suffix, raw)
+
+    return profile.assemble_profile_report(
+        source=source,
+        source_label=source_label,
+        fieldnames=columns.fieldnames,
+        counts=counts,
+        top_card_metric_limit=top_card_metric_limit,
+    )
+
+
+def _fold_arena_ids(
+    counts: profile.ProfileCounts,
+    arena_ids: Counter[str],
+    *,
+    suffix: str | None = None,
+    base_column: str | None = None,
+    turn: int | None = None,
+) -> None:
+    for arena_id, count in arena_ids.items():
+        counts.arena_id_counts[arena_id] += count
+        profile.update_card_observation(
+            counts.card_observations,
+            arena_id,
+            suffix=suffix,
+            base_column=base_column,
+            turn=turn,
+            count=count,
+        )
+
+
+def source_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_dir_for(cache_dir: Path | None, sha256: str) -> Path:
+    root = cache_dir or Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    return root / f"replay_columns_{sha256}"
+
+
+def write_columns(directory: Path, columns: ReplayColumns, sha256: str) -> None:
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    staging = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    staging.mkdir(parents=True, exist_ok=True)
+    layout: dict[str, dict[str, Any]] = {}
+    offset = 0
+    with (staging / "columns.bin").open("wb") as handle:
+
+        def put(values: array) -> list[Any]:
+            nonlocal offset
+            data = values.tobytes()
+            handle.write(data)
+            span = [values.typecode, offset, len(values)]
+            offset += len(data)
+            return span
+
+        for name, (games, values) in columns.scalars.items():
+            layout[name] = {"kind": "scalar", "games": put(games), "values": put(values)}
+        for name, (games, ends, values) in columns.ids.items():
+            layout[name] = {"kind": "ids", "games": put(games), "ends": put(ends), "values": put(values)}
+        for name, (games, _texts) in columns.raw.items():
+            layout[name] = {"kind": "raw", "games": put(games)}
+    with gzip.open(staging / "text.json.gz", "wt", encoding="utf-8", compresslevel=5) as handle:
+        json.dump(
+            {"text": columns.text, "raw": {name: texts for name, (_games, texts) in columns.raw.items()}},
+            handle,
+            separators=(",", ":"),
+        )
+    (staging / "manifest.json").write_text(
+        json.dumps(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "source_sha256": sha256,
+                "byteorder": sys.byteorder,
+                "games": columns.games,
+                "fieldnames": columns.fieldnames,
+                "layout": layout,
+            },
+            separators=(",", ":"),
+        ),
+        encoding="utf-8",
+    )
+    try:
+        staging.replace(directory)
+    except OSError:
+        for child in staging.iterdir():
+            child.unlink()
+        staging.rmdir()
+        if not directory.exists():
+            raise
+
+
+def read_columns(directory: Path, sha256: str) -> ReplayColumns | None:
+    try:
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        if manifest.get("schema_version") != SCHEMA_VERSION or manifest.get("source_sha256") != sha256:
+            return None
+        data = memoryview((directory / "columns.bin").read_bytes())
+        with gzip.open(directory / "text.json.gz", "rt", encoding="utf-8") as handle:
+            texts = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    swap = manifest.get("byteorder") != sys.byteorder
+
+    def take(span: list[Any]) -> array:
+        typecode, start, count = span
+        values = array(typecode)
+        values.frombytes(data[start : start + count * values.itemsize])
+        if swap:
+            values.byteswap()
+        return values
+
+    scalars: dict[str, tuple[array, array]] = {}
+    ids: dict[str, tuple[array, array, array]] = {}
+    raw: dict[str, tuple[array, list[str]]] = {}
+    for name, entry in manifest["layout"].items():
+        if entry["kind"] == "scalar":
+            scalars[name] = (take(entry["games"]), take(entry["values"]))
+        elif entry["kind"] == "ids":
+            ids[name] = (take(entry["games"]), take(entry["ends"]), take(entry["values"]))
+        else:
+            raw[name] = (take(entry["games"]), texts["raw"][name])
+    return ReplayColumns(
+        fieldnames=manifest["fieldnames"],
+        games=int(manifest["games"]),
+        text=texts["text"],
+        scalars=scalars,
+        ids=ids,
+        raw=raw,
+    )
+
+
+def load_replay_columns(
+    source: str,
+    *,
+    cache_dir: Path | None = None,
+    workers: int = COLUMN_WORKERS,
+) -> tuple[ReplayColumns, dict[str, Any]]:
+    """Return the columnar view of ``source`` and where it came from.
+
+    Local files are keyed by content sha256 and persisted; URL sources are
+    streamed and parsed without persisting, since they cannot be hashed
+    before they are downloaded.
+    """
+
+    if profile.is_url(source):
+        columns = build_columns(source, workers=workers)
+        return columns, {"source": "built_uncached", "source_sha256": None, "cache_path": None}
+    sha256 = source_sha256(Path(source))
+    directory = cache_dir_for(cache_dir, sha256)
+    cached = read_columns(directory, sha256)
+    if cached is not None:
+        return cached, {"source": "cache", "source_sha256": sha256, "cache_path": str(directory)}
+    columns = build_columns(source, workers=workers)
+    info = {"source": "built", "source_sha256": sha256, "cache_path": str(directory)}
+    try:
+        write_columns(directory, columns, sha256)
+    except OSError:
+        info.update(source="built_uncached", cache_path=None)
+    return columns, info
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", default=profile.DEFAULT_REPLAY_URL)
+    parser.add_argument("--cache-dir", type=Path)
+    parser.add_argument("--workers", type=int, default=COLUMN_WORKERS)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    columns, info = load_replay_columns(args.source, cache_dir=args.cache_dir, workers=args.workers)
+    sys.stdout.write(profile.stable_json({**columns.summary(), **info}) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
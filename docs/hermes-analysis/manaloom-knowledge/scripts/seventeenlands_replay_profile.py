@@ -14,14 +14,16 @@ import csv
 import gzip
 import io
 import json
+import os
 import re
 import subprocess
 import sys
 from collections import Counter, defaultdict
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator, TextIO
+from typing import Any, Iterable, Iterator, TextIO
 from urllib.parse import urlparse
 
 
@@ -434,6 +436,28 @@ def update_turn_metric(
     suffix: str,
     raw: str,
 ) -> None:
+    value = parse_float(raw)
+    add_turn_metric(
+        turn_metrics,
+        active_side,
+        turn,
+        suffix,
+        id_count=len(split_id_list(raw)) if suffix in ID_LIST_SUFFIXES else 0,
+        values=() if value is None else (value,),
+    )
+
+
+def add_turn_metric(
+    turn_metrics: dict[str, dict[str, Any]],
+    active_side: str,
+    turn: int,
+    suffix: str,
+    *,
+    id_count: int,
+    values: Iterable[float],
+) -> None:
+    """Fold already-parsed cells of one turn column into the turn bucket."""
+
     bucket = turn_metrics.setdefault(
         str(turn),
         {
@@ -446,26 +470,25 @@ def update_turn_metric(
             "active_mana_spent_sum_positive": 0.0,
         },
     )
-    ids = split_id_list(raw) if suffix in ID_LIST_SUFFIXES else []
     if suffix == "lands_played":
-        bucket["land_play_entries"] += len(ids)
+        bucket["land_play_entries"] += id_count
     elif suffix == "creatures_cast":
-        bucket["creature_cast_entries"] += len(ids)
-        bucket["spell_action_entries"] += len(ids)
+        bucket["creature_cast_entries"] += id_count
+        bucket["spell_action_entries"] += id_count
     elif suffix in {
         "non_creatures_cast",
         "user_instants_sorceries_cast",
         "oppo_instants_sorceries_cast",
     }:
-        bucket["noncreature_cast_entries"] += len(ids)
-        bucket["spell_action_entries"] += len(ids)
+        bucket["noncreature_cast_entries"] += id_count
+        bucket["spell_action_entries"] += id_count
     elif suffix in {"oppo_combat_damage_taken", "user_combat_damage_taken"}:
-        bucket["total_combat_damage"] += parse_float(raw) or 0.0
+        bucket["total_combat_damage"] += sum(values)
     elif suffix == f"{active_side}_mana_spent":
-        value = parse_float(raw)
-        if value is not None and value > 0:
-            bucket["active_mana_spent_sum_positive"] += value
-            bucket["active_mana_spent_positive_observations"] += 1
+        for value in values:
+            if value > 0:
+                bucket["active_mana_spent_sum_positive"] += value
+                bucket["active_mana_spent_positive_observations"] += 1
 
 
 def finalize_turn_metrics(turn_metrics: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
@@ -527,50 +550,51 @@ def update_card_observation(
     suffix: str | None = None,
     base_column: str | None = None,
     turn: int | None = None,
+    count: int = 1,
 ) -> None:
     row = card_observations.setdefault(arena_id, empty_card_observation())
-    row["total_observation_entries"] += 1
+    row["total_observation_entries"] += count
     row["first_seen_turn"] = min_turn(row["first_seen_turn"], turn)
 
     if base_column in BASE_ID_LIST_COLUMNS:
-        row["opening_or_candidate_hand_entries"] += 1
-        row["natural_access_entries"] += 1
+        row["opening_or_candidate_hand_entries"] += count
+        row["natural_access_entries"] += count
         row["first_access_turn"] = min_turn(row["first_access_turn"], turn)
 
     if suffix in ACCESS_SUFFIXES:
-        row["natural_access_entries"] += 1
+        row["natural_access_entries"] += count
         row["first_access_turn"] = min_turn(row["first_access_turn"], turn)
     if suffix == "cards_drawn":
-        row["drawn_entries"] += 1
+        row["drawn_entries"] += count
     elif suffix == "cards_tutored":
-        row["tutored_entries"] += 1
+        row["tutored_entries"] += count
     elif suffix == "cards_drawn_or_tutored":
-        row["drawn_or_tutored_entries"] += 1
+        row["drawn_or_tutored_entries"] += count
     elif suffix == "cards_discarded":
-        row["discard_entries"] += 1
+        row["discard_entries"] += count
 
     if suffix in DIRECT_USE_SUFFIXES:
-        row["direct_use_entries"] += 1
+        row["direct_use_entries"] += count
         row["first_use_turn"] = min_turn(row["first_use_turn"], turn)
     if suffix == "lands_played":
-        row["land_played_entries"] += 1
+        row["land_played_entries"] += count
     elif suffix == "creatures_cast":
-        row["creature_cast_entries"] += 1
+        row["creature_cast_entries"] += count
     elif suffix == "non_creatures_cast":
-        row["noncreature_cast_entries"] += 1
+        row["noncreature_cast_entries"] += count
     elif suffix in {"user_instants_sorceries_cast", "oppo_instants_sorceries_cast"}:
-        row["instant_sorcery_cast_entries"] += 1
+        row["instant_sorcery_cast_entries"] += count
     elif suffix in {"user_abilities", "oppo_abilities"}:
-        row["ability_entries"] += 1
+        row["ability_entries"] += count
     elif suffix in {
         "creatures_attacked",
         "creatures_blocked",
         "creatures_unblocked",
         "creatures_blocking",
     }:
-        row["attack_or_block_entries"] += 1
+        row["attack_or_block_entries"] += count
     elif suffix in EOT_LIST_SUFFIXES:
-        row["battlefield_eot_entries"] += 1
+        row["battlefield_eot_entries"] += count
 
 
 def finalize_card_observation_metrics(
@@ -680,29 +704,45 @@ def derive_manaloom_adjustments(coverage: dict[str, Any]) -> list[dict[str, Any]
     ]
 
 
+@dataclass
+class ProfileCounts:
+    """Aggregates behind a replay profile, filled per row or per column."""
+
+    rows_seen: int = 0
+    first_game: dict[str, str] = field(default_factory=dict)
+    nonempty_suffix_counts: Counter[str] = field(default_factory=Counter)
+    arena_id_counts: Counter[str] = field(default_factory=Counter)
+    colors: Counter[str] = field(default_factory=Counter)
+    opp_colors: Counter[str] = field(default_factory=Counter)
+    outcomes: Counter[str] = field(default_factory=Counter)
+    turn_count_distribution: Counter[str] = field(default_factory=Counter)
+    turn_metrics: dict[str, dict[str, Any]] = field(default_factory=dict)
+    card_observations: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
 def profile_rows(
     *,
     source: str,
     source_label: str,
     fieldnames: list[str],
-    rows: list[dict[str, str]],
+    rows: Iterable[dict[str, str]],
     top_card_metric_limit: int = 25,
 ) -> dict[str, Any]:
-    header = classify_header(fieldnames)
-    nonempty_suffix_counts: Counter[str] = Counter()
-    arena_id_counts: Counter[str] = Counter()
-    colors: Counter[str] = Counter()
-    opp_colors: Counter[str] = Counter()
-    outcomes: Counter[str] = Counter()
-    turn_count_distribution: Counter[str] = Counter()
-    turn_metrics: dict[str, dict[str, Any]] = {}
-    card_observations: dict[str, dict[str, Any]] = {}
+    turn_columns = [
+        (name, parts) for name in fieldnames if (parts := turn_column_parts(name)) is not None
+    ]
+    counts = ProfileCounts()
+    arena_id_counts = counts.arena_id_counts
+    card_observations = counts.card_observations
 
     for row in rows:
-        colors[row.get("main_colors", "") or "(empty)"] += 1
-        opp_colors[row.get("opp_colors", "") or "(empty)"] += 1
-        outcomes[row.get("won", "") or "(empty)"] += 1
-        turn_count_distribution[row.get("num_turns", "") or "(empty)"] += 1
+        if not counts.rows_seen:
+            counts.first_game = row
+        counts.rows_seen += 1
+        counts.colors[row.get("main_colors", "") or "(empty)"] += 1
+        counts.opp_colors[row.get("opp_colors", "") or "(empty)"] += 1
+        counts.outcomes[row.get("won", "") or "(empty)"] += 1
+        counts.turn_count_distribution[row.get("num_turns", "") or "(empty)"] += 1
         for base_column in BASE_ID_LIST_COLUMNS:
             for arena_id in split_id_list(row.get(base_column)):
                 arena_id_counts[arena_id] += 1
@@ -711,27 +751,14 @@ def profile_rows(
                     arena_id,
                     base_column=base_column,
                 )
-        for name in fieldnames:
+        for name, (active_side, turn, suffix) in turn_columns:
             raw = row.get(name)
             if raw is None or str(raw).strip() == "":
                 continue
-            parts = turn_column_parts(name)
-            if parts is None:
-                continue
-            active_side, turn, suffix = parts
             if not turn_reached(row, turn) or not is_meaningful_turn_value(suffix, raw):
                 continue
-            nonempty_suffix_counts[suffix] += 1
-            if suffix in ID_LIST_SUFFIXES:
-                for arena_id in split_id_list(raw):
-                    arena_id_counts[arena_id] += 1
-                    update_card_observation(
-                        card_observations,
-                        arena_id,
-                        suffix=suffix,
-                        turn=turn,
-                    )
-            elif suffix in EOT_LIST_SUFFIXES:
+            counts.nonempty_suffix_counts[suffix] += 1
+            if suffix in ID_LIST_SUFFIXES or suffix in EOT_LIST_SUFFIXES:
                 for arena_id in split_id_list(raw):
                     arena_id_counts[arena_id] += 1
                     update_card_observation(
@@ -741,13 +768,40 @@ def profile_rows(
                         turn=turn,
                     )
             if suffix in IMPORTANT_SUFFIXES:
-                update_turn_metric(turn_metrics, active_side, turn, suffix, raw)
+                update_turn_metric(counts.turn_metrics, active_side, turn, suffix, raw)
 
-    first_game = rows[0] if rows else {}
+    return assemble_profile_report(
+        source=source,
+        source_label=source_label,
+        fieldnames=fieldnames,
+        counts=counts,
+        top_card_metric_limit=top_card_metric_limit,
+    )
+
+
+def assemble_profile_report(
+    *,
+    source: str,
+    source_label: str,
+    fieldnames: list[str],
+    counts: ProfileCounts,
+    top_card_metric_limit: int = 25,
+) -> dict[str, Any]:
+    header = classify_header(fieldnames)
+    rows_seen = counts.rows_seen
+    first_game = counts.first_game
+    nonempty_suffix_counts = counts.nonempty_suffix_counts
+    arena_id_counts = counts.arena_id_counts
+    colors = counts.colors
+    opp_colors = counts.opp_colors
+    outcomes = counts.outcomes
+    turn_count_distribution = counts.turn_count_distribution
+    turn_metrics = counts.turn_metrics
+    card_observations = counts.card_observations
     signal_coverage = build_manaloom_signal_coverage(
         fieldnames=fieldnames,
         suffix_counts=nonempty_suffix_counts,
-        rows_sampled=len(rows),
+        rows_sampled=rows_seen,
     )
     report = {
         "generated_at": utc_now(),
@@ -755,7 +809,7 @@ def profile_rows(
         "source_label": source_label,
         "postgres_writes": False,
         "source_db_mutated": False,
-        "rows_sampled": len(rows),
+        "rows_sampled": rows_seen,
         "header": header,
         "sample_game_identity": identity_for_row(first_game) if first_game else {},
         "sample_game_normalized_events": normalize_turn_events(first_game, fieldnames)
@@ -915,6 +969,8 @@ def render_markdown(report: dict[str, Any]) -> str:
         "## What This Can Improve",
         "",
     ]
+    if report.get("columnar_cache"):
+        lines.insert(5, f"- Columnar cache: `{report['columnar_cache']['source']}`")
     for item in report["recommended_use"]:
         lines.append(f"- {item}")
     lines.extend(["", "## ManaLoom General Adjustments", ""])
@@ -972,15 +1028,36 @@ def run(
     cache_path: Path | None = None,
     max_card_name_lookups: int = 10,
     top_card_metric_limit: int = 25,
+    full_file: bool = False,
+    columns_cache_dir: Path | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
-    fieldnames, rows = read_sample_rows(source, sample_rows)
-    report = profile_rows(
-        source=source,
-        source_label=source_label,
-        fieldnames=fieldnames,
-        rows=rows,
-        top_card_metric_limit=top_card_metric_limit,
-    )
+    columns_info: dict[str, Any] | None = None
+    if full_file:
+        import seventeenlands_replay_columns as replay_columns
+
+        columns, columns_info = replay_columns.load_replay_columns(
+            source,
+            cache_dir=columns_cache_dir,
+            workers=workers,
+        )
+        report = replay_columns.profile_columns(
+            columns,
+            source=source,
+            source_label=source_label,
+            top_card_metric_limit=top_card_metric_limit,
+        )
+    else:
+        fieldnames, rows = read_sample_rows(source, sample_rows)
+        report = profile_rows(
+            source=source,
+            source_label=source_label,
+            fieldnames=fieldnames,
+            rows=rows,
+            top_card_metric_limit=top_card_metric_limit,
+        )
+    if columns_info is not None:
+        report["columnar_cache"] = columns_info
     if resolve_card_names:
         annotate_card_names(
             report,
@@ -995,6 +1072,13 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--source", default=DEFAULT_REPLAY_URL)
     parser.add_argument("--source-label", default="17Lands LCI PremierDraft replay_data")
     parser.add_argument("--sample-rows", type=int, default=500)
+    parser.add_argument(
+        "--full-file",
+        action="store_true",
+        help="Profile every game through the cached columnar view instead of a row sample.",
+    )
+    parser.add_argument("--columns-cache-dir", type=Path)
+    parser.add_argument("--workers", type=int, default=min(8, os.cpu_count() or 1))
     parser.add_argument("--output-json", type=Path)
     parser.add_argument("--output-md", type=Path)
     parser.add_argument("--resolve-card-names", action="store_true")
@@ -1020,6 +1104,9 @@ def main(argv: list[str] | None = None) -> int:
         cache_path=args.arena_id_cache if args.resolve_card_names else None,
         max_card_name_lookups=args.max_card_name_lookups,
         top_card_metric_limit=args.top_card_metric_limit,
+        full_file=args.full_file,
+        columns_cache_dir=args.columns_cache_dir,
+        workers=args.workers,
     )
     if args.output_json:
         args.output_json.parent.mkdir(parents=True, exist_ok=True)
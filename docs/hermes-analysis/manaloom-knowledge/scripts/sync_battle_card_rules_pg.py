@@ -18,9 +18,11 @@ SQLite cache from PG before simulations.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import sqlite3
+import time
 from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
@@ -34,6 +36,8 @@ from known_cards_fallback_snapshot import (
     load_snapshot_file,
     merge_runtime_annotations_from_existing_snapshot,
     resolve_canonical_snapshot_path,
+    snapshot_index_path,
+    write_snapshot_index,
     write_snapshot_payload,
 )
 from reviewed_battle_card_rules import DEFAULT_REVIEWED_RULES_PATH
@@ -74,6 +78,33 @@ DEFAULT_SQLITE_DB = Path(os.environ.get("MANALOOM_KNOWLEDGE_DB", DEFAULT_DB))
 PG_WRITE_APPROVAL_ENV = "MANALOOM_CONFIRM_POSTGRES_WRITES"
 PG_WRITE_APPROVAL_PHRASE = "I_HAVE_EXPLICIT_APPROVAL"
 
+PG_STAGE_PAGE_SIZE = 1000
+PG_RULE_CONFLICT_SQL = """
+ON CONFLICT (normalized_name, logical_rule_key) DO UPDATE SET
+  card_id = COALESCE(EXCLUDED.card_id, card_battle_rules.card_id),
+  card_name = EXCLUDED.card_name,
+  effect_json = CASE
+    WHEN card_battle_rules.source IN ('manual', 'curated')
+     AND EXCLUDED.source IN ('manual', 'curated')
+      THEN card_battle_rules.effect_json || EXCLUDED.effect_json
+    ELSE EXCLUDED.effect_json
+  END,
+  deck_role_json = EXCLUDED.deck_role_json,
+  source = EXCLUDED.source,
+  confidence = EXCLUDED.confidence,
+  review_status = EXCLUDED.review_status,
+  execution_status = EXCLUDED.execution_status,
+  oracle_hash = COALESCE(NULLIF(EXCLUDED.oracle_hash, ''), card_battle_rules.oracle_hash),
+  notes = EXCLUDED.notes,
+  reviewed_at = CASE
+    WHEN EXCLUDED.review_status IN ('verified', 'active')
+      THEN COALESCE(card_battle_rules.reviewed_at, EXCLUDED.reviewed_at)
+    ELSE card_battle_rules.reviewed_at
+  END,
+  updated_at = CURRENT_TIMESTAMP,
+  last_seen_at = CURRENT_TIMESTAMP
+"""
+
 PG_SCHEMA = """
 CREATE TABLE IF NOT EXISTS card_battle_rules (
   normalized_name TEXT NOT NULL,
@@ -185,6 +216,15 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="When used with --only-summary-json, restrict to matching recommended actions.",
     )
+    parser.add_argument(
+        "--pg-upsert-mode",
+        choices=("staged", "rows"),
+        default="staged",
+        help=(
+            "staged resolves and merges the whole package in set-based SQL; "
+            "rows keeps the per-row Python preparation path."
+        ),
+    )
     parser.add_argument("--report")
     return parser.parse_args()
 
@@ -696,30 +736,8 @@ def upsert_pg_rules(cur: Any, rows: list[dict[str, Any]]) -> tuple[int, int]:
               last_seen_at
             )
             VALUES %s
-            ON CONFLICT (normalized_name, logical_rule_key) DO UPDATE SET
-              card_id = COALESCE(EXCLUDED.card_id, card_battle_rules.card_id),
-              card_name = EXCLUDED.card_name,
-              effect_json = CASE
-                WHEN card_battle_rules.source IN ('manual', 'curated')
-                 AND EXCLUDED.source IN ('manual', 'curated')
-                  THEN card_battle_rules.effect_json || EXCLUDED.effect_json
-                ELSE EXCLUDED.effect_json
-              END,
-              deck_role_json = EXCLUDED.deck_role_json,
-              source = EXCLUDED.source,
-              confidence = EXCLUDED.confidence,
-              review_status = EXCLUDED.review_status,
-              execution_status = EXCLUDED.execution_status,
-              oracle_hash = COALESCE(NULLIF(EXCLUDED.oracle_hash, ''), card_battle_rules.oracle_hash),
-              notes = EXCLUDED.notes,
-              reviewed_at = CASE
-                WHEN EXCLUDED.review_status IN ('verified', 'active')
-                  THEN COALESCE(card_battle_rules.reviewed_at, EXCLUDED.reviewed_at)
-                ELSE card_battle_rules.reviewed_at
-              END,
-              updated_at = CURRENT_TIMESTAMP,
-              last_seen_at = CURRENT_TIMESTAMP
-            """,
+            """
+            + PG_RULE_CONFLICT_SQL,
             values,
             template=(
                 "(%s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s, %s, %s, 1, %s, %s, "
@@ -730,6 +748,242 @@ def upsert_pg_rules(cur: Any, rows: list[dict[str, Any]]) -> tuple[int, int]:
     return len(values), len(skipped_keys)
 
 
+def source_priority_sql(column: str) -> str:
+    cases = " ".join(
+        f"WHEN '{source}' THEN {priority}" for source, priority in SOURCE_PRIORITY.items()
+    )
+    return f"(CASE {column} {cases} ELSE 0 END)"
+
+
+def staged_rule_values(rows: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    values: list[tuple[Any, ...]] = []
+    for seq, row in enumerate(rows):
+        card_name = str(row["card_name"])
+        effect = json_obj(row.get("effect_json"))
+        deck_role = row.get("deck_role_json")
+        if not isinstance(deck_role, dict):
+            deck_role = battle_rule_registry.deck_role_from_effect(effect)
+        review_status = str(row.get("review_status") or "verified")
+        values.append(
+            (
+                seq,
+                normalize_card_name(card_name),
+                normalize_card_name(card_name.split(" // ", 1)[0]),
+                str(
+                    row.get("logical_rule_key")
+                    or battle_rule_registry.logical_rule_key(
+                        {"effect_json": effect, "deck_role_json": deck_role}
+                    )
+                ),
+                card_name,
+                json.dumps(effect, ensure_ascii=True, sort_keys=True),
+                json.dumps(deck_role, ensure_ascii=True, sort_keys=True),
+                str(row.get("source") or "curated"),
+                float(row.get("confidence", 1.0)),
+                review_status,
+                str(row.get("execution_status") or "auto"),
+                row.get("oracle_hash") or None,
+                str(row.get("notes") or ""),
+                datetime.now(timezone.utc) if review_status in ("verified", "active") else None,
+            )
+        )
+    return values
+
+
+def bulk_upsert_pg_rules(
+    cur: Any,
+    rows: list[dict[str, Any]],
+    *,
+    timings: dict[str, float] | None = None,
+) -> tuple[int, int]:
+    """Set-based variant of ``upsert_pg_rules`` for large rule packages.
+
+    Every candidate row is staged once into a temp table; card ids, oracle
+    hashes and the current PG source are resolved with joins, and the source
+    precedence, trusted-hash guard, last-seen touch and merge each run as a
+    single statement. Later rows win when a package repeats a rule key.
+    """
+    from psycopg2.extras import execute_values
+
+    timings = timings if timings is not None else {}
+    started = time.perf_counter()
+    cur.execute("DROP TABLE IF EXISTS staging_card_battle_rules")
+    cur.execute(
+        """
+        CREATE TEMP TABLE staging_card_battle_rules (
+          seq INTEGER NOT NULL,
+          normalized_name TEXT NOT NULL,
+          front_name TEXT NOT NULL,
+          logical_rule_key TEXT NOT NULL,
+          card_name TEXT NOT NULL,
+          effect_json JSONB NOT NULL,
+          deck_role_json JSONB NOT NULL,
+          source TEXT NOT NULL,
+          confidence DOUBLE PRECISION NOT NULL,
+          review_status TEXT NOT NULL,
+          execution_status TEXT NOT NULL,
+          oracle_hash TEXT,
+          notes TEXT NOT NULL,
+          reviewed_at TIMESTAMP WITH TIME ZONE,
+          card_id UUID,
+          current_source TEXT,
+          skipped BOOLEAN NOT NULL DEFAULT FALSE
+        ) ON COMMIT DROP
+        """
+    )
+    execute_values(
+        cur,
+        """
+        INSERT INTO staging_card_battle_rules (
+          seq, normalized_name, front_name, logical_rule_key, card_name,
+          effect_json, deck_role_json, source, confidence, review_status,
+          execution_status, oracle_hash, notes, reviewed_at
+        )
+        VALUES %s
+        """,
+        staged_rule_values(rows),
+        template="(%s, %s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s, %s, %s, %s, %s, %s)",
+        page_size=PG_STAGE_PAGE_SIZE,
+    )
+    timings["pg_stage_seconds"] = round(time.perf_counter() - started, 3)
+
+    started = time.perf_counter()
+    cur.execute(
+        """
+        UPDATE staging_card_battle_rules s
+        SET
+          card_id = COALESCE(
+            (SELECT c.id FROM cards c WHERE lower(c.name) = s.normalized_name LIMIT 1),
+            (
+              SELECT c.id FROM cards c
+              WHERE lower(split_part(c.name, ' // ', 1)) = s.front_name
+              LIMIT 1
+            )
+          ),
+          oracle_hash = COALESCE(
+            NULLIF(s.oracle_hash, ''),
+            (
+              SELECT md5(coalesce(c.oracle_text, '')) FROM cards c
+              WHERE lower(c.name) = s.normalized_name
+                AND btrim(coalesce(c.oracle_text, '')) <> ''
+              LIMIT 1
+            ),
+            (
+              SELECT md5(coalesce(c.oracle_text, '')) FROM cards c
+              WHERE lower(split_part(c.name, ' // ', 1)) = s.front_name
+                AND btrim(coalesce(c.oracle_text, '')) <> ''
+              LIMIT 1
+            )
+          )
+        """
+    )
+    cur.execute(
+        """
+        UPDATE staging_card_battle_rules s
+        SET current_source = br.source
+        FROM card_battle_rules br
+        WHERE br.normalized_name = s.normalized_name
+          AND br.logical_rule_key = s.logical_rule_key
+        """
+    )
+    cur.execute(
+        f"""
+        UPDATE staging_card_battle_rules
+        SET skipped = TRUE
+        WHERE current_source IS NOT NULL
+          AND {source_priority_sql("source")} < {source_priority_sql("current_source")}
+        """
+    )
+    timings["pg_resolve_seconds"] = round(time.perf_counter() - started, 3)
+
+    started = time.perf_counter()
+    cur.execute(
+        """
+        SELECT card_name
+        FROM staging_card_battle_rules
+        WHERE NOT skipped
+          AND COALESCE(oracle_hash, '') = ''
+          AND current_source IS NULL
+          AND review_status IN ('verified', 'active')
+          AND execution_status IN ('auto', 'executable')
+        """
+    )
+    trusted_without_oracle_hash = [str(row[0]) for row in cur.fetchall()]
+    if trusted_without_oracle_hash:
+        sample = ", ".join(sorted(trusted_without_oracle_hash)[:10])
+        raise RuntimeError(
+            "Refusing to insert trusted executable battle rules without oracle_hash "
+            f"or PostgreSQL oracle_text fallback. Count={len(trusted_without_oracle_hash)}; "
+            f"sample={sample}"
+        )
+    cur.execute(
+        """
+        SELECT
+          COUNT(*) FILTER (WHERE NOT skipped)::int,
+          COUNT(*) FILTER (WHERE skipped)::int
+        FROM staging_card_battle_rules
+        """
+    )
+    changed, skipped = cur.fetchone()
+    cur.execute(
+        """
+        UPDATE card_battle_rules br
+        SET last_seen_at = CURRENT_TIMESTAMP
+        FROM staging_card_battle_rules s
+        WHERE s.skipped
+          AND br.normalized_name = s.normalized_name
+          AND br.logical_rule_key = s.logical_rule_key
+        """
+    )
+    cur.execute(
+        """
+        INSERT INTO card_battle_rules (
+          normalized_name,
+          logical_rule_key,
+          card_id,
+          card_name,
+          effect_json,
+          deck_role_json,
+          source,
+          confidence,
+          review_status,
+          execution_status,
+          rule_version,
+          oracle_hash,
+          notes,
+          reviewed_at,
+          created_at,
+          updated_at,
+          last_seen_at
+        )
+        SELECT DISTINCT ON (normalized_name, logical_rule_key)
+          normalized_name,
+          logical_rule_key,
+          card_id,
+          card_name,
+          effect_json,
+          deck_role_json,
+          source,
+          confidence,
+          review_status,
+          execution_status,
+          1,
+          oracle_hash,
+          notes,
+          reviewed_at,
+          CURRENT_TIMESTAMP,
+          CURRENT_TIMESTAMP,
+          CURRENT_TIMESTAMP
+        FROM staging_card_battle_rules
+        WHERE NOT skipped
+        ORDER BY normalized_name, logical_rule_key, seq DESC
+        """
+        + PG_RULE_CONFLICT_SQL
+    )
+    timings["pg_merge_seconds"] = round(time.perf_counter() - started, 3)
+    return int(changed or 0), int(skipped or 0)
+
+
 def backfill_trusted_oracle_hashes(cur: Any) -> int:
     cur.execute(
         """
@@ -1164,6 +1418,62 @@ def cleanup_stale_local_priority_shadows(
     return int(deleted)
 
 
+def rule_content_hash(values: tuple[Any, ...]) -> str:
+    encoded = json.dumps(values, ensure_ascii=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_sqlite_rule_hashes(
+    conn: sqlite3.Connection,
+) -> dict[tuple[str, str], tuple[str, str | None]]:
+    """Content hash and oracle hash of every cached rule, by rule key."""
+    stored: dict[tuple[str, str], tuple[str, str | None]] = {}
+    for row in conn.execute(
+        """
+        SELECT normalized_name, logical_rule_key, card_name, effect_json,
+               deck_role_json, source, confidence, review_status,
+               execution_status, rule_version, oracle_hash, notes
+        FROM battle_card_rules
+        """
+    ):
+        stored[(str(row[0]), str(row[1]))] = (rule_content_hash(tuple(row[2:])), row[10])
+    return stored
+
+
+def runtime_row_content_hash(
+    row: dict[str, Any],
+    stored: dict[tuple[str, str], tuple[str, str | None]],
+) -> tuple[tuple[str, str], str]:
+    """Key and content hash `upsert_battle_card_rule` would leave for `row`."""
+    effect_json = json_obj(row.get("effect_json"))
+    deck_role_json = row.get("deck_role_json")
+    if not isinstance(deck_role_json, dict) or not deck_role_json:
+        deck_role_json = battle_rule_registry.deck_role_from_effect(effect_json)
+    key = (
+        normalize_card_name(row_normalized_name(row)),
+        str(row.get("logical_rule_key") or "")
+        or battle_rule_registry.logical_rule_key(
+            {"effect_json": effect_json, "deck_role_json": deck_role_json}
+        ),
+    )
+    stored_oracle_hash = stored.get(key, ("", None))[1]
+    content_hash = rule_content_hash(
+        (
+            row["card_name"],
+            json.dumps(effect_json, ensure_ascii=True, sort_keys=True),
+            json.dumps(deck_role_json, ensure_ascii=True, sort_keys=True),
+            row["source"],
+            row["confidence"],
+            row["review_status"],
+            str(row.get("execution_status") or "auto"),
+            max(1, int(row.get("rule_version") or 1)),
+            row.get("oracle_hash") or stored_oracle_hash,
+            row.get("notes") or "",
+        )
+    )
+    return key, content_hash
+
+
 def mirror_pg_rules_to_sqlite(
     sqlite_db: str,
     rows: list[dict[str, Any]],
@@ -1171,7 +1481,10 @@ def mirror_pg_rules_to_sqlite(
     reviewed_rows: list[dict[str, Any]] | None = None,
     global_cleanup: bool = False,
     prune_card_names: list[str] | None = None,
+    timings: dict[str, float] | None = None,
 ) -> int:
+    """Refresh the SQLite rule cache, writing only rows whose content moved."""
+    timings = timings if timings is not None else {}
     changed = 0
     filtered_rows = filter_rows_for_current_reviewed_curated(
         rows,
@@ -1182,6 +1495,7 @@ def mirror_pg_rules_to_sqlite(
         reviewed_rows or [],
     )
     with closing(sqlite3.connect(sqlite_db)) as conn:
+        started = time.perf_counter()
         battle_rule_registry.ensure_battle_card_rules(conn)
         cleanup_obsolete_manual_rows(conn)
         cleanup_stale_reviewed_rows(conn, reviewed_rows or [])
@@ -1196,7 +1510,14 @@ def mirror_pg_rules_to_sqlite(
             global_cleanup=global_cleanup,
             prune_card_names=prune_card_names,
         )
+        timings["sqlite_cleanup_seconds"] = round(time.perf_counter() - started, 3)
+
+        started = time.perf_counter()
+        stored = load_sqlite_rule_hashes(conn)
         for row in runtime_rows:
+            key, content_hash = runtime_row_content_hash(row, stored)
+            if stored.get(key, ("", None))[0] == content_hash:
+                continue
             effect_json = json_obj(row.get("effect_json"))
             deck_role_json = row.get("deck_role_json")
             if not isinstance(deck_role_json, dict):
@@ -1219,6 +1540,7 @@ def mirror_pg_rules_to_sqlite(
             if did_change:
                 changed += 1
         conn.commit()
+        timings["sqlite_upsert_seconds"] = round(time.perf_counter() - started, 3)
     return changed
 
 
@@ -1235,6 +1557,7 @@ def export_canonical_snapshot(
         load_snapshot_file(output_path),
     )
     write_snapshot_payload(output_path, payload)
+    write_snapshot_index(snapshot_index_path(output_path), payload, source_path=output_path)
     return len(payload)
 
 
@@ -1278,7 +1601,10 @@ def main() -> int:
         "pg_rows_loaded": 0,
         "sqlite_inserted_or_updated": 0,
         "canonical_snapshot_rows_exported": 0,
+        "pg_upsert_mode": args.pg_upsert_mode,
+        "phase_seconds": {},
     }
+    timings: dict[str, float] = report["phase_seconds"]
 
     if args.apply_pg or args.apply_sqlite_from_pg:
         require_pg()
@@ -1287,17 +1613,28 @@ def main() -> int:
         with connect() as conn:
             with conn.cursor() as cur:
                 ensure_pg_table(cur)
-                changed, skipped = upsert_pg_rules(cur, seed_rows)
+                if args.pg_upsert_mode == "staged":
+                    changed, skipped = bulk_upsert_pg_rules(cur, seed_rows, timings=timings)
+                else:
+                    started = time.perf_counter()
+                    changed, skipped = upsert_pg_rules(cur, seed_rows)
+                    timings["pg_merge_seconds"] = round(time.perf_counter() - started, 3)
+                started = time.perf_counter()
                 backfilled = backfill_trusted_oracle_hashes(cur)
+                timings["pg_oracle_hash_backfill_seconds"] = round(
+                    time.perf_counter() - started, 3
+                )
                 report["pg_inserted_or_updated"] += changed
                 report["pg_skipped_lower_priority"] += skipped
                 report["pg_trusted_oracle_hash_backfilled"] = backfilled
 
     if args.apply_sqlite_from_pg:
+        started = time.perf_counter()
         with connect() as conn:
             with conn.cursor() as cur:
                 rows = load_pg_rules(cur, include_needs_review=args.include_needs_review)
         rows = filter_rows_by_card_names(rows, selected_card_names)
+        timings["pg_load_seconds"] = round(time.perf_counter() - started, 3)
         report["pg_rows_loaded"] = len(rows)
         report["sqlite_inserted_or_updated"] = mirror_pg_rules_to_sqlite(
             args.sqlite_db,
@@ -1305,12 +1642,15 @@ def main() -> int:
             reviewed_rows=seed_rows,
             global_cleanup=not bool(selected_card_names),
             prune_card_names=selected_card_names,
+            timings=timings,
         )
+        started = time.perf_counter()
         report["canonical_snapshot_rows_exported"] = export_canonical_snapshot(
             load_active_snapshot_rows(args.sqlite_db),
             sqlite_db=args.sqlite_db,
             output_path=args.export_canonical_fallback_json,
         )
+        timings["snapshot_export_seconds"] = round(time.perf_counter() - started, 3)
 
     output = json.dumps(report, ensure_ascii=True, indent=2, sort_keys=True)
     print(output)
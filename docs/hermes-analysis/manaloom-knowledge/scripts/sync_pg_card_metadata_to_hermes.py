@@ -12,12 +12,14 @@ Run from the Hermes scripts directory or any cwd:
 
     python3 sync_pg_card_metadata_to_hermes.py
     python3 sync_pg_card_metadata_to_hermes.py --dry-run
+    python3 sync_pg_card_metadata_to_hermes.py --incremental
     python3 sync_pg_card_metadata_to_hermes.py --report ../card_oracle_cache_report.json
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -26,9 +28,10 @@ import subprocess
 import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import urlparse
 
+from knowledge_db_access import connect_knowledge_db, ensure_hot_query_indexes
 from known_cards_fallback_snapshot import load_layered_known_cards
 from battle_target_deck_identity_guard import compute_snapshot_hashes
 
@@ -52,6 +55,24 @@ except Exception as exc:  # pragma: no cover - exercised in lean containers.
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_SQLITE_DB = Path(os.environ.get("MANALOOM_KNOWLEDGE_DB", SCRIPT_DIR / "knowledge.db"))
 
+SYNC_BATCH_SIZE = 2000
+SYNC_CURSOR_NAME = "hermes_card_metadata_sync"
+SYNC_WATERMARK_SOURCE = "postgres_cards"
+CONTENT_HASH_FIELDS = (
+    "card_id",
+    "name",
+    "mana_cost",
+    "type_line",
+    "oracle_text",
+    "colors",
+    "color_identity",
+    "cmc",
+    "power",
+    "toughness",
+    "keywords",
+    "scryfall_id",
+)
+
 COMBAT_KEYWORDS = (
     "flying",
     "reach",
@@ -113,6 +134,20 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="Optional JSON list (repeatable) of additional card names to sync.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Stream requested cards in batches, upsert only rows whose content "
+            "hash changed since the last sync and rehash only decks naming them."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SYNC_BATCH_SIZE,
+        help="Rows fetched per PostgreSQL batch in --incremental mode.",
+    )
     return parser.parse_args()
 
 
@@ -300,8 +335,13 @@ def refresh_deck_snapshot_hashes(
     *,
     dry_run: bool,
     allowed_rehash_deck_ids: set[int],
+    scope_deck_ids: set[int] | None = None,
 ) -> dict[str, Any]:
-    """Rehash only snapshots whose card ids this sync actually changed."""
+    """Rehash only snapshots whose card ids this sync actually changed.
+
+    ``scope_deck_ids`` limits the drift check itself to decks an incremental
+    sync touched; ``None`` checks every tracked snapshot.
+    """
     allowed_rehash_deck_ids = {int(value) for value in allowed_rehash_deck_ids}
     columns = column_names(cur, "deck_cards")
     required = {
@@ -367,6 +407,8 @@ def refresh_deck_snapshot_hashes(
             """
         )
     ]
+    if scope_deck_ids is not None:
+        deck_ids = [deck_id for deck_id in deck_ids if deck_id in scope_deck_ids]
     drifted_snapshots: list[tuple[int, list[Any], tuple[str, str, str]]] = []
     for deck_id in deck_ids:
         raw_rows = cur.execute(
@@ -475,16 +517,30 @@ def refresh_deck_snapshot_hashes(
     }
 
 
+def scope_changed_aliases(cur: sqlite3.Cursor, changed_aliases: set[str]) -> None:
+    ensure_hot_query_indexes(cur.connection, tables=("deck_cards",))
+    cur.execute("DROP TABLE IF EXISTS temp.sync_changed_aliases")
+    cur.execute(
+        "CREATE TEMP TABLE sync_changed_aliases (normalized_name TEXT PRIMARY KEY)"
+    )
+    cur.executemany(
+        "INSERT OR IGNORE INTO temp.sync_changed_aliases VALUES (?)",
+        [(alias,) for alias in sorted(changed_aliases)],
+    )
+
+
 def backfill_deck_cards_from_cache(
     cur: sqlite3.Cursor,
     *,
     dry_run: bool,
+    changed_aliases: set[str] | None = None,
 ) -> dict[str, Any]:
     """Copy authoritative PG metadata from card_oracle_cache into deck_cards.
 
     `deck_cards` is the table used by Hermes optimizers/battle simulations.
     It can be older than `card_oracle_cache`, so this step makes CMC/type/oracle
-    consistency explicit and measurable.
+    consistency explicit and measurable. With `changed_aliases` only deck rows
+    naming those cache aliases are counted, updated and rehashed.
     """
 
     if not table_exists(cur, "deck_cards"):
@@ -507,22 +563,39 @@ def backfill_deck_cards_from_cache(
         }
 
     ensure_deck_cards_metadata_columns(cur)
+    scope = ""
+    update_scope = ""
+    scope_deck_ids: set[int] | None = None
+    if changed_aliases is not None:
+        scope_changed_aliases(cur, changed_aliases)
+        scope = (
+            " AND lower(trim(dc.card_name)) IN "
+            "(SELECT normalized_name FROM temp.sync_changed_aliases)"
+        )
+        update_scope = scope.replace("dc.card_name", "deck_cards.card_name")
+        scope_deck_ids = {
+            int(row[0])
+            for row in cur.execute(
+                f"SELECT DISTINCT dc.deck_id FROM deck_cards dc WHERE 1=1{scope}"
+            )
+            if row[0] is not None
+        }
     total = cur.execute(
-        "SELECT COUNT(*) FROM deck_cards WHERE COALESCE(card_name,'')!=''"
+        f"SELECT COUNT(*) FROM deck_cards dc WHERE COALESCE(dc.card_name,'')!=''{scope}"
     ).fetchone()[0]
     matched = cur.execute(
-        """
+        f"""
         SELECT COUNT(*)
         FROM deck_cards dc
         JOIN card_oracle_cache coc
           ON coc.normalized_name = lower(trim(dc.card_name))
-        WHERE COALESCE(dc.card_name,'')!=''
+        WHERE COALESCE(dc.card_name,'')!=''{scope}
         """
     ).fetchone()[0]
     has_card_id_column = "card_id" in column_names(cur, "card_oracle_cache")
     card_id_to_update = (
         cur.execute(
-            """
+            f"""
             SELECT COUNT(*)
             FROM deck_cards dc
             JOIN card_oracle_cache coc
@@ -532,7 +605,7 @@ def backfill_deck_cards_from_cache(
                 dc.card_id IS NULL
                 OR dc.card_id = ''
                 OR lower(dc.card_id) != lower(coc.card_id)
-              )
+              ){scope}
             """
         ).fetchone()[0]
         if has_card_id_column and "card_id" in column_names(cur, "deck_cards")
@@ -542,7 +615,7 @@ def backfill_deck_cards_from_cache(
         {
             int(row[0])
             for row in cur.execute(
-                """
+                f"""
                 SELECT DISTINCT dc.deck_id
                 FROM deck_cards dc
                 JOIN card_oracle_cache coc
@@ -552,7 +625,7 @@ def backfill_deck_cards_from_cache(
                     dc.card_id IS NULL
                     OR dc.card_id = ''
                     OR lower(dc.card_id) != lower(coc.card_id)
-                  )
+                  ){scope}
                 """
             )
             if row[0] is not None
@@ -562,7 +635,7 @@ def backfill_deck_cards_from_cache(
         else set()
     )
     cmc_to_update = cur.execute(
-        """
+        f"""
         SELECT COUNT(*)
         FROM deck_cards dc
         JOIN card_oracle_cache coc
@@ -571,13 +644,13 @@ def backfill_deck_cards_from_cache(
           AND (
             dc.cmc IS NULL
             OR abs(CAST(dc.cmc AS REAL) - CAST(coc.cmc AS REAL)) > 0.001
-          )
+          ){scope}
         """
     ).fetchone()[0]
 
     if not dry_run:
         cur.execute(
-            """
+            f"""
             UPDATE deck_cards
             SET
               card_id = COALESCE(
@@ -621,7 +694,7 @@ def backfill_deck_cards_from_cache(
               SELECT 1
               FROM card_oracle_cache coc
               WHERE coc.normalized_name = lower(trim(deck_cards.card_name))
-            )
+            ){update_scope}
             """
         )
 
@@ -629,10 +702,11 @@ def backfill_deck_cards_from_cache(
         cur,
         dry_run=dry_run,
         allowed_rehash_deck_ids=card_id_deck_ids_to_update,
+        scope_deck_ids=scope_deck_ids,
     )
 
     suspicious_after = cur.execute(
-        """
+        f"""
         SELECT COUNT(*)
         FROM deck_cards dc
         LEFT JOIN card_oracle_cache coc
@@ -644,7 +718,7 @@ def backfill_deck_cards_from_cache(
             OR lower(COALESCE(coc.type_line, dc.type_line, '')) GLOB '*[^a-z]land[^a-z]*'
           )
           AND COALESCE(CAST(COALESCE(coc.cmc, dc.cmc, 0) AS REAL), 0) = 0
-          AND COALESCE(coc.mana_cost, '') NOT IN ('', '{0}')
+          AND COALESCE(coc.mana_cost, '') NOT IN ('', '{{0}}'){scope}
         """
     ).fetchone()[0]
 
@@ -764,16 +838,42 @@ def pg_fold_sql(expression: str) -> str:
     return folded
 
 
-def cards_select_sql(pg_columns: set[str], names_sql: str | None = None) -> str:
+def cards_select_sql(
+    pg_columns: set[str],
+    names_sql: str | None = None,
+    *,
+    updated_after_sql: str | None = None,
+    after_id_sql: str | None = None,
+    limit: int | None = None,
+) -> str:
+    """Select cards matching the requested names.
+
+    The incremental sync adds an ``updated_at`` predicate when PG carries
+    that column, and pages by ``c.id`` so batches are stable across calls.
+    """
+
     names_expression = names_sql or "%s"
     folded_name = pg_fold_sql("c.name")
     folded_front = pg_fold_sql("split_part(c.name, ' // ', 1)")
     where = f"""
-        WHERE lower(c.name) = ANY({names_expression})
-           OR lower(split_part(c.name, ' // ', 1)) = ANY({names_expression})
-           OR {folded_name} = ANY({names_expression})
-           OR {folded_front} = ANY({names_expression})
+        WHERE (
+            lower(c.name) = ANY({names_expression})
+            OR lower(split_part(c.name, ' // ', 1)) = ANY({names_expression})
+            OR {folded_name} = ANY({names_expression})
+            OR {folded_front} = ANY({names_expression})
+        )
     """
+    if updated_after_sql is not None:
+        where += f" AND c.updated_at > {updated_after_sql}::timestamptz"
+    if after_id_sql is not None:
+        where += f" AND c.id > {after_id_sql}::uuid"
+    paged = updated_after_sql is not None or after_id_sql is not None or limit is not None
+    updated_at = (
+        "to_char(c.updated_at AT TIME ZONE 'UTC', "
+        "'YYYY-MM-DD\"T\"HH24:MI:SS.US\"Z\"')"
+        if "updated_at" in pg_columns
+        else "NULL::text"
+    )
     return f"""
         SELECT
           c.id::text AS card_id,
@@ -787,18 +887,17 @@ def cards_select_sql(pg_columns: set[str], names_sql: str | None = None) -> str:
           {selectable('power', pg_columns, 'NULL::text')} AS power,
           {selectable('toughness', pg_columns, 'NULL::text')} AS toughness,
           {selectable('keywords', pg_columns, 'NULL::text[]')} AS keywords,
-          {selectable('scryfall_id', pg_columns, 'NULL::uuid')}::text AS scryfall_id
+          {selectable('scryfall_id', pg_columns, 'NULL::uuid')}::text AS scryfall_id,
+          {updated_at} AS pg_updated_at
         FROM cards c
         {where}
-        ORDER BY c.name
+        ORDER BY {"c.id" if paged else "c.name"}
+        {f"LIMIT {int(limit)}" if limit is not None else ""}
     """
 
 
-def fetch_pg_cards(names: set[str], pg_columns: set[str]) -> list[dict[str, Any]]:
-    if not names:
-        return []
-
-    normalized = sorted(
+def requested_aliases(names: set[str]) -> list[str]:
+    return sorted(
         {
             alias
             for name in names
@@ -806,6 +905,13 @@ def fetch_pg_cards(names: set[str], pg_columns: set[str]) -> list[dict[str, Any]
             if alias
         }
     )
+
+
+def fetch_pg_cards(names: set[str], pg_columns: set[str]) -> list[dict[str, Any]]:
+    if not names:
+        return []
+
+    normalized = requested_aliases(names)
     if connect is None:
         names_sql = pg_text_array(normalized)
         query = f"SELECT COALESCE(json_agg(row_to_json(t)), '[]'::json) FROM ({cards_select_sql(pg_columns, names_sql)}) t"
@@ -821,6 +927,67 @@ def fetch_pg_cards(names: set[str], pg_columns: set[str]) -> list[dict[str, Any]
             return [dict(zip(columns, row)) for row in cur.fetchall()]
 
 
+def pg_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def iter_pg_card_batches(
+    names: set[str],
+    pg_columns: set[str],
+    *,
+    batch_size: int,
+    updated_after: str | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield matching cards in batches of at most ``batch_size`` rows.
+
+    psycopg2 streams through a server-side (named) cursor. The psql fallback
+    pages by card id instead of materializing one JSON blob for every card.
+    """
+
+    if not names:
+        return
+    normalized = requested_aliases(names)
+    if connect is None:
+        names_sql = pg_text_array(normalized)
+        after_id: str | None = None
+        while True:
+            select_sql = cards_select_sql(
+                pg_columns,
+                names_sql,
+                updated_after_sql=pg_literal(updated_after) if updated_after else None,
+                after_id_sql=pg_literal(after_id) if after_id else None,
+                limit=batch_size,
+            )
+            batch = run_psql_json(
+                f"SELECT COALESCE(json_agg(row_to_json(t)), '[]'::json) FROM ({select_sql}) t"
+            ) or []
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = max(str(card["card_id"]) for card in batch)
+
+    params: list[Any] = [normalized, normalized, normalized, normalized]
+    if updated_after:
+        params.append(updated_after)
+    with connect() as conn:
+        with conn.cursor(name=SYNC_CURSOR_NAME) as cur:
+            cur.itersize = batch_size
+            cur.execute(
+                cards_select_sql(
+                    pg_columns,
+                    updated_after_sql="%s" if updated_after else None,
+                ),
+                params,
+            )
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    return
+                columns = [desc[0] for desc in cur.description]
+                yield [dict(zip(columns, row)) for row in rows]
+
+
 def extract_keywords(row: dict[str, Any]) -> list[str]:
     found = set()
     raw_keywords = row.get("keywords")
@@ -844,19 +1011,23 @@ def json_list(value: Any) -> str:
     return "[]"
 
 
+def card_aliases(card: dict[str, Any]) -> list[str]:
+    aliases = {
+        normalize_name(card["name"]),
+        normalize_name(front_face_name(card["name"])),
+        fold_name(card["name"]),
+        fold_name(front_face_name(card["name"])),
+    }
+    return sorted(alias for alias in aliases if alias)
+
+
 def cache_rows(pg_cards: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
     now = datetime.now(timezone.utc).isoformat()
     rows: list[tuple[Any, ...]] = []
     seen: set[str] = set()
 
     for card in pg_cards:
-        aliases = {
-            normalize_name(card["name"]),
-            normalize_name(front_face_name(card["name"])),
-            fold_name(card["name"]),
-            fold_name(front_face_name(card["name"])),
-        }
-        for alias in sorted(alias for alias in aliases if alias):
+        for alias in card_aliases(card):
             if alias in seen:
                 continue
             seen.add(alias)
@@ -910,6 +1081,170 @@ def write_cache(cur: sqlite3.Cursor, rows: list[tuple[Any, ...]]) -> None:
     )
 
 
+def ensure_sync_state_tables(cur: sqlite3.Cursor) -> None:
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS card_oracle_sync_state (
+            card_key TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            pg_updated_at TEXT,
+            synced_at TEXT NOT NULL
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS card_oracle_sync_watermark (
+            source TEXT PRIMARY KEY,
+            pg_updated_at TEXT,
+            cards_tracked INTEGER NOT NULL DEFAULT 0,
+            synced_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def card_state_key(card: dict[str, Any]) -> str:
+    return str(card.get("card_id") or normalize_name(card["name"]))
+
+
+def card_content_hash(card: dict[str, Any]) -> str:
+    payload = {field: card.get(field) for field in CONTENT_HASH_FIELDS}
+    if payload["cmc"] is not None:
+        payload["cmc"] = float(payload["cmc"])
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_sync_watermark(cur: sqlite3.Cursor) -> str | None:
+    row = cur.execute(
+        "SELECT pg_updated_at FROM card_oracle_sync_watermark WHERE source=?",
+        (SYNC_WATERMARK_SOURCE,),
+    ).fetchone()
+    return str(row[0]) if row is not None and row[0] else None
+
+
+def stored_content_hashes(cur: sqlite3.Cursor, keys: list[str]) -> dict[str, str]:
+    return {
+        str(key): str(content_hash)
+        for key, content_hash in cur.execute(
+            """
+            SELECT card_key, content_hash
+            FROM card_oracle_sync_state
+            WHERE card_key IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(keys),),
+        )
+    }
+
+
+def collect_changed_cards(
+    cur: sqlite3.Cursor,
+    requested_names: set[str],
+    pg_columns: set[str],
+    *,
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> tuple[list[dict[str, Any]], list[tuple[str, str, str | None]], dict[str, Any]]:
+    """Stream requested cards and keep only those whose content hash moved.
+
+    A card is also treated as changed when one of its cache aliases is
+    missing, so a wiped or newly requested alias is always repopulated.
+    When PG exposes ``cards.updated_at``, names that are already cached are
+    only re-read past the stored watermark.
+    """
+
+    ensure_sync_state_tables(cur)
+    cached_aliases = {
+        str(row[0]) for row in cur.execute("SELECT normalized_name FROM card_oracle_cache")
+    }
+    watermark = load_sync_watermark(cur) if "updated_at" in pg_columns else None
+    if watermark:
+        uncached_names = {
+            name for name in requested_names if normalize_name(name) not in cached_aliases
+        }
+        passes = [(requested_names - uncached_names, watermark), (uncached_names, None)]
+    else:
+        passes = [(requested_names, None)]
+
+    changed: list[dict[str, Any]] = []
+    state_rows: list[tuple[str, str, str | None]] = []
+    seen: set[str] = set()
+    batches = 0
+    streamed = 0
+    latest_updated_at = watermark
+    for names, updated_after in passes:
+        for batch in iter_pg_card_batches(
+            names,
+            pg_columns,
+            batch_size=batch_size,
+            updated_after=updated_after,
+        ):
+            batches += 1
+            streamed += len(batch)
+            stored = stored_content_hashes(cur, [card_state_key(card) for card in batch])
+            for card in batch:
+                key = card_state_key(card)
+                if key in seen:
+                    continue
+                seen.add(key)
+                updated_at = card.get("pg_updated_at")
+                if updated_at and (latest_updated_at is None or updated_at > latest_updated_at):
+                    latest_updated_at = updated_at
+                content_hash = card_content_hash(card)
+                if stored.get(key) == content_hash and cached_aliases.issuperset(
+                    card_aliases(card)
+                ):
+                    continue
+                changed.append(card)
+                state_rows.append((key, content_hash, updated_at))
+
+    return (
+        changed,
+        state_rows,
+        {
+            "watermark_column": "updated_at" if "updated_at" in pg_columns else "content_hash",
+            "watermark_before": watermark,
+            "watermark_after": latest_updated_at,
+            "batch_size": batch_size,
+            "batches": batches,
+            "cards_streamed": streamed,
+            "cards_changed": len(changed),
+            "cards_unchanged": len(seen) - len(changed),
+        },
+    )
+
+
+def write_sync_state(
+    cur: sqlite3.Cursor,
+    state_rows: list[tuple[str, str, str | None]],
+    *,
+    watermark: str | None,
+) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    cur.executemany(
+        """
+        INSERT INTO card_oracle_sync_state (card_key, content_hash, pg_updated_at, synced_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(card_key) DO UPDATE SET
+            content_hash = excluded.content_hash,
+            pg_updated_at = excluded.pg_updated_at,
+            synced_at = excluded.synced_at
+        """,
+        [(key, content_hash, updated_at, now) for key, content_hash, updated_at in state_rows],
+    )
+    cur.execute(
+        """
+        INSERT INTO card_oracle_sync_watermark (source, pg_updated_at, cards_tracked, synced_at)
+        VALUES (?, ?, (SELECT COUNT(*) FROM card_oracle_sync_state), ?)
+        ON CONFLICT(source) DO UPDATE SET
+            pg_updated_at = excluded.pg_updated_at,
+            cards_tracked = excluded.cards_tracked,
+            synced_at = excluded.synced_at
+        """,
+        (SYNC_WATERMARK_SOURCE, watermark, now),
+    )
+
+
 def build_report(
     *,
     requested_names: set[str],
@@ -918,8 +1253,11 @@ def build_report(
     pg_columns: set[str],
     dry_run: bool,
     deck_cards_backfill: dict[str, Any],
+    resolved_aliases: set[str] | None = None,
+    incremental: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    resolved_aliases = {row[0] for row in rows}
+    if resolved_aliases is None:
+        resolved_aliases = {row[0] for row in rows}
     unresolved = sorted(
         name for name in requested_names if normalize_name(name) not in resolved_aliases
     )
@@ -959,6 +1297,7 @@ def build_report(
             "keywords": sum(1 for card in pg_cards if extract_keywords(card)),
         },
         "deck_cards_backfill": deck_cards_backfill,
+        "incremental": incremental,
     }
 
 
@@ -967,7 +1306,7 @@ def main() -> None:
     sqlite_db = Path(args.sqlite_db)
     sqlite_db.parent.mkdir(parents=True, exist_ok=True)
 
-    sqlite_conn = sqlite3.connect(sqlite_db)
+    sqlite_conn = connect_knowledge_db(sqlite_db, profile="batch", row_factory=None)
     sqlite_cur = sqlite_conn.cursor()
     ensure_cache_table(sqlite_cur)
 
@@ -977,20 +1316,45 @@ def main() -> None:
         requested_names = set(sorted(requested_names)[: args.limit])
 
     pg_columns = load_pg_columns()
-    pg_cards = fetch_pg_cards(requested_names, pg_columns)
-    rows = cache_rows(pg_cards)
+    incremental: dict[str, Any] | None = None
+    changed_aliases: set[str] | None = None
+    resolved_aliases: set[str] | None = None
+    if args.incremental:
+        pg_cards, state_rows, incremental = collect_changed_cards(
+            sqlite_cur,
+            requested_names,
+            pg_columns,
+            batch_size=max(1, args.batch_size),
+        )
+        rows = cache_rows(pg_cards)
+        changed_aliases = {row[0] for row in rows}
+        resolved_aliases = changed_aliases | {
+            str(row[0])
+            for row in sqlite_cur.execute("SELECT normalized_name FROM card_oracle_cache")
+        }
+    else:
+        pg_cards = fetch_pg_cards(requested_names, pg_columns)
+        rows = cache_rows(pg_cards)
 
     if not args.dry_run:
         write_cache(sqlite_cur, rows)
+        if incremental is not None:
+            write_sync_state(
+                sqlite_cur,
+                state_rows,
+                watermark=incremental["watermark_after"],
+            )
         deck_cards_backfill = backfill_deck_cards_from_cache(
             sqlite_cur,
             dry_run=False,
+            changed_aliases=changed_aliases,
         )
         sqlite_conn.commit()
     else:
         deck_cards_backfill = backfill_deck_cards_from_cache(
             sqlite_cur,
             dry_run=True,
+            changed_aliases=changed_aliases,
         )
         sqlite_conn.rollback()
 
@@ -1001,6 +1365,8 @@ def main() -> None:
         pg_columns=pg_columns,
         dry_run=args.dry_run,
         deck_cards_backfill=deck_cards_backfill,
+        resolved_aliases=resolved_aliases,
+        incremental=incremental,
     )
 
     if args.report:
@@ -1012,6 +1378,15 @@ def main() -> None:
     print(f"postgres target: {report['postgres_target']}")
     print(f"requested unique names: {report['requested_unique_names']}")
     print(f"postgres cards matched: {report['postgres_cards_matched']}")
+    if incremental is not None:
+        print(
+            "incremental: "
+            f"watermark={incremental['watermark_column']} "
+            f"batches={incremental['batches']} "
+            f"streamed={incremental['cards_streamed']} "
+            f"changed={incremental['cards_changed']} "
+            f"unchanged={incremental['cards_unchanged']}"
+        )
     print(f"sqlite cache alias rows: {report['sqlite_cache_alias_rows']}")
     print(
         "deck_cards backfill: "
@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import Iterable
 
 from db_helper import connect
+from knowledge_db_access import connect_knowledge_db, ensure_hot_query_indexes
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -215,9 +216,10 @@ def main() -> None:
         raise SystemExit(f"SQLite DB not found: {sqlite_db}")
 
     decks = fetch_meta_decks(args.limit, args.include_lorehold)
-    conn = sqlite3.connect(sqlite_db)
+    conn = connect_knowledge_db(sqlite_db, profile="batch", row_factory=None)
     cur = conn.cursor()
     ensure_learned_decks(cur)
+    ensure_hot_query_indexes(conn, tables=("learned_decks",))
     stats = write_decks(cur, decks, min_cards=args.min_cards, apply=args.apply)
     if args.apply:
         conn.commit()
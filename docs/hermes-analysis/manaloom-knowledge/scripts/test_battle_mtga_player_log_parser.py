@@ -49,7 +49,51 @@ def test_build_report_summarizes_player_log_without_raw_payloads() -> None:
     assert first["actions_count"] == 1
 
 
+def test_cursor_state_parses_only_appended_lines_and_resets_on_truncation() -> None:
+    lines = SAMPLE_LOG.splitlines(keepends=True)
+    with tempfile.TemporaryDirectory() as tmp_name:
+        source = Path(tmp_name) / "Player.log"
+        state = Path(tmp_name) / "cursor.json"
+        source.write_text("".join(lines[:2]) + lines[2][:40], encoding="utf-8")
+
+        first = parser.build_report([source], cursor_state=state)
+        with source.open("a", encoding="utf-8") as handle:
+            handle.write("".join(lines[2:])[40:])
+        second = parser.build_report([source], cursor_state=state)
+        full = parser.build_report([source])
+        persisted = state.read_text(encoding="utf-8")
+        source.write_text(lines[1], encoding="utf-8")
+        truncated = parser.build_report([source], cursor_state=state)
+
+    first_file = first["files"][0]
+    assert first_file["incremental"]["pending_partial_bytes"] == 40
+    assert first["summary"]["json_objects_seen"] == 1
+    second_file = second["files"][0]
+    assert second_file["incremental"]["resumed"] is True
+    assert second_file["incremental"]["start_offset"] == len("".join(lines[:2]).encode("utf-8"))
+    assert second["summary"] == full["summary"]
+    assert second["game_state_samples"] == full["game_state_samples"]
+    assert "gameObjects" not in persisted
+    assert truncated["files"][0]["incremental"]["reset_reason"] == "truncated"
+    assert truncated["summary"]["json_objects_seen"] == 1
+
+
+def test_follow_logs_reports_each_poll_with_new_bytes() -> None:
+    updates: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp_name:
+        source = Path(tmp_name) / "Player.log"
+        source.write_text(SAMPLE_LOG, encoding="utf-8")
+
+        report = parser.follow_logs([source], on_update=updates.append, poll_seconds=0, max_polls=3)
+
+    assert len(updates) == 1
+    assert report["summary"]["game_state_messages_seen"] == 2
+    assert report["files"][0]["incremental"]["bytes_read"] == len(SAMPLE_LOG.encode("utf-8"))
+
+
 if __name__ == "__main__":
     test_iter_json_values_extracts_embedded_objects()
     test_build_report_summarizes_player_log_without_raw_payloads()
-    print("2 tests passed")
+    test_cursor_state_parses_only_appended_lines_and_resets_on_truncation()
+    test_follow_logs_reports_each_poll_with_new_bytes()
+    print("4 tests passed")
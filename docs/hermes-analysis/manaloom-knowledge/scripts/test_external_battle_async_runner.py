@@ -9,6 +9,10 @@ import gzip
 import importlib.util
 import json
 import copy
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -45,6 +49,83 @@ def completed_result(
     }
 
 
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list = []
+
+    def do_POST(self):  # noqa: N802
+        raw = self.rfile.read(int(self.headers["content-length"]))
+        encoding = self.headers.get("content-encoding")
+        if encoding == "gzip":
+            raw = gzip.decompress(raw)
+        type(self).seen.append((self.client_address[1], encoding))
+        body = json.dumps({"echo": json.loads(raw)}).encode()
+        if "gzip" in self.headers.get("accept-encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("content-encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("accept-encoding", "gzip")
+        self.send_header("server-timing", "app;dur=12.5")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return
+
+
+class DropAfterFirstHandler(BaseHTTPRequestHandler):
+    """Answers the first POST, then accepts later ones without replying."""
+
+    protocol_version = "HTTP/1.1"
+    seen: list = []
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["content-length"]))
+        type(self).seen.append(self.client_address[1])
+        if len(type(self).seen) > 1:
+            self.close_connection = True
+            return
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return
+
+
+class CloseAfterReplyHandler(BaseHTTPRequestHandler):
+    """Answers with keep-alive headers, then half-closes like an idle timeout.
+
+    Later bytes on that socket are read and dropped, so a request sent on it
+    is accepted by the kernel but never answered.
+    """
+
+    protocol_version = "HTTP/1.1"
+    seen: list = []
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["content-length"]))
+        type(self).seen.append(self.client_address[1])
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+        self.connection.shutdown(socket.SHUT_WR)
+        while self.connection.recv(65536):
+            pass
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        return
+
+
 class FakeClient:
     def __init__(self, posts, health=None):
         self.posts = list(posts)
@@ -934,6 +1015,192 @@ class ExternalBattleAsyncRunnerTest(unittest.TestCase):
             runner.BattleQueueRunner(**kwargs).run()
         self.assertEqual(len(client.post_calls), 1)
 
+    def test_journal_replay_matches_full_checkpoint_and_gates(self):
+        registry = comparison_registry()
+        client = FakeClient(
+            [
+                runner.HttpResult(
+                    200,
+                    completed_result(
+                        job["focus_cards"][0],
+                        seed=job["request"]["seed"],
+                        deck_hashes=job["request"]["deck_hashes"],
+                    ),
+                )
+                for job in registry["jobs"]
+            ]
+        )
+        with tempfile.TemporaryDirectory() as temporary:
+            root = Path(temporary)
+            checkpoint_path = root / "checkpoint.json"
+            queue = runner.BattleQueueRunner(
+                registry=registry,
+                checkpoint_path=checkpoint_path,
+                result_dir=root / "results",
+                xmage_url="http://xmage",
+                forge_url="http://forge",
+                request_timeout=5,
+                recovery_timeout=5,
+                max_attempts=1,
+                client=client,
+                journal_compact_every=100,
+            )
+            for job in registry["jobs"][:4]:
+                queue._run_job(job)
+            interrupted = json.loads(json.dumps(queue.checkpoint))
+            journal = runner.checkpoint_journal_path(checkpoint_path)
+            self.assertTrue(journal.exists())
+            compacted = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+            self.assertLess(len(compacted["jobs"]), len(interrupted["jobs"]))
+
+            with journal.open("a", encoding="utf-8") as handle:
+                handle.write('{"torn": ')
+            replayed = runner.load_checkpoint(checkpoint_path, registry)
+            self.assertEqual(replayed, interrupted)
+            self.assertEqual(
+                interrupted["comparison_gates"],
+                runner.evaluate_comparisons(registry, interrupted),
+            )
+
+            resumed = runner.BattleQueueRunner(
+                registry=registry,
+                checkpoint_path=checkpoint_path,
+                result_dir=root / "results",
+                xmage_url="http://xmage",
+                forge_url="http://forge",
+                request_timeout=5,
+                recovery_timeout=5,
+                max_attempts=1,
+                client=client,
+            ).run()
+            self.assertFalse(journal.exists())
+            self.assertEqual(
+                json.loads(checkpoint_path.read_text(encoding="utf-8")),
+                json.loads(json.dumps(resumed)),
+            )
+        self.assertEqual(len(client.post_calls), len(registry["jobs"]))
+        self.assertEqual(resumed["status"], "completed")
+        self.assertTrue(resumed["comparison_gates"]["swap-1"]["comparison_input_ready"])
+
+    def test_deleted_checkpoint_restarts_without_replaying_old_journal(self):
+        registry = comparison_registry()
+        client = FakeClient(
+            [
+                runner.HttpResult(
+                    200,
+                    completed_result(
+                        job["focus_cards"][0],
+                        seed=job["request"]["seed"],
+                        deck_hashes=job["request"]["deck_hashes"],
+                    ),
+                )
+                for job in registry["jobs"]
+            ]
+        )
+        with tempfile.TemporaryDirectory() as temporary:
+            root = Path(temporary)
+            checkpoint_path = root / "checkpoint.json"
+            queue = runner.BattleQueueRunner(
+                registry=registry,
+                checkpoint_path=checkpoint_path,
+                result_dir=root / "results",
+                xmage_url="http://xmage",
+                forge_url="http://forge",
+                request_timeout=5,
+                recovery_timeout=5,
+                max_attempts=1,
+                client=client,
+                journal_compact_every=2,
+            )
+            for job in registry["jobs"][:3]:
+                queue._run_job(job)
+            compacted = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+            journal = runner.checkpoint_journal_path(checkpoint_path)
+            self.assertTrue(journal.exists())
+
+            checkpoint_path.unlink()
+            restarted = runner.load_checkpoint(checkpoint_path, registry)
+
+        # Mid-run compactions persist every gate, not only the touched ones.
+        self.assertEqual(
+            compacted["comparison_gates"],
+            runner.evaluate_comparisons(registry, compacted),
+        )
+        self.assertEqual(restarted["jobs"], {})
+        self.assertEqual(restarted["journal_sequence"], 0)
+        self.assertNotEqual(restarted["run_id"], compacted["run_id"])
+
+    def test_http_client_reuses_connections_and_negotiates_gzip(self):
+        EchoHandler.seen = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = runner.JsonHttpClient(gzip_min_bytes=0)
+        url = "http://127.0.0.1:%d/simulate" % server.server_address[1]
+        try:
+            first = client.post(url, {"deck": ["Card"] * 200}, 5)
+            second = client.post(url, {"deck": ["Card"] * 200}, 5)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(first.body, {"echo": {"deck": ["Card"] * 200}})
+        self.assertEqual(second.body, first.body)
+        self.assertEqual([encoding for _port, encoding in EchoHandler.seen], [None, "gzip"])
+        self.assertEqual(EchoHandler.seen[0][0], EchoHandler.seen[1][0])
+        self.assertFalse(first.timing["reused_connection"])
+        self.assertTrue(second.timing["reused_connection"])
+        self.assertTrue(second.timing["request_gzip"])
+        self.assertTrue(second.timing["response_gzip"])
+        self.assertLess(
+            second.timing["request_bytes"],
+            second.timing["request_uncompressed_bytes"],
+        )
+        self.assertEqual(second.timing["server_ms"], 12.5)
+        for key in ("connect_ms", "upload_ms", "wait_ms", "download_ms"):
+            self.assertGreaterEqual(second.timing[key], 0)
+
+    def test_http_client_does_not_resend_post_the_server_may_have_accepted(self):
+        DropAfterFirstHandler.seen = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), DropAfterFirstHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = runner.JsonHttpClient()
+        url = "http://127.0.0.1:%d/simulate" % server.server_address[1]
+        try:
+            client.post(url, {"seed": 1}, 5)
+            with self.assertRaises(runner.http.client.RemoteDisconnected):
+                client.post(url, {"seed": 2}, 5)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(len(DropAfterFirstHandler.seen), 2)
+
+    def test_http_client_redials_when_server_closed_the_pooled_socket(self):
+        CloseAfterReplyHandler.seen = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), CloseAfterReplyHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = runner.JsonHttpClient()
+        url = "http://127.0.0.1:%d/simulate" % server.server_address[1]
+        try:
+            client.post(url, {"seed": 1}, 5)
+            # Let the server's FIN reach the pooled socket.
+            time.sleep(0.2)
+            second = client.post(url, {"seed": 2}, 5)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(second.status, 200)
+        self.assertFalse(second.timing["reused_connection"])
+        self.assertEqual(len(CloseAfterReplyHandler.seen), 2)
+        self.assertNotEqual(*CloseAfterReplyHandler.seen)
+
     def test_registry_rejects_duplicate_comparison_seed(self):
         registry = comparison_registry()
         duplicate = copy.deepcopy(registry["jobs"][0])
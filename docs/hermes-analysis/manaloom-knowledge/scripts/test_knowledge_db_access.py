@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+import knowledge_db
+import knowledge_db_access as access
+
+
+LEARNED_DECKS_DDL = """
+CREATE TABLE learned_decks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    commander TEXT NOT NULL,
+    card_list TEXT,
+    card_count INTEGER
+);
+CREATE TABLE card_oracle_cache (
+    normalized_name TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+def build_fixture(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(knowledge_db.SCHEMA)
+        conn.executescript(LEARNED_DECKS_DDL)
+        conn.executemany(
+            "INSERT INTO learned_decks (source, commander, card_list, card_count) VALUES (?, ?, ?, ?)",
+            [
+                ("pg_meta_decks" if index % 3 else "edhrec", f"Commander {index}", "x" * 600, 80 + index % 20)
+                for index in range(400)
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class KnowledgeDbAccessTests(unittest.TestCase):
+    def test_hot_query_plans_regress_without_indexes_and_pass_with_them(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "knowledge.db"
+            build_fixture(db_path)
+            conn = access.connect_knowledge_db(db_path, profile="batch")
+            try:
+                before = {plan["query"]: plan for plan in access.check_query_plans(conn)}
+                indexes = access.ensure_hot_query_indexes(conn)
+                conn.execute("ANALYZE")
+                conn.commit()
+                after = access.check_query_plans(conn)
+                expected_top = conn.execute(
+                    """
+                    SELECT id FROM learned_decks
+                    ORDER BY CASE WHEN source = 'pg_meta_decks' THEN 0 ELSE 1 END,
+                             card_count DESC, id DESC
+                    LIMIT 5
+                    """
+                ).fetchall()
+                selected = conn.execute(access.LEARNED_OPPONENT_SELECTION_SQL, (80, 5)).fetchall()
+            finally:
+                conn.close()
+
+        self.assertFalse(before["learned_decks_opponent_selection"]["ok"])
+        self.assertFalse(before["deck_cards_by_normalized_card_name"]["ok"])
+        self.assertIn("idx_learned_decks_opponent_order", indexes)
+        self.assertIn("sqlite_autoindex_deck_cards_1", indexes)
+        self.assertNotIn("idx_deck_cards_deck_id", indexes)
+        self.assertEqual(len(after), 4)
+        self.assertTrue(all(plan["ok"] for plan in after), after)
+        self.assertEqual([row["id"] for row in selected], [row["id"] for row in expected_top])
+
+    def test_profiles_tune_pragmas_and_runtime_is_read_only(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "knowledge.db"
+            build_fixture(db_path)
+            writer = access.connect_knowledge_db(db_path, profile="batch")
+            reader = access.connect_knowledge_db(db_path, profile="runtime")
+            try:
+                journal_mode = writer.execute("PRAGMA journal_mode").fetchone()[0]
+                writer.execute("UPDATE learned_decks SET card_count = 99 WHERE id = 1")
+                count = reader.execute("SELECT card_count FROM learned_decks WHERE id = 1").fetchone()[0]
+                writer.commit()
+                mmap_size = reader.execute("PRAGMA mmap_size").fetchone()[0]
+                cache_size = reader.execute("PRAGMA cache_size").fetchone()[0]
+                with self.assertRaises(sqlite3.OperationalError):
+                    reader.execute("DELETE FROM learned_decks")
+            finally:
+                reader.close()
+                writer.close()
+            with self.assertRaises(sqlite3.OperationalError):
+                access.connect_knowledge_db(Path(tmp) / "missing.db", profile="runtime")
+
+        self.assertEqual(journal_mode, "wal")
+        self.assertEqual(count, 80)
+        self.assertEqual(mmap_size, access.PROFILES["runtime"].mmap_size)
+        self.assertEqual(cache_size, -access.PROFILES["runtime"].cache_size_kib)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from __future__ import annotations
 import json
 import io
 import os
+import sqlite3
 import sys
 import tempfile
 import unittest
@@ -72,7 +73,7 @@ class KnowledgeDbMultiTagsTests(unittest.TestCase):
         old_stdout = sys.stdout
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = os.path.join(tmpdir, "knowledge.db")
-            conn = knowledge_db.sqlite3.connect(db_path)
+            conn = sqlite3.connect(db_path)
             conn.executescript(legacy_schema)
             conn.commit()
             conn.close()
@@ -84,7 +85,7 @@ class KnowledgeDbMultiTagsTests(unittest.TestCase):
 
                 knowledge_db.cmd_insert_deck()
 
-                conn = knowledge_db.sqlite3.connect(db_path)
+                conn = sqlite3.connect(db_path)
                 columns = {
                     row[1]
                     for row in conn.execute("PRAGMA table_info(deck_cards)").fetchall()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import battle_analyst_v9 as battle
+import known_cards_fallback_snapshot as snapshot_module
+
+
+PAYLOAD = {
+    "Fire // Ice": {"effect": "removal", "battle_rule_review_status": "verified"},
+    "Lightning Bolt": {"effect": "burn", "damage": 3, "battle_rule_review_status": "verified"},
+    "LIGHTNING  BOLT": {"effect": "burn", "damage": 4, "battle_rule_review_status": "verified"},
+    "Lim-Dûl's Vault": {"effect": "tutor", "battle_rule_review_status": "verified"},
+    "Sol Ring": {"effect": "ramp_permanent", "instant": False, "battle_rule_review_status": "verified"},
+}
+
+
+def write_snapshot(path: Path, payload: dict) -> None:
+    snapshot_module.write_snapshot_payload(path, payload)
+    snapshot_module.write_snapshot_index(
+        snapshot_module.snapshot_index_path(path),
+        payload,
+        source_path=path,
+    )
+
+
+class KnownCardsSnapshotIndexTests(unittest.TestCase):
+    def test_index_looks_up_exact_names_and_decodes_only_on_access(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "known_cards_canonical_snapshot.json"
+            write_snapshot(json_path, PAYLOAD)
+            index = snapshot_module.open_snapshot_file(json_path)
+            try:
+                self.assertIsInstance(index, snapshot_module.IndexedSnapshot)
+                self.assertEqual(len(index), len(PAYLOAD))
+                self.assertEqual(sorted(index), sorted(PAYLOAD))
+                self.assertIn("LIGHTNING  BOLT", index)
+                self.assertNotIn("lightning bolt", index)
+                self.assertNotIn("Counterspell", index)
+                self.assertEqual(index._decoded, {})
+
+                self.assertEqual(index["Lightning Bolt"]["damage"], 3)
+                self.assertEqual(index["LIGHTNING  BOLT"]["damage"], 4)
+                self.assertEqual(index["Lim-Dûl's Vault"], PAYLOAD["Lim-Dûl's Vault"])
+                self.assertIs(index["Lightning Bolt"], index["Lightning Bolt"])
+                self.assertEqual(set(index._decoded), {"Lightning Bolt", "LIGHTNING  BOLT", "Lim-Dûl's Vault"})
+                self.assertEqual(dict(index.items()), PAYLOAD)
+            finally:
+                index.close()
+
+    def test_stale_or_missing_index_falls_back_to_json_and_is_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "known_cards_canonical_snapshot.json"
+            index_path = snapshot_module.snapshot_index_path(json_path)
+            write_snapshot(json_path, PAYLOAD)
+
+            # Same bytes with a new mtime (e.g. a fresh checkout) keeps the index.
+            stat = json_path.stat()
+            os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+            reopened = snapshot_module.open_snapshot_file(json_path)
+            self.assertIsInstance(reopened, snapshot_module.IndexedSnapshot)
+            reopened.close()
+            # The verified mtime is recorded, so the next open skips hashing.
+            with mock.patch.object(
+                snapshot_module, "_file_sha256", side_effect=AssertionError("rehashed")
+            ):
+                fast = snapshot_module.open_snapshot_file(json_path)
+            self.assertIsInstance(fast, snapshot_module.IndexedSnapshot)
+            self.assertEqual(fast["Lightning Bolt"]["damage"], 3)
+            fast.close()
+
+            changed = {**PAYLOAD, "Counterspell": {"effect": "counter"}}
+            snapshot_module.write_snapshot_payload(json_path, changed)
+            fallback = snapshot_module.open_snapshot_file(json_path)
+            self.assertEqual(fallback, changed)
+            rebuilt = snapshot_module.open_snapshot_file(json_path)
+            try:
+                self.assertIsInstance(rebuilt, snapshot_module.IndexedSnapshot)
+                self.assertEqual(rebuilt["Counterspell"], {"effect": "counter"})
+            finally:
+                rebuilt.close()
+
+            index_path.write_bytes(b"garbage")
+            self.assertEqual(snapshot_module.open_snapshot_file(json_path), changed)
+            self.assertEqual(snapshot_module.open_snapshot_file(Path(tmp) / "missing.json"), {})
+
+    def test_battle_runtime_materializes_snapshot_cards_on_first_lookup(self) -> None:
+        payload = {
+            "Index Fixture Bolt": {
+                "effect": "burn",
+                "instant": True,
+                "battle_rule_source": "curated",
+                "battle_rule_review_status": "verified",
+                "battle_rule_execution_status": "auto",
+                "battle_rule_confidence": 0.9,
+            }
+        }
+        bucket: set[str] = set()
+        previous_snapshots = list(battle._KNOWN_CARD_SNAPSHOTS)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "known_cards_canonical_snapshot.json"
+            write_snapshot(json_path, payload)
+            battle._load_known_cards_into_runtime(json_path, bucket=bucket)
+            try:
+                self.assertNotIn("Index Fixture Bolt", battle.KNOWN_CARDS)
+                card = {"name": "Index Fixture Bolt", "type_line": "Kindred", "oracle_text": ""}
+                self.assertTrue(battle.is_instant(card))
+                self.assertEqual(battle.KNOWN_CARDS["Index Fixture Bolt"]["effect"], "burn")
+                self.assertEqual(bucket, {"Index Fixture Bolt"})
+                self.assertEqual(battle.known_card_entry("Index Fixture Bolt")["instant"], True)
+                with self.assertRaises(KeyError):
+                    battle.known_card_entry("Index Fixture Missing")
+            finally:
+                for snapshot, _bucket in battle._KNOWN_CARD_SNAPSHOTS[len(previous_snapshots):]:
+                    snapshot.close()
+                battle._KNOWN_CARD_SNAPSHOTS[:] = previous_snapshots
+                battle._KNOWN_CARD_MISSES.clear()
+                battle.KNOWN_CARDS.pop("Index Fixture Bolt", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import csv
+import gzip
+import tempfile
+from pathlib import Path
+
+import seventeenlands_history_learning as learning
+import seventeenlands_replay_columns as replay_columns
+import seventeenlands_replay_profile as profile
+from test_seventeenlands_history_learning import FIELDNAMES as HISTORY_FIELDNAMES
+from test_seventeenlands_history_learning import fixture_rows as history_rows
+from test_seventeenlands_replay_profile import FIELDNAMES, fixture_row
+
+
+def write_gzip_fixture(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def without_volatile(report: dict) -> dict:
+    return {
+        key: value
+        for key, value in report.items()
+        if key not in {"generated_at", "columnar_cache"}
+    }
+
+
+def test_columns_round_trip_sparse_rows_across_workers_and_cache() -> None:
+    second = dict(fixture_row(), draft_id="draft-b", user_turn_1_cards_drawn="", user_turn_2_user_mana_spent="0.0")
+    with tempfile.TemporaryDirectory() as tmp_name:
+        source = Path(tmp_name) / "replay_data_public.csv.gz"
+        cache_dir = Path(tmp_name) / "cache"
+        write_gzip_fixture(source, FIELDNAMES, [fixture_row(), second])
+
+        serial = replay_columns.build_columns(str(source), workers=1)
+        pooled = replay_columns.build_columns(str(source), workers=2, chunk_rows=1)
+        built, built_info = replay_columns.load_replay_columns(str(source), cache_dir=cache_dir, workers=1)
+        cached, cached_info = replay_columns.load_replay_columns(str(source), cache_dir=cache_dir, workers=1)
+
+    rows = list(serial.iter_rows())
+    assert serial.games == 2
+    assert rows == list(pooled.iter_rows()) == list(built.iter_rows()) == list(cached.iter_rows())
+    assert list(rows[0]) == [name for name in FIELDNAMES if rows[0].get(name) is not None]
+    assert rows[0]["opening_hand"] == "1100|1101|1102|1103|1104|1105|1106"
+    assert rows[0]["user_turn_2_non_creatures_cast"] == "1109|1110"
+    assert rows[0]["user_turn_1_user_mana_spent"] == "1.0"
+    assert "user_turn_1_cards_drawn" not in rows[1]
+    assert rows[1]["draft_id"] == "draft-b"
+    assert serial.cell("user_turn_2_non_creatures_cast", 1) == "1109|1110"
+    assert (built_info["source"], cached_info["source"]) == ("built", "cache")
+    assert built_info["source_sha256"] == cached_info["source_sha256"]
+
+
+def ranked_lists_as_sets(report: dict) -> dict:
+    """Equal ranks may order differently between the row and column paths."""
+
+    summary = report["sample_summary"]
+    metrics = summary["card_observation_metrics"]
+    return {
+        **report,
+        "sample_summary": {
+            **summary,
+            "card_observation_metrics": {
+                key: sorted(rows, key=lambda row: row["arena_id"]) for key, rows in metrics.items()
+            },
+        },
+    }
+
+
+def test_profile_columns_matches_row_profile_of_the_same_games() -> None:
+    short = dict(fixture_row(), draft_id="draft-b", num_turns="1", won="False", user_turn_1_user_mana_spent="0.0")
+    unknown = dict(fixture_row(), draft_id="draft-c", num_turns="", opening_hand="1100|1190")
+    with tempfile.TemporaryDirectory() as tmp_name:
+        source = Path(tmp_name) / "replay_data_public.csv.gz"
+        write_gzip_fixture(source, FIELDNAMES, [fixture_row(), short, unknown])
+        columns = replay_columns.build_columns(str(source), workers=1)
+
+    by_rows = profile.profile_rows(
+        source=str(source),
+        source_label="fixture",
+        fieldnames=columns.fieldnames,
+        rows=columns.iter_rows(),
+    )
+    by_columns = replay_columns.profile_columns(columns, source=str(source), source_label="fixture")
+
+    assert ranked_lists_as_sets(without_volatile(by_columns)) == ranked_lists_as_sets(without_volatile(by_rows))
+    assert by_columns["rows_sampled"] == 3
+
+
+def test_full_file_profile_and_columnar_learning_match_csv_reads() -> None:
+    with tempfile.TemporaryDirectory() as tmp_name:
+        profile_source = Path(tmp_name) / "profile.csv.gz"
+        write_gzip_fixture(profile_source, FIELDNAMES, [fixture_row()])
+        history_source = Path(tmp_name) / "history.csv.gz"
+        write_gzip_fixture(history_source, HISTORY_FIELDNAMES, history_rows())
+        cache_dir = Path(tmp_name) / "cache"
+
+        sampled = profile.run(source=str(profile_source), source_label="fixture", sample_rows=10)
+        full = profile.run(
+            source=str(profile_source),
+            source_label="fixture",
+            sample_rows=10,
+            full_file=True,
+            columns_cache_dir=cache_dir,
+        )
+        learn_args = {
+            "source": str(history_source),
+            "source_label": "fixture",
+            "max_rows": 0,
+            "top_card_limit": 10,
+            "top_sequence_limit": 10,
+            "turn_prefix_limit": 3,
+        }
+        streamed = learning.learn_rows(**learn_args)
+        columnar = learning.learn_rows(**learn_args, columnar=True, columns_cache_dir=cache_dir)
+
+    assert without_volatile(full) == without_volatile(sampled)
+    assert full["columnar_cache"]["source"] == "built"
+    assert without_volatile(columnar) == without_volatile(streamed)
+    assert columnar["rows_processed"] == 2
+
+
+if __name__ == "__main__":
+    test_columns_round_trip_sparse_rows_across_workers_and_cache()
+    test_profile_columns_matches_row_profile_of_the_same_games()
+    test_full_file_profile_and_columnar_learning_match_csv_reads()
+    print("3 tests passed")
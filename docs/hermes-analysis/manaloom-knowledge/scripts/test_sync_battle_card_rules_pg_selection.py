@@ -1015,6 +1015,114 @@ class SyncBattleCardRulesPgSelectionTests(unittest.TestCase):
 
         execute_values.assert_not_called()
 
+    def test_bulk_upsert_pg_rules_stages_once_and_merges_in_sql(self) -> None:
+        captured: dict[str, object] = {}
+
+        def fake_execute_values(cur, sql, values, template, page_size):
+            captured["sql"] = sql
+            captured["values"] = values
+
+        cur = mock.Mock()
+        cur.fetchall.return_value = []
+        cur.fetchone.return_value = (2, 0)
+        rows = [
+            {
+                "card_name": "Mana Vault",
+                "logical_rule_key": "battle_rule_v1:fast-mana",
+                "effect_json": {"effect": "ramp_permanent", "mana_produced": 3},
+                "deck_role_json": {"category": "ramp"},
+                "source": "curated",
+                "confidence": 0.91,
+                "review_status": "active",
+                "execution_status": "annotation_only",
+            },
+            {
+                "card_name": "Mana Vault",
+                "logical_rule_key": "battle_rule_v1:fast-mana",
+                "effect_json": {"effect": "ramp_permanent", "mana_produced": 3},
+                "source": "generated",
+                "review_status": "needs_review",
+                "oracle_hash": "md5",
+            },
+        ]
+        timings: dict[str, float] = {}
+
+        with mock.patch("psycopg2.extras.execute_values", side_effect=fake_execute_values):
+            changed, skipped = sync_pg.bulk_upsert_pg_rules(cur, rows, timings=timings)
+
+        statements = [str(call.args[0]) for call in cur.execute.call_args_list]
+        merge = next(sql for sql in statements if "INSERT INTO card_battle_rules" in sql)
+        self.assertEqual((changed, skipped), (2, 0))
+        self.assertIn("staging_card_battle_rules", str(captured["sql"]))
+        self.assertEqual([value[0] for value in captured["values"]], [0, 1])
+        self.assertEqual(captured["values"][0][10], "annotation_only")
+        self.assertIsNone(captured["values"][0][11])
+        self.assertIn("DISTINCT ON (normalized_name, logical_rule_key)", merge)
+        self.assertIn("seq DESC", merge)
+        self.assertIn(
+            "COALESCE(NULLIF(EXCLUDED.oracle_hash, ''), card_battle_rules.oracle_hash)",
+            merge,
+        )
+        self.assertTrue(any("md5(coalesce(c.oracle_text, ''))" in sql for sql in statements))
+        self.assertTrue(any("WHEN 'manual' THEN 100" in sql for sql in statements))
+        self.assertEqual(
+            set(timings),
+            {"pg_stage_seconds", "pg_resolve_seconds", "pg_merge_seconds"},
+        )
+
+    def test_bulk_upsert_pg_rules_rejects_trusted_rows_before_merging(self) -> None:
+        cur = mock.Mock()
+        cur.fetchall.return_value = [("Mana Vault",)]
+        row = {
+            "card_name": "Mana Vault",
+            "logical_rule_key": "battle_rule_v1:fast-mana",
+            "effect_json": {"effect": "ramp_permanent"},
+            "source": "curated",
+            "review_status": "active",
+            "execution_status": "auto",
+        }
+
+        with mock.patch("psycopg2.extras.execute_values"):
+            with self.assertRaisesRegex(RuntimeError, "without oracle_hash"):
+                sync_pg.bulk_upsert_pg_rules(cur, [row])
+
+        statements = [str(call.args[0]) for call in cur.execute.call_args_list]
+        self.assertFalse(any("INSERT INTO card_battle_rules" in sql for sql in statements))
+
+    def test_pg_mirror_rewrites_only_rows_whose_content_changed(self) -> None:
+        rows = [
+            {
+                "normalized_name": name.lower(),
+                "card_name": name,
+                "logical_rule_key": f"pg-key-{index}",
+                "effect_json": {"effect": "ramp_permanent"},
+                "deck_role_json": {"category": "ramp"},
+                "source": "generated",
+                "confidence": 0.5,
+                "review_status": "needs_review",
+                "execution_status": "auto",
+                "rule_version": 1,
+                "notes": "",
+                "oracle_hash": "hash",
+            }
+            for index, name in enumerate(("Sol Ring", "Mind Stone"))
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sqlite_db = str(Path(tmpdir) / "knowledge.db")
+            first = sync_pg.mirror_pg_rules_to_sqlite(sqlite_db, rows)
+            timings: dict[str, float] = {}
+            unchanged = sync_pg.mirror_pg_rules_to_sqlite(sqlite_db, rows, timings=timings)
+            rows[1] = dict(rows[1], notes="retuned", oracle_hash=None)
+            retuned = sync_pg.mirror_pg_rules_to_sqlite(sqlite_db, rows)
+            with closing(sqlite3.connect(sqlite_db)) as conn:
+                stored = conn.execute(
+                    "SELECT notes, oracle_hash FROM battle_card_rules WHERE normalized_name='mind stone'"
+                ).fetchone()
+
+        self.assertEqual((first, unchanged, retuned), (2, 0, 1))
+        self.assertEqual(stored, ("retuned", "hash"))
+        self.assertEqual(set(timings), {"sqlite_cleanup_seconds", "sqlite_upsert_seconds"})
+
     def test_pg_mirror_preserves_pg_logical_key_and_removes_shadow_rows(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             sqlite_db = Path(tmpdir) / "knowledge.db"
@@ -365,6 +365,105 @@ class SyncPgCardMetadataToHermesTest(unittest.TestCase):
         finally:
             conn.close()
 
+    def test_incremental_sync_upserts_only_cards_whose_hash_changed(self) -> None:
+        sol_ring = {
+            "card_id": "11111111-1111-1111-1111-111111111111",
+            "name": "Sol Ring",
+            "mana_cost": "{1}",
+            "type_line": "Artifact",
+            "oracle_text": "{T}: Add {C}{C}.",
+            "colors": [],
+            "color_identity": [],
+            "cmc": 1,
+            "power": None,
+            "toughness": None,
+            "keywords": [],
+            "scryfall_id": None,
+            "pg_updated_at": None,
+        }
+        mountain = dict(
+            sol_ring,
+            card_id="22222222-2222-2222-2222-222222222222",
+            name="Mountain",
+            mana_cost="",
+            type_line="Basic Land — Mountain",
+            oracle_text="({T}: Add {R}.)",
+            cmc=0,
+        )
+        pages = [[sol_ring, mountain]]
+        queries: list[str] = []
+
+        def fake_psql(sql: str):
+            queries.append(sql)
+            return pages[len(queries) - 1] if len(queries) <= len(pages) else []
+
+        def run_sync() -> tuple[list[dict], dict]:
+            queries.clear()
+            with mock.patch.object(sync, "connect", None), mock.patch.object(
+                sync, "run_psql_json", side_effect=fake_psql
+            ):
+                changed, state_rows, report = sync.collect_changed_cards(
+                    self.cur,
+                    {"Sol Ring", "Mountain"},
+                    set(),
+                    batch_size=2,
+                )
+            sync.write_cache(self.cur, sync.cache_rows(changed))
+            sync.write_sync_state(self.cur, state_rows, watermark=report["watermark_after"])
+            return changed, report
+
+        first, first_report = run_sync()
+        self.assertEqual([card["name"] for card in first], ["Sol Ring", "Mountain"])
+        self.assertEqual(first_report["watermark_column"], "content_hash")
+        self.assertEqual(first_report["batches"], 1)
+        self.assertIn("LIMIT 2", queries[0])
+        self.assertIn("c.id > '22222222-2222-2222-2222-222222222222'::uuid", queries[1])
+
+        unchanged, unchanged_report = run_sync()
+        self.assertEqual(unchanged, [])
+        self.assertEqual(unchanged_report["cards_unchanged"], 2)
+
+        pages = [[dict(sol_ring, oracle_text="{T}: Add {C}{C}{C}."), mountain]]
+        changed, changed_report = run_sync()
+        self.assertEqual([card["name"] for card in changed], ["Sol Ring"])
+        self.assertEqual(changed_report["cards_changed"], 1)
+        self.assertEqual(
+            self.cur.execute(
+                "SELECT oracle_text FROM card_oracle_cache WHERE normalized_name='sol ring'"
+            ).fetchone()[0],
+            "{T}: Add {C}{C}{C}.",
+        )
+
+    def test_incremental_backfill_touches_only_decks_naming_changed_cards(self) -> None:
+        self.cur.executemany(
+            """
+            INSERT INTO deck_cards (
+                deck_id, card_name, quantity, cmc, type_line, oracle_text
+            ) VALUES (?, ?, 1, 0, '', '')
+            """,
+            [(1, "Sol Ring"), (2, "Arcane Signet")],
+        )
+        sync.write_cache(
+            self.cur,
+            sync.cache_rows(
+                [
+                    {"name": "Sol Ring", "type_line": "Artifact", "cmc": 1},
+                    {"name": "Arcane Signet", "type_line": "Artifact", "cmc": 2},
+                ]
+            ),
+        )
+
+        report = sync.backfill_deck_cards_from_cache(
+            self.cur,
+            dry_run=False,
+            changed_aliases={"sol ring"},
+        )
+
+        self.assertEqual(report["rows_total"], 1)
+        self.assertEqual(report["cmc_rows_updated"], 1)
+        cmc_by_deck = dict(self.cur.execute("SELECT deck_id, cmc FROM deck_cards"))
+        self.assertEqual(cmc_by_deck, {1: 1.0, 2: 0.0})
+
     def test_absent_deck_cards_table_reports_explicitly(self) -> None:
         conn = sqlite3.connect(":memory:")
         try:
@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import xmage_authoritative_exact_scope_split as split
+import xmage_source_index
 
 
 MANA_VAULT_SOURCE = r'''
@@ -37540,6 +37544,57 @@ class XMageAuthoritativeExactScopeSplitTest(unittest.TestCase):
         self.assertEqual(report["summary"]["proposal_count"], 1)
         self.assertEqual(report["summary"]["blocked_reason_counts"], {"x_damage_source_not_supported": 1})
 
+    def test_report_matches_between_serial_and_process_pool_splits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = []
+            card_metadata = {}
+            fixtures = [
+                ("draw", split.DRAW_UNIT, "DrawCardSourceControllerEffect", "Draw a card.", "new DrawCardSourceControllerEffect(1)"),
+                ("variable", split.DAMAGE_UNIT, "DamageTargetEffect", "Variable Fixture deals X damage to any target.", "new DamageTargetEffect(FixtureDynamicValue.instance)"),
+                ("draw-two", split.DRAW_UNIT, "DrawCardSourceControllerEffect", "Draw two cards.", "new DrawCardSourceControllerEffect(2)"),
+            ]
+            for card_id, unit, effect_class, oracle_text, source in fixtures:
+                path = Path(tmp) / f"{card_id}.java"
+                path.write_text(source, encoding="utf-8")
+                row = queue_row(unit, effect_classes=[effect_class], card_id=card_id)
+                row["xmage_path"] = str(path)
+                rows.append(row)
+                card_metadata[card_id] = metadata(card_id, oracle_text=oracle_text)
+            payload = {"queue": rows, "generated_at": "fixture", "status": "ready", "method": {"scope": "test"}}
+
+            serial = split.build_exact_split_report(payload, card_metadata_by_id=card_metadata)
+            with mock.patch.object(split, "SPLIT_POOL_MIN_ROWS", 1), mock.patch.object(split, "SPLIT_CHUNK_ROWS", 1):
+                pooled = split.build_exact_split_report(payload, card_metadata_by_id=card_metadata, workers=2)
+                capped = split.build_exact_split_report(
+                    payload, card_metadata_by_id=card_metadata, workers=2, max_cards=1
+                )
+
+        self.assertEqual(pooled["summary"], serial["summary"])
+        self.assertEqual(pooled["proposals"], serial["proposals"])
+        self.assertEqual(serial["summary"]["proposal_count"], 2)
+        self.assertEqual(capped["summary"]["proposal_count"], 1)
+        self.assertEqual(capped["summary"]["considered_supported_work_unit_rows"], 1)
+
+    def test_unit_classification_is_shared_by_rows_with_equal_features(self) -> None:
+        first = queue_row(
+            split.DRAW_ENGINE_UNIT,
+            effect_classes=["DrawCardSourceControllerEffect"],
+            ability_classes=["FlyingAbility", "EntersBattlefieldTriggeredAbility"],
+            xmage_signals=["triggered_ability", "draw"],
+        )
+        second = dict(
+            first,
+            card_id="card-2",
+            xmage_ability_classes=["EntersBattlefieldTriggeredAbility", "FlyingAbility"],
+            xmage_signals=["draw", "triggered_ability"],
+        )
+        units = split.unit_classification(first)
+
+        self.assertIs(split.unit_classification(second), units)
+        self.assertTrue(units(split.is_creature_etb_draw_unit))
+        self.assertFalse(units(split.is_static_keyword_creature_unit))
+        self.assertEqual(units(split.is_creature_etb_draw_unit), split.is_creature_etb_draw_unit(second))
+
     def test_each_player_sacrifice_maps_fixed_creature_count(self) -> None:
         proposal, reason = split.split_row(
             queue_row(split.BOARD_WIPE_UNIT, effect_classes=["SacrificeAllEffect"]),
@@ -39780,5 +39835,24 @@ class XMageAuthoritativeExactScopeSplitTest(unittest.TestCase):
                 self.assertEqual(effect["mana_color_status"], "colored_pool_runtime")
 
 
+    def test_token_class_source_resolves_nested_token_through_source_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve() / "xmage"
+            token = root / "Mage/src/main/java/mage/game/permanent/token/custom/SpiritWarriorToken.java"
+            token.parent.mkdir(parents=True)
+            token.write_text("public final class SpiritWarriorToken extends TokenImpl {}", encoding="utf-8")
+            card = root / "Mage.Sets/src/mage/cards/s/SpiritCaller.java"
+            card.parent.mkdir(parents=True)
+            card.write_text("public final class SpiritCaller extends CardImpl {}", encoding="utf-8")
+            self.addCleanup(xmage_source_index._LOADED.clear)
+            row = {"xmage_path": str(card)}
+
+            source = split.token_class_source(row, card.read_text(encoding="utf-8"), "SpiritWarriorToken")
+            missing = split.token_class_source(row, "", "MissingToken")
+
+        self.assertIn("class SpiritWarriorToken extends TokenImpl", source)
+        self.assertEqual(missing, "")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,10 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import xmage_local_rule_indexer as indexer
+import xmage_source_index
 
 
 PEARL_MEDALLION_JAVA = """
@@ -147,6 +149,15 @@ public final class BartolomeDelPresidio extends CardImpl {
 
 
 class XMageLocalRuleIndexerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = Path(cache_dir.name)
+        patcher = mock.patch.dict("os.environ", {xmage_source_index.INDEX_CACHE_DIR_ENV: cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(xmage_source_index._LOADED.clear)
+
     def _fixture_root(self) -> Path:
         tmpdir = tempfile.TemporaryDirectory()
         self.addCleanup(tmpdir.cleanup)
@@ -284,6 +295,36 @@ class XMageLocalRuleIndexerTests(unittest.TestCase):
             {candidate["class_name"] for candidate in entry["nearby_xmage_class_candidates"]},
         )
 
+    def test_report_reuses_extractions_and_reparses_only_changed_sources(self) -> None:
+        root = self._fixture_root()
+        cards = ["Pearl Medallion", "Promise of Loyalty", "Emeria's Call", "Mountain", "Missing Card"]
+
+        with mock.patch.object(indexer, "EXTRACTION_POOL_MIN_FILES", 1):
+            first = indexer.build_index_report(cards, xmage_root=root, workers=2)
+        xmage_source_index._LOADED.clear()
+        second = indexer.build_index_report(cards, xmage_root=root)
+        pearl = root / "Mage.Sets" / "src" / "mage" / "cards" / "p" / "PearlMedallion.java"
+        pearl.write_text(PEARL_MEDALLION_JAVA.replace("{2}", "{3}"), encoding="utf-8")
+        xmage_source_index._LOADED.clear()
+        third = indexer.build_index_report(cards, xmage_root=root)
+
+        self.assertEqual(
+            (first["summary"]["extraction_parsed_count"], first["summary"]["extraction_reused_count"]),
+            (4, 0),
+        )
+        self.assertEqual(
+            (second["summary"]["extraction_parsed_count"], second["summary"]["extraction_reused_count"]),
+            (0, 4),
+        )
+        self.assertEqual(second["cards"], first["cards"])
+        self.assertEqual(
+            (third["summary"]["extraction_parsed_count"], third["summary"]["extraction_reused_count"]),
+            (1, 3),
+        )
+        self.assertEqual(third["cards"][0]["constructor_metadata"]["mana_cost"], "{3}")
+        self.assertEqual(third["cards"][0]["xmage_path"], str(pearl))
+        self.assertEqual(Path(third["extraction_cache"]).parent, self.cache_dir)
+
 
 if __name__ == "__main__":
     unittest.main()
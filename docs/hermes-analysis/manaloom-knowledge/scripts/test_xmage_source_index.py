@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import xmage_source_index as source_index
+
+
+def _write(root: Path, relative: str, text: str) -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class XMageSourceIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name).resolve() / "xmage"
+        self.cache_dir = Path(tmpdir.name) / "cache"
+        _write(
+            self.root,
+            "Mage/src/main/java/mage/game/permanent/token/TokenImpl.java",
+            "public abstract class TokenImpl extends MageObjectImpl {}",
+        )
+        _write(
+            self.root,
+            "Mage/src/main/java/mage/game/permanent/token/GoblinToken.java",
+            "public final class GoblinToken extends TokenImpl {}",
+        )
+        _write(
+            self.root,
+            "Mage.Sets/src/mage/cards/g/GoblinToken.java",
+            "class GoblinToken extends mage.game.permanent.token.TokenImpl {}",
+        )
+        _write(
+            self.root,
+            "Mage.Sets/src/mage/cards/s/SolRing.java",
+            "public final class SolRing extends CardImpl {}",
+        )
+        _write(
+            self.root,
+            "Mage.Tests/src/test/java/org/mage/test/SolRingTest.java",
+            "public class SolRingTest extends CardTestPlayerBase {}",
+        )
+        self.addCleanup(source_index._LOADED.clear)
+
+    def test_maps_class_names_to_paths_hashes_and_superclasses(self) -> None:
+        index = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+
+        self.assertEqual(index.source, "built_uncached")
+        self.assertEqual(
+            index.find("GoblinToken", under=("Mage.Sets/src/mage/cards", "Mage/src/main/java")),
+            self.root / "Mage.Sets/src/mage/cards/g/GoblinToken.java",
+        )
+        self.assertEqual(
+            index.find("GoblinToken", under=("Mage/src/main/java",)),
+            self.root / "Mage/src/main/java/mage/game/permanent/token/GoblinToken.java",
+        )
+        self.assertEqual(index.extends_chain("GoblinToken"), ["TokenImpl", "MageObjectImpl"])
+        self.assertEqual(
+            [path.name for path in index.files_under("Mage.Tests/src/test/java")],
+            ["SolRingTest.java"],
+        )
+        entry = index.entry(self.root / "Mage.Sets/src/mage/cards/s/SolRing.java")
+        self.assertEqual(entry.extends, "CardImpl")
+        self.assertEqual(len(entry.sha256), 64)
+        self.assertIs(source_index.load_source_index(self.root), index)
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_clean_checkout_is_persisted_per_commit(self) -> None:
+        git = ["git", "-C", str(self.root), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        subprocess.run([*git, "add", "."], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "fixture"], check=True)
+
+        built = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+        source_index._LOADED.clear()
+        with mock.patch.object(
+            source_index, "build_source_index", side_effect=AssertionError("rebuilt")
+        ):
+            cached = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+
+        self.assertEqual(built.source, "built")
+        self.assertEqual(cached.source, "cache")
+        self.assertEqual(cached.commit, built.commit)
+        self.assertEqual(cached.entries, built.entries)
+
+    def test_dirty_checkout_rehashes_only_reported_paths_and_is_cached(self) -> None:
+        git = ["git", "-C", str(self.root), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        subprocess.run([*git, "add", "."], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "fixture"], check=True)
+        clean = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+
+        _write(self.root, "Mage.Sets/src/mage/cards/a/ArcaneSignet.java", "class ArcaneSignet {}")
+        _write(self.root, "Mage.Sets/src/mage/cards/s/SolRing.java", "public final class SolRing extends ManaRock {}")
+        (self.root / "Mage.Tests/src/test/java/org/mage/test/SolRingTest.java").unlink()
+        indexed: list[str] = []
+        original_index_file = source_index._index_file
+
+        def record_index_file(root: Path, path: Path) -> source_index.SourceEntry:
+            indexed.append(path.relative_to(root).as_posix())
+            return original_index_file(root, path)
+
+        source_index._LOADED.clear()
+        with mock.patch.object(source_index, "_index_file", side_effect=record_index_file):
+            dirty = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+        source_index._LOADED.clear()
+        with mock.patch.object(
+            source_index, "build_source_index", side_effect=AssertionError("rebuilt")
+        ), mock.patch.object(source_index, "_index_file", side_effect=AssertionError("rehashed")):
+            cached = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+
+        self.assertIsNone(dirty.commit)
+        self.assertEqual(dirty.head, clean.commit)
+        self.assertEqual(dirty.source, "incremental")
+        self.assertEqual(
+            sorted(indexed),
+            ["Mage.Sets/src/mage/cards/a/ArcaneSignet.java", "Mage.Sets/src/mage/cards/s/SolRing.java"],
+        )
+        self.assertIsNotNone(dirty.find("ArcaneSignet"))
+        self.assertIsNone(dirty.find("SolRingTest"))
+        self.assertEqual(dirty.extends_chain("SolRing"), ["ManaRock"])
+        self.assertEqual(cached.source, "cache")
+        self.assertEqual(cached.entries, dirty.entries)
+        self.assertEqual(dirty.entries, source_index.build_source_index(self.root))
+
+        # Back to clean: the HEAD index is reused as is.
+        subprocess.run([*git, "checkout", "-q", "--", "."], check=True)
+        (self.root / "Mage.Sets/src/mage/cards/a/ArcaneSignet.java").unlink()
+        source_index._LOADED.clear()
+        restored = source_index.load_source_index(self.root, cache_dir=self.cache_dir)
+        self.assertEqual(restored.source, "cache")
+        self.assertEqual(restored.entries, clean.entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
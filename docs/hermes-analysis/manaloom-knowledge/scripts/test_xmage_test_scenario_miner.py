@@ -4,6 +4,7 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import xmage_test_scenario_miner as miner
 
@@ -174,6 +175,41 @@ class XMageTestScenarioMinerTests(unittest.TestCase):
         self.assertEqual(card["test_file_count"], 0)
         self.assertEqual(card["status"], "no_exact_test_reference_found")
 
+    def test_token_index_is_cached_per_xmage_commit(self) -> None:
+        root = self._root(("ConstantReferenceCardTest.java", CONSTANT_REFERENCE_TEST))
+        cache_dir = root / "index-cache"
+        cards = ["Constant Reference Card", "Promise of Loyalty", "Missing Card"]
+
+        built = miner.build_report(
+            cards, xmage_root=root, xmage_commit="a" * 40, index_cache_dir=cache_dir
+        )
+        with mock.patch.object(miner, "iter_test_files", side_effect=AssertionError("rescanned")):
+            cached = miner.build_report(
+                cards, xmage_root=root, xmage_commit="a" * 40, index_cache_dir=cache_dir
+            )
+        rebuilt = miner.build_report(
+            cards, xmage_root=root, xmage_commit="b" * 40, index_cache_dir=cache_dir
+        )
+
+        self.assertEqual(built["test_index"]["source"], "built")
+        self.assertEqual(cached["test_index"]["source"], "cache")
+        self.assertEqual(rebuilt["test_index"]["source"], "built")
+        self.assertEqual(built["cards"], cached["cards"])
+        self.assertEqual(built["summary"], cached["summary"])
+        self.assertEqual(cached["summary"]["cards_with_test_reference"], 2)
+
+    def test_candidate_files_require_every_token_of_a_term(self) -> None:
+        root = self._root(("UnrelatedTest.java", COMMENT_ONLY_REFERENCE_TEST))
+        index = miner.build_test_index(miner.iter_test_files(root), xmage_root=root)
+        paths = [row["path"].rsplit("/", 1)[-1] for row in index["files"]]
+
+        promise = miner.candidate_file_ids(index, ["Promise of Loyalty"])
+        krark = miner.candidate_file_ids(index, ["Krark, the Thumbless", "KrarkTheThumbless"])
+
+        self.assertEqual([paths[file_id] for file_id in promise], ["PromiseOfLoyaltyTest.java"])
+        self.assertEqual([paths[file_id] for file_id in krark], ["UnrelatedTest.java"])
+        self.assertEqual(miner.candidate_file_ids(index, ["Missing Card"]), [])
+
     def test_markdown_contains_boundary(self) -> None:
         report = miner.build_report(["Promise of Loyalty"], xmage_root=self._root())
         markdown = miner.render_markdown(report)
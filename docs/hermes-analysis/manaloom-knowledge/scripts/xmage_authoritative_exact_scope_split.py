@@ -9,18 +9,25 @@ patterns. Broad review scopes stay blocked for a later subpattern mapper.
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
+import xmage_source_index
 from battle_rule_registry import deck_role_from_effect, logical_rule_key
 
 
 REPORT_DIR = Path(__file__).resolve().parent.parent.parent / "master_optimizer_reports"
+SPLIT_WORKERS = min(8, os.cpu_count() or 1)
+SPLIT_POOL_MIN_ROWS = 256
+SPLIT_CHUNK_ROWS = 64
 
 
 def as_list(value: Any) -> list[Any]:
@@ -2516,15 +2523,15 @@ def token_class_source(row: dict[str, Any], source_text: str, token_class: str)
     direct = root / "Mage" / "src" / "main" / "java" / "mage" / "game" / "permanent" / "token" / f"{token_class}.java"
     if direct.is_file():
         return direct.read_text(encoding="utf-8", errors="replace")
-    for base in (
-        root / "Mage" / "src" / "main" / "java",
-        root / "Mage.Sets" / "src" / "mage" / "cards",
-    ):
-        if not base.is_dir():
-            continue
-        for candidate in base.rglob(f"{token_class}.java"):
-            return candidate.read_text(encoding="utf-8", errors="replace")
-    return ""
+    if not root.is_dir():
+        return ""
+    candidate = xmage_source_index.load_source_index(root).find(
+        token_class,
+        under=("Mage/src/main/java", "Mage.Sets/src/mage/cards"),
+    )
+    if candidate is None:
+        return ""
+    return candidate.read_text(encoding="utf-8", errors="replace")
 
 
 def title_subtype(value: str) -> str:
@@ -34811,134 +34818,72 @@ def build_proposal(
     }
 
 
+class UnitClassification:
+    """Lazily evaluated ``is_*_unit`` predicate results for one feature signature.
+
+    Every unit predicate reads only the work unit, effect classes, ability
+    classes and signals of a row, so rows sharing those features share one
+    classification and each predicate runs at most once for all of them.
+    """
+
+    def __init__(self, features: tuple[str, frozenset[str], frozenset[str], frozenset[Any]]) -> None:
+        unit, effects, abilities, signals = features
+        self._row = {
+            "adapter_work_unit": unit,
+            "xmage_effect_classes": sorted(effects),
+            "xmage_ability_classes": sorted(abilities),
+            "xmage_signals": list(signals),
+        }
+        self._results: dict[Callable[[dict[str, Any]], bool], bool] = {}
+
+    def __call__(self, predicate: Callable[[dict[str, Any]], bool]) -> bool:
+        try:
+            return self._results[predicate]
+        except KeyError:
+            result = self._results[predicate] = predicate(self._row)
+            return result
+
+
+def unit_features(row: dict[str, Any]) -> tuple[str, frozenset[str], frozenset[str], frozenset[Any]]:
+    return (
+        str(row.get("adapter_work_unit") or ""),
+        frozenset(effect_classes(row)),
+        frozenset(ability_classes(row)),
+        frozenset(row.get("xmage_signals") or []),
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _unit_classification_for(
+    features: tuple[str, frozenset[str], frozenset[str], frozenset[Any]],
+) -> UnitClassification:
+    return UnitClassification(features)
+
+
+def unit_classification(row: dict[str, Any]) -> UnitClassification:
+    return _unit_classification_for(unit_features(row))
+
+
 def split_row(
     row: dict[str, Any],
     metadata: dict[str, Any],
     *,
     source_text: str,
+    units: UnitClassification | None = None,
 ) -> tuple[dict[str, Any] | None, str]:
+    if units is None:
+        units = unit_classification(row)
     unit = str(row.get("adapter_work_unit") or "")
-    keyword_creature_unit = is_static_keyword_creature_unit(row)
-    static_ward_creature_unit = is_static_ward_creature_unit(row)
-    static_attacks_each_combat_creature_unit = is_static_attacks_each_combat_creature_unit(row)
-    prowess_creature_unit = is_prowess_creature_unit(row)
-    changeling_creature_unit = is_changeling_creature_unit(row)
-    static_protection_from_colors_creature_unit = (
-        is_static_protection_from_colors_creature_unit(row)
-    )
-    static_cast_as_flash_permission_unit = is_static_cast_as_flash_permission_unit(row)
-    static_cant_be_blocked_creature_unit = is_static_cant_be_blocked_creature_unit(row)
-    static_cant_block_creature_unit = is_static_cant_block_creature_unit(row)
-    static_cant_be_blocked_by_more_than_one_creature_unit = (
-        is_static_cant_be_blocked_by_more_than_one_creature_unit(row)
-    )
-    static_basic_landwalk_creature_unit = is_static_basic_landwalk_creature_unit(row)
-    static_filtered_evasion_creature_unit = is_static_filtered_evasion_creature_unit(row)
-    static_flying_can_block_only_flying_creature_unit = (
-        is_static_flying_can_block_only_flying_creature_unit(row)
-    )
-    static_horsemanship_creature_unit = is_static_horsemanship_creature_unit(row)
     creature_enters_tapped_unit = unit in {
         CREATURE_ENTERS_TAPPED_ABILITY_UNIT,
         CREATURE_ENTERS_TAPPED_EFFECT_UNIT,
     }
-    etb_life_gain_creature_unit = is_creature_etb_life_gain_unit(row)
-    etb_life_gain_draw_creature_unit = is_creature_etb_life_gain_draw_unit(row)
-    creature_enters_life_gain_unit = is_creature_enters_life_gain_unit(row)
-    creature_enters_draw_unit = is_creature_enters_draw_unit(row)
-    dies_life_gain_creature_unit = is_creature_dies_life_gain_unit(row)
-    etb_draw_creature_unit = is_creature_etb_draw_unit(row)
-    etb_scry_creature_unit = is_creature_etb_scry_unit(row)
-    etb_draw_lose_life_creature_unit = is_creature_etb_draw_lose_life_unit(row)
-    beginning_upkeep_draw_lose_life_unit = is_beginning_upkeep_draw_lose_life_unit(row)
-    etb_draw_discard_creature_unit = is_creature_etb_draw_discard_unit(row)
-    dies_draw_creature_unit = is_creature_dies_draw_unit(row)
-    combat_damage_draw_creature_unit = is_creature_combat_damage_draw_unit(row)
-    etb_target_player_discard_creature_unit = is_creature_etb_target_player_discard_unit(row)
-    dies_target_player_discard_creature_unit = is_creature_dies_target_player_discard_unit(row)
-    combat_damage_target_player_discard_creature_unit = (
-        is_creature_combat_damage_target_player_discard_unit(row)
-    )
-    dies_damage_creature_unit = is_creature_dies_damage_unit(row)
-    spell_cast_draw_engine_unit = is_spell_cast_draw_engine_unit(row)
-    beginning_end_step_draw_unit = is_beginning_end_step_conditional_draw_unit(row)
-    spell_cast_add_counters_source_unit = is_spell_cast_add_counters_source_unit(row)
-    spell_cast_gain_life_unit = is_spell_cast_gain_life_unit(row)
-    spell_cast_token_maker_unit = is_spell_cast_token_maker_unit(row)
-    permanent_activated_draw_discard_unit = is_permanent_activated_draw_discard_unit(row)
-    dies_recursion_creature_unit = is_creature_dies_recursion_unit(row)
-    etb_damage_creature_unit = is_creature_etb_damage_unit(row)
-    etb_target_boost_creature_unit = is_creature_etb_target_boost_unit(row)
-    etb_graveyard_count_damage_creature_unit = is_creature_etb_graveyard_count_damage_unit(row)
-    etb_destroy_creature_unit = is_creature_etb_destroy_unit(row)
-    etb_bounce_creature_unit = is_creature_etb_bounce_unit(row)
-    etb_recursion_creature_unit = is_creature_etb_recursion_unit(row)
-    etb_recursion_battlefield_creature_unit = is_creature_etb_recursion_battlefield_unit(row)
-    etb_mill_recursion_creature_unit = is_creature_etb_mill_then_return_unit(row)
-    attack_recursion_permanent_unit = is_permanent_attack_recursion_to_hand_unit(row)
-    combat_damage_recursion_creature_unit = is_creature_combat_damage_recursion_to_hand_unit(row)
-    etb_graveyard_to_library_creature_unit = is_creature_etb_graveyard_to_library_unit(row)
-    etb_library_pick_creature_unit = is_creature_etb_library_pick_unit(row)
-    etb_tutor_battlefield_creature_unit = is_creature_etb_tutor_to_battlefield_unit(row)
-    etb_tutor_top_creature_unit = is_creature_etb_tutor_to_top_unit(row)
-    etb_tutor_hand_creature_unit = is_creature_etb_tutor_to_hand_unit(row)
-    etb_fixed_mana_creature_unit = is_creature_etb_fixed_mana_unit(row)
     dies_fixed_mana_permanent_unit = (
         unit in RAMP_UNITS
         and effect_classes(row) == {"BasicManaEffect"}
         and ability_classes(row) == {"DiesSourceTriggeredAbility"}
         and set(row.get("xmage_signals") or []).issubset({"triggered_ability"})
     )
-    etb_token_creature_unit = is_creature_etb_token_unit(row)
-    dies_token_creature_unit = is_creature_dies_token_unit(row)
-    permanent_activated_token_unit = is_permanent_activated_token_unit(row)
-    etb_add_counters_creature_unit = is_creature_etb_add_counters_unit(row)
-    dies_add_counters_creature_unit = is_creature_dies_add_counters_unit(row)
-    permanent_activated_self_add_counters_unit = (
-        is_permanent_activated_self_add_counters_unit(row)
-    )
-    permanent_activated_target_add_counters_unit = (
-        is_permanent_activated_target_add_counters_unit(row)
-    )
-    creature_tap_damage_unit = is_creature_tap_damage_unit(row)
-    permanent_activated_draw_unit = is_permanent_activated_draw_unit(row)
-    permanent_activated_damage_unit = is_permanent_activated_damage_unit(row)
-    permanent_activated_destroy_unit = is_permanent_activated_destroy_unit(row)
-    permanent_activated_exile_unit = is_permanent_activated_exile_unit(row)
-    permanent_activated_bounce_unit = is_permanent_activated_bounce_unit(row)
-    permanent_activated_tap_target_unit = is_permanent_activated_tap_target_unit(row)
-    permanent_activated_untap_target_unit = is_permanent_activated_untap_target_unit(row)
-    tap_target_spell_unit = is_tap_target_spell_unit(row)
-    permanent_activated_life_gain_unit = is_permanent_activated_life_gain_unit(row)
-    permanent_activated_self_boost_unit = is_permanent_activated_self_boost_unit(row)
-    permanent_activated_target_boost_unit = is_permanent_activated_target_boost_unit(row)
-    permanent_activated_target_keyword_unit = is_permanent_activated_target_keyword_unit(row)
-    permanent_activated_self_keyword_unit = is_permanent_activated_self_keyword_unit(row)
-    permanent_activated_regenerate_source_unit = is_permanent_activated_regenerate_source_unit(row)
-    permanent_activated_regenerate_target_unit = is_permanent_activated_regenerate_target_unit(row)
-    permanent_activated_tutor_battlefield_unit = is_permanent_activated_tutor_battlefield_unit(row)
-    permanent_activated_tutor_hand_unit = is_permanent_activated_tutor_hand_unit(row)
-    permanent_activated_hand_to_battlefield_unit = is_permanent_activated_hand_to_battlefield_unit(row)
-    attack_target_keyword_unit = is_creature_attack_target_keyword_unit(row)
-    attack_self_boost_creature_unit = is_creature_attack_self_boost_unit(row)
-    landfall_self_boost_creature_unit = is_creature_landfall_self_boost_unit(row)
-    becomes_blocked_self_boost_creature_unit = is_creature_becomes_blocked_self_boost_unit(row)
-    becomes_blocked_draw_creature_unit = is_creature_becomes_blocked_draw_unit(row)
-    static_controlled_pt_unit = is_static_controlled_pt_unit(row)
-    static_controlled_keyword_unit = is_static_controlled_keyword_unit(row)
-    static_global_pt_unit = is_static_global_pt_unit(row)
-    simple_aura_static_pt_unit = is_simple_aura_static_pt_unit(row)
-    simple_equipment_static_attachment_unit = is_simple_equipment_static_attachment_unit(row)
-    static_generic_cost_reduction_unit = is_static_generic_cost_reduction_unit(row)
-    static_generic_cost_increase_unit = is_static_generic_cost_increase_unit(row)
-    static_graveyard_count_pt_unit = is_static_graveyard_count_pt_unit(row)
-    static_graveyard_threshold_boost_unit = is_static_graveyard_threshold_boost_unit(row)
-    static_graveyard_count_boost_unit = is_static_graveyard_count_boost_unit(row)
-    static_dynamic_count_source_boost_unit = is_static_dynamic_count_source_boost_unit(row)
-    permanent_activated_recursion_to_hand_unit = is_permanent_activated_recursion_to_hand_unit(row)
-    permanent_activated_recursion_to_battlefield_unit = is_permanent_activated_recursion_to_battlefield_unit(row)
-    permanent_activated_graveyard_exile_unit = is_permanent_activated_graveyard_exile_unit(row)
-    permanent_activated_graveyard_to_library_unit = is_permanent_activated_graveyard_to_library_unit(row)
     graveyard_self_return_to_hand_unit = (
         unit == RECURSION_UNIT
         and effect_classes(row) == {"ReturnSourceFromGraveyardToHandEffect"}
@@ -34962,12 +34907,6 @@ def split_row(
         and effect_classes(row) == {"DamageTargetEffect"}
         and not ability_classes(row)
     )
-    counter_unless_pays_spell_unit = is_counter_unless_pays_spell_unit(row)
-    counter_target_with_replacement_spell_unit = is_counter_target_with_replacement_spell_unit(row)
-    counter_target_controller_mill_spell_unit = is_counter_target_controller_mill_spell_unit(row)
-    target_keyword_spell_unit = is_target_keyword_spell_unit(row)
-    battlefield_to_library_spell_unit = is_battlefield_to_library_spell_unit(row)
-    boost_keyword_spell_unit = is_boost_keyword_spell_unit(row)
     prevent_all_combat_damage_spell_unit = unit in {
         PREVENT_ALL_COMBAT_DAMAGE_SPELL_UNIT,
         PREVENT_ALL_COMBAT_DAMAGE_CYCLING_SPELL_UNIT,
@@ -35064,116 +35003,116 @@ def split_row(
     )
     if (
         unit not in SUPPORTED_UNITS
-        and not keyword_creature_unit
-        and not static_ward_creature_unit
-        and not static_attacks_each_combat_creature_unit
-        and not prowess_creature_unit
-        and not changeling_creature_unit
-        and not static_protection_from_colors_creature_unit
-        and not static_cast_as_flash_permission_unit
-        and not static_cant_be_blocked_creature_unit
-        and not static_cant_block_creature_unit
-        and not static_cant_be_blocked_by_more_than_one_creature_unit
-        and not static_basic_landwalk_creature_unit
-        and not static_filtered_evasion_creature_unit
-        and not static_flying_can_block_only_flying_creature_unit
-        and not static_horsemanship_creature_unit
-        and not etb_life_gain_creature_unit
-        and not etb_life_gain_draw_creature_unit
-        and not creature_enters_life_gain_unit
-        and not creature_enters_draw_unit
-        and not dies_life_gain_creature_unit
-        and not etb_draw_creature_unit
-        and not etb_scry_creature_unit
-        and not etb_draw_lose_life_creature_unit
-        and not beginning_upkeep_draw_lose_life_unit
-        and not etb_draw_discard_creature_unit
-        and not dies_draw_creature_unit
-        and not combat_damage_draw_creature_unit
-        and not etb_target_player_discard_creature_unit
-        and not dies_target_player_discard_creature_unit
-        and not combat_damage_target_player_discard_creature_unit
-        and not dies_damage_creature_unit
-        and not spell_cast_draw_engine_unit
-        and not beginning_end_step_draw_unit
-        and not spell_cast_add_counters_source_unit
-        and not spell_cast_gain_life_unit
-        and not spell_cast_token_maker_unit
-        and not permanent_activated_draw_discard_unit
-        and not dies_recursion_creature_unit
-        and not etb_damage_creature_unit
-        and not etb_target_boost_creature_unit
-        and not etb_graveyard_count_damage_creature_unit
-        and not etb_destroy_creature_unit
-        and not etb_bounce_creature_unit
-        and not etb_recursion_creature_unit
-        and not etb_recursion_battlefield_creature_unit
-        and not etb_mill_recursion_creature_unit
-        and not attack_recursion_permanent_unit
-        and not combat_damage_recursion_creature_unit
-        and not etb_graveyard_to_library_creature_unit
-        and not etb_library_pick_creature_unit
-        and not etb_tutor_battlefield_creature_unit
-        and not etb_tutor_top_creature_unit
-        and not etb_tutor_hand_creature_unit
-        and not etb_fixed_mana_creature_unit
+        and not units(is_static_keyword_creature_unit)
+        and not units(is_static_ward_creature_unit)
+        and not units(is_static_attacks_each_combat_creature_unit)
+        and not units(is_prowess_creature_unit)
+        and not units(is_changeling_creature_unit)
+        and not units(is_static_protection_from_colors_creature_unit)
+        and not units(is_static_cast_as_flash_permission_unit)
+        and not units(is_static_cant_be_blocked_creature_unit)
+        and not units(is_static_cant_block_creature_unit)
+        and not units(is_static_cant_be_blocked_by_more_than_one_creature_unit)
+        and not units(is_static_basic_landwalk_creature_unit)
+        and not units(is_static_filtered_evasion_creature_unit)
+        and not units(is_static_flying_can_block_only_flying_creature_unit)
+        and not units(is_static_horsemanship_creature_unit)
+        and not units(is_creature_etb_life_gain_unit)
+        and not units(is_creature_etb_life_gain_draw_unit)
+        and not units(is_creature_enters_life_gain_unit)
+        and not units(is_creature_enters_draw_unit)
+        and not units(is_creature_dies_life_gain_unit)
+        and not units(is_creature_etb_draw_unit)
+        and not units(is_creature_etb_scry_unit)
+        and not units(is_creature_etb_draw_lose_life_unit)
+        and not units(is_beginning_upkeep_draw_lose_life_unit)
+        and not units(is_creature_etb_draw_discard_unit)
+        and not units(is_creature_dies_draw_unit)
+        and not units(is_creature_combat_damage_draw_unit)
+        and not units(is_creature_etb_target_player_discard_unit)
+        and not units(is_creature_dies_target_player_discard_unit)
+        and not units(is_creature_combat_damage_target_player_discard_unit)
+        and not units(is_creature_dies_damage_unit)
+        and not units(is_spell_cast_draw_engine_unit)
+        and not units(is_beginning_end_step_conditional_draw_unit)
+        and not units(is_spell_cast_add_counters_source_unit)
+        and not units(is_spell_cast_gain_life_unit)
+        and not units(is_spell_cast_token_maker_unit)
+        and not units(is_permanent_activated_draw_discard_unit)
+        and not units(is_creature_dies_recursion_unit)
+        and not units(is_creature_etb_damage_unit)
+        and not units(is_creature_etb_target_boost_unit)
+        and not units(is_creature_etb_graveyard_count_damage_unit)
+        and not units(is_creature_etb_destroy_unit)
+        and not units(is_creature_etb_bounce_unit)
+        and not units(is_creature_etb_recursion_unit)
+        and not units(is_creature_etb_recursion_battlefield_unit)
+        and not units(is_creature_etb_mill_then_return_unit)
+        and not units(is_permanent_attack_recursion_to_hand_unit)
+        and not units(is_creature_combat_damage_recursion_to_hand_unit)
+        and not units(is_creature_etb_graveyard_to_library_unit)
+        and not units(is_creature_etb_library_pick_unit)
+        and not units(is_creature_etb_tutor_to_battlefield_unit)
+        and not units(is_creature_etb_tutor_to_top_unit)
+        and not units(is_creature_etb_tutor_to_hand_unit)
+        and not units(is_creature_etb_fixed_mana_unit)
         and not dies_fixed_mana_permanent_unit
-        and not etb_token_creature_unit
-        and not dies_token_creature_unit
-        and not permanent_activated_token_unit
-        and not etb_add_counters_creature_unit
-        and not dies_add_counters_creature_unit
-        and not permanent_activated_self_add_counters_unit
-        and not permanent_activated_target_add_counters_unit
-        and not creature_tap_damage_unit
-        and not permanent_activated_draw_unit
-        and not permanent_activated_damage_unit
-        and not permanent_activated_destroy_unit
-        and not permanent_activated_exile_unit
-        and not permanent_activated_bounce_unit
-        and not permanent_activated_untap_target_unit
-        and not permanent_activated_life_gain_unit
-        and not permanent_activated_self_boost_unit
-        and not permanent_activated_target_boost_unit
-        and not permanent_activated_target_keyword_unit
-        and not permanent_activated_self_keyword_unit
-        and not permanent_activated_regenerate_source_unit
-        and not permanent_activated_regenerate_target_unit
-        and not permanent_activated_tutor_battlefield_unit
-        and not permanent_activated_tutor_hand_unit
-        and not permanent_activated_hand_to_battlefield_unit
-        and not attack_target_keyword_unit
-        and not attack_self_boost_creature_unit
-        and not landfall_self_boost_creature_unit
-        and not becomes_blocked_self_boost_creature_unit
-        and not becomes_blocked_draw_creature_unit
-        and not static_controlled_pt_unit
-        and not static_controlled_keyword_unit
-        and not static_global_pt_unit
-        and not simple_aura_static_pt_unit
-        and not simple_equipment_static_attachment_unit
-        and not static_generic_cost_reduction_unit
-        and not static_generic_cost_increase_unit
-        and not static_graveyard_count_pt_unit
-        and not static_graveyard_threshold_boost_unit
-        and not static_graveyard_count_boost_unit
-        and not static_dynamic_count_source_boost_unit
-        and not permanent_activated_recursion_to_hand_unit
-        and not permanent_activated_recursion_to_battlefield_unit
-        and not permanent_activated_graveyard_exile_unit
-        and not permanent_activated_graveyard_to_library_unit
-        and not target_keyword_spell_unit
-        and not boost_keyword_spell_unit
+        and not units(is_creature_etb_token_unit)
+        and not units(is_creature_dies_token_unit)
+        and not units(is_permanent_activated_token_unit)
+        and not units(is_creature_etb_add_counters_unit)
+        and not units(is_creature_dies_add_counters_unit)
+        and not units(is_permanent_activated_self_add_counters_unit)
+        and not units(is_permanent_activated_target_add_counters_unit)
+        and not units(is_creature_tap_damage_unit)
+        and not units(is_permanent_activated_draw_unit)
+        and not units(is_permanent_activated_damage_unit)
+        and not units(is_permanent_activated_destroy_unit)
+        and not units(is_permanent_activated_exile_unit)
+        and not units(is_permanent_activated_bounce_unit)
+        and not units(is_permanent_activated_untap_target_unit)
+        and not units(is_permanent_activated_life_gain_unit)
+        and not units(is_permanent_activated_self_boost_unit)
+        and not units(is_permanent_activated_target_boost_unit)
+        and not units(is_permanent_activated_target_keyword_unit)
+        and not units(is_permanent_activated_self_keyword_unit)
+        and not units(is_permanent_activated_regenerate_source_unit)
+        and not units(is_permanent_activated_regenerate_target_unit)
+        and not units(is_permanent_activated_tutor_battlefield_unit)
+        and not units(is_permanent_activated_tutor_hand_unit)
+        and not units(is_permanent_activated_hand_to_battlefield_unit)
+        and not units(is_creature_attack_target_keyword_unit)
+        and not units(is_creature_attack_self_boost_unit)
+        and not units(is_creature_landfall_self_boost_unit)
+        and not units(is_creature_becomes_blocked_self_boost_unit)
+        and not units(is_creature_becomes_blocked_draw_unit)
+        and not units(is_static_controlled_pt_unit)
+        and not units(is_static_controlled_keyword_unit)
+        and not units(is_static_global_pt_unit)
+        and not units(is_simple_aura_static_pt_unit)
+        and not units(is_simple_equipment_static_attachment_unit)
+        and not units(is_static_generic_cost_reduction_unit)
+        and not units(is_static_generic_cost_increase_unit)
+        and not units(is_static_graveyard_count_pt_unit)
+        and not units(is_static_graveyard_threshold_boost_unit)
+        and not units(is_static_graveyard_count_boost_unit)
+        and not units(is_static_dynamic_count_source_boost_unit)
+        and not units(is_permanent_activated_recursion_to_hand_unit)
+        and not units(is_permanent_activated_recursion_to_battlefield_unit)
+        and not units(is_permanent_activated_graveyard_exile_unit)
+        and not units(is_permanent_activated_graveyard_to_library_unit)
+        and not units(is_target_keyword_spell_unit)
+        and not units(is_boost_keyword_spell_unit)
         and not keyword_draw_spell_unit
         and not fixed_token_spell_unit
         and not fixed_token_draw_spell_unit
         and not graveyard_count_damage_unit
         and not etb_each_player_sacrifice_creature_unit
         and not dies_each_player_sacrifice_creature_unit
-        and not counter_unless_pays_spell_unit
-        and not counter_target_with_replacement_spell_unit
-        and not counter_target_controller_mill_spell_unit
-        and not battlefield_to_library_spell_unit
+        and not units(is_counter_unless_pays_spell_unit)
+        and not units(is_counter_target_with_replacement_spell_unit)
+        and not units(is_counter_target_controller_mill_spell_unit)
+        and not units(is_battlefield_to_library_spell_unit)
         and not cycling_only_unit
     ):
         return None, "unsupported_adapter_work_unit"
@@ -35332,95 +35271,95 @@ def split_row(
     if (
         (
             unit in SPELL_UNITS
-            or boost_keyword_spell_unit
-            or target_keyword_spell_unit
-        )
-        and not etb_life_gain_creature_unit
-        and not creature_enters_life_gain_unit
-        and not creature_enters_draw_unit
-        and not static_protection_from_colors_creature_unit
-        and not static_cast_as_flash_permission_unit
-        and not static_cant_be_blocked_creature_unit
-        and not static_cant_block_creature_unit
-        and not static_basic_landwalk_creature_unit
-        and not static_filtered_evasion_creature_unit
-        and not static_flying_can_block_only_flying_creature_unit
-        and not static_horsemanship_creature_unit
-        and not dies_life_gain_creature_unit
-        and not etb_life_gain_draw_creature_unit
-        and not etb_draw_creature_unit
-        and not etb_scry_creature_unit
-        and not etb_draw_lose_life_creature_unit
-        and not beginning_upkeep_draw_lose_life_unit
-        and not etb_draw_discard_creature_unit
-        and not dies_draw_creature_unit
-        and not combat_damage_draw_creature_unit
-        and not etb_target_player_discard_creature_unit
-        and not dies_target_player_discard_creature_unit
-        and not combat_damage_target_player_discard_creature_unit
-        and not dies_damage_creature_unit
-        and not spell_cast_draw_engine_unit
-        and not spell_cast_add_counters_source_unit
-        and not spell_cast_gain_life_unit
-        and not spell_cast_token_maker_unit
-        and not permanent_activated_draw_discard_unit
-        and not dies_recursion_creature_unit
-        and not etb_damage_creature_unit
-        and not etb_target_boost_creature_unit
-        and not etb_graveyard_count_damage_creature_unit
-        and not etb_destroy_creature_unit
-        and not etb_bounce_creature_unit
-        and not etb_recursion_creature_unit
-        and not etb_recursion_battlefield_creature_unit
-        and not etb_mill_recursion_creature_unit
-        and not attack_recursion_permanent_unit
-        and not combat_damage_recursion_creature_unit
-        and not etb_graveyard_to_library_creature_unit
-        and not etb_library_pick_creature_unit
-        and not etb_tutor_battlefield_creature_unit
-        and not etb_tutor_top_creature_unit
-        and not etb_tutor_hand_creature_unit
-        and not etb_fixed_mana_creature_unit
+            or units(is_boost_keyword_spell_unit)
+            or units(is_target_keyword_spell_unit)
+        )
+        and not units(is_creature_etb_life_gain_unit)
+        and not units(is_creature_enters_life_gain_unit)
+        and not units(is_creature_enters_draw_unit)
+        and not units(is_static_protection_from_colors_creature_unit)
+        and not units(is_static_cast_as_flash_permission_unit)
+        and not units(is_static_cant_be_blocked_creature_unit)
+        and not units(is_static_cant_block_creature_unit)
+        and not units(is_static_basic_landwalk_creature_unit)
+        and not units(is_static_filtered_evasion_creature_unit)
+        and not units(is_static_flying_can_block_only_flying_creature_unit)
+        and not units(is_static_horsemanship_creature_unit)
+        and not units(is_creature_dies_life_gain_unit)
+        and not units(is_creature_etb_life_gain_draw_unit)
+        and not units(is_creature_etb_draw_unit)
+        and not units(is_creature_etb_scry_unit)
+        and not units(is_creature_etb_draw_lose_life_unit)
+        and not units(is_beginning_upkeep_draw_lose_life_unit)
+        and not units(is_creature_etb_draw_discard_unit)
+        and not units(is_creature_dies_draw_unit)
+        and not units(is_creature_combat_damage_draw_unit)
+        and not units(is_creature_etb_target_player_discard_unit)
+        and not units(is_creature_dies_target_player_discard_unit)
+        and not units(is_creature_combat_damage_target_player_discard_unit)
+        and not units(is_creature_dies_damage_unit)
+        and not units(is_spell_cast_draw_engine_unit)
+        and not units(is_spell_cast_add_counters_source_unit)
+        and not units(is_spell_cast_gain_life_unit)
+        and not units(is_spell_cast_token_maker_unit)
+        and not units(is_permanent_activated_draw_discard_unit)
+        and not units(is_creature_dies_recursion_unit)
+        and not units(is_creature_etb_damage_unit)
+        and not units(is_creature_etb_target_boost_unit)
+        and not units(is_creature_etb_graveyard_count_damage_unit)
+        and not units(is_creature_etb_destroy_unit)
+        and not units(is_creature_etb_bounce_unit)
+        and not units(is_creature_etb_recursion_unit)
+        and not units(is_creature_etb_recursion_battlefield_unit)
+        and not units(is_creature_etb_mill_then_return_unit)
+        and not units(is_permanent_attack_recursion_to_hand_unit)
+        and not units(is_creature_combat_damage_recursion_to_hand_unit)
+        and not units(is_creature_etb_graveyard_to_library_unit)
+        and not units(is_creature_etb_library_pick_unit)
+        and not units(is_creature_etb_tutor_to_battlefield_unit)
+        and not units(is_creature_etb_tutor_to_top_unit)
+        and not units(is_creature_etb_tutor_to_hand_unit)
+        and not units(is_creature_etb_fixed_mana_unit)
         and not dies_fixed_mana_permanent_unit
-        and not etb_token_creature_unit
-        and not dies_token_creature_unit
-        and not permanent_activated_token_unit
-        and not etb_add_counters_creature_unit
-        and not dies_add_counters_creature_unit
-        and not permanent_activated_self_add_counters_unit
-        and not permanent_activated_target_add_counters_unit
-        and not creature_tap_damage_unit
-        and not permanent_activated_draw_unit
-        and not permanent_activated_damage_unit
-        and not permanent_activated_destroy_unit
-        and not permanent_activated_exile_unit
-        and not permanent_activated_bounce_unit
-        and not permanent_activated_untap_target_unit
-        and not permanent_activated_life_gain_unit
-        and not permanent_activated_self_boost_unit
-        and not permanent_activated_target_keyword_unit
-        and not permanent_activated_self_keyword_unit
-        and not permanent_activated_tutor_battlefield_unit
-        and not permanent_activated_tutor_hand_unit
-        and not attack_target_keyword_unit
-        and not attack_self_boost_creature_unit
-        and not landfall_self_boost_creature_unit
-        and not becomes_blocked_self_boost_creature_unit
-        and not becomes_blocked_draw_creature_unit
-        and not static_controlled_pt_unit
-        and not static_global_pt_unit
-        and not simple_aura_static_pt_unit
-        and not simple_equipment_static_attachment_unit
-        and not static_generic_cost_reduction_unit
-        and not static_generic_cost_increase_unit
-        and not static_graveyard_count_pt_unit
-        and not static_graveyard_threshold_boost_unit
-        and not static_graveyard_count_boost_unit
-        and not static_dynamic_count_source_boost_unit
-        and not permanent_activated_recursion_to_hand_unit
-        and not permanent_activated_recursion_to_battlefield_unit
-        and not permanent_activated_graveyard_exile_unit
-        and not permanent_activated_graveyard_to_library_unit
+        and not units(is_creature_etb_token_unit)
+        and not units(is_creature_dies_token_unit)
+        and not units(is_permanent_activated_token_unit)
+        and not units(is_creature_etb_add_counters_unit)
+        and not units(is_creature_dies_add_counters_unit)
+        and not units(is_permanent_activated_self_add_counters_unit)
+        and not units(is_permanent_activated_target_add_counters_unit)
+        and not units(is_creature_tap_damage_unit)
+        and not units(is_permanent_activated_draw_unit)
+        and not units(is_permanent_activated_damage_unit)
+        and not units(is_permanent_activated_destroy_unit)
+        and not units(is_permanent_activated_exile_unit)
+        and not units(is_permanent_activated_bounce_unit)
+        and not units(is_permanent_activated_untap_target_unit)
+        and not units(is_permanent_activated_life_gain_unit)
+        and not units(is_permanent_activated_self_boost_unit)
+        and not units(is_permanent_activated_target_keyword_unit)
+        and not units(is_permanent_activated_self_keyword_unit)
+        and not units(is_permanent_activated_tutor_battlefield_unit)
+        and not units(is_permanent_activated_tutor_hand_unit)
+        and not units(is_creature_attack_target_keyword_unit)
+        and not units(is_creature_attack_self_boost_unit)
+        and not units(is_creature_landfall_self_boost_unit)
+        and not units(is_creature_becomes_blocked_self_boost_unit)
+        and not units(is_creature_becomes_blocked_draw_unit)
+        and not units(is_static_controlled_pt_unit)
+        and not units(is_static_global_pt_unit)
+        and not units(is_simple_aura_static_pt_unit)
+        and not units(is_simple_equipment_static_attachment_unit)
+        and not units(is_static_generic_cost_reduction_unit)
+        and not units(is_static_generic_cost_increase_unit)
+        and not units(is_static_graveyard_count_pt_unit)
+        and not units(is_static_graveyard_threshold_boost_unit)
+        and not units(is_static_graveyard_count_boost_unit)
+        and not units(is_static_dynamic_count_source_boost_unit)
+        and not units(is_permanent_activated_recursion_to_hand_unit)
+        and not units(is_permanent_activated_recursion_to_battlefield_unit)
+        and not units(is_permanent_activated_graveyard_exile_unit)
+        and not units(is_permanent_activated_graveyard_to_library_unit)
         and not graveyard_self_return_unit
         and not play_lands_from_graveyard_unit
         and not graveyard_count_damage_unit
@@ -35435,7 +35374,7 @@ def split_row(
         and not treasure_etb_creature_unit
         and not etb_each_player_sacrifice_creature_unit
         and not dies_each_player_sacrifice_creature_unit
-        and not counter_unless_pays_spell_unit
+        and not units(is_counter_unless_pays_spell_unit)
     ):
         if not is_spell(metadata):
             return None, "not_instant_or_sorcery_spell"
@@ -35697,7 +35636,7 @@ def split_row(
             family_id="xmage_return_all_matching_permanents_to_hand_spell",
         ), "selected_exact_scope"
 
-    if tap_target_spell_unit:
+    if units(is_tap_target_spell_unit):
         if classes != {"TapTargetEffect"}:
             return None, "tap_target_spell_effect_class_not_pure"
         if ability_classes(row):
@@ -35773,7 +35712,7 @@ def split_row(
             family_id="xmage_prevent_all_combat_damage_spell",
         ), "selected_exact_scope"
 
-    if simple_equipment_static_attachment_unit:
+    if units(is_simple_equipment_static_attachment_unit):
         type_line = str(metadata.get("type_line") or "").lower()
         if "artifact" not in type_line or "equipment" not in type_line:
             return None, "equipment_static_not_artifact_equipment_type"
@@ -35848,7 +35787,7 @@ def split_row(
             family_id="xmage_equipment_static_power_toughness_attachment",
         ), "selected_exact_scope"
 
-    if simple_aura_static_pt_unit:
+    if units(is_simple_aura_static_pt_unit):
         if "aura" not in str(metadata.get("type_line") or "").lower():
             return None, "aura_static_pt_not_aura_type"
         oracle_aura = fixed_aura_static_pt_from_oracle(metadata)
@@ -35930,7 +35869,7 @@ def split_row(
             family_id="xmage_aura_static_power_toughness_attachment",
         ), "selected_exact_scope"
 
-    if etb_fixed_mana_creature_unit:
+    if units(is_creature_etb_fixed_mana_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_mana_not_creature"
         mana_detail = etb_fixed_mana_detail_from_oracle(metadata)
@@ -36006,7 +35945,7 @@ def split_row(
             family_id="xmage_permanent_dies_add_fixed_mana",
         ), "selected_exact_scope"
 
-    if static_cast_as_flash_permission_unit:
+    if units(is_static_cast_as_flash_permission_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "flash_permission_not_permanent"
         oracle_permission = flash_permission_from_oracle(metadata)
@@ -36066,7 +36005,7 @@ def split_row(
             family_id="xmage_static_cast_spells_as_flash_permission",
         ), "selected_exact_scope"
 
-    if static_cant_be_blocked_creature_unit:
+    if units(is_static_cant_be_blocked_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_cant_be_blocked_not_creature"
         if not oracle_is_static_cant_be_blocked(metadata):
@@ -36129,7 +36068,7 @@ def split_row(
             family_id="xmage_creature_enters_tapped",
         ), "selected_exact_scope"
 
-    if static_cant_block_creature_unit:
+    if units(is_static_cant_block_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_cant_block_not_creature"
         if not oracle_is_static_cant_block(metadata):
@@ -36162,7 +36101,7 @@ def split_row(
             family_id="xmage_static_self_cant_block_creature",
         ), "selected_exact_scope"
 
-    if static_cant_be_blocked_by_more_than_one_creature_unit:
+    if units(is_static_cant_be_blocked_by_more_than_one_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_cant_be_blocked_by_more_than_one_not_creature"
         if not oracle_is_static_cant_be_blocked_by_more_than_one(metadata):
@@ -36190,7 +36129,7 @@ def split_row(
             family_id="xmage_static_self_cant_be_blocked_by_more_than_one_creature",
         ), "selected_exact_scope"
 
-    if static_filtered_evasion_creature_unit:
+    if units(is_static_filtered_evasion_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_filtered_evasion_not_creature"
         oracle_evasion = filtered_evasion_spec_from_oracle(metadata)
@@ -36222,7 +36161,7 @@ def split_row(
             family_id="xmage_static_filtered_evasion_creature",
         ), "selected_exact_scope"
 
-    if static_basic_landwalk_creature_unit:
+    if units(is_static_basic_landwalk_creature_unit):
         land_type = basic_landwalk_type_for_row(row)
         if not land_type:
             return None, "static_landwalk_not_basic_unit"
@@ -36257,7 +36196,7 @@ def split_row(
             family_id="xmage_static_self_basic_landwalk_creature",
         ), "selected_exact_scope"
 
-    if static_flying_can_block_only_flying_creature_unit:
+    if units(is_static_flying_can_block_only_flying_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_flying_block_restriction_not_creature"
         if not oracle_is_static_flying_can_block_only_flying(metadata):
@@ -36285,7 +36224,7 @@ def split_row(
             family_id="xmage_static_flying_can_block_only_flying_creature",
         ), "selected_exact_scope"
 
-    if static_horsemanship_creature_unit:
+    if units(is_static_horsemanship_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_horsemanship_not_creature"
         if not oracle_is_static_horsemanship(metadata):
@@ -36311,7 +36250,7 @@ def split_row(
             family_id="xmage_static_self_horsemanship_creature",
         ), "selected_exact_scope"
 
-    if permanent_activated_tutor_battlefield_unit:
+    if units(is_permanent_activated_tutor_battlefield_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_library_tutor_not_permanent"
         oracle_tutor = activated_library_tutor_to_battlefield_from_oracle(metadata)
@@ -36418,7 +36357,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_library_search_to_battlefield",
         ), "selected_exact_scope"
 
-    if permanent_activated_hand_to_battlefield_unit:
+    if units(is_permanent_activated_hand_to_battlefield_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_hand_to_battlefield_not_permanent"
         oracle_activation = activated_hand_to_battlefield_from_oracle(metadata)
@@ -36500,7 +36439,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_hand_to_battlefield",
         ), "selected_exact_scope"
 
-    if permanent_activated_tutor_hand_unit:
+    if units(is_permanent_activated_tutor_hand_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_library_tutor_to_hand_not_permanent"
         type_line = str(metadata.get("type_line") or "").lower()
@@ -36600,7 +36539,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_library_search_to_hand",
         ), "selected_exact_scope"
 
-    if permanent_activated_draw_unit:
+    if units(is_permanent_activated_draw_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_draw_not_permanent"
         oracle_activation = activated_draw_from_oracle(metadata)
@@ -36678,7 +36617,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_draw",
         ), "selected_exact_scope"
 
-    if permanent_activated_draw_discard_unit:
+    if units(is_permanent_activated_draw_discard_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_draw_discard_not_permanent"
         oracle_activation = activated_draw_discard_from_oracle(metadata)
@@ -36739,7 +36678,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_draw_discard",
         ), "selected_exact_scope"
 
-    if spell_cast_draw_engine_unit:
+    if units(is_spell_cast_draw_engine_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "spell_cast_draw_not_permanent"
         oracle_spec = spell_cast_draw_filter_from_oracle(metadata)
@@ -36778,7 +36717,7 @@ def split_row(
             family_id="xmage_spell_cast_draw_engine",
         ), "selected_exact_scope"
 
-    if beginning_end_step_draw_unit:
+    if units(is_beginning_end_step_conditional_draw_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "end_step_draw_not_permanent"
         oracle_spec = beginning_end_step_draw_from_oracle(metadata)
@@ -36818,7 +36757,7 @@ def split_row(
             family_id="xmage_beginning_end_step_conditional_draw",
         ), "selected_exact_scope"
 
-    if spell_cast_add_counters_source_unit:
+    if units(is_spell_cast_add_counters_source_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "spell_cast_add_counters_not_permanent"
         oracle_spec = spell_cast_add_counters_filter_from_oracle(metadata)
@@ -36863,7 +36802,7 @@ def split_row(
             family_id="xmage_spell_cast_add_counters_source",
         ), "selected_exact_scope"
 
-    if spell_cast_gain_life_unit:
+    if units(is_spell_cast_gain_life_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "spell_cast_gain_life_not_permanent"
         oracle_spec = spell_cast_gain_life_filter_from_oracle(metadata)
@@ -36917,7 +36856,7 @@ def split_row(
             family_id="xmage_spell_cast_gain_life",
         ), "selected_exact_scope"
 
-    if spell_cast_token_maker_unit:
+    if units(is_spell_cast_token_maker_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "spell_cast_token_not_permanent"
         source_spec = spell_cast_token_filter_from_source(source_text)
@@ -36979,7 +36918,7 @@ def split_row(
             family_id="xmage_spell_cast_create_creature_token",
         ), "selected_exact_scope"
 
-    if permanent_activated_destroy_unit:
+    if units(is_permanent_activated_destroy_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_destroy_not_permanent"
         oracle_destroy = activated_destroy_from_oracle(metadata)
@@ -37120,7 +37059,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_destroy_target",
         ), "selected_exact_scope"
 
-    if permanent_activated_exile_unit:
+    if units(is_permanent_activated_exile_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_exile_not_permanent"
         oracle_exile = activated_exile_from_oracle(metadata)
@@ -37269,7 +37208,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_exile_target",
         ), "selected_exact_scope"
 
-    if permanent_activated_bounce_unit:
+    if units(is_permanent_activated_bounce_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_bounce_not_permanent"
         oracle_bounce = activated_bounce_from_oracle(metadata)
@@ -37420,7 +37359,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_return_to_hand",
         ), "selected_exact_scope"
 
-    if permanent_activated_tap_target_unit:
+    if units(is_permanent_activated_tap_target_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_tap_target_not_permanent"
         oracle_activation = activated_tap_target_from_oracle(metadata)
@@ -37486,7 +37425,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_tap_target",
         ), "selected_exact_scope"
 
-    if permanent_activated_untap_target_unit:
+    if units(is_permanent_activated_untap_target_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_untap_target_not_permanent"
         oracle_activation = activated_untap_target_from_oracle(metadata)
@@ -37563,7 +37502,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_untap_target",
         ), "selected_exact_scope"
 
-    if permanent_activated_life_gain_unit:
+    if units(is_permanent_activated_life_gain_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_life_gain_not_permanent"
         oracle_life_gain = activated_life_gain_from_oracle(metadata)
@@ -37651,7 +37590,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_life_gain",
         ), "selected_exact_scope"
 
-    if permanent_activated_self_boost_unit:
+    if units(is_permanent_activated_self_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "activated_self_boost_not_creature"
         oracle_boost = activated_self_boost_from_oracle(metadata)
@@ -37765,7 +37704,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_self_boost_until_eot",
         ), "selected_exact_scope"
 
-    if permanent_activated_target_boost_unit:
+    if units(is_permanent_activated_target_boost_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_target_boost_not_permanent"
         oracle_boost = activated_target_boost_from_oracle(metadata)
@@ -37859,7 +37798,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_target_boost_until_eot",
         ), "selected_exact_scope"
 
-    if permanent_activated_target_keyword_unit:
+    if units(is_permanent_activated_target_keyword_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_target_keyword_not_permanent"
         keyword_abilities = ability_classes(row).intersection(TARGET_GRANT_KEYWORD_ABILITY_CLASSES)
@@ -37977,7 +37916,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_target_keyword_until_eot",
         ), "selected_exact_scope"
 
-    if permanent_activated_self_keyword_unit:
+    if units(is_permanent_activated_self_keyword_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_self_keyword_not_permanent"
         keyword_abilities = ability_classes(row).intersection(TARGET_GRANT_KEYWORD_ABILITY_CLASSES)
@@ -38087,7 +38026,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_self_keyword_until_eot",
         ), "selected_exact_scope"
 
-    if permanent_activated_regenerate_source_unit:
+    if units(is_permanent_activated_regenerate_source_unit):
         if not is_creature_metadata(metadata):
             return None, "activated_regenerate_source_not_creature"
         oracle_activation = activated_regenerate_source_from_oracle(metadata)
@@ -38208,7 +38147,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_regenerate_source",
         ), "selected_exact_scope"
 
-    if permanent_activated_regenerate_target_unit:
+    if units(is_permanent_activated_regenerate_target_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_regenerate_target_not_permanent"
         oracle_activation = activated_regenerate_target_from_oracle(metadata)
@@ -38337,7 +38276,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_regenerate_target",
         ), "selected_exact_scope"
 
-    if attack_self_boost_creature_unit:
+    if units(is_creature_attack_self_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "attack_self_boost_not_creature"
         oracle_boost = attack_self_boost_from_oracle(metadata)
@@ -38379,7 +38318,7 @@ def split_row(
             family_id="xmage_creature_attack_self_boost_until_eot",
         ), "selected_exact_scope"
 
-    if landfall_self_boost_creature_unit:
+    if units(is_creature_landfall_self_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "landfall_self_boost_not_creature"
         oracle_boost = landfall_self_boost_from_oracle(metadata)
@@ -38421,7 +38360,7 @@ def split_row(
             family_id="xmage_creature_landfall_self_boost_until_eot",
         ), "selected_exact_scope"
 
-    if becomes_blocked_self_boost_creature_unit:
+    if units(is_creature_becomes_blocked_self_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "becomes_blocked_self_boost_not_creature"
         oracle_boost = becomes_blocked_self_boost_from_oracle(metadata)
@@ -38464,7 +38403,7 @@ def split_row(
             family_id="xmage_creature_becomes_blocked_self_boost_until_eot",
         ), "selected_exact_scope"
 
-    if becomes_blocked_draw_creature_unit:
+    if units(is_creature_becomes_blocked_draw_unit):
         if not is_creature_metadata(metadata):
             return None, "becomes_blocked_draw_not_creature"
         oracle_draw = becomes_blocked_draw_from_oracle(metadata)
@@ -38507,7 +38446,7 @@ def split_row(
             family_id="xmage_creature_becomes_blocked_draw_cards",
         ), "selected_exact_scope"
 
-    if attack_target_keyword_unit:
+    if units(is_creature_attack_target_keyword_unit):
         if not is_creature_metadata(metadata):
             return None, "attack_target_keyword_not_creature"
         keyword_abilities = ability_classes(row).intersection(TARGET_GRANT_KEYWORD_ABILITY_CLASSES)
@@ -38569,7 +38508,7 @@ def split_row(
             family_id="xmage_creature_attack_target_keyword_until_eot",
         ), "selected_exact_scope"
 
-    if permanent_activated_recursion_to_hand_unit:
+    if units(is_permanent_activated_recursion_to_hand_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_recursion_not_permanent"
         oracle_target = activated_recursion_to_hand_activation_from_oracle(metadata)
@@ -38723,7 +38662,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_graveyard_to_hand",
         ), "selected_exact_scope"
 
-    if permanent_activated_recursion_to_battlefield_unit:
+    if units(is_permanent_activated_recursion_to_battlefield_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_recursion_battlefield_not_permanent"
         oracle_target = activated_recursion_to_battlefield_from_oracle(metadata)
@@ -38891,7 +38830,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_graveyard_to_battlefield",
         ), "selected_exact_scope"
 
-    if permanent_activated_graveyard_to_library_unit:
+    if units(is_permanent_activated_graveyard_to_library_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_graveyard_to_library_not_permanent"
         oracle_target = activated_graveyard_to_library_from_oracle(metadata)
@@ -39004,7 +38943,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_graveyard_to_library",
         ), "selected_exact_scope"
 
-    if permanent_activated_graveyard_exile_unit:
+    if units(is_permanent_activated_graveyard_exile_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_graveyard_exile_not_permanent"
         oracle_exile = activated_graveyard_exile_from_oracle(metadata)
@@ -39520,7 +39459,7 @@ def split_row(
             family_id=family_id,
         ), "selected_exact_scope"
 
-    if permanent_activated_token_unit:
+    if units(is_permanent_activated_token_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_token_not_permanent"
         parsed_effect = fixed_create_token_effect_from_source(source_text)
@@ -39603,7 +39542,7 @@ def split_row(
             family_id=family_id,
         ), "selected_exact_scope"
 
-    if etb_token_creature_unit:
+    if units(is_creature_etb_token_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_token_not_creature"
         keyword_list = ordered_keywords(keywords_from_ability_classes(row))
@@ -39794,7 +39733,7 @@ def split_row(
             ),
         ), "selected_exact_scope"
 
-    if dies_token_creature_unit:
+    if units(is_creature_dies_token_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_token_not_creature"
         multi_tokens = multi_create_token_effects_from_source(source_text)
@@ -39991,7 +39930,7 @@ def split_row(
             ),
         ), "selected_exact_scope"
 
-    if etb_add_counters_creature_unit:
+    if units(is_creature_etb_add_counters_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_add_counters_not_creature"
         source_counter = etb_counter_target_spec_from_source(source_text)
@@ -40038,7 +39977,7 @@ def split_row(
             family_id="xmage_creature_etb_add_counters_target_creature",
         ), "selected_exact_scope"
 
-    if dies_add_counters_creature_unit:
+    if units(is_creature_dies_add_counters_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_add_counters_not_creature"
         source_counter = dies_counter_target_spec_from_source(source_text)
@@ -40091,7 +40030,7 @@ def split_row(
             family_id="xmage_creature_dies_add_counters_target_creature",
         ), "selected_exact_scope"
 
-    if permanent_activated_self_add_counters_unit:
+    if units(is_permanent_activated_self_add_counters_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_self_add_counters_not_permanent"
         source_counter = activated_self_counter_from_source(source_text)
@@ -40156,7 +40095,7 @@ def split_row(
             family_id="xmage_permanent_activated_self_add_counters",
         ), "selected_exact_scope"
 
-    if permanent_activated_target_add_counters_unit:
+    if units(is_permanent_activated_target_add_counters_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_target_add_counters_not_permanent"
         source_counter = activated_target_counter_from_source(source_text)
@@ -40254,7 +40193,7 @@ def split_row(
             family_id="xmage_permanent_simple_activated_add_counters_target_creature",
         ), "selected_exact_scope"
 
-    if static_controlled_pt_unit:
+    if units(is_static_controlled_pt_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "static_controlled_pt_not_permanent"
         oracle_static = static_controlled_pt_from_oracle(metadata)
@@ -40317,7 +40256,7 @@ def split_row(
             family_id="xmage_static_controlled_power_toughness_boost",
         ), "selected_exact_scope"
 
-    if static_controlled_keyword_unit:
+    if units(is_static_controlled_keyword_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "static_controlled_keyword_not_permanent"
         keyword_abilities = ability_classes(row).intersection(
@@ -40391,7 +40330,7 @@ def split_row(
             family_id="xmage_static_controlled_keyword_grant",
         ), "selected_exact_scope"
 
-    if static_global_pt_unit:
+    if units(is_static_global_pt_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "static_global_pt_not_permanent"
         oracle_static = static_global_pt_from_oracle(metadata)
@@ -40463,7 +40402,7 @@ def split_row(
             family_id="xmage_static_global_power_toughness_boost",
         ), "selected_exact_scope"
 
-    if static_generic_cost_reduction_unit:
+    if units(is_static_generic_cost_reduction_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "static_cost_reduction_not_permanent"
         source_reduction = static_cost_reduction_from_source(source_text)
@@ -40507,7 +40446,7 @@ def split_row(
             family_id="xmage_static_generic_cost_reduction_for_matching_spells",
         ), "selected_exact_scope"
 
-    if static_generic_cost_increase_unit:
+    if units(is_static_generic_cost_increase_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "static_cost_increase_not_permanent"
         source_increase = static_cost_increase_from_source(source_text)
@@ -40564,7 +40503,7 @@ def split_row(
             family_id="xmage_static_generic_cost_increase_for_matching_spells",
         ), "selected_exact_scope"
 
-    if static_graveyard_count_pt_unit:
+    if units(is_static_graveyard_count_pt_unit):
         if not is_creature_metadata(metadata):
             return None, "static_graveyard_count_pt_not_creature"
         oracle_count = static_count_pt_from_oracle(metadata)
@@ -40638,7 +40577,7 @@ def split_row(
             family_id="xmage_static_source_power_toughness_equal_graveyard_count",
         ), "selected_exact_scope"
 
-    if static_graveyard_threshold_boost_unit:
+    if units(is_static_graveyard_threshold_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "static_graveyard_threshold_boost_not_creature"
         oracle_static = static_graveyard_threshold_boost_from_oracle(metadata)
@@ -40675,7 +40614,7 @@ def split_row(
             family_id="xmage_static_source_boost_if_graveyard_threshold",
         ), "selected_exact_scope"
 
-    if static_graveyard_count_boost_unit:
+    if units(is_static_graveyard_count_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "static_graveyard_count_boost_not_creature"
         oracle_count = static_count_pt_zero_base_boost_from_oracle(metadata)
@@ -40746,7 +40685,7 @@ def split_row(
             family_id="xmage_static_source_boost_equal_graveyard_count",
         ), "selected_exact_scope"
 
-    if static_dynamic_count_source_boost_unit:
+    if units(is_static_dynamic_count_source_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "static_dynamic_count_boost_not_creature"
         oracle_static = static_dynamic_count_source_boost_from_oracle(metadata)
@@ -40785,7 +40724,7 @@ def split_row(
             family_id="xmage_static_source_boost_equal_dynamic_count",
         ), "selected_exact_scope"
 
-    if static_protection_from_colors_creature_unit:
+    if units(is_static_protection_from_colors_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_protection_not_creature"
         oracle_colors = protection_from_colors_from_oracle(metadata)
@@ -40883,7 +40822,7 @@ def split_row(
             ),
         ), "selected_exact_scope"
 
-    if keyword_creature_unit:
+    if units(is_static_keyword_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_keyword_not_creature"
         if ".getSpellAbility().addCost" in source_text:
@@ -40913,7 +40852,7 @@ def split_row(
             family_id="xmage_static_self_combat_keyword_creature",
         ), "selected_exact_scope"
 
-    if static_ward_creature_unit:
+    if units(is_static_ward_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_ward_not_creature"
         if ".getSpellAbility().addCost" in source_text:
@@ -40953,7 +40892,7 @@ def split_row(
             family_id="xmage_static_self_ward_creature",
         ), "selected_exact_scope"
 
-    if static_attacks_each_combat_creature_unit:
+    if units(is_static_attacks_each_combat_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "static_attacks_each_combat_not_creature"
         if ".getSpellAbility().addCost" in source_text:
@@ -40988,7 +40927,7 @@ def split_row(
             family_id="xmage_static_self_attacks_each_combat_creature",
         ), "selected_exact_scope"
 
-    if prowess_creature_unit:
+    if units(is_prowess_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "prowess_not_creature"
         if ".getSpellAbility().addCost" in source_text:
@@ -41022,7 +40961,7 @@ def split_row(
             family_id="xmage_static_self_prowess_creature",
         ), "selected_exact_scope"
 
-    if changeling_creature_unit:
+    if units(is_changeling_creature_unit):
         if not is_creature_metadata(metadata):
             return None, "changeling_not_creature"
         if ".getSpellAbility().addCost" in source_text:
@@ -41055,7 +40994,7 @@ def split_row(
             family_id="xmage_static_self_changeling_creature",
         ), "selected_exact_scope"
 
-    if etb_life_gain_draw_creature_unit:
+    if units(is_creature_etb_life_gain_draw_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_life_gain_draw_not_creature"
         oracle_pair = fixed_etb_life_gain_draw_from_oracle(metadata)
@@ -41101,7 +41040,7 @@ def split_row(
             family_id="xmage_creature_etb_gain_life_draw_cards",
         ), "selected_exact_scope"
 
-    if etb_life_gain_creature_unit:
+    if units(is_creature_etb_life_gain_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_life_gain_not_creature"
         dynamic_life_gain = etb_dynamic_life_gain_from_oracle(metadata)
@@ -41180,7 +41119,7 @@ def split_row(
             family_id="xmage_creature_etb_gain_life",
         ), "selected_exact_scope"
 
-    if creature_enters_life_gain_unit:
+    if units(is_creature_enters_life_gain_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "creature_enters_life_gain_not_permanent"
         oracle_trigger = creature_enters_life_gain_from_oracle(metadata)
@@ -41225,7 +41164,7 @@ def split_row(
             family_id="xmage_creature_enters_life_gain_trigger",
         ), "selected_exact_scope"
 
-    if creature_enters_draw_unit:
+    if units(is_creature_enters_draw_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "creature_enters_draw_not_permanent"
         oracle_trigger = creature_enters_draw_from_oracle(metadata)
@@ -41273,7 +41212,7 @@ def split_row(
             family_id="xmage_creature_enters_draw_trigger",
         ), "selected_exact_scope"
 
-    if dies_life_gain_creature_unit:
+    if units(is_creature_dies_life_gain_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_life_gain_not_creature"
         amount = dies_life_gain_amount_from_oracle(metadata)
@@ -41306,7 +41245,7 @@ def split_row(
             family_id="xmage_creature_dies_gain_life",
         ), "selected_exact_scope"
 
-    if dies_damage_creature_unit:
+    if units(is_creature_dies_damage_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_damage_not_creature"
         parsed = dies_damage_target_from_oracle(metadata)
@@ -41347,7 +41286,7 @@ def split_row(
             family_id="xmage_creature_dies_fixed_damage_target",
         ), "selected_exact_scope"
 
-    if etb_scry_creature_unit:
+    if units(is_creature_etb_scry_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_scry_not_creature"
         keyword_list = ordered_keywords(keywords_from_ability_classes(row))
@@ -41384,7 +41323,7 @@ def split_row(
             family_id="xmage_creature_etb_scry",
         ), "selected_exact_scope"
 
-    if etb_draw_discard_creature_unit:
+    if units(is_creature_etb_draw_discard_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_draw_discard_not_creature"
         oracle_draw_discard = etb_draw_discard_from_oracle(metadata)
@@ -41427,7 +41366,7 @@ def split_row(
             family_id="xmage_creature_etb_draw_discard_cards",
         ), "selected_exact_scope"
 
-    if etb_draw_creature_unit:
+    if units(is_creature_etb_draw_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_draw_not_creature"
         keyword_list = ordered_keywords(keywords_from_ability_classes(row))
@@ -41557,7 +41496,7 @@ def split_row(
             family_id="xmage_creature_etb_draw_cards",
         ), "selected_exact_scope"
 
-    if etb_draw_lose_life_creature_unit:
+    if units(is_creature_etb_draw_lose_life_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_draw_lose_life_not_creature"
         oracle_draw_life = etb_draw_lose_life_from_oracle(metadata)
@@ -41596,7 +41535,7 @@ def split_row(
             family_id="xmage_creature_etb_draw_lose_life",
         ), "selected_exact_scope"
 
-    if beginning_upkeep_draw_lose_life_unit:
+    if units(is_beginning_upkeep_draw_lose_life_unit):
         oracle_draw_life = beginning_upkeep_draw_lose_life_from_oracle(metadata)
         if isinstance(oracle_draw_life, str):
             return None, oracle_draw_life
@@ -41638,7 +41577,7 @@ def split_row(
             family_id="xmage_beginning_upkeep_draw_lose_life",
         ), "selected_exact_scope"
 
-    if dies_draw_creature_unit:
+    if units(is_creature_dies_draw_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_draw_not_creature"
         parsed = dies_draw_from_oracle(metadata)
@@ -41678,7 +41617,7 @@ def split_row(
             family_id="xmage_creature_dies_draw_cards",
         ), "selected_exact_scope"
 
-    if combat_damage_draw_creature_unit:
+    if units(is_creature_combat_damage_draw_unit):
         if not is_creature_metadata(metadata):
             return None, "combat_damage_draw_not_creature"
         parsed = combat_damage_draw_from_oracle(metadata)
@@ -41732,7 +41671,7 @@ def split_row(
             family_id="xmage_creature_combat_damage_draw_cards",
         ), "selected_exact_scope"
 
-    if etb_target_player_discard_creature_unit:
+    if units(is_creature_etb_target_player_discard_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_target_player_discard_not_creature"
         oracle_discard = etb_target_player_discard_from_oracle(metadata)
@@ -41782,7 +41721,7 @@ def split_row(
             family_id="xmage_creature_etb_target_player_discard",
         ), "selected_exact_scope"
 
-    if dies_target_player_discard_creature_unit:
+    if units(is_creature_dies_target_player_discard_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_target_player_discard_not_creature"
         oracle_discard = dies_target_player_discard_from_oracle(metadata)
@@ -41831,7 +41770,7 @@ def split_row(
             family_id="xmage_creature_dies_target_player_discard",
         ), "selected_exact_scope"
 
-    if combat_damage_target_player_discard_creature_unit:
+    if units(is_creature_combat_damage_target_player_discard_unit):
         if not is_creature_metadata(metadata):
             return None, "combat_damage_target_player_discard_not_creature"
         oracle_discard = combat_damage_target_player_discard_from_oracle(metadata)
@@ -41880,7 +41819,7 @@ def split_row(
             family_id="xmage_creature_combat_damage_target_player_discard",
         ), "selected_exact_scope"
 
-    if dies_recursion_creature_unit:
+    if units(is_creature_dies_recursion_unit):
         if not is_creature_metadata(metadata):
             return None, "dies_recursion_not_creature"
         if "DoIfCostPaid" in source_text or "GenericManaCost" in source_text:
@@ -41917,7 +41856,7 @@ def split_row(
             family_id="xmage_creature_dies_graveyard_to_hand",
         ), "selected_exact_scope"
 
-    if etb_damage_creature_unit:
+    if units(is_creature_etb_damage_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_damage_not_creature"
         dynamic_damage = dynamic_count_damage_from_oracle(metadata)
@@ -42017,7 +41956,7 @@ def split_row(
             family_id="xmage_creature_etb_fixed_damage_target",
         ), "selected_exact_scope"
 
-    if etb_target_boost_creature_unit:
+    if units(is_creature_etb_target_boost_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_target_boost_not_creature"
         source_boost = fixed_boost_target_from_source(source_text)
@@ -42054,7 +41993,7 @@ def split_row(
             family_id="xmage_creature_etb_fixed_boost_target_until_eot",
         ), "selected_exact_scope"
 
-    if etb_destroy_creature_unit:
+    if units(is_creature_etb_destroy_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_destroy_not_creature"
         target = etb_destroy_target_from_oracle(metadata)
@@ -42101,7 +42040,7 @@ def split_row(
             family_id="xmage_creature_etb_destroy_target",
         ), "selected_exact_scope"
 
-    if etb_bounce_creature_unit:
+    if units(is_creature_etb_bounce_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_bounce_not_creature"
         oracle_bounce = etb_bounce_target_from_oracle(metadata)
@@ -42151,7 +42090,7 @@ def split_row(
             family_id="xmage_creature_etb_return_target_to_hand",
         ), "selected_exact_scope"
 
-    if etb_recursion_creature_unit:
+    if units(is_creature_etb_recursion_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_recursion_not_creature"
         target = etb_recursion_to_hand_from_oracle(metadata)
@@ -42192,7 +42131,7 @@ def split_row(
             family_id="xmage_creature_etb_graveyard_to_hand",
         ), "selected_exact_scope"
 
-    if etb_recursion_battlefield_creature_unit:
+    if units(is_creature_etb_recursion_battlefield_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_recursion_battlefield_not_creature"
         target = etb_recursion_to_battlefield_from_oracle(metadata)
@@ -42248,7 +42187,7 @@ def split_row(
             family_id="xmage_creature_etb_graveyard_to_battlefield",
         ), "selected_exact_scope"
 
-    if etb_mill_recursion_creature_unit:
+    if units(is_creature_etb_mill_then_return_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_mill_recursion_not_creature"
         oracle_target = mill_then_return_from_oracle(metadata)
@@ -42289,17 +42228,17 @@ def split_row(
             family_id="xmage_creature_etb_mill_then_return_graveyard_to_hand",
         ), "selected_exact_scope"
 
-    if attack_recursion_permanent_unit or combat_damage_recursion_creature_unit:
+    if units(is_permanent_attack_recursion_to_hand_unit) or units(is_creature_combat_damage_recursion_to_hand_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "triggered_recursion_not_permanent"
-        if combat_damage_recursion_creature_unit and not is_creature_metadata(metadata):
+        if units(is_creature_combat_damage_recursion_to_hand_unit) and not is_creature_metadata(metadata):
             return None, "combat_damage_recursion_not_creature"
         oracle_trigger = triggered_graveyard_to_hand_from_oracle(metadata)
         if isinstance(oracle_trigger, str):
             return None, oracle_trigger
         expected_trigger = (
             "combat_damage_to_player"
-            if combat_damage_recursion_creature_unit
+            if units(is_creature_combat_damage_recursion_to_hand_unit)
             else "attack"
         )
         if str(oracle_trigger.get("trigger")) != expected_trigger:
@@ -42392,7 +42331,7 @@ def split_row(
             ),
         ), "selected_exact_scope"
 
-    if etb_graveyard_to_library_creature_unit:
+    if units(is_creature_etb_graveyard_to_library_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_graveyard_to_library_not_creature"
         oracle_target = etb_graveyard_to_library_from_oracle(metadata)
@@ -42448,7 +42387,7 @@ def split_row(
             family_id="xmage_creature_etb_graveyard_to_library",
         ), "selected_exact_scope"
 
-    if etb_library_pick_creature_unit:
+    if units(is_creature_etb_library_pick_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_library_pick_not_creature"
         oracle_pick = etb_library_pick_from_oracle(metadata)
@@ -42508,7 +42447,7 @@ def split_row(
             ),
         ), "selected_exact_scope"
 
-    if etb_tutor_battlefield_creature_unit:
+    if units(is_creature_etb_tutor_to_battlefield_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_library_tutor_not_creature"
         oracle_tutor = etb_library_tutor_to_battlefield_from_oracle(metadata)
@@ -42549,7 +42488,7 @@ def split_row(
             family_id="xmage_creature_etb_library_search_to_battlefield",
         ), "selected_exact_scope"
 
-    if etb_tutor_top_creature_unit:
+    if units(is_creature_etb_tutor_to_top_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_library_tutor_to_top_not_creature"
         oracle_tutor = etb_library_tutor_to_top_from_oracle(metadata)
@@ -42590,7 +42529,7 @@ def split_row(
             family_id="xmage_creature_etb_library_search_to_top",
         ), "selected_exact_scope"
 
-    if etb_tutor_hand_creature_unit:
+    if units(is_creature_etb_tutor_to_hand_unit):
         if not is_creature_metadata(metadata):
             return None, "etb_library_tutor_to_hand_not_creature"
         oracle_tutor = etb_library_tutor_to_hand_from_oracle(metadata)
@@ -42634,7 +42573,7 @@ def split_row(
             family_id="xmage_creature_etb_library_search_to_hand",
         ), "selected_exact_scope"
 
-    if creature_tap_damage_unit and is_creature_metadata(metadata):
+    if units(is_creature_tap_damage_unit) and is_creature_metadata(metadata):
         oracle_damage = activated_tap_damage_from_oracle(metadata)
         source_amount = activated_tap_damage_amount_from_source(source_text)
         if oracle_damage is not None and source_amount is not None:
@@ -42674,7 +42613,7 @@ def split_row(
                 family_id="xmage_creature_tap_fixed_damage",
             ), "selected_exact_scope"
 
-    if permanent_activated_damage_unit:
+    if units(is_permanent_activated_damage_unit):
         if not is_permanent_metadata(metadata) or is_spell(metadata):
             return None, "activated_damage_not_permanent"
         oracle_damage = activated_damage_from_oracle(metadata)
@@ -46959,7 +46898,7 @@ def split_row(
         }
         return build_proposal(row, metadata, effect_json, family_id="xmage_exile_target_spell"), "selected_exact_scope"
 
-    if counter_unless_pays_spell_unit:
+    if units(is_counter_unless_pays_spell_unit):
         if not is_spell(metadata):
             return None, "counter_unless_pays_not_instant_or_sorcery_spell"
         if ability_kind(row) != "one_shot":
@@ -47031,7 +46970,7 @@ def split_row(
             family_id="xmage_counter_unless_pays_dynamic_spell",
         ), "selected_exact_scope"
 
-    if counter_target_with_replacement_spell_unit:
+    if units(is_counter_target_with_replacement_spell_unit):
         if not is_spell(metadata):
             return None, "counter_replacement_not_instant_or_sorcery_spell"
         unsupported_abilities = ability_classes(row) - ALLOWED_AUXILIARY_RESOLUTION_ABILITY_CLASSES
@@ -47082,7 +47021,7 @@ def split_row(
             family_id=family_id,
         ), "selected_exact_scope"
 
-    if counter_target_controller_mill_spell_unit:
+    if units(is_counter_target_controller_mill_spell_unit):
         if not is_spell(metadata):
             return None, "counter_mill_not_instant_or_sorcery_spell"
         if ability_kind(row) != "one_shot":
@@ -47415,7 +47354,7 @@ def split_row(
         }
         return build_proposal(row, metadata, effect_json, family_id="xmage_return_target_to_hand_spell"), "selected_exact_scope"
 
-    if battlefield_to_library_spell_unit:
+    if units(is_battlefield_to_library_spell_unit):
         unsupported_abilities = ability_classes(row) - ALLOWED_AUXILIARY_RESOLUTION_ABILITY_CLASSES
         if unsupported_abilities:
             return None, "battlefield_to_library_ability_class_not_simple"
@@ -47519,7 +47458,7 @@ def split_row(
                 effect_json,
                 family_id="xmage_static_play_lands_from_graveyard",
             ), "selected_exact_scope"
-        if etb_graveyard_count_damage_creature_unit:
+        if units(is_creature_etb_graveyard_count_damage_unit):
             if not is_creature_metadata(metadata):
                 return None, "etb_graveyard_count_damage_not_creature"
             if ability_kind(row) != "triggered":
@@ -49438,7 +49377,7 @@ def split_row(
             effect_json["up_to_count"] = bool(oracle_boost["up_to_count"])
         return build_proposal(row, metadata, effect_json, family_id="xmage_boost_target_creature_until_eot_spell"), "selected_exact_scope"
 
-    if target_keyword_spell_unit:
+    if units(is_target_keyword_spell_unit):
         if classes != {"GainAbilityTargetEffect"}:
             return None, "target_keyword_spell_effect_class_not_pure"
         abilities = ability_classes(row)
@@ -49480,7 +49419,7 @@ def split_row(
             family_id="xmage_target_keyword_creature_until_eot_spell",
         ), "selected_exact_scope"
 
-    if boost_keyword_spell_unit:
+    if units(is_boost_keyword_spell_unit):
         if classes != {"BoostTargetEffect", "GainAbilityTargetEffect"}:
             return None, "boost_keyword_effect_class_not_pure"
         abilities = ability_classes(row)
@@ -51366,110 +51305,152 @@ def split_row(
     return None, "unsupported_adapter_work_unit"
 
 
+def _split_rows_from_default_source(
+    chunk: list[tuple[dict[str, Any], dict[str, Any]]],
+) -> list[tuple[dict[str, Any] | None, str]]:
+    return [split_row(row, metadata, source_text=default_source_reader(row)) for row, metadata in chunk]
+
+
+def split_candidates(
+    candidates: list[tuple[dict[str, Any], UnitClassification]],
+    *,
+    card_metadata_by_id: dict[str, dict[str, Any]],
+    source_reader: Callable[[dict[str, Any]], str],
+    workers: int,
+) -> Iterator[tuple[dict[str, Any] | None, str]]:
+    """Yield ``split_row`` results in queue order, over a process pool when it pays.
+
+    Only the default file reader is shipped to worker processes; a custom
+    reader (tests, in-memory sources) keeps the split in-process.
+    """
+
+    if workers <= 1 or source_reader is not default_source_reader or len(candidates) < SPLIT_POOL_MIN_ROWS:
+        for row, units in candidates:
+            metadata = card_metadata_by_id.get(str(row.get("card_id") or ""), {})
+            yield split_row(row, metadata, source_text=source_reader(row), units=units)
+        return
+    chunks = [
+        [
+            (row, card_metadata_by_id.get(str(row.get("card_id") or ""), {}))
+            for row, _units in candidates[start : start + SPLIT_CHUNK_ROWS]
+        ]
+        for start in range(0, len(candidates), SPLIT_CHUNK_ROWS)
+    ]
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(chunks)))
+    try:
+        for chunk_results in executor.map(_split_rows_from_default_source, chunks):
+            yield from chunk_results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def build_exact_split_report(
     queue_payload: dict[str, Any],
     *,
     card_metadata_by_id: dict[str, dict[str, Any]],
     source_reader: Callable[[dict[str, Any]], str] = default_source_reader,
     max_cards: int = 0,
+    workers: int = 1,
 ) -> dict[str, Any]:
     proposals: list[dict[str, Any]] = []
     blocked_reason_counts: Counter[str] = Counter()
     blocked_samples: dict[str, list[str]] = {}
     considered = 0
 
+    candidates: list[tuple[dict[str, Any], UnitClassification]] = []
     for row in queue_payload.get("queue") or []:
         if str(row.get("translation_lane") or "") != "xmage_authoritative_adapter_required":
             continue
+        units = unit_classification(row)
         if (
             str(row.get("adapter_work_unit") or "") not in SUPPORTED_UNITS
-            and not is_static_keyword_creature_unit(row)
-            and not is_static_ward_creature_unit(row)
-            and not is_static_attacks_each_combat_creature_unit(row)
-            and not is_prowess_creature_unit(row)
-            and not is_changeling_creature_unit(row)
-            and not is_static_protection_from_colors_creature_unit(row)
-            and not is_static_cast_as_flash_permission_unit(row)
-            and not is_static_cant_be_blocked_creature_unit(row)
-            and not is_static_cant_block_creature_unit(row)
-            and not is_static_cant_be_blocked_by_more_than_one_creature_unit(row)
-            and not is_counter_target_controller_mill_spell_unit(row)
-            and not is_static_basic_landwalk_creature_unit(row)
-            and not is_static_filtered_evasion_creature_unit(row)
-            and not is_static_flying_can_block_only_flying_creature_unit(row)
-            and not is_static_horsemanship_creature_unit(row)
-            and not is_creature_etb_life_gain_unit(row)
-            and not is_creature_etb_life_gain_draw_unit(row)
-            and not is_creature_dies_life_gain_unit(row)
-            and not is_creature_enters_draw_unit(row)
-            and not is_creature_etb_draw_unit(row)
-            and not is_creature_etb_draw_discard_unit(row)
-            and not is_creature_etb_scry_unit(row)
-            and not is_creature_etb_draw_lose_life_unit(row)
-            and not is_beginning_upkeep_draw_lose_life_unit(row)
-            and not is_creature_dies_draw_unit(row)
-            and not is_creature_combat_damage_draw_unit(row)
-            and not is_creature_etb_target_player_discard_unit(row)
-            and not is_creature_dies_target_player_discard_unit(row)
-            and not is_creature_combat_damage_target_player_discard_unit(row)
-            and not is_creature_dies_damage_unit(row)
-            and not is_spell_cast_draw_engine_unit(row)
-            and not is_beginning_end_step_conditional_draw_unit(row)
-            and not is_spell_cast_add_counters_source_unit(row)
-            and not is_spell_cast_gain_life_unit(row)
-            and not is_spell_cast_token_maker_unit(row)
-            and not is_permanent_activated_draw_discard_unit(row)
-            and not is_creature_etb_damage_unit(row)
-            and not is_creature_etb_graveyard_to_library_unit(row)
-            and not is_creature_etb_library_pick_unit(row)
-            and not is_creature_etb_tutor_to_hand_unit(row)
-            and not is_creature_etb_bounce_unit(row)
-            and not is_creature_tap_damage_unit(row)
-            and not is_creature_etb_target_boost_unit(row)
-            and not is_creature_etb_token_unit(row)
-            and not is_creature_dies_token_unit(row)
-            and not is_permanent_activated_token_unit(row)
-            and not is_creature_etb_add_counters_unit(row)
-            and not is_permanent_activated_self_add_counters_unit(row)
-            and not is_permanent_activated_draw_unit(row)
-            and not is_permanent_activated_damage_unit(row)
-            and not is_permanent_activated_destroy_unit(row)
-            and not is_permanent_activated_exile_unit(row)
-            and not is_permanent_activated_bounce_unit(row)
-            and not is_permanent_activated_life_gain_unit(row)
-            and not is_permanent_activated_self_boost_unit(row)
-            and not is_permanent_activated_target_boost_unit(row)
-            and not is_permanent_activated_target_keyword_unit(row)
-            and not is_permanent_activated_self_keyword_unit(row)
-            and not is_permanent_activated_regenerate_source_unit(row)
-            and not is_permanent_activated_regenerate_target_unit(row)
-            and not is_permanent_activated_tutor_hand_unit(row)
-            and not is_permanent_activated_hand_to_battlefield_unit(row)
-            and not is_creature_attack_target_keyword_unit(row)
-            and not is_creature_attack_self_boost_unit(row)
-            and not is_creature_landfall_self_boost_unit(row)
-            and not is_creature_becomes_blocked_self_boost_unit(row)
-            and not is_creature_becomes_blocked_draw_unit(row)
-            and not is_static_controlled_pt_unit(row)
-            and not is_static_global_pt_unit(row)
-            and not is_simple_aura_static_pt_unit(row)
-            and not is_simple_equipment_static_attachment_unit(row)
-            and not is_static_generic_cost_reduction_unit(row)
-            and not is_static_generic_cost_increase_unit(row)
-            and not is_static_graveyard_count_pt_unit(row)
-            and not is_static_graveyard_threshold_boost_unit(row)
-            and not is_static_graveyard_count_boost_unit(row)
-            and not is_static_dynamic_count_source_boost_unit(row)
-            and not is_permanent_activated_recursion_to_hand_unit(row)
-            and not is_permanent_activated_recursion_to_battlefield_unit(row)
-            and not is_permanent_activated_graveyard_exile_unit(row)
-            and not is_permanent_attack_recursion_to_hand_unit(row)
-            and not is_creature_combat_damage_recursion_to_hand_unit(row)
-            and not is_target_keyword_spell_unit(row)
-            and not is_boost_keyword_spell_unit(row)
-            and not is_counter_unless_pays_spell_unit(row)
-            and not is_counter_target_with_replacement_spell_unit(row)
-            and not is_battlefield_to_library_spell_unit(row)
+            and not units(is_static_keyword_creature_unit)
+            and not units(is_static_ward_creature_unit)
+            and not units(is_static_attacks_each_combat_creature_unit)
+            and not units(is_prowess_creature_unit)
+            and not units(is_changeling_creature_unit)
+            and not units(is_static_protection_from_colors_creature_unit)
+            and not units(is_static_cast_as_flash_permission_unit)
+            and not units(is_static_cant_be_blocked_creature_unit)
+            and not units(is_static_cant_block_creature_unit)
+            and not units(is_static_cant_be_blocked_by_more_than_one_creature_unit)
+            and not units(is_counter_target_controller_mill_spell_unit)
+            and not units(is_static_basic_landwalk_creature_unit)
+            and not units(is_static_filtered_evasion_creature_unit)
+            and not units(is_static_flying_can_block_only_flying_creature_unit)
+            and not units(is_static_horsemanship_creature_unit)
+            and not units(is_creature_etb_life_gain_unit)
+            and not units(is_creature_etb_life_gain_draw_unit)
+            and not units(is_creature_dies_life_gain_unit)
+            and not units(is_creature_enters_draw_unit)
+            and not units(is_creature_etb_draw_unit)
+            and not units(is_creature_etb_draw_discard_unit)
+            and not units(is_creature_etb_scry_unit)
+            and not units(is_creature_etb_draw_lose_life_unit)
+            and not units(is_beginning_upkeep_draw_lose_life_unit)
+            and not units(is_creature_dies_draw_unit)
+            and not units(is_creature_combat_damage_draw_unit)
+            and not units(is_creature_etb_target_player_discard_unit)
+            and not units(is_creature_dies_target_player_discard_unit)
+            and not units(is_creature_combat_damage_target_player_discard_unit)
+            and not units(is_creature_dies_damage_unit)
+            and not units(is_spell_cast_draw_engine_unit)
+            and not units(is_beginning_end_step_conditional_draw_unit)
+            and not units(is_spell_cast_add_counters_source_unit)
+            and not units(is_spell_cast_gain_life_unit)
+            and not units(is_spell_cast_token_maker_unit)
+            and not units(is_permanent_activated_draw_discard_unit)
+            and not units(is_creature_etb_damage_unit)
+            and not units(is_creature_etb_graveyard_to_library_unit)
+            and not units(is_creature_etb_library_pick_unit)
+            and not units(is_creature_etb_tutor_to_hand_unit)
+            and not units(is_creature_etb_bounce_unit)
+            and not units(is_creature_tap_damage_unit)
+            and not units(is_creature_etb_target_boost_unit)
+            and not units(is_creature_etb_token_unit)
+            and not units(is_creature_dies_token_unit)
+            and not units(is_permanent_activated_token_unit)
+            and not units(is_creature_etb_add_counters_unit)
+            and not units(is_permanent_activated_self_add_counters_unit)
+            and not units(is_permanent_activated_draw_unit)
+            and not units(is_permanent_activated_damage_unit)
+            and not units(is_permanent_activated_destroy_unit)
+            and not units(is_permanent_activated_exile_unit)
+            and not units(is_permanent_activated_bounce_unit)
+            and not units(is_permanent_activated_life_gain_unit)
+            and not units(is_permanent_activated_self_boost_unit)
+            and not units(is_permanent_activated_target_boost_unit)
+            and not units(is_permanent_activated_target_keyword_unit)
+            and not units(is_permanent_activated_self_keyword_unit)
+            and not units(is_permanent_activated_regenerate_source_unit)
+            and not units(is_permanent_activated_regenerate_target_unit)
+            and not units(is_permanent_activated_tutor_hand_unit)
+            and not units(is_permanent_activated_hand_to_battlefield_unit)
+            and not units(is_creature_attack_target_keyword_unit)
+            and not units(is_creature_attack_self_boost_unit)
+            and not units(is_creature_landfall_self_boost_unit)
+            and not units(is_creature_becomes_blocked_self_boost_unit)
+            and not units(is_creature_becomes_blocked_draw_unit)
+            and not units(is_static_controlled_pt_unit)
+            and not units(is_static_global_pt_unit)
+            and not units(is_simple_aura_static_pt_unit)
+            and not units(is_simple_equipment_static_attachment_unit)
+            and not units(is_static_generic_cost_reduction_unit)
+            and not units(is_static_generic_cost_increase_unit)
+            and not units(is_static_graveyard_count_pt_unit)
+            and not units(is_static_graveyard_threshold_boost_unit)
+            and not units(is_static_graveyard_count_boost_unit)
+            and not units(is_static_dynamic_count_source_boost_unit)
+            and not units(is_permanent_activated_recursion_to_hand_unit)
+            and not units(is_permanent_activated_recursion_to_battlefield_unit)
+            and not units(is_permanent_activated_graveyard_exile_unit)
+            and not units(is_permanent_attack_recursion_to_hand_unit)
+            and not units(is_creature_combat_damage_recursion_to_hand_unit)
+            and not units(is_target_keyword_spell_unit)
+            and not units(is_boost_keyword_spell_unit)
+            and not units(is_counter_unless_pays_spell_unit)
+            and not units(is_counter_target_with_replacement_spell_unit)
+            and not units(is_battlefield_to_library_spell_unit)
             and not (
                 not effect_classes(row)
                 and "CyclingAbility" in ability_classes(row)
@@ -51484,18 +51465,28 @@ def build_exact_split_report(
             )
         ):
             continue
-        considered += 1
-        metadata = card_metadata_by_id.get(str(row.get("card_id") or ""), {})
-        proposal, reason = split_row(row, metadata, source_text=source_reader(row))
-        if proposal is None:
-            blocked_reason_counts[reason] += 1
-            blocked_samples.setdefault(reason, [])
-            if len(blocked_samples[reason]) < 12:
-                blocked_samples[reason].append(str(row.get("card_name") or ""))
-            continue
-        proposals.append(proposal)
-        if max_cards > 0 and len(proposals) >= max_cards:
-            break
+        candidates.append((row, units))
+
+    results = split_candidates(
+        candidates,
+        card_metadata_by_id=card_metadata_by_id,
+        source_reader=source_reader,
+        workers=workers,
+    )
+    try:
+        for (row, _units), (proposal, reason) in zip(candidates, results):
+            considered += 1
+            if proposal is None:
+                blocked_reason_counts[reason] += 1
+                blocked_samples.setdefault(reason, [])
+                if len(blocked_samples[reason]) < 12:
+                    blocked_samples[reason].append(str(row.get("card_name") or ""))
+                continue
+            proposals.append(proposal)
+            if max_cards > 0 and len(proposals) >= max_cards:
+                break
+    finally:
+        results.close()
 
     family_counts = Counter(str(proposal.get("family_id") or "") for proposal in proposals)
     scope_counts = Counter(str(proposal.get("battle_model_scope") or "") for proposal in proposals)
@@ -51701,6 +51692,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--queue", required=True, help="XMage authoritative queue JSON")
     parser.add_argument("--output-prefix", help="Output path prefix")
     parser.add_argument("--max-cards", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=SPLIT_WORKERS)
     return parser.parse_args()
 
 
@@ -51711,6 +51703,7 @@ def main() -> int:
         queue_payload,
         card_metadata_by_id=fetch_card_metadata_by_id(),
         max_cards=args.max_cards,
+        workers=args.workers,
     )
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     output_prefix = Path(
@@ -220,7 +220,8 @@ def build_report() -> dict[str, object]:
                 "except (BrokenPipeError, ConnectionResetError)",
                 "start_new_session=True",
                 "os.killpg(process.pid, signal.SIGKILL)",
-                "SIMULATION_LOCK",
+                "class ForgeSlotPool",
+                "with self.slot_pool.acquire() as slot:",
                 '"/cards/coverage"',
                 '"/coverage"',
                 '"/simulate"',
@@ -9,19 +9,31 @@ runtime code, or reviewed battle rules.
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
+import gzip
+import hashlib
 import json
+import os
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import xmage_reference_test_scenario_builder as scenario_builder
+import xmage_source_index
 import xmage_to_manaloom_effect_hints as effect_hints
 
 
 DEFAULT_REPORT_DIR = Path(__file__).resolve().parent.parent.parent / "master_optimizer_reports"
+EXTRACTION_CACHE_SCHEMA_VERSION = "manaloom_xmage_card_extraction_cache_v1"
+EXTRACTION_CACHE_FILENAME = "xmage_card_extractions.json.gz"
+EXTRACTION_WORKERS = min(8, os.cpu_count() or 1)
+# Spawning a pool costs more than parsing a handful of sources inline.
+EXTRACTION_POOL_MIN_FILES = 8
 
 
 @dataclass(frozen=True)
@@ -80,12 +92,13 @@ def direct_card_paths(xmage_root: Path, class_name: str) -> list[Path]:
 
 
 def build_card_class_index(xmage_root: Path) -> dict[str, Path]:
+    source_index = xmage_source_index.load_source_index(xmage_root)
     index: dict[str, Path] = {}
-    for root in cards_source_roots(xmage_root):
-        if not root.exists():
-            continue
-        for path in root.glob("*/*.java"):
-            index[path.stem] = path
+    for root in cards_source_roots(source_index.root):
+        prefix = root.relative_to(source_index.root).as_posix()
+        for path in source_index.files_under(prefix):
+            if path.parent.parent == root:
+                index[path.stem] = xmage_root / path.relative_to(source_index.root)
     return index
 
 
@@ -353,26 +366,101 @@ def build_index_for_card(
 ) -> dict[str, Any]:
     resolved = resolve_card_source(xmage_root, card_name, class_index=class_index)
     if not resolved:
-        return {
-            "card_name": card_name,
-            "status": "not_found",
-            "candidate_class_names": xmage_class_candidates(card_name),
-            "nearby_xmage_class_candidates": nearby_class_candidates(card_name, class_index),
-            "mutations_performed": [],
-        }
-    source = resolved.path.read_text(encoding="utf-8", errors="replace")
-    entry = parse_java_card_source(
-        source,
-        card_name=card_name,
-        class_name=resolved.class_name,
-        path=resolved.path,
-    )
+        return _not_found_entry(card_name, class_index)
+    entry = _parse_resolved_source(card_name, resolved.class_name, str(resolved.path))
+    return _finish_found_entry(entry, card_name, resolved)
+
+
+def _not_found_entry(card_name: str, class_index: dict[str, Path] | None) -> dict[str, Any]:
+    return {
+        "card_name": card_name,
+        "status": "not_found",
+        "candidate_class_names": xmage_class_candidates(card_name),
+        "nearby_xmage_class_candidates": nearby_class_candidates(card_name, class_index),
+        "mutations_performed": [],
+    }
+
+
+def _parse_resolved_source(card_name: str, class_name: str, path: str) -> dict[str, Any]:
+    source = Path(path).read_text(encoding="utf-8", errors="replace")
+    return parse_java_card_source(source, card_name=card_name, class_name=class_name, path=Path(path))
+
+
+def _finish_found_entry(entry: dict[str, Any], card_name: str, resolved: ResolvedSource) -> dict[str, Any]:
+    entry["xmage_path"] = str(resolved.path)
     entry["resolution"] = resolved.resolution
     entry["candidate_class_names"] = xmage_class_candidates(card_name)
     entry["mutations_performed"] = []
     return entry
 
 
+@functools.lru_cache(maxsize=1)
+def extractor_fingerprint() -> str:
+    """Hash of the extraction code, so cached entries die with a parser change."""
+
+    digest = hashlib.sha256(EXTRACTION_CACHE_SCHEMA_VERSION.encode("utf-8"))
+    for module_path in (Path(__file__), Path(effect_hints.__file__), Path(scenario_builder.__file__)):
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def extraction_cache_path(cache_dir: Path | None = None) -> Path:
+    return xmage_source_index.index_cache_dir(cache_dir) / EXTRACTION_CACHE_FILENAME
+
+
+def extraction_key(content_sha256: str, card_name: str, class_name: str) -> str:
+    return f"{content_sha256}/{class_name}/{card_name}"
+
+
+def load_extraction_cache(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if (
+        payload.get("schema_version") != EXTRACTION_CACHE_SCHEMA_VERSION
+        or payload.get("extractor") != extractor_fingerprint()
+    ):
+        return {}
+    return dict(payload.get("entries") or {})
+
+
+def write_extraction_cache(path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=5) as handle:
+        json.dump(
+            {
+                "schema_version": EXTRACTION_CACHE_SCHEMA_VERSION,
+                "extractor": extractor_fingerprint(),
+                "entries": entries,
+            },
+            handle,
+            separators=(",", ":"),
+        )
+    temporary.replace(path)
+
+
+def _content_sha256(source_index: xmage_source_index.XMageSourceIndex, path: Path) -> str:
+    indexed = source_index.entry(path.resolve())
+    if indexed is not None:
+        return indexed.sha256
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _parse_pending(pending: list[tuple[str, ResolvedSource]], *, workers: int) -> list[dict[str, Any]]:
+    card_names = [card_name for card_name, _resolved in pending]
+    class_names = [resolved.class_name for _card_name, resolved in pending]
+    paths = [str(resolved.path) for _card_name, resolved in pending]
+    if workers <= 1 or len(pending) < EXTRACTION_POOL_MIN_FILES:
+        return list(map(_parse_resolved_source, card_names, class_names, paths))
+    pool_size = min(workers, len(pending))
+    with ProcessPoolExecutor(max_workers=pool_size) as executor:
+        chunksize = max(1, len(pending) // (pool_size * 4))
+        return list(executor.map(_parse_resolved_source, card_names, class_names, paths, chunksize=chunksize))
+
+
 def load_card_names(args: argparse.Namespace) -> tuple[list[str], dict[str, Any]]:
     source: dict[str, Any] = {}
     names: list[str] = []
@@ -412,12 +500,55 @@ def load_card_names(args: argparse.Namespace) -> tuple[list[str], dict[str, Any]
     return deduped, source
 
 
-def build_index_report(card_names: list[str], *, xmage_root: Path, source: dict[str, Any] | None = None) -> dict[str, Any]:
+def build_index_report(
+    card_names: list[str],
+    *,
+    xmage_root: Path,
+    source: dict[str, Any] | None = None,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+    workers: int = EXTRACTION_WORKERS,
+) -> dict[str, Any]:
+    """Index ``card_names``, re-parsing only sources whose content changed.
+
+    Extractions are persisted keyed by source sha256, class and card name, so
+    a re-run or a pin transition parses only the files that differ.
+    """
+
     class_index = build_card_class_index(xmage_root)
-    cards = [
-        build_index_for_card(card_name, xmage_root=xmage_root, class_index=class_index)
-        for card_name in card_names
-    ]
+    source_index = xmage_source_index.load_source_index(xmage_root)
+    cache_path = extraction_cache_path(cache_dir) if use_cache else None
+    cached = load_extraction_cache(cache_path) if cache_path else {}
+    cards: list[dict[str, Any]] = []
+    pending: list[tuple[str, ResolvedSource]] = []
+    pending_positions: list[tuple[int, str]] = []
+    reused_count = 0
+    for card_name in card_names:
+        resolved = resolve_card_source(xmage_root, card_name, class_index=class_index)
+        if not resolved:
+            cards.append(_not_found_entry(card_name, class_index))
+            continue
+        key = extraction_key(_content_sha256(source_index, resolved.path), card_name, resolved.class_name)
+        hit = cached.get(key)
+        if hit is not None:
+            cards.append(_finish_found_entry(copy.deepcopy(hit), card_name, resolved))
+            reused_count += 1
+            continue
+        pending_positions.append((len(cards), key))
+        pending.append((card_name, resolved))
+        cards.append({})
+    for (position, key), (card_name, resolved), entry in zip(
+        pending_positions, pending, _parse_pending(pending, workers=workers)
+    ):
+        cached[key] = {**entry, "xmage_path": None}
+        cards[position] = _finish_found_entry(entry, card_name, resolved)
+    if cache_path and pending:
+        live_hashes = {indexed.sha256 for indexed in source_index.entries}
+        live = {key: value for key, value in cached.items() if key.split("/", 1)[0] in live_hashes}
+        try:
+            write_extraction_cache(cache_path, live)
+        except OSError:
+            cache_path = None
     resolved_count = sum(1 for card in cards if card.get("status") == "found")
     return {
         "generated_at": utc_now(),
@@ -430,7 +561,10 @@ def build_index_report(card_names: list[str], *, xmage_root: Path, source: dict[
             "resolved_count": resolved_count,
             "not_found_count": len(cards) - resolved_count,
             "xmage_class_index_size": len(class_index),
+            "extraction_reused_count": reused_count,
+            "extraction_parsed_count": len(pending),
         },
+        "extraction_cache": str(cache_path) if cache_path else None,
         "cards": cards,
     }
 
@@ -518,6 +652,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cards-file")
     parser.add_argument("--coherence-report")
     parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--extraction-cache-dir", help="Defaults to MANALOOM_XMAGE_INDEX_CACHE_DIR.")
+    parser.add_argument("--no-extraction-cache", action="store_true")
+    parser.add_argument("--workers", type=int, default=EXTRACTION_WORKERS)
     parser.add_argument("--output-prefix")
     parser.add_argument("--output-json")
     parser.add_argument("--output-md")
@@ -528,7 +665,14 @@ def main() -> int:
     args = parse_args()
     xmage_root = Path(args.xmage_root)
     card_names, source = load_card_names(args)
-    report = build_index_report(card_names, xmage_root=xmage_root, source=source)
+    report = build_index_report(
+        card_names,
+        xmage_root=xmage_root,
+        source=source,
+        cache_dir=Path(args.extraction_cache_dir) if args.extraction_cache_dir else None,
+        use_cache=not args.no_extraction_cache,
+        workers=args.workers,
+    )
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     if args.output_prefix:
         output_json = Path(f"{args.output_prefix}.json")
@@ -546,6 +690,8 @@ def main() -> int:
     print(f"md_report={output_md}")
     print(f"cards={len(report['cards'])}")
     print(f"resolved={report['summary']['resolved_count']}")
+    print(f"extraction_reused={report['summary']['extraction_reused_count']}")
+    print(f"extraction_parsed={report['summary']['extraction_parsed_count']}")
     print("mutations_performed=[]")
     return 0
 
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""Shared class-name index over a local XMage source checkout.
+
+Every ``.java`` file under the XMage card, engine and test source roots is
+recorded once with its relative path, content hash and the direct superclass
+of the class it declares. A clean checkout is persisted per commit, so tools
+that used to glob or walk the tree on every lookup share one build per pin. A
+dirty checkout is persisted per HEAD plus the state of the paths ``git status``
+reports, and is derived from an earlier index of the same HEAD by re-hashing
+only those paths. The index is read-only evidence; it never mutates the
+checkout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+SCHEMA_VERSION = "manaloom_xmage_source_index_v1"
+INDEX_CACHE_DIR_ENV = "MANALOOM_XMAGE_INDEX_CACHE_DIR"
+DEFAULT_INDEX_CACHE_DIR = Path.home() / ".cache" / "manaloom" / "xmage"
+SOURCE_ROOTS = (
+    "Mage/src/main/java",
+    "Mage.Sets/src",
+    "Mage.Tests/src/test/java",
+)
+INDEX_WORKERS = 8
+# Dirty-tree indexes kept per HEAD; older ones are pruned.
+MAX_DIRTY_CACHES_PER_COMMIT = 4
+EXTENDS_PATTERN = r"\bclass\s+{name}\b[^{{;]*?\bextends\s+([A-Za-z_][A-Za-z0-9_.]*)"
+
+_LOADED: dict[Path, "XMageSourceIndex"] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SourceEntry:
+    path: str
+    sha256: str
+    extends: str | None
+
+
+@dataclass
+class XMageSourceIndex:
+    root: Path
+    commit: str | None
+    entries: list[SourceEntry]
+    source: str = "built"
+    head: str | None = None
+    dirty_paths: tuple[str, ...] = ()
+    by_class: dict[str, list[SourceEntry]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        for entry in self.entries:
+            self.by_class.setdefault(Path(entry.path).stem, []).append(entry)
+
+    def paths(self, class_name: str, *, under: tuple[str, ...] = ()) -> list[Path]:
+        """Files declaring ``class_name``, in the order of ``under`` then path."""
+
+        entries = self.by_class.get(class_name, [])
+        if not under:
+            return [self.root / entry.path for entry in entries]
+        return [
+            self.root / entry.path
+            for prefix in under
+            for entry in entries
+            if entry.path.startswith(prefix.rstrip("/") + "/")
+        ]
+
+    def find(self, class_name: str, *, under: tuple[str, ...] = ()) -> Path | None:
+        paths = self.paths(class_name, under=under)
+        return paths[0] if paths else None
+
+    def files_under(self, prefix: str) -> list[Path]:
+        prefix = prefix.rstrip("/") + "/"
+        return [self.root / entry.path for entry in self.entries if entry.path.startswith(prefix)]
+
+    def entry(self, path: Path) -> SourceEntry | None:
+        try:
+            relative = path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        stem_entries = self.by_class.get(path.stem, [])
+        return next((entry for entry in stem_entries if entry.path == relative), None)
+
+    def extends_chain(self, class_name: str) -> list[str]:
+        """Superclass names from ``class_name`` upward while they are indexed."""
+
+        chain: list[str] = []
+        current = class_name
+        while True:
+            entries = self.by_class.get(current)
+            parent = entries[0].extends if entries else None
+            if not parent:
+                return chain
+            parent = parent.rsplit(".", 1)[-1]
+            if parent in chain or parent == class_name:
+                return chain
+            chain.append(parent)
+            current = parent
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "commit": self.commit,
+            "head": self.head,
+            "dirty_path_count": len(self.dirty_paths),
+            "source": self.source,
+            "file_count": len(self.entries),
+            "class_count": len(self.by_class),
+        }
+
+
+@dataclass(frozen=True)
+class CheckoutState:
+    head: str
+    # Paths ``git status`` reports as changed or untracked, relative to root.
+    dirty_paths: tuple[str, ...]
+
+    @property
+    def clean(self) -> bool:
+        return not self.dirty_paths
+
+
+def _porcelain_paths(output: str) -> list[str]:
+    """Paths from ``git status --porcelain -z``, including rename sources."""
+
+    paths: list[str] = []
+    records = output.split("\0")
+    position = 0
+    while position < len(records):
+        record = records[position]
+        position += 1
+        if len(record) < 4:
+            continue
+        paths.append(record[3:])
+        if record[0] in "RC":
+            # Renames and copies are followed by their original path.
+            if position < len(records) and records[position]:
+                paths.append(records[position])
+            position += 1
+    return paths
+
+
+def checkout_state(root: Path) -> CheckoutState | None:
+    """HEAD and dirty paths of ``root`` when it is a git toplevel, else None."""
+
+    try:
+        top_level = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "--show-toplevel"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        revision = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "HEAD"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        status = subprocess.run(
+            ["git", "-C", str(root), "status", "--porcelain", "-z", "--untracked-files=all"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if (
+        top_level.returncode != 0
+        or Path(top_level.stdout.strip()).resolve() != root
+        or revision.returncode != 0
+        or status.returncode != 0
+        or not revision.stdout.strip()
+    ):
+        return None
+    return CheckoutState(
+        head=revision.stdout.strip(),
+        dirty_paths=tuple(sorted(set(_porcelain_paths(status.stdout)))),
+    )
+
+
+def dirty_fingerprint(root: Path, dirty_paths: tuple[str, ...]) -> str:
+    """Identify the current content state of ``dirty_paths`` by stat."""
+
+    digest = hashlib.sha256()
+    for relative in dirty_paths:
+        try:
+            stat = (root / relative).stat()
+            marker = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            marker = "missing"
+        digest.update(f"{relative}\0{marker}\n".encode("utf-8"))
+    return digest.hexdigest()[:20]
+
+
+def _index_file(root: Path, path: Path) -> SourceEntry:
+    data = path.read_bytes()
+    text = data.decode("utf-8", errors="replace")
+    match = re.search(EXTENDS_PATTERN.format(name=re.escape(path.stem)), text)
+    return SourceEntry(
+        path=path.relative_to(root).as_posix(),
+        sha256=hashlib.sha256(data).hexdigest(),
+        extends=match.group(1) if match else None,
+    )
+
+
+def _indexed_path(relative: str) -> bool:
+    return relative.endswith(".java") and any(
+        relative.startswith(source_root + "/") for source_root in SOURCE_ROOTS
+    )
+
+
+def refresh_source_index(
+    root: Path,
+    base: list[SourceEntry],
+    changed_paths: set[str],
+) -> list[SourceEntry]:
+    """``base`` with only ``changed_paths`` dropped and re-hashed from disk."""
+
+    kept = [entry for entry in base if entry.path not in changed_paths]
+    refreshed = [
+        _index_file(root, root / relative)
+        for relative in sorted(changed_paths)
+        if _indexed_path(relative) and (root / relative).is_file()
+    ]
+    return sorted(kept + refreshed, key=lambda entry: Path(entry.path))
+
+
+def build_source_index(root: Path, *, workers: int = INDEX_WORKERS) -> list[SourceEntry]:
+    paths: list[Path] = []
+    for relative in SOURCE_ROOTS:
+        base = root / relative
+        if not base.is_dir():
+            continue
+        for directory, _subdirectories, filenames in os.walk(base):
+            paths.extend(Path(directory) / name for name in filenames if name.endswith(".java"))
+    paths.sort()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(lambda path: _index_file(root, path), paths))
+
+
+def index_cache_dir(cache_dir: Path | None = None) -> Path:
+    if cache_dir is not None:
+        return cache_dir
+    return Path(os.environ.get(INDEX_CACHE_DIR_ENV) or DEFAULT_INDEX_CACHE_DIR)
+
+
+def cache_path_for(cache_dir: Path, commit: str, dirty: str | None = None) -> Path:
+    if dirty:
+        return cache_dir / f"xmage_source_index_{commit}_dirty_{dirty}.json.gz"
+    return cache_dir / f"xmage_source_index_{commit}.json.gz"
+
+
+def _read_cache(path: Path, commit: str) -> tuple[list[SourceEntry], tuple[str, ...]] | None:
+    """Entries and the dirty paths they were built with, if ``path`` is valid."""
+
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if payload.get("schema_version") != SCHEMA_VERSION or payload.get("commit") != commit:
+        return None
+    entries = [SourceEntry(path=row[0], sha256=row[1], extends=row[2]) for row in payload["files"]]
+    return entries, tuple(payload.get("dirty_paths") or ())
+
+
+def _write_cache(
+    path: Path,
+    commit: str,
+    entries: list[SourceEntry],
+    dirty_paths: tuple[str, ...] = (),
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=5) as handle:
+        json.dump(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "commit": commit,
+                "dirty_paths": list(dirty_paths),
+                "files": [[entry.path, entry.sha256, entry.extends] for entry in entries],
+            },
+            handle,
+            separators=(",", ":"),
+        )
+    temporary.replace(path)
+
+
+def _dirty_caches(cache_dir: Path, commit: str) -> list[Path]:
+    """Dirty-tree caches of ``commit``, newest first."""
+
+    candidates = []
+    for path in cache_dir.glob(f"xmage_source_index_{commit}_dirty_*.json.gz"):
+        try:
+            candidates.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    return [path for _mtime, path in sorted(candidates, reverse=True)]
+
+
+def _base_for_head(
+    cache_dir: Path,
+    commit: str,
+) -> tuple[list[SourceEntry], tuple[str, ...]] | None:
+    """Any persisted index of ``commit``: the clean one, else the newest dirty one."""
+
+    for path in (cache_path_for(cache_dir, commit), *_dirty_caches(cache_dir, commit)):
+        cached = _read_cache(path, commit)
+        if cached is not None:
+            return cached
+    return None
+
+
+def _load_entries(
+    root: Path,
+    state: CheckoutState | None,
+    cache_dir: Path,
+) -> tuple[list[SourceEntry], str]:
+    if state is None:
+        return build_source_index(root), "built_uncached"
+    dirty = None if state.clean else dirty_fingerprint(root, state.dirty_paths)
+    path = cache_path_for(cache_dir, state.head, dirty)
+    cached = _read_cache(path, state.head)
+    if cached is not None:
+        return cached[0], "cache"
+    base = _base_for_head(cache_dir, state.head)
+    if base is not None:
+        # Outside both dirty sets every file still matches HEAD, so only the
+        # union needs re-hashing.
+        base_entries, base_dirty = base
+        entries = refresh_source_index(root, base_entries, set(base_dirty) | set(state.dirty_paths))
+        source = "incremental"
+    else:
+        entries = build_source_index(root)
+        source = "built"
+    try:
+        _write_cache(path, state.head, entries, state.dirty_paths)
+        for stale in _dirty_caches(cache_dir, state.head)[MAX_DIRTY_CACHES_PER_COMMIT:]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        source = "built_uncached"
+    return entries, source
+
+
+def load_source_index(root: Path, *, cache_dir: Path | None = None) -> XMageSourceIndex:
+    """Return the index for ``root``, built at most once per process and state.
+
+    A clean checkout is persisted by HEAD commit and a dirty one by HEAD plus
+    the stat of its dirty paths. A tree that is not a git toplevel is indexed
+    in memory once per process.
+    """
+
+    resolved = root.expanduser().resolve()
+    with _LOAD_LOCK:
+        loaded = _LOADED.get(resolved)
+        if loaded is not None:
+            return loaded
+        state = checkout_state(resolved)
+        entries, source = _load_entries(resolved, state, index_cache_dir(cache_dir))
+        loaded = XMageSourceIndex(
+            root=resolved,
+            commit=state.head if state is not None and state.clean else None,
+            entries=entries,
+            source=source,
+            head=state.head if state is not None else None,
+            dirty_paths=state.dirty_paths if state is not None else (),
+        )
+        _LOADED[resolved] = loaded
+        return loaded
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--xmage-root", type=Path, required=True)
+    parser.add_argument("--cache-dir", type=Path)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = load_source_index(args.xmage_root, cache_dir=args.cache_dir)
+    for key, value in index.summary().items():
+        print(f"{key}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,23 +4,41 @@
 The miner is read-only. It scans XMage's Java test corpus for exact card-name or
 class-name references and emits scenario-shape evidence. It does not execute
 tests, mutate PostgreSQL, mutate SQLite, or promote battle rules.
+
+The corpus is scanned once into a token index (word tokens to files, plus
+method spans and named string constants per file). Each card then verifies
+only the files that contain every token of one of its search terms. With
+``--index-cache-dir`` the index is persisted per XMage commit.
 """
 
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+import os
 import re
 from collections import Counter
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import external_engine_source_contract as engine_source_contract
+import xmage_source_index
 
 DEFAULT_XMAGE_ROOT: Path | None = None
 DEFAULT_REPORT_DIR = Path(__file__).resolve().parent.parent.parent / "master_optimizer_reports"
 SCHEMA_VERSION = "manaloom_xmage_test_scenario_miner_v2_2026-07-28"
+TEST_INDEX_SCHEMA_VERSION = "manaloom_xmage_test_token_index_v1"
+# Tokens present in more than this share of files do not narrow a search and
+# are kept out of the postings; a term made only of them scans every file.
+TOKEN_POSTING_MAX_SHARE = 0.25
+WORD_TOKEN = re.compile(r"[A-Za-z0-9_]+")
+ASSIGNED_STRING = re.compile(
+    r"\b(?:String|var)\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"
+    r'"([^"]+)"'
+)
 
 TEST_COMMANDS = [
     "addCard",
@@ -96,10 +114,11 @@ def read_text(path: Path) -> str:
 
 
 def iter_test_files(xmage_root: Path) -> list[Path]:
-    root = xmage_root / "Mage.Tests" / "src" / "test" / "java"
-    if not root.exists():
-        return []
-    return sorted(path for path in root.rglob("*.java") if path.is_file())
+    source_index = xmage_source_index.load_source_index(xmage_root)
+    return [
+        xmage_root / path.relative_to(source_index.root)
+        for path in source_index.files_under("Mage.Tests/src/test/java")
+    ]
 
 
 def card_search_terms(card_name: str) -> list[str]:
@@ -198,69 +217,161 @@ def scenario_shape(source: str) -> dict[str, Any]:
 
 
 def method_matches_card(method_source: str, terms: list[str]) -> bool:
-    return any(
-        re.search(
-            rf"(?<![A-Za-z0-9_]){re.escape(term)}(?![A-Za-z0-9_])",
-            method_source,
-            flags=re.IGNORECASE,
-        )
-        is not None
-        for term in terms
+    return term_matcher(tuple(terms)).search(method_source) is not None
+
+
+@lru_cache(maxsize=4096)
+def term_matcher(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """One case-insensitive whole-token pattern for all of a card's terms."""
+
+    alternatives = "|".join(re.escape(term) for term in terms) or r"(?!x)x"
+    return re.compile(
+        rf"(?<![A-Za-z0-9_])(?:{alternatives})(?![A-Za-z0-9_])",
+        flags=re.IGNORECASE,
     )
 
 
 def _assigned_identifiers(source: str, card_name: str) -> list[str]:
     identifiers: set[str] = set()
-    for match in re.finditer(
-        r"\b(?:String|var)\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*"
-        r'"([^"]+)"',
-        source,
-    ):
+    for match in ASSIGNED_STRING.finditer(source):
         if normalize_name(match.group(2)) == normalize_name(card_name):
             identifiers.add(match.group(1))
     return sorted(identifiers)
 
 
-def build_test_index(test_files: list[Path]) -> list[dict[str, Any]]:
-    return [
-        {
-            "path": path,
-            "source": source,
-            "methods": extract_methods(source),
-        }
-        for path in test_files
-        if (source := read_text(path))
-    ]
+def build_test_index(test_files: list[Path], *, xmage_root: Path) -> dict[str, Any]:
+    files: list[dict[str, Any]] = []
+    postings: dict[str, list[int]] = {}
+    for path in test_files:
+        source = read_text(path)
+        if not source:
+            continue
+        file_id = len(files)
+        assigned: dict[str, set[str]] = {}
+        for match in ASSIGNED_STRING.finditer(source):
+            assigned.setdefault(normalize_name(match.group(2)), set()).add(match.group(1))
+        files.append(
+            {
+                "path": rel(path, xmage_root),
+                "methods": [
+                    {key: value for key, value in method.items() if key != "source"}
+                    for method in extract_methods(source)
+                ],
+                "assigned_identifiers": {
+                    literal: sorted(names) for literal, names in sorted(assigned.items())
+                },
+            }
+        )
+        for token in {token.lower() for token in WORD_TOKEN.findall(source)}:
+            postings.setdefault(token, []).append(file_id)
+    common_limit = max(1, int(len(files) * TOKEN_POSTING_MAX_SHARE))
+    common_tokens = sorted(token for token, ids in postings.items() if len(ids) > common_limit)
+    for token in common_tokens:
+        del postings[token]
+    return {
+        "schema_version": TEST_INDEX_SCHEMA_VERSION,
+        "test_files_scanned": len(test_files),
+        "files": files,
+        "common_tokens": common_tokens,
+        "postings": postings,
+    }
+
+
+def load_test_index(
+    xmage_root: Path,
+    *,
+    xmage_commit: str | None = None,
+    cache_dir: Path | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the token index, reusing the artifact for the same XMage commit."""
+
+    cache_path = (
+        cache_dir / f"xmage_test_token_index_{xmage_commit}.json.gz"
+        if cache_dir is not None and xmage_commit
+        else None
+    )
+    if cache_path is not None and cache_path.is_file():
+        try:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as handle:
+                cached = json.load(handle)
+        except (OSError, ValueError):
+            cached = None
+        if (
+            isinstance(cached, dict)
+            and cached.get("schema_version") == TEST_INDEX_SCHEMA_VERSION
+            and cached.get("xmage_commit") == xmage_commit
+        ):
+            return cached, {"source": "cache", "path": str(cache_path)}
+    index = build_test_index(iter_test_files(xmage_root), xmage_root=xmage_root)
+    if cache_path is None:
+        return index, {"source": "built_uncached", "path": None}
+    index["xmage_commit"] = xmage_commit
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=5) as handle:
+        json.dump(index, handle, separators=(",", ":"))
+    temporary.replace(cache_path)
+    return index, {"source": "built", "path": str(cache_path)}
+
+
+def candidate_file_ids(test_index: dict[str, Any], terms: list[str]) -> list[int]:
+    """Files holding every indexed token of at least one term, in path order."""
+
+    common = set(test_index["common_tokens"])
+    postings = test_index["postings"]
+    every_file = range(len(test_index["files"]))
+    candidates: set[int] = set()
+    for term in terms:
+        tokens = {token.lower() for token in WORD_TOKEN.findall(term)} - common
+        if not tokens:
+            return list(every_file)
+        lists = sorted((postings.get(token, []) for token in tokens), key=len)
+        matched = set(lists[0])
+        for ids in lists[1:]:
+            if not matched:
+                break
+            matched.intersection_update(ids)
+        candidates.update(matched)
+    return sorted(candidates)
+
+
+@lru_cache(maxsize=256)
+def _indexed_source(path: str) -> str:
+    return read_text(Path(path))
 
 
 def mine_card(
     card_name: str,
     *,
     xmage_root: Path,
-    test_index: list[dict[str, Any]],
+    test_index: dict[str, Any],
 ) -> dict[str, Any]:
     terms = card_search_terms(card_name)
     file_hits: list[dict[str, Any]] = []
     card_class = java_class_name(card_name)
-    for indexed_file in test_index:
-        path = indexed_file["path"]
-        source = indexed_file["source"]
-        if not method_matches_card(source, terms):
+    matcher = term_matcher(tuple(terms))
+    for file_id in candidate_file_ids(test_index, terms):
+        indexed_file = test_index["files"][file_id]
+        path = xmage_root / indexed_file["path"]
+        source = _indexed_source(str(path))
+        if matcher.search(source) is None:
             continue
-        identifier_terms = _assigned_identifiers(source, card_name)
-        method_terms = terms + identifier_terms
-        methods = [
-            method
+        identifier_terms = indexed_file["assigned_identifiers"].get(
+            normalize_name(card_name), []
+        )
+        method_matcher = term_matcher(tuple(terms + identifier_terms))
+        test_methods = [
+            {**method, "source": source[method["start_offset"] : method["end_offset"]]}
             for method in indexed_file["methods"]
             if method["is_test_method"]
-            and method_matches_card(method["source"], method_terms)
+        ]
+        methods = [
+            method
+            for method in test_methods
+            if method_matcher.search(method["source"]) is not None
         ]
         if not methods and path.stem.casefold() == f"{card_class}Test".casefold():
-            methods = [
-                method
-                for method in indexed_file["methods"]
-                if method["is_test_method"]
-            ]
+            methods = test_methods
         if not methods:
             continue
         method_hits = []
@@ -306,9 +417,19 @@ def load_cards_from_json(path: Path) -> list[str]:
     raise ValueError(f"Unsupported cards JSON shape: {path}")
 
 
-def build_report(cards: list[str], *, xmage_root: Path) -> dict[str, Any]:
-    test_files = iter_test_files(xmage_root)
-    test_index = build_test_index(test_files)
+def build_report(
+    cards: list[str],
+    *,
+    xmage_root: Path,
+    xmage_commit: str | None = None,
+    index_cache_dir: Path | None = None,
+) -> dict[str, Any]:
+    test_index, index_info = load_test_index(
+        xmage_root,
+        xmage_commit=xmage_commit,
+        cache_dir=index_cache_dir,
+    )
+    _indexed_source.cache_clear()
     mined_cards = [
         mine_card(card, xmage_root=xmage_root, test_index=test_index)
         for card in cards
@@ -322,12 +443,17 @@ def build_report(cards: list[str], *, xmage_root: Path) -> dict[str, Any]:
         "xmage_root": str(xmage_root),
         "summary": {
             "requested_card_count": len(cards),
-            "test_files_scanned": len(test_files),
+            "test_files_scanned": test_index["test_files_scanned"],
             "status_counts": dict(sorted(statuses.items())),
             "cards_with_test_reference": sum(1 for card in mined_cards if card["test_file_count"] > 0),
             "usable_scenario_candidate_count": sum(card["usable_scenario_candidate_count"] for card in mined_cards),
         },
         "cards": mined_cards,
+        "test_index": {
+            "schema_version": TEST_INDEX_SCHEMA_VERSION,
+            "xmage_commit": xmage_commit,
+            **index_info,
+        },
         "notes": [
             "XMage tests are reference evidence only; ManaLoom still needs local focused tests before PG promotion.",
             "no_exact_test_reference_found does not mean XMage has no card implementation; it only means the test corpus did not reference the card by scanned terms.",
@@ -393,6 +519,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cards-json", type=Path)
     parser.add_argument("--output-json", type=Path)
     parser.add_argument("--output-md", type=Path)
+    parser.add_argument(
+        "--index-cache-dir",
+        type=Path,
+        help="Persist the test-corpus token index here, keyed by the XMage commit.",
+    )
     return parser.parse_args()
 
 
@@ -411,10 +542,16 @@ def main() -> int:
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     output_json = args.output_json or DEFAULT_REPORT_DIR / f"xmage_test_scenario_miner_{timestamp}.json"
     output_md = args.output_md or output_json.with_suffix(".md")
-    report = build_report(cards, xmage_root=xmage_root)
+    report = build_report(
+        cards,
+        xmage_root=xmage_root,
+        xmage_commit=engine_source_contract.canonical_xmage_pin(),
+        index_cache_dir=args.index_cache_dir,
+    )
     write_outputs(report, output_json=output_json, output_md=output_md)
     print(f"wrote_json={output_json}")
     print(f"wrote_md={output_md}")
+    print(f"test_index_source={report['test_index']['source']}")
     print(f"requested_card_count={report['summary']['requested_card_count']}")
     print(f"cards_with_test_reference={report['summary']['cards_with_test_reference']}")
     print(f"usable_scenario_candidate_count={report['summary']['usable_scenario_candidate_count']}")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Plan/apply a safe cards.image_url backfill from Scryfall default bulk data.
 
-Dry-run is the default. Apply changes only image_url, preserves exact printing
+Default bulk data is read through the shared indexed store in
+``scryfall_bulk_cache``, so an unchanged bulk file is neither downloaded nor
+parsed again. Dry-run is the default. Apply changes only image_url, preserves exact printing
 identity or skips ambiguous legacy aliases, and requires the pinned PostgreSQL
 wrapper plus both ManaLoom live/PostgreSQL approval tokens.
 """
@@ -9,13 +11,13 @@ wrapper plus both ManaLoom live/PostgreSQL approval tokens.
 from __future__ import annotations
 
 import argparse
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 import json
 import os
 import ssl
+import sys
 import tempfile
-import uuid
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -24,6 +26,9 @@ from urllib.request import Request, urlopen
 import psycopg2
 import psycopg2.extras
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import scryfall_bulk_cache as bulk_cache  # noqa: E402
+
 
 BULK_METADATA_URL = "https://api.scryfall.com/bulk-data/default-cards"
 APPROVAL_VALUE = "I_HAVE_EXPLICIT_APPROVAL"
@@ -35,10 +40,10 @@ USER_AGENT = "ManaLoom/1.0 card-image-backfill"
 
 @dataclass(frozen=True)
 class CardImageIndex:
-    by_printing: dict[str, str]
-    by_oracle_set_collector: dict[tuple[str, str, str], frozenset[str]]
-    by_oracle_set: dict[tuple[str, str], frozenset[str]]
-    by_oracle: dict[str, frozenset[str]]
+    by_printing: Mapping[str, str]
+    by_oracle_set_collector: Mapping[tuple[str, str, str], frozenset[str]]
+    by_oracle_set: Mapping[tuple[str, str], frozenset[str]]
+    by_oracle: Mapping[str, frozenset[str]]
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -49,6 +54,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     mode.add_argument("--dry-run", action="store_true")
     mode.add_argument("--apply", action="store_true")
     parser.add_argument("--bulk-json", type=Path)
+    parser.add_argument(
+        "--bulk-cache-dir",
+        type=Path,
+        help=f"Indexed bulk store directory (default ${bulk_cache.CACHE_DIR_ENV} "
+        "or ~/.cache/manaloom/scryfall).",
+    )
     parser.add_argument("--limit", type=int)
     parser.add_argument("--batch-size", type=int, default=1000)
     args = parser.parse_args(argv)
@@ -76,48 +87,10 @@ def require_apply_approval(environment: dict[str, str]) -> None:
         )
 
 
-def normalized_uuid(value: Any) -> str | None:
-    candidate = str(value or "").strip().lower()
-    try:
-        parsed = uuid.UUID(candidate)
-    except (ValueError, AttributeError):
-        return None
-    normalized = str(parsed)
-    return normalized if normalized == candidate else None
-
-
-def direct_normal_image(card: dict[str, Any]) -> str | None:
-    printing_id = normalized_uuid(card.get("id"))
-    oracle_id = normalized_uuid(card.get("oracle_id"))
-    if printing_id is None or oracle_id is None:
-        return None
-
-    candidates: list[Any] = []
-    image_uris = card.get("image_uris")
-    if isinstance(image_uris, dict):
-        candidates.append(image_uris.get("normal"))
-    faces = card.get("card_faces")
-    if isinstance(faces, list):
-        for face in faces:
-            if isinstance(face, dict) and isinstance(face.get("image_uris"), dict):
-                candidates.append(face["image_uris"].get("normal"))
-
-    for raw in candidates:
-        value = str(raw or "").strip()
-        parsed = urlparse(value)
-        if (
-            parsed.scheme == "https"
-            and parsed.hostname == "cards.scryfall.io"
-            and parsed.path.startswith("/normal/")
-            and parsed.path.lower().endswith(f"/{printing_id}.jpg")
-        ):
-            return value
-    return None
-
-
-def _normalized_text(value: Any) -> str | None:
-    normalized = str(value or "").strip().lower()
-    return normalized or None
+normalized_uuid = bulk_cache.normalized_uuid
+direct_normal_image = bulk_cache.direct_normal_image
+_normalized_text = bulk_cache.normalized_text
+iter_bulk_cards = bulk_cache.iter_bulk_cards
 
 
 def _freeze_candidates(
@@ -126,64 +99,6 @@ def _freeze_candidates(
     return {key: frozenset(values) for key, values in candidates.items()}
 
 
-def iter_bulk_cards(path: Path) -> Iterator[dict[str, Any]]:
-    decoder = json.JSONDecoder()
-    with path.open(encoding="utf-8") as source:
-        buffer = ""
-        offset = 0
-        started = False
-        reached_eof = False
-
-        while True:
-            if not reached_eof:
-                chunk = source.read(1024 * 1024)
-                reached_eof = not chunk
-                buffer += chunk
-
-            while True:
-                while offset < len(buffer) and buffer[offset].isspace():
-                    offset += 1
-                if not started:
-                    if offset >= len(buffer):
-                        break
-                    if buffer[offset] != "[":
-                        raise RuntimeError(
-                            "Scryfall default bulk JSON must be a top-level list."
-                        )
-                    started = True
-                    offset += 1
-                    continue
-
-                while offset < len(buffer) and (
-                    buffer[offset].isspace() or buffer[offset] == ","
-                ):
-                    offset += 1
-                if offset >= len(buffer):
-                    break
-                if buffer[offset] == "]":
-                    return
-
-                try:
-                    value, next_offset = decoder.raw_decode(buffer, offset)
-                except json.JSONDecodeError:
-                    if reached_eof:
-                        raise RuntimeError(
-                            "Scryfall default bulk JSON ended mid-object."
-                        )
-                    break
-                offset = next_offset
-                if isinstance(value, dict):
-                    yield value
-
-            if offset:
-                buffer = buffer[offset:]
-                offset = 0
-            if reached_eof:
-                raise RuntimeError(
-                    "Scryfall default bulk JSON has no closing array."
-                )
-
-
 def load_card_image_index(path: Path) -> CardImageIndex:
     by_printing: dict[str, str] = {}
     by_oracle_set_collector: dict[tuple[str, str, str], set[str]] = {}
@@ -220,6 +135,76 @@ def load_card_image_index(path: Path) -> CardImageIndex:
     )
 
 
+class _StoreImageLookup(Mapping):
+    """Indexed ``CardImageIndex`` mapping over the shared bulk store."""
+
+    def __init__(
+        self,
+        store: bulk_cache.BulkCardStore,
+        columns: tuple[str, ...],
+        *,
+        single: bool,
+    ) -> None:
+        self._store = store
+        self._columns = columns
+        self._single = single
+        self._where = " AND ".join(f"{column} = ?" for column in columns)
+
+    def _key(self, key: Any) -> tuple[Any, ...]:
+        return key if isinstance(key, tuple) else (key,)
+
+    def __getitem__(self, key: Any) -> Any:
+        parameters = self._key(key)
+        if len(parameters) != len(self._columns):
+            raise KeyError(key)
+        if self._single:
+            rows = self._store.query(
+                f"SELECT normal_image FROM cards WHERE {self._where} "
+                "AND normal_image IS NOT NULL ORDER BY card_rowid DESC LIMIT 1",
+                parameters,
+            )
+            if not rows:
+                raise KeyError(key)
+            return rows[0][0]
+        rows = self._store.query(
+            f"SELECT DISTINCT normal_image FROM cards WHERE {self._where} "
+            "AND normal_image IS NOT NULL",
+            parameters,
+        )
+        if not rows:
+            raise KeyError(key)
+        return frozenset(row[0] for row in rows)
+
+    def _keys(self) -> list[Any]:
+        columns = ", ".join(self._columns)
+        rows = self._store.query(
+            f"SELECT DISTINCT {columns} FROM cards WHERE normal_image IS NOT NULL "
+            + "".join(f"AND {column} IS NOT NULL " for column in self._columns)
+        )
+        return [row[0] if len(row) == 1 else tuple(row) for row in rows]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+
+def card_image_index_from_store(store: bulk_cache.BulkCardStore) -> CardImageIndex:
+    """Same lookups as ``load_card_image_index`` without loading every card."""
+
+    return CardImageIndex(
+        by_printing=_StoreImageLookup(store, ("printing_id",), single=True),
+        by_oracle_set_collector=_StoreImageLookup(
+            store, ("oracle_id", "set_code", "collector_number"), single=False
+        ),
+        by_oracle_set=_StoreImageLookup(
+            store, ("oracle_id", "set_code"), single=False
+        ),
+        by_oracle=_StoreImageLookup(store, ("oracle_id",), single=False),
+    )
+
+
 def is_backfill_eligible(current_url: Any) -> bool:
     value = str(current_url or "").strip()
     if not value:
@@ -372,14 +357,20 @@ def configure_connection(conn, *, apply: bool) -> None:
         conn.set_session(readonly=True, autocommit=False)
 
 
-def download_default_bulk() -> Path:
-    ssl_context = trusted_ssl_context()
+def fetch_default_bulk_metadata() -> dict[str, Any]:
     metadata_request = Request(
         BULK_METADATA_URL,
         headers={"Accept": "application/json", "User-Agent": USER_AGENT},
     )
-    with urlopen(metadata_request, timeout=60, context=ssl_context) as response:
+    with urlopen(metadata_request, timeout=60, context=trusted_ssl_context()) as response:
         metadata = json.load(response)
+    if not isinstance(metadata, dict):
+        raise RuntimeError("Scryfall default bulk metadata is not an object.")
+    return metadata
+
+
+def download_default_bulk(metadata: dict[str, Any]) -> Path:
+    ssl_context = trusted_ssl_context()
     download_uri = metadata.get("download_uri")
     if not isinstance(download_uri, str) or not download_uri.startswith("https://"):
         raise RuntimeError("Scryfall default bulk metadata has no safe download_uri.")
@@ -438,14 +429,27 @@ def main(argv: list[str] | None = None) -> None:
         require_apply_approval(os.environ)
 
     downloaded_path: Path | None = None
-    bulk_path = args.bulk_json
-    if bulk_path is None:
-        downloaded_path = download_default_bulk()
-        bulk_path = downloaded_path
-
+    store: bulk_cache.BulkCardStore | None = None
     conn = None
     try:
-        image_index = load_card_image_index(bulk_path)
+        if args.bulk_json is not None:
+            store = bulk_cache.open_bulk_store(
+                args.bulk_json, cache_dir_path=args.bulk_cache_dir
+            )
+        else:
+            metadata = fetch_default_bulk_metadata()
+            updated_at = str(metadata.get("updated_at") or "") or None
+            store_path = (
+                bulk_cache.cache_dir(args.bulk_cache_dir) / "default-cards.sqlite3"
+            )
+            if bulk_cache.store_is_current(store_path, updated_at):
+                store = bulk_cache.BulkCardStore(store_path, source="cache")
+            else:
+                downloaded_path = download_default_bulk(metadata)
+                store = bulk_cache.open_bulk_store(
+                    downloaded_path, store_path=store_path, updated_at=updated_at
+                )
+        image_index = card_image_index_from_store(store)
         conn = connect()
         configure_connection(conn, apply=args.apply)
         rows = fetch_card_rows(conn)
@@ -460,6 +464,7 @@ def main(argv: list[str] | None = None) -> None:
             json.dumps(
                 {
                     "mode": "apply" if args.apply else "dry-run",
+                    "bulk_store": store.source,
                     "bulk_printing_images": len(image_index.by_printing),
                     **stats,
                     "candidates": len(updates),
@@ -475,6 +480,8 @@ def main(argv: list[str] | None = None) -> None:
     finally:
         if conn is not None:
             conn.close()
+        if store is not None:
+            store.close()
         if downloaded_path is not None:
             downloaded_path.unlink(missing_ok=True)
 
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Persisted, indexed canonical card lookup shared by the learned-deck audits.
+
+`learned_deck_coherence_audit.load_card_lookup` and the planners built on it
+used to pull the whole card identity view from PostgreSQL and rebuild every
+alias into a Python dict on every run. This store keeps one identity payload
+per card plus its ranked alias candidates in SQLite, together with a content
+hash per card. A refresh only re-fetches cards whose hash changed; audits
+then resolve names through an indexed alias table instead of a rebuilt dict.
+A schema version bump drops the store and rebuilds it from scratch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+SCHEMA_VERSION = "manaloom_card_identity_lookup_v1"
+CACHE_DIR_ENV = "MANALOOM_CARD_IDENTITY_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "manaloom" / "card_identity"
+INSERT_BATCH_ROWS = 2000
+
+# (normalized alias, priority, normalized canonical name, card_id). The lowest
+# tuple wins an alias, matching `add_lookup_alias` ranking.
+AliasCandidate = tuple[str, int, str, str]
+# fetch(card_ids) -> (payload per card_id, alias candidates for those cards).
+# `card_ids=None` means every card.
+ChangedCardFetcher = Callable[
+    [list[str] | None],
+    tuple[dict[str, dict[str, Any]], list[AliasCandidate]],
+]
+
+STORE_DDL = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS identities (
+  card_id TEXT PRIMARY KEY,
+  content_hash TEXT NOT NULL,
+  payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS alias_candidates (
+  alias_key TEXT NOT NULL,
+  priority INTEGER NOT NULL,
+  canonical_key TEXT NOT NULL,
+  card_id TEXT NOT NULL,
+  PRIMARY KEY (alias_key, card_id)
+);
+CREATE INDEX IF NOT EXISTS alias_candidates_card ON alias_candidates (card_id);
+CREATE TABLE IF NOT EXISTS aliases (
+  alias_key TEXT PRIMARY KEY,
+  card_id TEXT NOT NULL
+);
+"""
+
+RESOLVE_ALIASES_SQL = """
+INSERT INTO aliases (alias_key, card_id)
+SELECT alias_key, card_id
+FROM (
+  SELECT
+    alias_key,
+    card_id,
+    ROW_NUMBER() OVER (
+      PARTITION BY alias_key
+      ORDER BY priority, canonical_key, card_id
+    ) AS rank
+  FROM alias_candidates
+  {where}
+)
+WHERE rank = 1
+"""
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def cache_dir(path: Path | None = None) -> Path:
+    if path is not None:
+        return path
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def store_path_for(database_label: str, *, cache_dir_path: Path | None = None) -> Path:
+    """Store location per source database, e.g. ``host/dbname``."""
+
+    digest = hashlib.sha1(database_label.encode("utf-8")).hexdigest()[:12]
+    return cache_dir(cache_dir_path) / f"card_identity_lookup-{digest}.sqlite3"
+
+
+def open_store(store_path: Path) -> tuple[sqlite3.Connection, bool]:
+    """Open ``store_path`` read-write; returns (conn, rebuilt).
+
+    A store written by another schema version is dropped and recreated empty.
+    """
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(store_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    version = None
+    try:
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        version = row[0] if row else None
+    except sqlite3.Error:
+        pass
+    rebuilt = version != SCHEMA_VERSION
+    if rebuilt:
+        with conn:
+            for table in ("meta", "identities", "alias_candidates", "aliases"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.executescript(STORE_DDL)
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                (SCHEMA_VERSION,),
+            )
+    return conn, rebuilt
+
+
+def stored_hashes(conn: sqlite3.Connection) -> dict[str, str]:
+    return dict(conn.execute("SELECT card_id, content_hash FROM identities"))
+
+
+def hashes_watermark(card_hashes: Mapping[str, str]) -> str:
+    digest = hashlib.sha256()
+    for card_id in sorted(card_hashes):
+        digest.update(f"{card_id}:{card_hashes[card_id]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _chunks(values: list[Any], size: int = INSERT_BATCH_ROWS) -> Iterator[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _alias_keys_for_cards(conn: sqlite3.Connection, card_ids: list[str]) -> set[str]:
+    keys: set[str] = set()
+    for chunk in _chunks(card_ids, 500):
+        placeholders = ",".join("?" for _ in chunk)
+        keys.update(
+            row[0]
+            for row in conn.execute(
+                f"SELECT alias_key FROM alias_candidates WHERE card_id IN ({placeholders})",
+                chunk,
+            )
+        )
+    return keys
+
+
+def apply_changes(
+    conn: sqlite3.Connection,
+    *,
+    card_hashes: Mapping[str, str],
+    payloads: dict[str, dict[str, Any]],
+    candidates: Iterable[AliasCandidate],
+    replaced_ids: list[str],
+    full: bool,
+) -> None:
+    """Replace ``replaced_ids`` with the fetched cards in one transaction.
+
+    Only alias keys touched by a replaced or newly fetched card are re-ranked,
+    unless ``full`` rebuilds the whole alias table.
+    """
+
+    candidate_rows = list(dict.fromkeys(candidates))
+    with conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS touched_aliases (alias_key TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM touched_aliases")
+        if full:
+            conn.execute("DELETE FROM identities")
+            conn.execute("DELETE FROM alias_candidates")
+        else:
+            touched = _alias_keys_for_cards(conn, replaced_ids)
+            touched.update(row[0] for row in candidate_rows)
+            conn.executemany(
+                "INSERT OR IGNORE INTO touched_aliases (alias_key) VALUES (?)",
+                [(key,) for key in touched],
+            )
+            for chunk in _chunks(replaced_ids, 500):
+                placeholders = ",".join("?" for _ in chunk)
+                conn.execute(f"DELETE FROM identities WHERE card_id IN ({placeholders})", chunk)
+                conn.execute(
+                    f"DELETE FROM alias_candidates WHERE card_id IN ({placeholders})",
+                    chunk,
+                )
+        conn.executemany(
+            "INSERT OR REPLACE INTO identities (card_id, content_hash, payload) VALUES (?, ?, ?)",
+            [
+                (
+                    card_id,
+                    card_hashes.get(card_id, ""),
+                    json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                )
+                for card_id, payload in payloads.items()
+            ],
+        )
+        conn.executemany(
+            """
+            INSERT INTO alias_candidates (alias_key, priority, canonical_key, card_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (alias_key, card_id) DO UPDATE SET
+              priority = MIN(priority, excluded.priority)
+            """,
+            candidate_rows,
+        )
+        if full:
+            conn.execute("DELETE FROM aliases")
+            conn.execute(RESOLVE_ALIASES_SQL.format(where=""))
+        else:
+            conn.execute(
+                "DELETE FROM aliases WHERE alias_key IN (SELECT alias_key FROM touched_aliases)"
+            )
+            conn.execute(
+                RESOLVE_ALIASES_SQL.format(
+                    where="WHERE alias_key IN (SELECT alias_key FROM touched_aliases)"
+                )
+            )
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("watermark", hashes_watermark(card_hashes)),
+                ("refreshed_at", utc_now()),
+            ],
+        )
+
+
+def refresh_store(
+    conn: sqlite3.Connection,
+    card_hashes: Mapping[str, str],
+    fetch_changed: ChangedCardFetcher,
+) -> dict[str, Any]:
+    """Bring the store up to ``card_hashes``, fetching only changed cards."""
+
+    previous = stored_hashes(conn)
+    full = not previous
+    changed = sorted(
+        card_id for card_id, content_hash in card_hashes.items() if previous.get(card_id) != content_hash
+    )
+    removed = sorted(set(previous) - set(card_hashes))
+    if not changed and not removed:
+        return {"source": "cache", "changed_cards": 0, "removed_cards": 0}
+
+    if full:
+        payloads, candidates = fetch_changed(None)
+    elif changed:
+        payloads, candidates = fetch_changed(changed)
+    else:
+        payloads, candidates = {}, []
+    apply_changes(
+        conn,
+        card_hashes=card_hashes,
+        payloads=payloads,
+        candidates=candidates,
+        replaced_ids=changed + removed,
+        full=full,
+    )
+    return {
+        "source": "built" if full else "refreshed",
+        "changed_cards": len(changed),
+        "removed_cards": len(removed),
+    }
+
+
+class CardIdentityLookup(Mapping[str, Any]):
+    """Read-only ``alias -> identity`` mapping over a refreshed store.
+
+    Aliases resolve through the indexed ``aliases`` table. Each card payload
+    is materialized once by ``identity_factory``, so aliases of one card
+    return the same object, as the in-memory lookup did.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        identity_factory: Callable[[dict[str, Any]], Any],
+    ) -> None:
+        self._conn = conn
+        self._identity_factory = identity_factory
+        self._identities: dict[str, Any] = {}
+        self._aliases: dict[str, Any] = {}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _identity(self, card_id: str) -> Any:
+        identity = self._identities.get(card_id)
+        if identity is None:
+            row = self._conn.execute(
+                "SELECT payload FROM identities WHERE card_id = ?",
+                (card_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            identity = self._identity_factory(json.loads(row[0]))
+            self._identities[card_id] = identity
+        return identity
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._aliases:
+            identity = self._aliases[key]
+        else:
+            row = self._conn.execute(
+                "SELECT card_id FROM aliases WHERE alias_key = ?",
+                (key,),
+            ).fetchone()
+            identity = self._identity(row[0]) if row else None
+            self._aliases[key] = identity
+        if identity is None:
+            raise KeyError(key)
+        return identity
+
+    def __iter__(self) -> Iterator[str]:
+        for (alias_key,) in self._conn.execute("SELECT alias_key FROM aliases ORDER BY alias_key"):
+            yield alias_key
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM aliases").fetchone()[0])
+
+    def summary(self) -> dict[str, Any]:
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        return {
+            "schema_version": meta.get("schema_version"),
+            "watermark": meta.get("watermark"),
+            "refreshed_at": meta.get("refreshed_at"),
+            "card_count": int(
+                self._conn.execute("SELECT COUNT(*) FROM identities").fetchone()[0]
+            ),
+            "alias_count": len(self),
+        }
+
+
+def load_lookup(
+    store_path: Path,
+    card_hashes: Mapping[str, str],
+    fetch_changed: ChangedCardFetcher,
+    identity_factory: Callable[[dict[str, Any]], Any],
+) -> tuple[CardIdentityLookup, dict[str, Any]]:
+    """Refresh ``store_path`` from ``card_hashes`` and open it as a lookup."""
+
+    conn, rebuilt = open_store(store_path)
+    try:
+        info = refresh_store(conn, card_hashes, fetch_changed)
+    except BaseException:
+        conn.close()
+        raise
+    lookup = CardIdentityLookup(conn, identity_factory)
+    info = {
+        **info,
+        "store_path": str(store_path),
+        "schema_rebuilt": rebuilt,
+        **lookup.summary(),
+    }
+    return lookup, info
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--store-path", type=Path, required=True)
+    parser.add_argument("--name", action="append", default=[], help="Normalized alias to resolve.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    conn = sqlite3.connect(f"file:{args.store_path}?mode=ro", uri=True)
+    lookup = CardIdentityLookup(conn, lambda payload: payload)
+    try:
+        output: dict[str, Any] = lookup.summary()
+        if args.name:
+            output["lookups"] = {
+                name: (lookup.get(name) or {}).get("canonical_name") for name in args.name
+            }
+    finally:
+        lookup.close()
+    print(json.dumps(output, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
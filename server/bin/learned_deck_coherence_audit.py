@@ -17,7 +17,7 @@ import sqlite3
 import sys
 import unicodedata
 from collections import Counter, defaultdict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
@@ -25,6 +25,9 @@ from typing import Any, Iterable
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import card_identity_lookup_store as lookup_store  # noqa: E402
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parents[1]
@@ -500,6 +503,19 @@ def connect_pg() -> psycopg2.extensions.connection:
     )
 
 
+def lookup_alias_keys(name: str | None) -> list[str]:
+    if not name:
+        return []
+    candidates = [name]
+    if "//" in name:
+        candidates.append(name.split("//", 1)[0].strip())
+    return [
+        normalized
+        for normalized in dict.fromkeys(normalize_name(candidate) for candidate in candidates)
+        if normalized
+    ]
+
+
 def add_lookup_alias(
     lookup: dict[str, CardIdentity],
     lookup_rank: dict[str, tuple[int, str, str]],
@@ -508,15 +524,7 @@ def add_lookup_alias(
     *,
     priority: int = 0,
 ) -> None:
-    if not name:
-        return
-    candidates = [name]
-    if "//" in name:
-        candidates.append(name.split("//", 1)[0].strip())
-    for candidate in candidates:
-        normalized = normalize_name(candidate)
-        if not normalized:
-            continue
+    for normalized in lookup_alias_keys(name):
         rank = (
             priority,
             normalize_name(identity.canonical_name),
@@ -527,17 +535,49 @@ def add_lookup_alias(
             lookup_rank[normalized] = rank
 
 
-def load_card_lookup(conn: psycopg2.extensions.connection) -> dict[str, CardIdentity]:
-    # Keep the one-row-per-card intelligence payload separate from the alias
-    # bridge. `card_identity_bridge` currently has several aliases per card;
-    # joining the full Oracle/legality/tag payload to every alias transfers and
-    # materializes that same large payload hundreds of thousands of times.
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(
-            """
-            SELECT
-                cis.card_id,
-                cis.card_name AS canonical_name,
+CARD_SNAPSHOT_SQL = """
+    SELECT
+        cis.card_id,
+        cis.card_name AS canonical_name,
+        cis.oracle_id,
+        cis.oracle_text,
+        cis.type_line,
+        cis.cmc,
+        cis.color_identity,
+        cis.legalities,
+        cis.function_tags,
+        cis.battle_rule_count,
+        cis.verified_battle_rule_count,
+        cis.source_coverage
+    FROM card_intelligence_snapshot cis
+    {where}
+    ORDER BY cis.card_id
+"""
+
+CARD_ALIAS_SQL = """
+    SELECT
+        cib.card_id,
+        cib.canonical_name,
+        cib.lookup_name,
+        cib.printed_name,
+        COALESCE(cib.match_priority, 999) AS match_priority
+    FROM card_identity_bridge cib
+    {where}
+    ORDER BY
+        cib.normalized_lookup_name,
+        COALESCE(cib.match_priority, 999),
+        cib.normalized_canonical_name,
+        cib.card_id
+"""
+
+# Neither view carries an updated_at, so each card's content hash over the
+# lookup columns is the change watermark for the persisted lookup store.
+CARD_LOOKUP_HASH_SQL = """
+    WITH snapshot AS (
+        SELECT
+            cis.card_id::text AS card_id,
+            md5(ROW(
+                cis.card_name,
                 cis.oracle_id,
                 cis.oracle_text,
                 cis.type_line,
@@ -548,12 +588,80 @@ def load_card_lookup(conn: psycopg2.extensions.connection) -> dict[str, CardIden
                 cis.battle_rule_count,
                 cis.verified_battle_rule_count,
                 cis.source_coverage
-            FROM card_intelligence_snapshot cis
-            ORDER BY cis.card_id
-            """
-        )
-        snapshot_rows = cur.fetchall()
+            )::text) AS snapshot_hash
+        FROM card_intelligence_snapshot cis
+    ),
+    aliases AS (
+        SELECT
+            cib.card_id::text AS card_id,
+            md5(string_agg(
+                ROW(
+                    cib.canonical_name,
+                    cib.lookup_name,
+                    cib.printed_name,
+                    COALESCE(cib.match_priority, 999)
+                )::text,
+                '|'
+                ORDER BY
+                    cib.normalized_lookup_name,
+                    COALESCE(cib.match_priority, 999),
+                    cib.lookup_name,
+                    cib.printed_name
+            )) AS alias_hash
+        FROM card_identity_bridge cib
+        GROUP BY cib.card_id
+    )
+    SELECT
+        COALESCE(s.card_id, a.card_id) AS card_id,
+        md5(COALESCE(s.snapshot_hash, '') || ':' || COALESCE(a.alias_hash, ''))
+            AS content_hash
+    FROM snapshot s
+    FULL JOIN aliases a ON a.card_id = s.card_id
+"""
+
+CARD_LOOKUP_FETCH_CHUNK = 5000
+
+
+def fetch_card_lookup_rows(
+    conn: psycopg2.extensions.connection,
+    card_ids: list[str] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Snapshot rows and alias rows, for every card or only ``card_ids``."""
+
+    # Keep the one-row-per-card intelligence payload separate from the alias
+    # bridge. `card_identity_bridge` currently has several aliases per card;
+    # joining the full Oracle/legality/tag payload to every alias transfers and
+    # materializes that same large payload hundreds of thousands of times.
+    if card_ids is None:
+        batches: list[list[str] | None] = [None]
+    else:
+        batches = [
+            card_ids[start : start + CARD_LOOKUP_FETCH_CHUNK]
+            for start in range(0, len(card_ids), CARD_LOOKUP_FETCH_CHUNK)
+        ]
+    snapshot_rows: list[dict[str, Any]] = []
+    alias_rows: list[dict[str, Any]] = []
+    for sql, column, rows in (
+        (CARD_SNAPSHOT_SQL, "cis.card_id", snapshot_rows),
+        (CARD_ALIAS_SQL, "cib.card_id", alias_rows),
+    ):
+        for batch in batches:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if batch is None:
+                    cur.execute(sql.format(where=""))
+                else:
+                    cur.execute(
+                        sql.format(where=f"WHERE {column} = ANY(%s::uuid[])"),
+                        (batch,),
+                    )
+                rows.extend(cur.fetchall())
+    return snapshot_rows, alias_rows
+
 
+def card_identities_by_id(
+    snapshot_rows: list[dict[str, Any]],
+    alias_rows: list[dict[str, Any]],
+) -> dict[str, CardIdentity]:
     identities_by_card_id: dict[str, CardIdentity] = {}
     for row in snapshot_rows:
         card_id = str(row["card_id"])
@@ -571,69 +679,99 @@ def load_card_lookup(conn: psycopg2.extensions.connection) -> dict[str, CardIden
             verified_battle_rule_count=int(row["verified_battle_rule_count"] or 0),
             source_coverage=json_value(row["source_coverage"], {}),
         )
-
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        cur.execute(
-            """
-            SELECT
-                cib.card_id,
-                cib.canonical_name,
-                cib.lookup_name,
-                cib.printed_name,
-                COALESCE(cib.match_priority, 999) AS match_priority
-            FROM card_identity_bridge cib
-            ORDER BY
-                cib.normalized_lookup_name,
-                COALESCE(cib.match_priority, 999),
-                cib.normalized_canonical_name,
-                cib.card_id
-            """
+    for row in alias_rows:
+        card_id = str(row["card_id"])
+        if card_id in identities_by_card_id:
+            continue
+        # Preserve the old LEFT JOIN behavior for aliases whose card has no
+        # current intelligence snapshot. Resolution remains possible and
+        # the downstream audit will surface the missing metadata.
+        identities_by_card_id[card_id] = CardIdentity(
+            card_id=card_id,
+            canonical_name=str(row["canonical_name"] or row["lookup_name"] or ""),
+            type_line="",
+            cmc=None,
+            oracle_id=None,
+            oracle_text="",
+            color_identity=[],
+            legalities={},
+            function_tags=[],
+            battle_rule_count=0,
+            verified_battle_rule_count=0,
+            source_coverage={},
         )
-        alias_rows = cur.fetchall()
+    return identities_by_card_id
+
 
+def card_alias_names(row: dict[str, Any]) -> list[tuple[str | None, int]]:
+    match_priority = int(row["match_priority"] or 999)
+    return [
+        (row["canonical_name"], 0),
+        (row["lookup_name"], match_priority),
+        (row["printed_name"], match_priority),
+    ]
+
+
+def load_card_lookup(conn: psycopg2.extensions.connection) -> dict[str, CardIdentity]:
+    snapshot_rows, alias_rows = fetch_card_lookup_rows(conn)
+    identities_by_card_id = card_identities_by_id(snapshot_rows, alias_rows)
     lookup: dict[str, CardIdentity] = {}
     lookup_rank: dict[str, tuple[int, str, str]] = {}
     for row in alias_rows:
-        card_id = str(row["card_id"])
-        identity = identities_by_card_id.get(card_id)
-        if identity is None:
-            # Preserve the old LEFT JOIN behavior for aliases whose card has no
-            # current intelligence snapshot. Resolution remains possible and
-            # the downstream audit will surface the missing metadata.
-            identity = CardIdentity(
-                card_id=card_id,
-                canonical_name=str(row["canonical_name"] or row["lookup_name"] or ""),
-                type_line="",
-                cmc=None,
-                oracle_id=None,
-                oracle_text="",
-                color_identity=[],
-                legalities={},
-                function_tags=[],
-                battle_rule_count=0,
-                verified_battle_rule_count=0,
-                source_coverage={},
-            )
-            identities_by_card_id[card_id] = identity
-        match_priority = int(row["match_priority"] or 999)
-        add_lookup_alias(lookup, lookup_rank, row["canonical_name"], identity)
-        add_lookup_alias(
-            lookup,
-            lookup_rank,
-            row["lookup_name"],
-            identity,
-            priority=match_priority,
-        )
-        add_lookup_alias(
-            lookup,
-            lookup_rank,
-            row["printed_name"],
-            identity,
-            priority=match_priority,
-        )
+        identity = identities_by_card_id[str(row["card_id"])]
+        for name, priority in card_alias_names(row):
+            add_lookup_alias(lookup, lookup_rank, name, identity, priority=priority)
     return lookup
 
 
+def card_lookup_store_rows(
+    conn: psycopg2.extensions.connection,
+    card_ids: list[str] | None,
+) -> tuple[dict[str, dict[str, Any]], list[lookup_store.AliasCandidate]]:
+    snapshot_rows, alias_rows = fetch_card_lookup_rows(conn, card_ids)
+    identities_by_card_id = card_identities_by_id(snapshot_rows, alias_rows)
+    candidates: list[lookup_store.AliasCandidate] = []
+    for row in alias_rows:
+        identity = identities_by_card_id[str(row["card_id"])]
+        canonical_key = normalize_name(identity.canonical_name)
+        for name, priority in card_alias_names(row):
+            candidates.extend(
+                (alias_key, priority, canonical_key, identity.card_id)
+                for alias_key in lookup_alias_keys(name)
+            )
+    payloads = {
+        card_id: asdict(identity) for card_id, identity in identities_by_card_id.items()
+    }
+    return payloads, candidates
+
+
+def card_lookup_store_path() -> Path:
+    database_label = f"{os.environ.get('DB_HOST', '')}/{os.environ.get('DB_NAME', '')}"
+    return lookup_store.store_path_for(database_label)
+
+
+def load_cached_card_lookup(
+    conn: psycopg2.extensions.connection,
+    *,
+    store_path: Path | None = None,
+) -> tuple[lookup_store.CardIdentityLookup, dict[str, Any]]:
+    """``load_card_lookup`` backed by the persisted, incrementally refreshed store.
+
+    Only cards whose content hash changed since the last refresh are fetched
+    from PostgreSQL; names resolve through the store's alias index.
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(CARD_LOOKUP_HASH_SQL)
+        card_hashes = {str(card_id): str(content_hash) for card_id, content_hash in cur.fetchall()}
+    return lookup_store.load_lookup(
+        store_path or card_lookup_store_path(),
+        card_hashes,
+        lambda card_ids: card_lookup_store_rows(conn, card_ids),
+        lambda payload: CardIdentity(**payload),
+    )
+
+
 def resolve_card(card: CardLine, lookup: dict[str, CardIdentity]) -> ResolvedCard:
     identity = lookup.get(normalize_name(card.name))
     if identity is None and "//" in card.name:
@@ -2205,8 +2343,17 @@ def write_outputs(payload: dict[str, Any], output_dir: Path) -> tuple[Path, Path
 def build_payload(args: argparse.Namespace) -> dict[str, Any]:
     conn = connect_pg()
     conn.set_session(readonly=True, autocommit=True)
+    lookup_store_handle = None
     try:
-        lookup = load_card_lookup(conn)
+        if args.no_card_lookup_cache:
+            lookup = load_card_lookup(conn)
+            card_lookup_info: dict[str, Any] = {"source": "postgres"}
+        else:
+            lookup, card_lookup_info = load_cached_card_lookup(
+                conn,
+                store_path=args.card_lookup_store,
+            )
+            lookup_store_handle = lookup
         audits = load_active_learned_decks(conn, lookup)
         payload = {
             "generated_at": utc_now().isoformat(),
@@ -2217,6 +2364,7 @@ def build_payload(args: argparse.Namespace) -> dict[str, Any]:
                     "host_present": bool(os.environ.get("DB_HOST")),
                 },
                 "knowledge_db": str(args.knowledge_db),
+                "card_lookup": card_lookup_info,
             },
             "postgres_oracle_inventory": pg_oracle_inventory(conn),
             "aggregate": summarize(audits),
@@ -2234,6 +2382,8 @@ def build_payload(args: argparse.Namespace) -> dict[str, Any]:
         }
         return payload
     finally:
+        if lookup_store_handle is not None:
+            lookup_store_handle.close()
         conn.close()
 
 
@@ -2257,6 +2407,20 @@ def main(argv: list[str] | None = None) -> int:
         default=DEFAULT_OUTPUT_DIR,
         help="Directory for JSON and Markdown audit artifacts.",
     )
+    parser.add_argument(
+        "--card-lookup-store",
+        type=Path,
+        default=None,
+        help=(
+            "Persisted card identity lookup store. Defaults to one per "
+            f"database under ${lookup_store.CACHE_DIR_ENV}."
+        ),
+    )
+    parser.add_argument(
+        "--no-card-lookup-cache",
+        action="store_true",
+        help="Rebuild the card lookup from PostgreSQL without the persisted store.",
+    )
     parser.add_argument(
         "--stdout",
         action="store_true",
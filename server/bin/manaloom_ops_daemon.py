@@ -1,4 +1,7 @@
 #!/usr/bin/env python3
+import fcntl
+import heapq
+import itertools
 import os
 import json
 import re
@@ -48,6 +51,47 @@ RUN_PREFLIGHT_ON_BOOT = os.environ.get("MANALOOM_RUN_PREFLIGHT_ON_BOOT", "0") ==
 BOOT_PULL_PENDING_EVENTS = os.environ.get("MANALOOM_BOOT_PULL_PENDING_EVENTS", "1") == "1"
 NATIVE_BATTLE_HTTP_ENABLED = os.environ.get("MANALOOM_NATIVE_BATTLE_HTTP_ENABLED", "1") == "1"
 NATIVE_BATTLE_SYNC_ON_BOOT = os.environ.get("MANALOOM_NATIVE_BATTLE_SYNC_ON_BOOT", "1") == "1"
+# Jobs may print one ``MANALOOM_JOB_METRICS {json}`` line (throughput, backlog
+# depth, ...); the latest one is kept as ``last_metrics`` in jobs.json.
+JOB_METRICS_MARKER = "MANALOOM_JOB_METRICS"
+# Python jobs flagged ``warm_python`` run through a forkserver that has the
+# shared heavy modules imported already (see manaloom_warm_python.py).
+WARM_PYTHON_ENABLED = os.environ.get("MANALOOM_WARM_PYTHON", "1") == "1"
+WARM_PYTHON_SCRIPT = REPO_ROOT / "server/bin/manaloom_warm_python.py"
+WARM_PYTHON_CLIENT = REPO_ROOT / "server/bin/manaloom_warm_python.sh"
+WARM_PYTHON_SOCKET = Path(
+    os.environ.get("MANALOOM_WARM_PYTHON_SOCKET", str(DATA_ROOT / "run" / "warm_python.sock"))
+)
+WARM_RUNTIME_MARKER = "MANALOOM_WARM_RUNTIME"
+
+
+@dataclass(frozen=True)
+class ResourceClass:
+    name: str
+    slots: int
+    priority: int
+
+
+# Concurrency budget per kind of work. CPU-heavy battle simulations never
+# take every core, IO-bound syncs overlap with them, and light reports have
+# their own slots so they are not starved by either.
+RESOURCE_CLASSES = {
+    "battle": ResourceClass(
+        "battle",
+        slots=max(1, int(os.environ.get("MANALOOM_OPS_BATTLE_SLOTS", "1"))),
+        priority=30,
+    ),
+    "sync": ResourceClass(
+        "sync",
+        slots=max(1, int(os.environ.get("MANALOOM_OPS_SYNC_SLOTS", "2"))),
+        priority=10,
+    ),
+    "report": ResourceClass(
+        "report",
+        slots=max(1, int(os.environ.get("MANALOOM_OPS_REPORT_SLOTS", "2"))),
+        priority=20,
+    ),
+}
 
 
 @dataclass(frozen=True)
@@ -57,7 +101,24 @@ class Job:
     lockfile: Path
     command: str
     script_name: str
+    # Manifest-only: marks the long battle audits for the cron dashboard.
+    # Scheduling no longer reads it; resource_class replaced the old
+    # detached background runner.
     background: bool = False
+    resource_class: str = "report"
+    # Lower runs first; None uses the resource class priority.
+    priority: int | None = None
+    # Jobs that must not be queued or running when this one starts.
+    after: tuple[str, ...] = ()
+    # The job's wrapper ends in `exec "$PYTHON_BIN" <script>.py ...`, so it
+    # can run in the warm forkserver.
+    warm_python: bool = False
+
+    @property
+    def effective_priority(self) -> int:
+        if self.priority is not None:
+            return self.priority
+        return RESOURCE_CLASSES[self.resource_class].priority
 
 
 STATE_WRITE_LOCK = threading.Lock()
@@ -307,6 +368,7 @@ JOBS = [
             '"${RATE_LIMIT_EVENT_RETENTION_HOURS:-24}"'
         ),
         script_name="cron_cleanup_optimize_telemetry.sh",
+        resource_class="sync",
     ),
     Job(
         name="pull_learning_events",
@@ -314,6 +376,9 @@ JOBS = [
         lockfile=LOCK_DIR / "pull_learning_events.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/pull_learning_events.sh',
         script_name="pull_learning_events.sh",
+        resource_class="sync",
+        priority=0,
+        warm_python=True,
     ),
     Job(
         name="auto_sync_learned_decks",
@@ -321,6 +386,8 @@ JOBS = [
         lockfile=LOCK_DIR / "auto_sync_learned_decks.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/auto_sync_learned_decks.sh',
         script_name="auto_sync_learned_decks.sh",
+        resource_class="sync",
+        warm_python=True,
     ),
     Job(
         name="manaloom_sync_card_legalities_from_scryfall",
@@ -331,6 +398,8 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_sync_card_legalities_from_scryfall.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/sync_card_legalities_from_scryfall.sh',
         script_name="sync_card_legalities_from_scryfall.sh",
+        resource_class="sync",
+        warm_python=True,
     ),
     Job(
         name="manaloom_new_card_candidate_review",
@@ -341,6 +410,9 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_new_card_candidate_review.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_new_card_candidate_review.sh',
         script_name="manaloom_new_card_candidate_review.sh",
+        resource_class="report",
+        after=("manaloom_sync_card_legalities_from_scryfall",),
+        warm_python=True,
     ),
     Job(
         name="manaloom_card_data_gap_review",
@@ -348,6 +420,8 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_card_data_gap_review.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_card_data_gap_review.sh',
         script_name="manaloom_card_data_gap_review.sh",
+        resource_class="report",
+        warm_python=True,
     ),
     Job(
         name="manaloom_battle_rule_review_queue",
@@ -355,6 +429,8 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_battle_rule_review_queue.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_battle_rule_review_queue.sh',
         script_name="manaloom_battle_rule_review_queue.sh",
+        resource_class="report",
+        warm_python=True,
     ),
     Job(
         name="manaloom_battle_rule_focused_evidence",
@@ -362,6 +438,9 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_battle_rule_focused_evidence.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_battle_rule_focused_evidence.sh',
         script_name="manaloom_battle_rule_focused_evidence.sh",
+        resource_class="battle",
+        after=("manaloom_battle_rule_review_queue",),
+        warm_python=True,
     ),
     Job(
         name="manaloom_battle_rule_promotion_gate",
@@ -369,6 +448,9 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_battle_rule_promotion_gate.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_battle_rule_promotion_gate.sh',
         script_name="manaloom_battle_rule_promotion_gate.sh",
+        resource_class="report",
+        after=("manaloom_battle_rule_focused_evidence",),
+        warm_python=True,
     ),
     Job(
         name="auto_promote_learned_decks",
@@ -376,6 +458,8 @@ JOBS = [
         lockfile=LOCK_DIR / "auto_promote_learned_decks.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/auto_promote_learned_decks.sh',
         script_name="auto_promote_learned_decks.sh",
+        resource_class="sync",
+        warm_python=True,
     ),
     Job(
         name="manaloom_battle_strategy_audit",
@@ -392,6 +476,7 @@ JOBS = [
         ),
         script_name="manaloom_battle_strategy_audit.sh",
         background=True,
+        resource_class="battle",
     ),
     Job(
         name="manaloom_battle_strategy_nightly",
@@ -405,6 +490,7 @@ JOBS = [
         ),
         script_name="manaloom_battle_strategy_audit.sh",
         background=True,
+        resource_class="battle",
     ),
     Job(
         name="master_optimizer_preflight",
@@ -412,6 +498,7 @@ JOBS = [
         lockfile=LOCK_DIR / "master_optimizer_preflight.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/master_optimizer_preflight.sh',
         script_name="master_optimizer_preflight.sh",
+        resource_class="battle",
     ),
     Job(
         name="manaloom_knowledge_import",
@@ -419,6 +506,7 @@ JOBS = [
         lockfile=LOCK_DIR / "manaloom_knowledge_import.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/manaloom_knowledge_import.sh',
         script_name="manaloom_knowledge_import.sh",
+        resource_class="sync",
     ),
     Job(
         name="hermes_mana_base_validator",
@@ -426,6 +514,8 @@ JOBS = [
         lockfile=LOCK_DIR / "hermes_mana_base_validator.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/hermes_mana_base_validator.sh',
         script_name="hermes_mana_base_validator.sh",
+        resource_class="battle",
+        warm_python=True,
     ),
     Job(
         name="hermes_cron_governor_report",
@@ -433,6 +523,8 @@ JOBS = [
         lockfile=LOCK_DIR / "hermes_cron_governor_report.lock",
         command='cd "$MTGIA_HOME" && ./server/bin/hermes_cron_governor_report.sh',
         script_name="hermes_cron_governor_report.sh",
+        resource_class="report",
+        warm_python=True,
     ),
 ]
 
@@ -489,12 +581,18 @@ def _write_jobs_manifest(
                 "schedule": job.schedule,
                 "schedule_display": job.schedule,
                 "background": job.background,
+                "resource_class": job.resource_class,
+                "priority": job.effective_priority,
                 "last_status": job_state.get("last_status"),
                 "last_started_at": job_state.get("last_started_at"),
                 "last_finished_at": job_state.get("last_finished_at"),
                 "last_exit_code": job_state.get("last_exit_code"),
                 "last_error": job_state.get("last_error"),
                 "latest_output": job_state.get("latest_output"),
+                "last_metrics": job_state.get("last_metrics"),
+                "last_queue_wait_seconds": job_state.get("last_queue_wait_seconds"),
+                "last_run_seconds": job_state.get("last_run_seconds"),
+                "last_warm_runtime": job_state.get("last_warm_runtime"),
             }
         )
     JOBS_JSON.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
@@ -520,6 +618,10 @@ def _load_existing_state(jobs: list[Job]) -> dict[str, dict[str, object]]:
         "last_exit_code",
         "last_error",
         "latest_output",
+        "last_metrics",
+        "last_queue_wait_seconds",
+        "last_run_seconds",
+        "last_warm_runtime",
     )
     state: dict[str, dict[str, object]] = {}
     for row in payload:
@@ -625,6 +727,9 @@ def _recover_state_from_output_dir(job: Job) -> dict[str, object]:
     if status is not None:
         recovered["last_status"] = status
         recovered["last_exit_code"] = 0 if status == "ok" else 1
+    metrics = _read_job_metrics(latest)
+    if metrics is not None:
+        recovered["last_metrics"] = metrics
     return recovered
 
 
@@ -644,9 +749,96 @@ def _tail_excerpt(path: Path, max_lines: int = 6) -> str:
     return " | ".join(line.strip() for line in lines[-max_lines:] if line.strip())[:600]
 
 
-def _run_job(job: Job, env: dict[str, str], state: dict[str, dict[str, object]]) -> None:
+def _read_job_metrics(
+    path: Path,
+    marker: str = JOB_METRICS_MARKER,
+) -> dict[str, object] | None:
+    """Last ``<marker> {json}`` line a job printed, if any."""
+    if not path.exists():
+        return None
+    metrics = None
+    for line in path.read_text(errors="replace").splitlines():
+        if not line.startswith(marker):
+            continue
+        try:
+            payload = json.loads(line[len(marker):].strip())
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            metrics = payload
+    return metrics
+
+
+def _job_env(job: Job, env: dict[str, str]) -> dict[str, str]:
+    if not job.warm_python or not env.get("MANALOOM_WARM_RUNTIME_SOCKET"):
+        return env
+    return {
+        **env,
+        "PYTHON_BIN": str(WARM_PYTHON_CLIENT),
+        "MANALOOM_WARM_RUNTIME_PYTHON": env.get("PYTHON_BIN", PYTHON_BIN),
+    }
+
+
+def _start_warm_python_runtime(
+    env: dict[str, str],
+    *,
+    socket_path: Path = WARM_PYTHON_SOCKET,
+    timeout: float = 60.0,
+) -> subprocess.Popen | None:
+    """Start the forkserver and wait for its ready line; None disables it."""
+    if not WARM_PYTHON_ENABLED:
+        return None
+    try:
+        process = subprocess.Popen(
+            [PYTHON_BIN, str(WARM_PYTHON_SCRIPT), "serve", "--socket", str(socket_path)],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+    except OSError as exc:
+        print(f"[manaloom-ops] warm python runtime disabled error={exc}", flush=True)
+        return None
+    ready: dict[str, object] = {}
+
+    def read_ready() -> None:
+        assert process.stdout is not None
+        line = process.stdout.readline()
+        try:
+            ready.update(json.loads(line))
+        except ValueError:
+            pass
+
+    reader = threading.Thread(target=read_ready, daemon=True)
+    reader.start()
+    reader.join(timeout)
+    if not ready.get("ready"):
+        process.kill()
+        print("[manaloom-ops] warm python runtime disabled error=not_ready", flush=True)
+        return None
+    env["MANALOOM_WARM_RUNTIME_SOCKET"] = str(socket_path)
+    print(
+        f"[manaloom-ops] warm python runtime ready pid={ready.get('pid')} "
+        f"preload_seconds={ready.get('preload_seconds')} "
+        f"preloaded={len(ready.get('preloaded') or [])} "
+        f"preload_failed={sorted(ready.get('preload_failed') or {})}",
+        flush=True,
+    )
+    return process
+
+
+def _run_job(
+    job: Job,
+    env: dict[str, str],
+    state: dict[str, dict[str, object]],
+    *,
+    queue_wait_seconds: float | None = None,
+) -> None:
     started_at = datetime.now().isoformat(timespec="seconds")
+    started = time.monotonic()
     log_path = _job_log_path(job)
+    job_env = _job_env(job, env)
+    queue_wait = round(queue_wait_seconds, 3) if queue_wait_seconds is not None else None
     with STATE_WRITE_LOCK:
         state[job.name] = {
             **state.get(job.name, {}),
@@ -656,10 +848,13 @@ def _run_job(job: Job, env: dict[str, str], state: dict[str, dict[str, object]])
             "last_exit_code": None,
             "last_error": None,
             "latest_output": str(log_path),
+            "last_queue_wait_seconds": queue_wait,
+            "last_run_seconds": None,
         }
         _write_jobs_manifest(JOBS, state)
     print(
         f"[manaloom-ops] run name={job.name} schedule={job.schedule} "
+        f"class={job.resource_class} queue_wait={queue_wait} "
         f"at={started_at} log={log_path}",
         flush=True,
     )
@@ -674,12 +869,15 @@ def _run_job(job: Job, env: dict[str, str], state: dict[str, dict[str, object]])
                 job.command,
             ],
             cwd=REPO_ROOT,
-            env=env,
+            env=job_env,
             check=False,
             stdout=handle,
             stderr=subprocess.STDOUT,
         )
     finished_at = datetime.now().isoformat(timespec="seconds")
+    run_seconds = round(time.monotonic() - started, 3)
+    metrics = _read_job_metrics(log_path)
+    warm_runtime = _read_job_metrics(log_path, WARM_RUNTIME_MARKER)
     with STATE_WRITE_LOCK:
         state[job.name] = {
             "last_status": "ok" if result.returncode == 0 else "error",
@@ -688,61 +886,174 @@ def _run_job(job: Job, env: dict[str, str], state: dict[str, dict[str, object]])
             "last_exit_code": result.returncode,
             "last_error": None,
             "latest_output": str(log_path),
+            "last_metrics": metrics,
+            "last_queue_wait_seconds": queue_wait,
+            "last_run_seconds": run_seconds,
+            "last_warm_runtime": warm_runtime,
         }
         _write_jobs_manifest(JOBS, state)
     excerpt = _tail_excerpt(log_path)
     print(
-        f"[manaloom-ops] done name={job.name} exit_code={result.returncode}",
+        f"[manaloom-ops] done name={job.name} exit_code={result.returncode} "
+        f"run_seconds={run_seconds}",
         flush=True,
     )
+    if metrics:
+        print(
+            f"[manaloom-ops] metrics name={job.name} "
+            f"{json.dumps(metrics, sort_keys=True)}",
+            flush=True,
+        )
+    if warm_runtime:
+        print(
+            f"[manaloom-ops] warm_runtime name={job.name} "
+            f"startup_saved_seconds={warm_runtime.get('startup_saved_seconds')}",
+            flush=True,
+        )
     if excerpt:
         print(f"[manaloom-ops] excerpt name={job.name} tail={excerpt}", flush=True)
 
 
-def _start_background_job(
-    job: Job,
-    env: dict[str, str],
-    state: dict[str, dict[str, object]],
-    active_jobs: dict[str, threading.Thread],
-    active_jobs_lock: threading.Lock,
-) -> bool:
-    with active_jobs_lock:
-        current = active_jobs.get(job.name)
-        if current is not None and current.is_alive():
-            print(f"[manaloom-ops] skip active background job name={job.name}", flush=True)
-            return False
-
-        def run() -> None:
+def _lock_is_held(lockfile: Path) -> bool:
+    """Whether another process holds the job's ``flock`` lockfile."""
+    try:
+        lockfile.parent.mkdir(parents=True, exist_ok=True)
+        with lockfile.open("a") as handle:
             try:
-                _run_job(job, env, state)
-            except Exception as exc:
-                finished_at = datetime.now().isoformat(timespec="seconds")
-                with STATE_WRITE_LOCK:
-                    state[job.name] = {
-                        **state.get(job.name, {}),
-                        "last_status": "error",
-                        "last_finished_at": finished_at,
-                        "last_exit_code": 1,
-                        "last_error": str(exc),
-                    }
-                    _write_jobs_manifest(JOBS, state)
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            fcntl.flock(handle, fcntl.LOCK_UN)
+    except OSError:
+        return False
+    return False
+
+
+class JobScheduler:
+    """Priority queue that runs jobs within per-resource-class slot limits.
+
+    A job already queued, running, or holding its lockfile elsewhere is
+    skipped rather than queued twice. Queued jobs start lowest priority first
+    (FIFO within a priority) as soon as their class has a free slot and no
+    job listed in ``Job.after`` is still queued or running.
+    """
+
+    def __init__(
+        self,
+        env: dict[str, str],
+        state: dict[str, dict[str, object]],
+        *,
+        resource_classes: dict[str, ResourceClass] = RESOURCE_CLASSES,
+        run_job: Callable[..., None] = _run_job,
+        lock_is_held: Callable[[Path], bool] = _lock_is_held,
+    ) -> None:
+        self._env = env
+        self._state = state
+        self._resource_classes = resource_classes
+        self._run_job = run_job
+        self._lock_is_held = lock_is_held
+        self._condition = threading.Condition()
+        self._queue: list[tuple[int, int, float, Job]] = []
+        self._sequence = itertools.count()
+        self._queued: set[str] = set()
+        self._running: dict[str, threading.Thread] = {}
+        self._class_running: dict[str, int] = {name: 0 for name in resource_classes}
+
+    def submit(self, job: Job, reason: str = "schedule") -> bool:
+        with self._condition:
+            if job.name in self._queued or job.name in self._running:
                 print(
-                    f"[manaloom-ops] background error name={job.name} error={exc}",
+                    f"[manaloom-ops] skip queued_or_running name={job.name} reason={reason}",
                     flush=True,
                 )
-            finally:
-                with active_jobs_lock:
-                    active_jobs.pop(job.name, None)
-
-        thread = threading.Thread(
-            target=run,
-            name=f"manaloom-ops-{job.name}",
-            daemon=True,
-        )
-        active_jobs[job.name] = thread
-        thread.start()
+                return False
+            if self._lock_is_held(job.lockfile):
+                print(
+                    f"[manaloom-ops] skip locked name={job.name} lockfile={job.lockfile}",
+                    flush=True,
+                )
+                return False
+            heapq.heappush(
+                self._queue,
+                (job.effective_priority, next(self._sequence), time.monotonic(), job),
+            )
+            self._queued.add(job.name)
+            print(
+                f"[manaloom-ops] queued name={job.name} class={job.resource_class} "
+                f"priority={job.effective_priority} reason={reason}",
+                flush=True,
+            )
+            self._dispatch()
         return True
 
+    def _blocked(self, job: Job) -> bool:
+        slots = self._resource_classes[job.resource_class].slots
+        if self._class_running[job.resource_class] >= slots:
+            return True
+        return any(
+            dependency in self._queued or dependency in self._running
+            for dependency in job.after
+        )
+
+    def _dispatch(self) -> None:
+        waiting: list[tuple[int, int, float, Job]] = []
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            job = entry[3]
+            if self._blocked(job):
+                waiting.append(entry)
+                continue
+            self._queued.discard(job.name)
+            self._class_running[job.resource_class] += 1
+            thread = threading.Thread(
+                target=self._run,
+                args=(job, entry[2]),
+                name=f"manaloom-ops-{job.name}",
+                daemon=True,
+            )
+            self._running[job.name] = thread
+            thread.start()
+        for entry in waiting:
+            heapq.heappush(self._queue, entry)
+
+    def _run(self, job: Job, enqueued_at: float) -> None:
+        try:
+            self._run_job(
+                job,
+                self._env,
+                self._state,
+                queue_wait_seconds=time.monotonic() - enqueued_at,
+            )
+        except Exception as exc:
+            finished_at = datetime.now().isoformat(timespec="seconds")
+            with STATE_WRITE_LOCK:
+                self._state[job.name] = {
+                    **self._state.get(job.name, {}),
+                    "last_status": "error",
+                    "last_finished_at": finished_at,
+                    "last_exit_code": 1,
+                    "last_error": str(exc),
+                }
+                _write_jobs_manifest(JOBS, self._state)
+            print(
+                f"[manaloom-ops] job error name={job.name} error={exc}",
+                flush=True,
+            )
+        finally:
+            with self._condition:
+                self._running.pop(job.name, None)
+                self._class_running[job.resource_class] -= 1
+                self._dispatch()
+                self._condition.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until nothing is queued or running."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._running,
+                timeout=timeout,
+            )
+
 
 def main() -> int:
     LOCK_DIR.mkdir(parents=True, exist_ok=True)
@@ -754,10 +1065,10 @@ def main() -> int:
     env = _base_env()
     _sync_native_battle_rules(env)
     native_battle_server = _start_native_battle_http()
+    warm_python_runtime = _start_warm_python_runtime(env)
     state = _load_existing_state(JOBS)
     _write_jobs_manifest(JOBS, state)
-    active_jobs: dict[str, threading.Thread] = {}
-    active_jobs_lock = threading.Lock()
+    scheduler = JobScheduler(env, state)
 
     print("[manaloom-ops] scheduler started", flush=True)
     print(f"[manaloom-ops] repo_root={REPO_ROOT}", flush=True)
@@ -770,9 +1081,20 @@ def main() -> int:
         f"[manaloom-ops] native_battle_http={'enabled' if native_battle_server else 'disabled'}",
         flush=True,
     )
+    print(
+        f"[manaloom-ops] warm_python={'enabled' if warm_python_runtime else 'disabled'}",
+        flush=True,
+    )
+    for resource_class in RESOURCE_CLASSES.values():
+        print(
+            f"[manaloom-ops] resource_class name={resource_class.name} "
+            f"slots={resource_class.slots} priority={resource_class.priority}",
+            flush=True,
+        )
     for job in JOBS:
         print(
-            f"[manaloom-ops] job name={job.name} schedule={job.schedule} script={job.script_name}",
+            f"[manaloom-ops] job name={job.name} schedule={job.schedule} script={job.script_name} "
+            f"class={job.resource_class} priority={job.effective_priority}",
             flush=True,
         )
 
@@ -784,7 +1106,7 @@ def main() -> int:
             f"[manaloom-ops] boot trigger name={job_name} reason={reason}",
             flush=True,
         )
-        _run_job(job, env, state)
+        scheduler.submit(job, reason=f"boot:{reason}")
 
     last_minute: str | None = None
     while True:
@@ -794,16 +1116,7 @@ def main() -> int:
             for job in JOBS:
                 try:
                     if _matches_schedule(job.schedule, now):
-                        if job.background:
-                            _start_background_job(
-                                job,
-                                env,
-                                state,
-                                active_jobs,
-                                active_jobs_lock,
-                            )
-                        else:
-                            _run_job(job, env, state)
+                        scheduler.submit(job)
                 except Exception as exc:  # keep scheduler alive even on bad schedule
                     print(
                         f"[manaloom-ops] error name={job.name} schedule={job.schedule} "
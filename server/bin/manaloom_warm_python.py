@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Warm Python runtime for manaloom_ops_daemon Python cron jobs.
+
+``serve`` starts a single-threaded forkserver that imports the heavy modules
+shared by the ops jobs once (psycopg2, the Hermes battle support modules,
+...) and listens on a Unix socket. ``client`` stands in for ``$PYTHON_BIN`` in
+the job shell wrappers: for ``<script>.py args...`` it hands argv, working
+directory, environment and stdin/stdout/stderr to the forkserver, which
+forks a child that runs the script with ``runpy``. The client relays the
+exit status, so wrappers, log capture and ``flock`` behave as before. Any
+other invocation (``-c``, ``-m``, ...) or an unreachable forkserver falls
+back to exec'ing the real interpreter.
+
+Modules whose import reads the environment see the daemon's base job
+environment, so only env-independent modules belong in the preload list;
+the job script itself is always executed fresh in the forked child.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+SOCKET_ENV = "MANALOOM_WARM_RUNTIME_SOCKET"
+PYTHON_ENV = "MANALOOM_WARM_RUNTIME_PYTHON"
+PRELOAD_ENV = "MANALOOM_WARM_RUNTIME_PRELOAD"
+# Printed by the client on stderr so the daemon can record it per job.
+WARM_RUNTIME_MARKER = "MANALOOM_WARM_RUNTIME"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HERMES_SCRIPTS_DIR = REPO_ROOT / "docs/hermes-analysis/manaloom-knowledge/scripts"
+DEFAULT_PRELOAD = (
+    "argparse",
+    "dataclasses",
+    "json",
+    "sqlite3",
+    "ssl",
+    "urllib.request",
+    "psycopg2",
+    "psycopg2.extras",
+    "battle_mana_cost_support",
+    "battle_card_characteristics_support",
+    "battle_land_support",
+    "battle_zone_transition_support",
+    "battle_replacement_support",
+    "battle_sba_support",
+    "battle_unfinity_sticker_support",
+    # battle_rule_registry and known_cards_fallback_snapshot resolve
+    # MANALOOM_KNOWLEDGE_DB / MANALOOM_CANONICAL_KNOWN_CARDS_JSON at import.
+    "knowledge_db_access",
+)
+_HEADER = struct.Struct("!I")
+
+
+def _send_message(conn: socket.socket, payload: dict, fds: list[int] | None = None) -> None:
+    data = json.dumps(payload).encode("utf-8")
+    message = _HEADER.pack(len(data)) + data
+    if fds:
+        socket.send_fds(conn, [message], fds)
+    else:
+        conn.sendall(message)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = conn.recv(size)
+        if not chunk:
+            raise ConnectionError("warm runtime connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_message(conn: socket.socket, *, max_fds: int = 0) -> tuple[dict, list[int]]:
+    fds: list[int] = []
+    if max_fds:
+        head, fds, _flags, _addr = socket.recv_fds(conn, _HEADER.size, max_fds)
+        if len(head) < _HEADER.size:
+            head += _recv_exact(conn, _HEADER.size - len(head))
+    else:
+        head = _recv_exact(conn, _HEADER.size)
+    (size,) = _HEADER.unpack(head)
+    return json.loads(_recv_exact(conn, size).decode("utf-8")), fds
+
+
+def preload_modules(names: list[str]) -> dict:
+    started = time.perf_counter()
+    loaded: list[str] = []
+    failed: dict[str, str] = {}
+    for name in names:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception as exc:  # a missing optional module just stays cold
+            failed[name] = f"{type(exc).__name__}: {exc}"
+    return {
+        "preload_seconds": round(time.perf_counter() - started, 3),
+        "preloaded": loaded,
+        "preload_failed": failed,
+    }
+
+
+def _run_script(request: dict, fds: list[int], cold_sys_path: list[str]) -> None:
+    """Grandchild: become the job interpreter and never return."""
+    code = 1
+    try:
+        for target, fd in enumerate(fds[:3]):
+            os.dup2(fd, target)
+        for fd in fds:
+            os.close(fd)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        argv = list(request["argv"])
+        script = os.path.abspath(argv[0])
+        sys.argv = [script, *argv[1:]]
+        sys.path[:] = [os.path.dirname(script), *cold_sys_path]
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        import runpy
+
+        try:
+            runpy.run_path(script, run_name="__main__")
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            _finalize_interpreter()
+        finally:
+            os._exit(code)
+
+
+def _finalize_interpreter() -> None:
+    """Run the shutdown steps ``os._exit`` skips: joins, atexit, log flush."""
+    import atexit
+    import threading
+
+    for step in (threading._shutdown, atexit._run_exitfuncs):
+        try:
+            step()
+        except BaseException:
+            traceback.print_exc()
+    logging = sys.modules.get("logging")
+    if logging is not None:
+        logging.shutdown()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _handle_connection(conn: socket.socket, info: dict, cold_sys_path: list[str]) -> None:
+    """Per-connection child: fork the job, then relay its pid and exit status."""
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    request, fds = _recv_message(conn, max_fds=3)
+    started = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        conn.close()
+        _run_script(request, fds, cold_sys_path)
+    for fd in fds:
+        os.close(fd)
+    _send_message(conn, {"pid": pid, "fork_seconds": round(time.perf_counter() - started, 4)})
+    _pid, status = os.waitpid(pid, 0)
+    _send_message(
+        conn,
+        {
+            "exit_code": os.waitstatus_to_exitcode(status),
+            "startup_saved_seconds": info["preload_seconds"],
+        },
+    )
+
+
+def serve(socket_path: Path, preload: list[str]) -> int:
+    cold_sys_path = list(sys.path)
+    sys.path.insert(0, str(HERMES_SCRIPTS_DIR))
+    info = preload_modules(preload)
+    sys.path[:] = cold_sys_path
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen(16)
+    # Per-connection children are never waited on by the server itself.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(json.dumps({"ready": True, "pid": os.getpid(), **info}), flush=True)
+    try:
+        while True:
+            conn, _addr = server.accept()
+            if os.fork() == 0:
+                server.close()
+                try:
+                    _handle_connection(conn, info, cold_sys_path)
+                    code = 0
+                except BaseException:
+                    traceback.print_exc()
+                    code = 1
+                finally:
+                    os._exit(code)
+            conn.close()
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _exec_cold(argv: list[str]) -> None:
+    python = os.environ.get(PYTHON_ENV) or "python3"
+    os.execvp(python, [python, *argv])
+
+
+def client(argv: list[str]) -> int:
+    socket_path = os.environ.get(SOCKET_ENV)
+    if not socket_path or not argv or argv[0].startswith("-") or not argv[0].endswith(".py"):
+        _exec_cold(argv)
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path)
+        _send_message(
+            conn,
+            {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)},
+            fds=[0, 1, 2],
+        )
+        started, _fds = _recv_message(conn)
+    except OSError:
+        conn.close()
+        _exec_cold(argv)
+
+    def forward(signum: int, _frame: object) -> None:
+        try:
+            os.kill(started["pid"], signum)
+        except ProcessLookupError:
+            pass
+
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+        signal.signal(signum, forward)
+    try:
+        result, _fds = _recv_message(conn)
+    except ConnectionError:
+        print(f"{WARM_RUNTIME_MARKER} forkserver lost the job", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+    sys.stderr.write(
+        f"{WARM_RUNTIME_MARKER} "
+        + json.dumps(
+            {
+                "startup_saved_seconds": result.get("startup_saved_seconds"),
+                "fork_seconds": started.get("fork_seconds"),
+            },
+            sort_keys=True,
+        )
+        + "\n"
+    )
+    exit_code = int(result["exit_code"])
+    return 128 - exit_code if exit_code < 0 else exit_code
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["client"]:
+        return client(argv[1:])
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=["serve"])
+    parser.add_argument("--socket", type=Path, required=True)
+    parser.add_argument(
+        "--preload",
+        default=os.environ.get(PRELOAD_ENV) or ",".join(DEFAULT_PRELOAD),
+        help="Comma-separated modules to import before forking jobs.",
+    )
+    args = parser.parse_args(argv)
+    return serve(args.socket, [name for name in args.preload.split(",") if name.strip()])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,8 @@
+#!/bin/sh
+set -eu
+
+# Stand-in for $PYTHON_BIN: runs `<script>.py args...` in the ops daemon's
+# warm forkserver and execs the real interpreter for anything else.
+SCRIPT_DIR=$(CDPATH= cd -- "$(dirname -- "$0")" && pwd)
+
+exec "${MANALOOM_WARM_RUNTIME_PYTHON:-python3}" -S "$SCRIPT_DIR/manaloom_warm_python.py" client "$@"
@@ -3,31 +3,48 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import os
+import queue
 import sqlite3
 import subprocess
 import sys
+import tempfile
 import threading
+import time
 import uuid
+import zlib
 from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+HERMES_SCRIPTS = REPO_ROOT / "docs" / "hermes-analysis" / "manaloom-knowledge" / "scripts"
+if str(HERMES_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(HERMES_SCRIPTS))
+
+from knowledge_db_access import connect_knowledge_db  # noqa: E402
+
 WORKER = Path(__file__).resolve().with_name("native_battle_worker.py")
 KNOWLEDGE_DB = Path(
     os.environ.get("MANALOOM_KNOWLEDGE_DB", "/data/manaloom-ops/knowledge.db")
 )
 MAX_BODY_BYTES = 8 * 1024 * 1024
+GZIP_RESPONSE_MIN_BYTES = 1024
+GZIP_RESPONSE_LEVEL = 5
 DEFAULT_SIMULATION_TIMEOUT_MS = 40_000
 MAXIMUM_SIMULATION_TIMEOUT_MS = 180_000
+MAX_BATCH_SEEDS = 50
 PROCESS_ID = str(uuid.uuid4())
 STARTED_AT = datetime.now(timezone.utc).isoformat()
 SIMULATION_LOCK = threading.Lock()
+COVERAGE_INDEX_LOCK = threading.Lock()
 
 
 class InvalidRequest(ValueError):
@@ -48,76 +65,198 @@ def _lookup_names(value: Any) -> list[str]:
     return aliases
 
 
+@dataclass(frozen=True)
+class RuleCoverageIndex:
+    """Reviewed-rule coverage for every name in one rules-table generation."""
+
+    generation: tuple[Any, ...]
+    version: str
+    built_at: str
+    build_ms: int
+    rule_count: int
+    rules_by_name: dict[str, tuple[tuple[str, str], ...]]
+    oracle_basic_land: dict[str, bool]
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+            "rule_count": self.rule_count,
+            "rule_names": len(self.rules_by_name),
+        }
+
+
+_COVERAGE_INDEXES: dict[Path, RuleCoverageIndex] = {}
+# DB file state each resident index was last confirmed against.
+_COVERAGE_FILE_STATES: dict[Path, tuple[int, ...]] = {}
+COVERED_RULES_WHERE = """
+    WHERE review_status IN ('verified', 'active')
+      AND execution_status IN ('auto', 'executable')
+      AND COALESCE(oracle_hash, '') != ''
+      AND json_valid(effect_json) = 1
+      AND json_type(effect_json) = 'object'
+      AND json(effect_json) != '{}'
+"""
+# What the coverage index reads, concatenated in SQLite: any insert, delete
+# or in-place update of these values changes the fingerprint, while writes to
+# other tables or columns (telemetry, last_seen_at) leave it alone.
+COVERAGE_FINGERPRINT_SQL = {
+    "battle_card_rules": f"""
+        SELECT COUNT(*), group_concat(
+          normalized_name || char(9) || logical_rule_key || char(9) || oracle_hash,
+          char(10)
+        )
+        FROM battle_card_rules
+        {COVERED_RULES_WHERE}
+    """,
+    "card_oracle_cache": """
+        SELECT COUNT(*), group_concat(
+          normalized_name || char(9) || COALESCE(type_line, ''),
+          char(10)
+        )
+        FROM card_oracle_cache
+    """,
+}
+
+
+def db_file_state(db_path: Path) -> tuple[int, ...]:
+    """Identify the DB file state; any write changes the file or its WAL."""
+
+    state: list[int] = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            state.extend((0, 0, 0))
+            continue
+        state.extend((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(state)
+
+
+def rules_generation(connection: sqlite3.Connection) -> tuple[Any, ...]:
+    """Fingerprint of the rows and columns the coverage index is built from."""
+
+    generation: list[Any] = []
+    for table, fingerprint_sql in COVERAGE_FINGERPRINT_SQL.items():
+        if not connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone():
+            generation.append(None)
+            continue
+        count, values = connection.execute(fingerprint_sql).fetchone()
+        digest = hashlib.sha256(str(values or "").encode("utf-8")).hexdigest()
+        generation.append((count, digest))
+    return tuple(generation)
+
+
+def _build_coverage_index(
+    connection: sqlite3.Connection,
+    generation: tuple[Any, ...],
+) -> RuleCoverageIndex:
+    started = time.perf_counter()
+    rows = connection.execute(
+        f"""
+        SELECT normalized_name, logical_rule_key, oracle_hash
+        FROM battle_card_rules
+        {COVERED_RULES_WHERE}
+        ORDER BY normalized_name, logical_rule_key
+        """
+    ).fetchall()
+    has_oracle_cache = connection.execute(
+        """
+        SELECT 1 FROM sqlite_master
+        WHERE type = 'table' AND name = 'card_oracle_cache'
+        """
+    ).fetchone()
+    oracle_rows = (
+        connection.execute(
+            "SELECT normalized_name, type_line FROM card_oracle_cache"
+        ).fetchall()
+        if has_oracle_cache
+        else []
+    )
+    digest = hashlib.sha256()
+    grouped: dict[str, list[tuple[str, str]]] = {}
+    for normalized_name, logical_rule_key, oracle_hash in rows:
+        grouped.setdefault(str(normalized_name), []).append(
+            (str(logical_rule_key), str(oracle_hash))
+        )
+        digest.update(f"{normalized_name}\t{logical_rule_key}\t{oracle_hash}\n".encode())
+    return RuleCoverageIndex(
+        generation=generation,
+        version=digest.hexdigest()[:16],
+        built_at=datetime.now(timezone.utc).isoformat(),
+        build_ms=round((time.perf_counter() - started) * 1000),
+        rule_count=len(rows),
+        rules_by_name={name: tuple(rules) for name, rules in grouped.items()},
+        oracle_basic_land={
+            str(normalized_name): str(type_line or "").lower().startswith("basic land")
+            for normalized_name, type_line in oracle_rows
+        },
+    )
+
+
+def coverage_index(db_path: Path = KNOWLEDGE_DB) -> RuleCoverageIndex:
+    """Return the resident index, rebuilding it when the rules tables move.
+
+    An unchanged DB file skips SQLite entirely; a changed one costs a
+    fingerprint query, and only a new rules generation rebuilds the index.
+    """
+
+    if not db_path.is_file():
+        raise RuntimeError(f"knowledge DB not found: {db_path}")
+    file_state = db_file_state(db_path)
+    index = _COVERAGE_INDEXES.get(db_path)
+    if index is not None and _COVERAGE_FILE_STATES.get(db_path) == file_state:
+        return index
+    with COVERAGE_INDEX_LOCK:
+        index = _COVERAGE_INDEXES.get(db_path)
+        if index is not None and _COVERAGE_FILE_STATES.get(db_path) == file_state:
+            return index
+        with closing(
+            connect_knowledge_db(db_path, profile="sidecar", row_factory=None)
+        ) as connection:
+            generation = rules_generation(connection)
+            if index is None or index.generation != generation:
+                index = _build_coverage_index(connection, generation)
+        _COVERAGE_INDEXES[db_path] = index
+        _COVERAGE_FILE_STATES[db_path] = file_state
+    return index
+
+
 def _rule_rows(db_path: Path, card_rows: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     names = [str(row.get("name") or "").strip() for row in card_rows]
     if not names or any(not name for name in names):
         raise InvalidRequest("cards must contain non-empty names")
-    normalized = sorted({alias for name in names for alias in _lookup_names(name)})
-    if not db_path.is_file():
-        raise RuntimeError(f"knowledge DB not found: {db_path}")
-    placeholders = ",".join("?" for _ in normalized)
-    with closing(sqlite3.connect(db_path)) as connection:
-        connection.row_factory = sqlite3.Row
-        rows = connection.execute(
-            f"""
-            SELECT normalized_name, logical_rule_key, card_name, review_status,
-                   execution_status, oracle_hash, effect_json
-            FROM battle_card_rules
-            WHERE normalized_name IN ({placeholders})
-              AND review_status IN ('verified', 'active')
-              AND execution_status IN ('auto', 'executable')
-              AND COALESCE(oracle_hash, '') != ''
-              AND json_valid(effect_json) = 1
-              AND json_type(effect_json) = 'object'
-              AND json(effect_json) != '{{}}'
-            ORDER BY normalized_name, logical_rule_key
-            """,
-            normalized,
-        ).fetchall()
-        has_oracle_cache = connection.execute(
-            """
-            SELECT 1 FROM sqlite_master
-            WHERE type = 'table' AND name = 'card_oracle_cache'
-            """
-        ).fetchone()
-        oracle_rows = (
-            connection.execute(
-                f"""
-                SELECT normalized_name, name, type_line
-                FROM card_oracle_cache
-                WHERE normalized_name IN ({placeholders})
-                """,
-                normalized,
-            ).fetchall()
-            if has_oracle_cache
-            else []
-        )
-    by_name: dict[str, list[sqlite3.Row]] = {}
-    for row in rows:
-        by_name.setdefault(str(row["normalized_name"]), []).append(row)
-    oracle_by_name = {str(row["normalized_name"]): row for row in oracle_rows}
+    index = coverage_index(db_path)
     supported = []
     unsupported = []
     seen = set()
-    for index, card in enumerate(card_rows):
+    for position, card in enumerate(card_rows):
         name = str(card.get("name") or "").strip()
         key = normalize_name(name)
         if key in seen:
             continue
         seen.add(key)
         aliases = _lookup_names(name)
-        matching = [rule for alias in aliases for rule in by_name.get(alias, [])]
+        matching = [
+            (alias, rule)
+            for alias in aliases
+            for rule in index.rules_by_name.get(alias, ())
+        ]
         if not matching:
-            oracle = next(
-                (oracle_by_name[alias] for alias in aliases if alias in oracle_by_name),
+            oracle_name = next(
+                (alias for alias in aliases if alias in index.oracle_basic_land),
                 None,
             )
-            if oracle is not None and str(oracle["type_line"] or "").lower().startswith("basic land"):
+            if oracle_name is not None and index.oracle_basic_land[oracle_name]:
                 supported.append(
                     {
                         "name": name,
                         "normalized_name": key,
-                        "matched_normalized_name": str(oracle["normalized_name"]),
+                        "matched_normalized_name": oracle_name,
                         "support_kind": "intrinsic_basic_land",
                         "logical_rule_keys": ["native_intrinsic_v1:basic_land"],
                         "oracle_hashes": [],
@@ -127,7 +266,7 @@ def _rule_rows(db_path: Path, card_rows: list[dict[str, Any]]) -> tuple[list[dic
             unsupported.append(
                 {
                     "name": name,
-                    "input_index": index,
+                    "input_index": position,
                     "reason": "verified_native_rule_missing",
                 }
             )
@@ -136,10 +275,10 @@ def _rule_rows(db_path: Path, card_rows: list[dict[str, Any]]) -> tuple[list[dic
             {
                 "name": name,
                 "normalized_name": key,
-                "matched_normalized_name": str(matching[0]["normalized_name"]),
+                "matched_normalized_name": matching[0][0],
                 "support_kind": "reviewed_card_rule",
-                "logical_rule_keys": [str(row["logical_rule_key"]) for row in matching],
-                "oracle_hashes": sorted({str(row["oracle_hash"]) for row in matching}),
+                "logical_rule_keys": [rule[0] for _, rule in matching],
+                "oracle_hashes": sorted({rule[1] for _, rule in matching}),
             }
         )
     return supported, unsupported
@@ -168,25 +307,13 @@ def card_coverage(payload: dict[str, Any], *, db_path: Path = KNOWLEDGE_DB) -> d
 
 
 def _runtime_health(db_path: Path = KNOWLEDGE_DB) -> tuple[int, dict[str, Any]]:
-    rule_count = 0
+    index = None
     error = None
     try:
-        with closing(sqlite3.connect(db_path)) as connection:
-            rule_count = int(
-                connection.execute(
-                    """
-                    SELECT COUNT(*) FROM battle_card_rules
-                    WHERE review_status IN ('verified', 'active')
-                      AND execution_status IN ('auto', 'executable')
-                      AND COALESCE(oracle_hash, '') != ''
-                      AND json_valid(effect_json) = 1
-                      AND json_type(effect_json) = 'object'
-                      AND json(effect_json) != '{}'
-                    """
-                ).fetchone()[0]
-            )
-    except (OSError, sqlite3.Error) as exc:
+        index = coverage_index(db_path)
+    except (OSError, RuntimeError, sqlite3.Error) as exc:
         error = str(exc)
+    rule_count = index.rule_count if index is not None else 0
     ready = rule_count > 0 and error is None
     return (
         200 if ready else 503,
@@ -197,6 +324,7 @@ def _runtime_health(db_path: Path = KNOWLEDGE_DB) -> tuple[int, dict[str, Any]]:
             "git_sha": os.environ.get("GIT_SHA", "unknown"),
             "knowledge_db_ready": ready,
             "verified_rule_count": rule_count,
+            "rule_index": index.health() if index is not None else None,
             "sidecar_process_id": PROCESS_ID,
             "sidecar_started_at": STARTED_AT,
             **({"error": error} if error else {}),
@@ -204,52 +332,49 @@ def _runtime_health(db_path: Path = KNOWLEDGE_DB) -> tuple[int, dict[str, Any]]:
     )
 
 
-def _run_simulation(payload: dict[str, Any], *, db_path: Path = KNOWLEDGE_DB) -> tuple[int, dict[str, Any]]:
+def _required_coverage(
+    payload: dict[str, Any], *, db_path: Path
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
     required = payload.get("required_rule_cards")
     if not isinstance(required, list) or not required:
         raise InvalidRequest("required_rule_cards is required")
     coverage = card_coverage({"cards": required}, db_path=db_path)
     if coverage["unsupported_cards"]:
-        return 422, {
+        return coverage, {
             "error": "native_coverage_incomplete",
             "message": "Reviewed native coverage is incomplete",
             "unsupported_cards": coverage["unsupported_cards"],
         }
-    timeout_ms = max(
+    return coverage, None
+
+
+def _timeout_ms(payload: dict[str, Any]) -> int:
+    return max(
         1000,
         min(
             MAXIMUM_SIMULATION_TIMEOUT_MS,
             int(payload.get("timeout_ms") or DEFAULT_SIMULATION_TIMEOUT_MS),
         ),
     )
+
+
+def _run_simulation(payload: dict[str, Any], *, db_path: Path = KNOWLEDGE_DB) -> tuple[int, dict[str, Any]]:
+    coverage, incomplete = _required_coverage(payload, db_path=db_path)
+    if incomplete is not None:
+        return 422, incomplete
+    timeout_ms = _timeout_ms(payload)
     env = dict(os.environ)
     env["MANALOOM_KNOWLEDGE_DB"] = str(db_path)
     with SIMULATION_LOCK:
         try:
-            completed = subprocess.run(
-                [sys.executable, str(WORKER)],
-                cwd=REPO_ROOT,
-                env=env,
-                input=json.dumps(payload),
-                text=True,
-                capture_output=True,
-                timeout=timeout_ms / 1000,
-                check=False,
-            )
+            returncode, result = _run_worker(payload, env=env, timeout=timeout_ms / 1000)
         except subprocess.TimeoutExpired:
             return 504, {
                 "error": "native_battle_timeout",
                 "message": f"Native battle exceeded {timeout_ms} ms",
             }
-    try:
-        result = json.loads((completed.stdout or "").strip())
-    except json.JSONDecodeError:
-        result = {
-            "error": "native_runtime_invalid_output",
-            "message": (completed.stderr or completed.stdout or "native worker returned no JSON")[-2000:],
-        }
-    if completed.returncode != 0:
-        return (400 if completed.returncode == 2 else 500), result
+    if returncode != 0:
+        return (400 if returncode == 2 else 500), result
     if not isinstance(result, dict):
         return 500, {
             "error": "native_runtime_invalid_output",
@@ -266,10 +391,358 @@ def _run_simulation(payload: dict[str, Any], *, db_path: Path = KNOWLEDGE_DB) ->
     return 200, result
 
 
+class WorkerResultDecoder:
+    """Reassemble the worker's compact line stream into one result.
+
+    The worker writes ``["e", event]`` and ``["d", decision]`` lines while the
+    game runs and closes with ``["r", result]``. A plain JSON object line is
+    a complete result on its own (errors and older workers).
+    """
+
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+        self.decisions: list[Any] = []
+        self._result: Any = None
+
+    def feed(self, line: str) -> None:
+        if not line.strip():
+            return
+        row = json.loads(line)
+        if isinstance(row, list) and len(row) == 2 and row[0] in {"e", "d", "r"}:
+            kind, value = row
+            if kind == "e":
+                self.events.append(value)
+            elif kind == "d":
+                self.decisions.append(value)
+            elif isinstance(value, dict):
+                self._result = {
+                    **value,
+                    "events": self.events,
+                    "game_log": self.events,
+                    "decision_trace": self.decisions,
+                }
+            else:
+                self._result = value
+            return
+        self._result = row
+
+    def result(self) -> Any:
+        if self._result is None:
+            raise json.JSONDecodeError("native worker returned no result", "", 0)
+        return self._result
+
+
+def worker_result(stdout: str) -> Any:
+    decoder = WorkerResultDecoder()
+    for line in stdout.splitlines():
+        decoder.feed(line)
+    return decoder.result()
+
+
+def _run_worker(
+    payload: dict[str, Any],
+    *,
+    env: dict[str, str],
+    timeout: float,
+) -> tuple[int, Any]:
+    """Run one game, decoding worker lines as they arrive.
+
+    Stdout is never buffered whole; only stderr is spooled for error
+    messages. ``timeout`` covers the whole run and raises
+    ``subprocess.TimeoutExpired``.
+    """
+
+    decoder = WorkerResultDecoder()
+    invalid_line: str | None = None
+    deadline = time.monotonic() + timeout
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as stderr:
+        process = subprocess.Popen(
+            [sys.executable, str(WORKER)],
+            cwd=REPO_ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+        )
+        lines: queue.Queue[str | None] = queue.Queue()
+
+        def pump() -> None:
+            assert process.stdout is not None
+            with process.stdout:
+                for line in process.stdout:
+                    lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=pump, name="native-battle-output", daemon=True).start()
+        try:
+            assert process.stdin is not None
+            try:
+                with process.stdin:
+                    process.stdin.write(json.dumps(payload))
+            except BrokenPipeError:
+                pass
+            while True:
+                try:
+                    line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    raise subprocess.TimeoutExpired(process.args, timeout) from None
+                if line is None:
+                    break
+                if invalid_line is None:
+                    try:
+                        decoder.feed(line)
+                    except json.JSONDecodeError:
+                        invalid_line = line
+            returncode = process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+        stderr.seek(0)
+        stderr_text = stderr.read()
+    if invalid_line is None:
+        try:
+            return returncode, decoder.result()
+        except json.JSONDecodeError:
+            pass
+    return returncode, {
+        "error": "native_runtime_invalid_output",
+        "message": (stderr_text or invalid_line or "native worker returned no JSON")[-2000:],
+    }
+
+
+def _batch_seeds(payload: dict[str, Any]) -> list[int]:
+    seeds = payload.get("seeds")
+    if seeds is None:
+        try:
+            count = int(payload.get("seed_count") or 0)
+            base_seed = int(payload.get("base_seed") or payload.get("seed") or 0)
+        except (TypeError, ValueError) as exc:
+            raise InvalidRequest("seed_count and base_seed must be integers") from exc
+        seeds = [base_seed + offset for offset in range(count)]
+    if not isinstance(seeds, list) or not seeds:
+        raise InvalidRequest("seeds or seed_count is required")
+    if len(seeds) > MAX_BATCH_SEEDS:
+        raise InvalidRequest(f"seeds is limited to {MAX_BATCH_SEEDS} per batch")
+    if any(isinstance(seed, bool) or not isinstance(seed, int) for seed in seeds):
+        raise InvalidRequest("seeds must be integers")
+    return seeds
+
+
+def _run_simulation_batch(
+    payload: dict[str, Any], *, db_path: Path = KNOWLEDGE_DB
+) -> tuple[int, dict[str, Any] | Iterator[dict[str, Any]]]:
+    """Play one deck pair over many seeds; stream one record per game.
+
+    Coverage is checked once and one worker builds both decks once for all of
+    its games. Every game keeps the single-game timeout cap. A game that times
+    out or kills the worker is reported on its own and the remaining seeds
+    continue in a fresh worker.
+    """
+
+    seeds = _batch_seeds(payload)
+    coverage, incomplete = _required_coverage(payload, db_path=db_path)
+    if incomplete is not None:
+        return 422, incomplete
+    records = _batch_records(payload, seeds, coverage=coverage, db_path=db_path)
+    first = next(records)
+    if first.get("type") == "error":
+        records.close()
+        return first.pop("http_status"), {
+            key: value
+            for key, value in first.items()
+            if key not in {"type", "status"}
+        }
+
+    def stream() -> Iterator[dict[str, Any]]:
+        try:
+            yield first
+            yield from records
+        finally:
+            records.close()
+
+    return 200, stream()
+
+
+def _batch_records(
+    payload: dict[str, Any],
+    seeds: list[int],
+    *,
+    coverage: dict[str, Any],
+    db_path: Path,
+) -> Iterator[dict[str, Any]]:
+    started = time.monotonic()
+    timeout_ms = _timeout_ms(payload)
+    env = dict(os.environ)
+    env["MANALOOM_KNOWLEDGE_DB"] = str(db_path)
+    pending = list(enumerate(seeds))
+    status_counts: dict[str, int] = {}
+    launches = 0
+    deck_construction = None
+    with SIMULATION_LOCK:
+        while pending:
+            launches += 1
+            request = {
+                key: value
+                for key, value in payload.items()
+                if key not in {"seeds", "seed_count", "base_seed", "seed"}
+            }
+            request["batch_games"] = [
+                {"index": index, "seed": seed} for index, seed in pending
+            ]
+            for row in _batch_worker(request, env=env, timeout_ms=timeout_ms):
+                if row.get("type") == "prepared":
+                    if deck_construction is None:
+                        deck_construction = row.get("deck_construction")
+                        yield {"type": "started", "games": len(seeds)}
+                    continue
+                if deck_construction is None:
+                    # Nothing has streamed yet, so the batch fails as one request.
+                    yield {
+                        "http_status": 504 if row.get("status") == "timeout" else row.get("http_status", 500),
+                        **row,
+                        "type": "error",
+                    }
+                    return
+                row.pop("http_status", None)
+                index, seed = next(
+                    (item for item in pending if item[0] == row.get("index")),
+                    pending[0],
+                )
+                pending.remove((index, seed))
+                status = str(row.get("status") or "failed")
+                status_counts[status] = status_counts.get(status, 0) + 1
+                yield {
+                    **row,
+                    "type": "game",
+                    "index": index,
+                    "seed": seed,
+                    "status": status,
+                }
+    yield {
+        "type": "aggregate",
+        "status": "completed" if set(status_counts) <= {"completed"} else "partial",
+        "games": len(seeds),
+        "status_counts": dict(sorted(status_counts.items())),
+        "worker_launches": launches,
+        "duration_ms": int((time.monotonic() - started) * 1000),
+        "deck_construction": deck_construction,
+        "native_rule_coverage": coverage,
+        "sidecar_process_id": PROCESS_ID,
+        "sidecar_started_at": STARTED_AT,
+        "engine_commit": os.environ.get("GIT_SHA", "unknown"),
+    }
+
+
+def _batch_worker(
+    request: dict[str, Any],
+    *,
+    env: dict[str, str],
+    timeout_ms: int,
+) -> Iterator[dict[str, Any]]:
+    """Yield worker records until the worker exits or a game overruns.
+
+    The last record is an error record whenever the worker stops before
+    answering every game; it names no index, so it is charged to the next
+    pending game.
+    """
+
+    expected = len(request["batch_games"])
+    answered = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as stderr:
+        process = subprocess.Popen(
+            [sys.executable, str(WORKER)],
+            cwd=REPO_ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+        )
+        lines: queue.Queue[str | None] = queue.Queue()
+
+        def pump() -> None:
+            assert process.stdout is not None
+            with process.stdout:
+                for line in process.stdout:
+                    lines.put(line)
+            lines.put(None)
+
+        assert process.stdin is not None
+        with process.stdin:
+            process.stdin.write(json.dumps(request))
+        threading.Thread(target=pump, name="native-battle-batch-output", daemon=True).start()
+        try:
+            # Each game, and the start-up before the first, gets the full per-game cap.
+            while answered < expected:
+                try:
+                    line = lines.get(timeout=timeout_ms / 1000)
+                except queue.Empty:
+                    yield {
+                        "type": "game",
+                        "status": "timeout",
+                        "error": "native_battle_timeout",
+                        "message": f"Native battle exceeded {timeout_ms} ms",
+                    }
+                    return
+                if line is None:
+                    returncode = process.wait()
+                    stderr.seek(0)
+                    yield {
+                        "type": "error",
+                        "http_status": 400 if returncode == 2 else 500,
+                        "error": "native_runtime_failed",
+                        "message": (
+                            f"native worker exited with code {returncode}: "
+                            + stderr.read()[-2000:]
+                        ),
+                    }
+                    return
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(row, dict):
+                    continue
+                if "error" in row and "type" not in row:
+                    yield {
+                        "type": "error",
+                        "http_status": 400 if row.get("error") == "invalid_request" else 500,
+                        **row,
+                    }
+                    return
+                if row.get("type") == "game":
+                    answered += 1
+                yield row
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+
+def decode_request_body(raw: bytes, content_encoding: str | None) -> bytes:
+    encoding = str(content_encoding or "").strip().lower()
+    if encoding in {"", "identity"}:
+        return raw
+    if encoding != "gzip":
+        raise InvalidRequest(f"unsupported content-encoding: {encoding}")
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        body = decompressor.decompress(raw, MAX_BODY_BYTES + 1)
+    except zlib.error as exc:
+        raise InvalidRequest("request body is not valid gzip") from exc
+    if len(body) > MAX_BODY_BYTES or decompressor.unconsumed_tail:
+        raise InvalidRequest("request body is empty or too large")
+    return body
+
+
 class NativeBattleHandler(BaseHTTPRequestHandler):
     server_version = "ManaLoomNativeBattle/1"
+    protocol_version = "HTTP/1.1"
 
     def do_GET(self) -> None:  # noqa: N802
+        self._started = time.perf_counter()
         if self.path != "/health":
             self._send(404, {"error": "not_found"})
             return
@@ -277,6 +750,7 @@ class NativeBattleHandler(BaseHTTPRequestHandler):
         self._send(status, body)
 
     def do_POST(self) -> None:  # noqa: N802
+        self._started = time.perf_counter()
         try:
             payload = self._read_json()
             if self.path == "/cards/coverage":
@@ -286,6 +760,13 @@ class NativeBattleHandler(BaseHTTPRequestHandler):
                 status, body = _run_simulation(payload)
                 self._send(status, body)
                 return
+            if self.path == "/simulate/batch":
+                status, body = _run_simulation_batch(payload)
+                if isinstance(body, dict):
+                    self._send(status, body)
+                else:
+                    self._stream(status, body)
+                return
             self._send(404, {"error": "not_found"})
         except InvalidRequest as exc:
             self._send(400, {"error": "invalid_request", "message": str(exc)})
@@ -296,11 +777,17 @@ class NativeBattleHandler(BaseHTTPRequestHandler):
         try:
             length = int(self.headers.get("content-length", "0"))
         except ValueError as exc:
+            self.close_connection = True
             raise InvalidRequest("invalid content-length") from exc
         if length <= 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
             raise InvalidRequest("request body is empty or too large")
+        raw = decode_request_body(
+            self.rfile.read(length),
+            self.headers.get("content-encoding"),
+        )
         try:
-            payload = json.loads(self.rfile.read(length))
+            payload = json.loads(raw)
         except json.JSONDecodeError as exc:
             raise InvalidRequest("request body must be valid JSON") from exc
         if not isinstance(payload, dict):
@@ -309,12 +796,45 @@ class NativeBattleHandler(BaseHTTPRequestHandler):
 
     def _send(self, status: int, payload: dict[str, Any]) -> None:
         body = json.dumps(payload, ensure_ascii=True, separators=(",", ":")).encode()
+        compressed = (
+            len(body) >= GZIP_RESPONSE_MIN_BYTES
+            and "gzip" in self.headers.get("accept-encoding", "").lower()
+        )
+        if compressed:
+            body = gzip.compress(body, compresslevel=GZIP_RESPONSE_LEVEL, mtime=0)
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
         self.send_response(status)
         self.send_header("content-type", "application/json")
+        self.send_header("accept-encoding", "gzip")
+        self.send_header("vary", "accept-encoding")
+        if compressed:
+            self.send_header("content-encoding", "gzip")
+        self.send_header("server-timing", f"app;dur={elapsed_ms:.1f}")
         self.send_header("content-length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
+    def _stream(self, status: int, records: Iterator[dict[str, Any]]) -> None:
+        """Write records as NDJSON over a chunked HTTP/1.1 response."""
+
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        self.send_response(status)
+        self.send_header("content-type", "application/x-ndjson")
+        self.send_header("accept-encoding", "gzip")
+        self.send_header("server-timing", f"app;dur={elapsed_ms:.1f}")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+        try:
+            for record in records:
+                line = json.dumps(record, ensure_ascii=True, separators=(",", ":")).encode() + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            records.close()
+
     def log_message(self, format: str, *args: Any) -> None:
         return
 
@@ -322,6 +842,11 @@ class NativeBattleHandler(BaseHTTPRequestHandler):
 def create_server(host: str | None = None, port: int | None = None) -> ThreadingHTTPServer:
     resolved_host = host or os.environ.get("MANALOOM_NATIVE_BATTLE_HOST", "0.0.0.0")
     resolved_port = port or int(os.environ.get("MANALOOM_NATIVE_BATTLE_PORT", "8080"))
+    try:
+        coverage_index()
+    except (OSError, RuntimeError, sqlite3.Error):
+        # /health reports the failure; the index is retried on the next request.
+        pass
     return ThreadingHTTPServer((resolved_host, resolved_port), NativeBattleHandler)
 
 
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-"""Execute one isolated ManaLoom-native battle request."""
+"""Execute one isolated ManaLoom-native battle request or seed batch."""
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import random
@@ -155,8 +156,7 @@ def _native_replay_event(
     return row
 
 
-def simulate(payload: dict[str, Any]) -> dict[str, Any]:
-    started = time.monotonic()
+def prepare(payload: dict[str, Any]) -> dict[str, Any]:
     db_path = Path(os.environ.get("MANALOOM_KNOWLEDGE_DB", battle.DB))
     if not db_path.is_file():
         raise NativeBattleInputError(f"knowledge DB not found: {db_path}")
@@ -165,11 +165,64 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
         connection.row_factory = sqlite3.Row
         deck_a, commander_a, cards_a, report_a = _build_deck(connection, payload, "deck_a")
         deck_b, commander_b, cards_b, report_b = _build_deck(connection, payload, "deck_b")
+    return {
+        "deck_a": deck_a,
+        "commander_a": commander_a,
+        "cards_a": cards_a,
+        "report_a": report_a,
+        "deck_b": deck_b,
+        "commander_b": commander_b,
+        "cards_b": cards_b,
+        "report_b": report_b,
+    }
+
+
+def _capture_limits() -> tuple[int, int]:
+    max_events = max(100, min(50000, int(os.environ.get("MANALOOM_NATIVE_MAX_EVENTS", "20000"))))
+    max_decisions = max(100, min(20000, int(os.environ.get("MANALOOM_NATIVE_MAX_DECISIONS", "5000"))))
+    return max_events, max_decisions
+
 
+def simulate(payload: dict[str, Any], *, sink: Any = None) -> dict[str, Any]:
+    started = time.monotonic()
+    return play(
+        prepare(payload),
+        payload,
+        seed=int(payload.get("seed") or 0),
+        started=started,
+        sink=sink,
+    )
+
+
+def play(
+    prepared: dict[str, Any],
+    payload: dict[str, Any],
+    *,
+    seed: int,
+    started: float,
+    sink: Any = None,
+) -> dict[str, Any]:
+    """Play one game, keeping at most the configured events and decisions.
+
+    Rows past a cap are counted but never built. With ``sink``, captured rows
+    are handed to ``sink(kind, row)`` as they happen (``"e"`` for events,
+    ``"d"`` for decisions) and the result omits the row lists.
+    """
+
+    deck_a = prepared["deck_a"]
+    commander_a = prepared["commander_a"]
+    cards_a = prepared["cards_a"]
+    report_a = prepared["report_a"]
+    deck_b = prepared["deck_b"]
+    commander_b = prepared["commander_b"]
+    cards_b = prepared["cards_b"]
+    report_b = prepared["report_b"]
     forced_access_mode = _configure_focus_access(payload)
     max_turns = _configure_runtime_limits(payload)
+    max_events, max_decisions = _capture_limits()
     events: list[dict[str, Any]] = []
     decisions: list[dict[str, Any]] = []
+    counts = {"events": 0, "decisions": 0, "events_dropped": 0, "decisions_dropped": 0}
     previous_event_handler = battle.REPLAY_EVENT_HANDLER
     previous_decision_handler = battle.DECISION_TRACE_HANDLER
     previous_target = os.environ.get(battle.EVALUATION_TARGET_ENV)
@@ -181,19 +234,39 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
     deck_b_card_names = {
         _normalize_name(card.get("name")) for card in [commander_b, *cards_b]
     }
+
+    def capture_event(event: str, data: dict[str, Any]) -> None:
+        if counts["events"] >= max_events:
+            counts["events_dropped"] += 1
+            return
+        counts["events"] += 1
+        row = _native_replay_event(
+            event,
+            data,
+            deck_a_player=deck_a_player,
+            deck_b_player=deck_b_player,
+            deck_a_card_names=deck_a_card_names,
+            deck_b_card_names=deck_b_card_names,
+        )
+        if sink is None:
+            events.append(row)
+        else:
+            sink("e", row)
+
+    def capture_decision(row: dict[str, Any]) -> None:
+        if counts["decisions"] >= max_decisions:
+            counts["decisions_dropped"] += 1
+            return
+        counts["decisions"] += 1
+        if sink is None:
+            decisions.append(dict(row))
+        else:
+            sink("d", row)
+
     try:
         os.environ[battle.EVALUATION_TARGET_ENV] = deck_a_player
-        battle.REPLAY_EVENT_HANDLER = lambda event, data: events.append(
-            _native_replay_event(
-                event,
-                dict(data),
-                deck_a_player=deck_a_player,
-                deck_b_player=deck_b_player,
-                deck_a_card_names=deck_a_card_names,
-                deck_b_card_names=deck_b_card_names,
-            )
-        )
-        battle.DECISION_TRACE_HANDLER = lambda row: decisions.append(dict(row))
+        battle.REPLAY_EVENT_HANDLER = capture_event
+        battle.DECISION_TRACE_HANDLER = capture_decision
         battle.reset_decision_trace_counter()
         result, turns, reason = battle.simulate_game_v8(
             commander_a,
@@ -209,7 +282,7 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
                     "commander_name": commander_b.get("name"),
                 }
             ],
-            random.Random(int(payload.get("seed") or 0)),
+            random.Random(seed),
             str(payload.get("request_id") or "native-battle"),
         )
     finally:
@@ -229,13 +302,11 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
         winner_deck_id = deck_b["id"]
         winner = "Deck B"
     duration_ms = int((time.monotonic() - started) * 1000)
-    max_events = max(100, min(50000, int(os.environ.get("MANALOOM_NATIVE_MAX_EVENTS", "20000"))))
-    max_decisions = max(100, min(20000, int(os.environ.get("MANALOOM_NATIVE_MAX_DECISIONS", "5000"))))
-    return {
+    result = {
         "status": "completed",
         "engine": "manaloom_native_reviewed",
         "engine_contract": "native_reviewed_rules_execution",
-        "seed": int(payload.get("seed") or 0),
+        "seed": seed,
         "winner": winner,
         "winner_deck_id": winner_deck_id,
         "turns": turns,
@@ -243,9 +314,6 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
         "win_condition": reason,
         "duration_ms": duration_ms,
         "forced_access_mode": forced_access_mode,
-        "events": events[:max_events],
-        "game_log": events[:max_events],
-        "decision_trace": decisions[:max_decisions],
         "visual_snapshots": [],
         "deck_construction": {"deck_a": report_a, "deck_b": report_b},
         "learning_contract": {
@@ -257,12 +325,66 @@ def simulate(payload: dict[str, Any]) -> dict[str, Any]:
             "forced_access_diagnostic": forced_access_mode != "none",
         },
         "metrics": {
-            "event_count": min(len(events), max_events),
-            "decision_count": min(len(decisions), max_decisions),
-            "events_truncated": len(events) > max_events,
-            "decisions_truncated": len(decisions) > max_decisions,
+            "event_count": counts["events"],
+            "decision_count": counts["decisions"],
+            "events_truncated": counts["events_dropped"] > 0,
+            "decisions_truncated": counts["decisions_dropped"] > 0,
+            "events_dropped": counts["events_dropped"],
+            "decisions_dropped": counts["decisions_dropped"],
         },
     }
+    if sink is None:
+        result["events"] = events
+        result["game_log"] = events
+        result["decision_trace"] = decisions
+    return result
+
+
+def simulate_batch(payload: dict[str, Any], emit: Any) -> None:
+    """Build both decks once, then play every requested seed in turn.
+
+    Each game runs on a fresh copy of the prepared decks because the engine
+    mutates card rows. A failing game is emitted as an error record and the
+    batch continues with the next seed.
+    """
+
+    games = payload.get("batch_games")
+    if not isinstance(games, list) or not games:
+        raise NativeBattleInputError("batch_games is required")
+    prepared = prepare(payload)
+    emit(
+        {
+            "type": "prepared",
+            "deck_construction": {
+                "deck_a": prepared["report_a"],
+                "deck_b": prepared["report_b"],
+            },
+        }
+    )
+    for game in games:
+        index = int(game["index"])
+        seed = int(game["seed"])
+        try:
+            result = play(
+                copy.deepcopy(prepared),
+                payload,
+                seed=seed,
+                started=time.monotonic(),
+            )
+        except NativeBattleInputError as error:
+            result = {"status": "invalid_request", "error": "invalid_request", "message": str(error)}
+        except Exception as error:
+            result = {"status": "failed", "error": "native_runtime_failed", "message": str(error)}
+        emit({"type": "game", "index": index, **result, "seed": seed})
+
+
+def _emit_line(row: dict[str, Any]) -> None:
+    print(json.dumps(row, ensure_ascii=True, separators=(",", ":")), flush=True)
+
+
+def _emit_compact(kind: str, row: dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps([kind, row], ensure_ascii=True, separators=(",", ":")))
+    sys.stdout.write("\n")
 
 
 def main() -> int:
@@ -270,7 +392,12 @@ def main() -> int:
         payload = json.load(sys.stdin)
         if not isinstance(payload, dict):
             raise NativeBattleInputError("request body must be an object")
-        print(json.dumps(simulate(payload), ensure_ascii=True, separators=(",", ":")))
+        if "batch_games" in payload:
+            simulate_batch(payload, _emit_line)
+            return 0
+        # Rows stream out as the game runs; the result line closes the stream.
+        _emit_compact("r", simulate(payload, sink=_emit_compact))
+        sys.stdout.flush()
         return 0
     except NativeBattleInputError as error:
         print(json.dumps({"error": "invalid_request", "message": str(error)}))
@@ -183,8 +183,11 @@ def load_current_audits() -> list[Any]:
     conn = audit_module.connect_pg()
     try:
         conn.set_session(readonly=True, autocommit=False)
-        lookup = audit_module.load_card_lookup(conn)
-        return audit_module.load_active_learned_decks(conn, lookup)
+        lookup, _info = audit_module.load_cached_card_lookup(conn)
+        try:
+            return audit_module.load_active_learned_decks(conn, lookup)
+        finally:
+            lookup.close()
     finally:
         try:
             conn.rollback()
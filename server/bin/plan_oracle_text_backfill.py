@@ -3,7 +3,9 @@
 
 The planner reads PostgreSQL through the same env path used by the learned-deck
 coherence audit, aggregates current deck/learned-deck impact, and optionally
-looks up exact Scryfall candidates. It never mutates PostgreSQL.
+looks up exact Scryfall candidates. With ``--bulk-json`` exact names resolve
+from the shared indexed bulk store first and only misses go to the network.
+It never mutates PostgreSQL.
 """
 
 from __future__ import annotations
@@ -25,6 +27,9 @@ from typing import Any
 
 from psycopg2.extras import RealDictCursor
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import scryfall_bulk_cache as bulk_cache  # noqa: E402
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parents[1]
@@ -288,6 +293,25 @@ def fetch_scryfall_best_match(name: str, timeout_seconds: int) -> dict[str, Any]
     }
 
 
+def bulk_best_match(
+    store: bulk_cache.BulkCardStore, name: str
+) -> dict[str, Any] | None:
+    """Exact lookup attempts against the local bulk store; fuzzy stays remote."""
+    attempts = scryfall_lookup_attempts(name)
+    for attempt in attempts:
+        if attempt["mode"] != "exact":
+            continue
+        card = store.by_name(attempt["query"])
+        if card is not None:
+            return scryfall_candidate(card) | {
+                "lookup_strategy": attempt["strategy"],
+                "lookup_mode": "bulk_exact",
+                "lookup_query": attempt["query"],
+                "lookup_attempts": attempts,
+            }
+    return None
+
+
 def fetch_scryfall_exact(name: str, timeout_seconds: int) -> dict[str, Any]:
     """Backward-compatible wrapper kept for older callers/tests."""
     return fetch_scryfall_named(name, mode="exact", timeout_seconds=timeout_seconds)
@@ -417,8 +441,11 @@ def load_deck_card_gap_items(conn) -> dict[str, OracleGapItem]:
 def merge_active_learned_gaps(items: dict[str, OracleGapItem], audit_module) -> None:
     conn = audit_module.connect_pg()
     try:
-        lookup = audit_module.load_card_lookup(conn)
-        audits = audit_module.load_active_learned_decks(conn, lookup)
+        lookup, _info = audit_module.load_cached_card_lookup(conn)
+        try:
+            audits = audit_module.load_active_learned_decks(conn, lookup)
+        finally:
+            lookup.close()
     finally:
         conn.close()
 
@@ -469,6 +496,12 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Skip Scryfall exact-name lookups.",
     )
+    parser.add_argument(
+        "--bulk-json",
+        type=Path,
+        help="Scryfall oracle-cards bulk file; exact names resolve from its indexed store.",
+    )
+    parser.add_argument("--bulk-cache-dir", type=Path)
     parser.add_argument("--delay-ms", type=int, default=100)
     parser.add_argument("--timeout-seconds", type=int, default=20)
     args = parser.parse_args(argv)
@@ -499,13 +532,24 @@ def main(argv: list[str] | None = None) -> int:
         planned = planned[: args.limit]
 
     scryfall_by_name: dict[str, dict[str, Any]] = {}
+    bulk_store_summary: dict[str, Any] | None = None
+    if args.bulk_json is not None:
+        with bulk_cache.open_bulk_store(
+            args.bulk_json, cache_dir_path=args.bulk_cache_dir
+        ) as store:
+            bulk_store_summary = store.summary()
+            for item in planned:
+                match = bulk_best_match(store, item.name)
+                if match is not None:
+                    scryfall_by_name[item.name] = match
     if not args.no_scryfall:
-        for index, item in enumerate(planned):
+        remote = [item for item in planned if item.name not in scryfall_by_name]
+        for index, item in enumerate(remote):
             scryfall_by_name[item.name] = fetch_scryfall_best_match(
                 item.name,
                 args.timeout_seconds,
             )
-            if index < len(planned) - 1 and args.delay_ms > 0:
+            if index < len(remote) - 1 and args.delay_ms > 0:
                 time.sleep(args.delay_ms / 1000)
 
     output_items = [
@@ -520,6 +564,7 @@ def main(argv: list[str] | None = None) -> int:
         "source": {
             "postgres": "server/.env via learned_deck_coherence_audit.connect_pg",
             "scryfall": None if args.no_scryfall else SCRYFALL_NAMED_URL,
+            "scryfall_bulk_store": bulk_store_summary,
         },
         "base_oracle_summary": base_summary,
         "counts": {
@@ -531,6 +576,11 @@ def main(argv: list[str] | None = None) -> int:
             "scryfall_found": sum(
                 1 for item in output_items if item["scryfall"].get("found")
             ),
+            "scryfall_bulk_found": sum(
+                1
+                for item in output_items
+                if item["scryfall"].get("lookup_mode") == "bulk_exact"
+            ),
             "backfill_ready": sum(
                 1 for item in output_items if item["backfill_ready"]
             ),
@@ -6,7 +6,7 @@ Faz parte do loop App → Hermes:
 
 Execucao idempotente: eventos ja sincronizados sao ignorados.
 """
-import json, os, sqlite3, sys
+import json, os, sqlite3, sys, time
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -47,6 +47,11 @@ PG_NAME = os.environ.get("PGDATABASE") or os.environ.get("DB_NAME") or ""
 PG_USER = os.environ.get("PGUSER") or os.environ.get("DB_USER") or ""
 PG_PASS = os.environ.get("PGPASSWORD") or os.environ.get("DB_PASS") or ""
 MIN_TRAINING_CARD_COUNT = int(os.environ.get("HERMES_MIN_TRAINING_CARD_COUNT", "90"))
+PAGE_SIZE = max(1, int(os.environ.get("HERMES_PULL_EVENTS_PAGE_SIZE", "500")))
+# 0 = drena o backlog inteiro numa execucao.
+MAX_PAGES = max(0, int(os.environ.get("HERMES_PULL_EVENTS_MAX_PAGES", "0")))
+# Linha lida pelo manaloom_ops_daemon para registrar vazao e backlog do job.
+JOB_METRICS_MARKER = "MANALOOM_JOB_METRICS"
 
 
 def main():
@@ -86,52 +91,162 @@ def main():
         print(f"PG connection failed: {e}")
         return 1
 
-    # Busca eventos nao sincronizados (ultimos 500)
-    cur.execute("""
-        SELECT id, deck_id, commander_name, format, card_count, source,
-               event_data, created_at
-        FROM deck_learning_events
-        WHERE synced_to_hermes = FALSE
-        ORDER BY created_at ASC
-        LIMIT 500
-    """)
-    events = cur.fetchall()
-
     sqlite = sqlite3.connect(SQLITE_DB)
     _ensure_tables(sqlite)
+    sqlite.commit()
 
-    if not events:
+    started = time.monotonic()
+    backlog_before = _pending_event_count(cur)
+    imported = 0
+    pages = 0
+    watermark = None
+    # Pagina o backlog inteiro por keyset (created_at, id): cada pagina entra
+    # no SQLite numa transacao e so depois e marcada como sincronizada no PG.
+    while not MAX_PAGES or pages < MAX_PAGES:
+        events = _fetch_event_page(cur, watermark, PAGE_SIZE)
+        if not events:
+            break
+        pages += 1
+        statuses = _apply_event_page(sqlite, events)
+        _mark_events_synced(cur, [e["id"] for e in events])
+        imported += len(events)
+        last = events[-1]
+        watermark = (last["created_at"], last["id"])
+        print(
+            "  page="
+            f"{pages} events={len(events)} "
+            + " ".join(f"{status}={count}" for status, count in sorted(statuses.items()))
+            + f" watermark={last['created_at'].isoformat() if last['created_at'] else None}"
+        )
+        if len(events) < PAGE_SIZE:
+            break
+
+    elapsed = time.monotonic() - started
+    backlog_after = _pending_event_count(cur) if pages else backlog_before
+    metrics = {
+        "job": "pull_learning_events",
+        "imported": imported,
+        "pages": pages,
+        "page_size": PAGE_SIZE,
+        "elapsed_seconds": round(elapsed, 3),
+        "events_per_second": round(imported / elapsed, 1) if elapsed > 0 else None,
+        "backlog_before": backlog_before,
+        "backlog_after": backlog_after,
+    }
+
+    if not imported:
         print("Nenhum evento novo.")
-        sqlite.commit()
+        print(f"{JOB_METRICS_MARKER} {json.dumps(metrics, sort_keys=True)}")
         sqlite.close()
         cur.close()
         conn.close()
         return 0
 
-    imported = 0
+    totals = sqlite.execute(
+        """
+        SELECT
+          COUNT(*) AS imported_total,
+          SUM(CASE WHEN training_eligible = 1 THEN 1 ELSE 0 END) AS trainable,
+          SUM(CASE WHEN learning_status = 'partial_telemetry' THEN 1 ELSE 0 END) AS partial,
+          SUM(CASE WHEN learning_status = 'non_commander_telemetry' THEN 1 ELSE 0 END) AS non_commander
+        FROM user_learning_events
+        """
+    ).fetchone()
+
+    print(
+        "\nTOTALS "
+        f"imported={imported} "
+        f"stored_total={totals[0] or 0} "
+        f"trainable={totals[1] or 0} "
+        f"partial={totals[2] or 0} "
+        f"non_commander={totals[3] or 0}"
+    )
+    print(f"{JOB_METRICS_MARKER} {json.dumps(metrics, sort_keys=True)}")
+    sqlite.close()
+    cur.close()
+    conn.close()
+    return 0
+
+
+def _pending_event_count(cur):
+    cur.execute(
+        "SELECT COUNT(*) AS pending FROM deck_learning_events WHERE synced_to_hermes = FALSE"
+    )
+    row = cur.fetchone() or {}
+    return int(row.get("pending") or 0)
+
+
+def _fetch_event_page(cur, watermark, limit):
+    """Proxima pagina de eventos nao sincronizados apos o watermark."""
+    after_clause = ""
+    params = [limit]
+    if watermark is not None:
+        after_clause = "AND (created_at, id) > (%s, %s)"
+        params = [watermark[0], watermark[1], limit]
+    cur.execute(
+        f"""
+        SELECT id, deck_id, commander_name, format, card_count, source,
+               event_data, created_at
+        FROM deck_learning_events
+        WHERE synced_to_hermes = FALSE
+          {after_clause}
+        ORDER BY created_at ASC, id ASC
+        LIMIT %s
+        """,
+        params,
+    )
+    return cur.fetchall()
+
+
+def _mark_events_synced(cur, event_ids):
+    """Marca como sincronizado no PG."""
+    placeholders = ",".join(["%s"] * len(event_ids))
+    cur.execute(
+        f"UPDATE deck_learning_events SET synced_to_hermes = TRUE, synced_at = NOW() WHERE id IN ({placeholders})",
+        tuple(str(event_id) for event_id in event_ids),
+    )
+
+
+def _apply_event_page(sqlite, events):
+    """Grava uma pagina de eventos (e seus comandantes) numa transacao."""
+    imported_at = datetime.now(timezone.utc).isoformat()
+    rows = []
+    commanders = []
+    statuses = {}
     for ev in events:
-        ev_id = ev["id"]
         commander = (ev["commander_name"] or "").strip()
         fmt = ev["format"]
         card_count = ev["card_count"]
-        source = ev["source"] or "user_created"
-        event_data = ev["event_data"] or {}
         created_at = ev["created_at"]
-
         classification = _classify_learning_event(fmt, card_count, commander)
-
-        print(
-            "  event="
-            f"{ev_id} commander={commander} format={fmt} cards={card_count} "
-            f"status={classification['learning_status']}"
-        )
+        status = classification["learning_status"]
+        statuses[status] = statuses.get(status, 0) + 1
 
         # Importa commander se tiver nome
-        if commander and fmt.lower() == "commander":
-            _import_commander(sqlite, commander)
+        if commander and (fmt or "").lower() == "commander":
+            commanders.append(commander)
+
+        rows.append(
+            (
+                str(ev["id"]),
+                str(ev["deck_id"]),
+                commander,
+                fmt,
+                card_count,
+                ev["source"] or "user_created",
+                json.dumps(_sanitize_event_data(ev["event_data"] or {})),
+                created_at.isoformat() if created_at else None,
+                imported_at,
+                1 if classification["training_eligible"] else 0,
+                status,
+                classification["learning_reason"],
+            )
+        )
 
-        # Loga evento no SQLite
-        sqlite.execute(
+    with sqlite:
+        _import_commanders(sqlite, commanders)
+        # Loga eventos no SQLite
+        sqlite.executemany(
             """INSERT OR REPLACE INTO user_learning_events
                (
                  event_id,
@@ -148,57 +263,9 @@ def main():
                  learning_reason
                )
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                str(ev_id),
-                str(ev["deck_id"]),
-                commander,
-                fmt,
-                card_count,
-                source,
-                json.dumps(_sanitize_event_data(event_data)),
-                created_at.isoformat() if created_at else None,
-                datetime.now(timezone.utc).isoformat(),
-                1 if classification["training_eligible"] else 0,
-                classification["learning_status"],
-                classification["learning_reason"],
-            ),
+            rows,
         )
-
-        imported += 1
-
-    sqlite.commit()
-
-    # Marca como sincronizado no PG
-    event_ids = [str(e["id"]) for e in events]
-    placeholders = ",".join(["%s"] * len(event_ids))
-    cur.execute(
-        f"UPDATE deck_learning_events SET synced_to_hermes = TRUE, synced_at = NOW() WHERE id IN ({placeholders})",
-        tuple(event_ids),
-    )
-
-    totals = sqlite.execute(
-        """
-        SELECT
-          COUNT(*) AS imported_total,
-          SUM(CASE WHEN training_eligible = 1 THEN 1 ELSE 0 END) AS trainable,
-          SUM(CASE WHEN learning_status = 'partial_telemetry' THEN 1 ELSE 0 END) AS partial,
-          SUM(CASE WHEN learning_status = 'non_commander_telemetry' THEN 1 ELSE 0 END) AS non_commander
-        FROM user_learning_events
-        """
-    ).fetchone()
-
-    print(
-        "\nTOTALS "
-        f"imported={imported} "
-        f"stored_total={totals[0] or 0} "
-        f"trainable={totals[1] or 0} "
-        f"partial={totals[2] or 0} "
-        f"non_commander={totals[3] or 0}"
-    )
-    sqlite.close()
-    cur.close()
-    conn.close()
-    return 0
+    return statuses
 
 
 def _ensure_tables(sqlite):
@@ -293,54 +360,80 @@ def _classify_learning_event(fmt, card_count, commander):
 
 
 def _backfill_learning_classification(sqlite):
-    rows = sqlite.execute(
-        """
-        SELECT event_id, format, card_count, commander
-        FROM user_learning_events
-        WHERE learning_status IS NULL
-           OR learning_status = ''
-           OR learning_status = 'unknown'
+    """Reclassifica, numa unica UPDATE, eventos sem learning_status.
+
+    Espelha _classify_learning_event em SQL.
+    """
+    sqlite.execute(
         """
-    ).fetchall()
-    for event_id, fmt, card_count, commander in rows:
-        classification = _classify_learning_event(fmt, card_count, commander)
-        sqlite.execute(
-            """
-            UPDATE user_learning_events
-            SET training_eligible = ?,
-                learning_status = ?,
-                learning_reason = ?
-            WHERE event_id = ?
-            """,
-            (
-                1 if classification["training_eligible"] else 0,
-                classification["learning_status"],
-                classification["learning_reason"],
+        WITH pending AS (
+            SELECT
                 event_id,
-            ),
+                lower(trim(COALESCE(format, ''), ' \t\r\n')) AS fmt,
+                trim(COALESCE(commander, ''), ' \t\r\n') AS commander_name,
+                CAST(COALESCE(card_count, 0) AS INTEGER) AS count
+            FROM user_learning_events
+            WHERE learning_status IS NULL
+               OR learning_status = ''
+               OR learning_status = 'unknown'
+        ),
+        classified AS (
+            SELECT
+                event_id,
+                CASE
+                    WHEN fmt != 'commander' THEN 'non_commander_telemetry'
+                    WHEN commander_name = '' THEN 'partial_telemetry'
+                    WHEN count < :min_count THEN 'partial_telemetry'
+                    ELSE 'trainable_commander_deck'
+                END AS status,
+                CASE
+                    WHEN fmt != 'commander'
+                        THEN 'format=' || CASE WHEN fmt = '' THEN 'unknown' ELSE fmt END
+                    WHEN commander_name = '' THEN 'missing_commander'
+                    WHEN count < :min_count
+                        THEN 'card_count=' || count || '<min=' || :min_count
+                    ELSE 'card_count=' || count || '>=min=' || :min_count
+                END AS reason
+            FROM pending
         )
+        UPDATE user_learning_events
+        SET training_eligible = CASE
+                WHEN classified.status = 'trainable_commander_deck' THEN 1
+                ELSE 0
+            END,
+            learning_status = classified.status,
+            learning_reason = classified.reason
+        FROM classified
+        WHERE user_learning_events.event_id = classified.event_id
+        """,
+        {"min_count": MIN_TRAINING_CARD_COUNT},
+    )
 
 
-def _import_commander(sqlite, name):
-    """Registra comandante no catalogo se ainda nao existe."""
-    existing = sqlite.execute(
-        "SELECT id FROM commanders WHERE LOWER(name) = LOWER(?)", (name,)
-    ).fetchone()
-    if existing:
+def _import_commanders(sqlite, names):
+    """Registra no catalogo os comandantes que ainda nao existem."""
+    unique = {}
+    for name in names:
+        unique.setdefault(name.lower(), name)
+    if not unique:
         return
+    now = datetime.now(timezone.utc).isoformat()
     color_identity = ""  # Poderia deduzir do event_data, mas deixamos simplificado
-    sqlite.execute(
+    sqlite.executemany(
         """INSERT INTO commanders (name, color_identity, first_analyzed, last_analyzed, deck_count, insight_count)
-           VALUES (?, ?, ?, ?, 1, 0)""",
-        (
-            name,
-            color_identity,
-            datetime.now(timezone.utc).isoformat(),
-            datetime.now(timezone.utc).isoformat(),
-        ),
+           SELECT ?, ?, ?, ?, 1, 0
+           WHERE NOT EXISTS (
+             SELECT 1 FROM commanders WHERE LOWER(name) = LOWER(?)
+           )""",
+        [(name, color_identity, now, now, name) for name in unique.values()],
     )
 
 
+def _import_commander(sqlite, name):
+    """Registra comandante no catalogo se ainda nao existe."""
+    _import_commanders(sqlite, [name])
+
+
 def _sanitize_event_data(data):
     """Remove campos grandes/desnecessarios para reduzir armazenamento."""
     if isinstance(data, dict):
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Indexed local store for Scryfall bulk card files.
+
+A downloaded bulk file (oracle-cards, default-cards, ...) is streamed once
+into a SQLite file keyed by normalized card/face name, oracle id, printing id
+and oracle/set/collector. Planners, backfills and benchmarks then do indexed
+lookups instead of re-parsing hundreds of MB of JSON on every run. The store
+is rebuilt only when the bulk `updated_at` (or, without metadata, the file
+size and mtime) changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+
+SCHEMA_VERSION = "manaloom_scryfall_bulk_store_v1"
+CACHE_DIR_ENV = "MANALOOM_SCRYFALL_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "manaloom" / "scryfall"
+READ_CHUNK_CHARS = 1024 * 1024
+INSERT_BATCH_ROWS = 2000
+
+
+def normalize_name(value: Any) -> str:
+    return " ".join(str(value or "").strip().lower().split())
+
+
+def normalized_uuid(value: Any) -> str | None:
+    candidate = str(value or "").strip().lower()
+    try:
+        parsed = uuid.UUID(candidate)
+    except (ValueError, AttributeError):
+        return None
+    normalized = str(parsed)
+    return normalized if normalized == candidate else None
+
+
+def normalized_text(value: Any) -> str | None:
+    normalized = str(value or "").strip().lower()
+    return normalized or None
+
+
+def direct_normal_image(card: dict[str, Any]) -> str | None:
+    """The card's own cards.scryfall.io normal image, when it has one."""
+
+    printing_id = normalized_uuid(card.get("id"))
+    oracle_id = normalized_uuid(card.get("oracle_id"))
+    if printing_id is None or oracle_id is None:
+        return None
+
+    candidates: list[Any] = []
+    image_uris = card.get("image_uris")
+    if isinstance(image_uris, dict):
+        candidates.append(image_uris.get("normal"))
+    faces = card.get("card_faces")
+    if isinstance(faces, list):
+        for face in faces:
+            if isinstance(face, dict) and isinstance(face.get("image_uris"), dict):
+                candidates.append(face["image_uris"].get("normal"))
+
+    for raw in candidates:
+        value = str(raw or "").strip()
+        parsed = urlparse(value)
+        if (
+            parsed.scheme == "https"
+            and parsed.hostname == "cards.scryfall.io"
+            and parsed.path.startswith("/normal/")
+            and parsed.path.lower().endswith(f"/{printing_id}.jpg")
+        ):
+            return value
+    return None
+
+
+def _open_text(path: Path):
+    with path.open("rb") as raw:
+        prefix = raw.read(2)
+    if prefix == b"\x1f\x8b":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def iter_bulk_cards(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream card objects from a (possibly gzipped) top-level JSON list."""
+
+    decoder = json.JSONDecoder()
+    with _open_text(path) as source:
+        buffer = ""
+        offset = 0
+        started = False
+        reached_eof = False
+
+        while True:
+            if not reached_eof:
+                chunk = source.read(READ_CHUNK_CHARS)
+                reached_eof = not chunk
+                buffer += chunk
+
+            while True:
+                while offset < len(buffer) and buffer[offset].isspace():
+                    offset += 1
+                if not started:
+                    if offset >= len(buffer):
+                        break
+                    if buffer[offset] != "[":
+                        raise RuntimeError(
+                            "Scryfall bulk JSON must be a top-level list."
+                        )
+                    started = True
+                    offset += 1
+                    continue
+
+                while offset < len(buffer) and (
+                    buffer[offset].isspace() or buffer[offset] == ","
+                ):
+                    offset += 1
+                if offset >= len(buffer):
+                    break
+                if buffer[offset] == "]":
+                    return
+
+                try:
+                    value, next_offset = decoder.raw_decode(buffer, offset)
+                except json.JSONDecodeError:
+                    if reached_eof:
+                        raise RuntimeError("Scryfall bulk JSON ended mid-object.")
+                    break
+                offset = next_offset
+                if isinstance(value, dict):
+                    yield value
+
+            if offset:
+                buffer = buffer[offset:]
+                offset = 0
+            if reached_eof:
+                raise RuntimeError("Scryfall bulk JSON has no closing array.")
+
+
+def cache_dir(path: Path | None = None) -> Path:
+    if path is not None:
+        return path
+    return Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+
+
+def store_path_for(bulk_path: Path, *, cache_dir_path: Path | None = None) -> Path:
+    """Store location for a bulk file, stable per resolved path."""
+
+    resolved = str(bulk_path.expanduser().resolve())
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:12]
+    name = bulk_path.name.split(".", 1)[0] or "bulk"
+    return cache_dir(cache_dir_path) / f"{name}-{digest}.sqlite3"
+
+
+def bulk_fingerprint(bulk_path: Path, updated_at: str | None = None) -> str:
+    if updated_at:
+        return f"updated_at:{updated_at}"
+    stat = bulk_path.stat()
+    return f"stat:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def stored_fingerprint(store_path: Path) -> str | None:
+    if not store_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{store_path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        rows = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    if rows.get("schema_version") != SCHEMA_VERSION:
+        return None
+    return rows.get("fingerprint")
+
+
+def _card_row(card: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        normalized_uuid(card.get("id")),
+        normalized_uuid(card.get("oracle_id")),
+        normalized_text(card.get("set")),
+        normalized_text(card.get("collector_number")),
+        direct_normal_image(card),
+        json.dumps(card, ensure_ascii=False, separators=(",", ":")),
+    )
+
+
+def _name_keys(card: dict[str, Any]) -> list[str]:
+    keys = [normalize_name(card.get("name"))]
+    faces = card.get("card_faces")
+    if isinstance(faces, list):
+        keys.extend(
+            normalize_name(face.get("name")) for face in faces if isinstance(face, dict)
+        )
+    return [key for key in dict.fromkeys(keys) if key]
+
+
+def build_bulk_store(bulk_path: Path, store_path: Path, fingerprint: str) -> int:
+    """Convert ``bulk_path`` into a fresh store, replacing ``store_path`` atomically."""
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = store_path.with_name(f"{store_path.name}.{os.getpid()}.tmp")
+    temporary.unlink(missing_ok=True)
+    conn = sqlite3.connect(temporary)
+    try:
+        conn.executescript(
+            """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE cards (
+              card_rowid INTEGER PRIMARY KEY,
+              printing_id TEXT,
+              oracle_id TEXT,
+              set_code TEXT,
+              collector_number TEXT,
+              normal_image TEXT,
+              payload TEXT NOT NULL
+            );
+            CREATE TABLE names (name_key TEXT PRIMARY KEY, card_rowid INTEGER NOT NULL);
+            """
+        )
+        count = 0
+        cards: list[tuple[Any, ...]] = []
+        names: list[tuple[str, int]] = []
+        for card in iter_bulk_cards(bulk_path):
+            count += 1
+            cards.append((count, *_card_row(card)))
+            names.extend((key, count) for key in _name_keys(card))
+            if len(cards) >= INSERT_BATCH_ROWS:
+                _flush(conn, cards, names)
+        _flush(conn, cards, names)
+        conn.executescript(
+            """
+            CREATE INDEX cards_printing ON cards (printing_id);
+            CREATE INDEX cards_oracle_set_collector
+              ON cards (oracle_id, set_code, collector_number);
+            """
+        )
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", SCHEMA_VERSION),
+                ("fingerprint", fingerprint),
+                ("source_path", str(bulk_path)),
+                ("card_count", str(count)),
+            ],
+        )
+        conn.commit()
+    except BaseException:
+        conn.close()
+        temporary.unlink(missing_ok=True)
+        raise
+    conn.close()
+    temporary.replace(store_path)
+    return count
+
+
+def _flush(
+    conn: sqlite3.Connection,
+    cards: list[tuple[Any, ...]],
+    names: list[tuple[str, int]],
+) -> None:
+    conn.executemany("INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?)", cards)
+    # First card wins a shared name, as the in-memory setdefault indexes did.
+    conn.executemany("INSERT OR IGNORE INTO names VALUES (?, ?)", names)
+    cards.clear()
+    names.clear()
+
+
+class BulkCardStore:
+    """Read-only indexed lookups over one converted bulk file."""
+
+    def __init__(self, path: Path, *, source: str) -> None:
+        self.path = path
+        self.source = source
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def __enter__(self) -> "BulkCardStore":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return int(self._meta.get("card_count") or 0)
+
+    def by_name(self, name: str) -> dict[str, Any] | None:
+        """Card whose name or face name normalizes to ``name``."""
+
+        row = self._conn.execute(
+            "SELECT cards.payload FROM names JOIN cards USING (card_rowid) WHERE names.name_key = ?",
+            (normalize_name(name),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def by_printing_id(self, printing_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT payload FROM cards WHERE printing_id = ? ORDER BY card_rowid DESC LIMIT 1",
+            (normalized_uuid(printing_id),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def by_oracle_id(self, oracle_id: str) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT payload FROM cards WHERE oracle_id = ? ORDER BY card_rowid",
+            (normalized_uuid(oracle_id),),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def query(self, sql: str, parameters: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read-only query against the ``cards``/``names`` tables."""
+
+        return self._conn.execute(sql, parameters).fetchall()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "store_path": str(self.path),
+            "source": self.source,
+            "fingerprint": self._meta.get("fingerprint"),
+            "card_count": len(self),
+        }
+
+
+def open_bulk_store(
+    bulk_path: Path,
+    *,
+    store_path: Path | None = None,
+    updated_at: str | None = None,
+    cache_dir_path: Path | None = None,
+) -> BulkCardStore:
+    """Open the store for ``bulk_path``, converting it first when stale."""
+
+    if store_path is None:
+        store_path = store_path_for(bulk_path, cache_dir_path=cache_dir_path)
+    fingerprint = bulk_fingerprint(bulk_path, updated_at)
+    if stored_fingerprint(store_path) == fingerprint:
+        return BulkCardStore(store_path, source="cache")
+    build_bulk_store(bulk_path, store_path, fingerprint)
+    return BulkCardStore(store_path, source="built")
+
+
+def store_is_current(store_path: Path, updated_at: str | None) -> bool:
+    """Whether ``store_path`` already holds the bulk file published at ``updated_at``.
+
+    Lets callers skip downloading a bulk file they have already converted.
+    """
+
+    return bool(updated_at) and stored_fingerprint(store_path) == f"updated_at:{updated_at}"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bulk-json", type=Path, required=True)
+    parser.add_argument("--updated-at", help="Bulk metadata updated_at; defaults to file size/mtime.")
+    parser.add_argument("--cache-dir", type=Path)
+    parser.add_argument("--store-path", type=Path)
+    parser.add_argument("--name", action="append", default=[], help="Look up a card name after conversion.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    with open_bulk_store(
+        args.bulk_json,
+        store_path=args.store_path,
+        updated_at=args.updated_at,
+        cache_dir_path=args.cache_dir,
+    ) as store:
+        output: dict[str, Any] = store.summary()
+        if args.name:
+            output["lookups"] = {
+                name: (card or {}).get("oracle_id")
+                for name in args.name
+                for card in [store.by_name(name)]
+            }
+    print(json.dumps(output, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -448,7 +448,7 @@ Future<File> _downloadAtomicCards({required bool force}) async {
 }
 
 Future<_FullAtomicSyncResult> _syncFullAtomicFast(File atomicFile) async {
-  print('🚀 Full sync rapido via psycopg2/execute_values...');
+  print('🚀 Full sync rapido via psycopg2/COPY + merge...');
   final pythonExecutable = Platform.isWindows ? 'python' : 'python3';
   final result = await Process.run(
     pythonExecutable,
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Fast full MTGJSON cards/legalities sync.
 
-The Dart sync keeps network/version orchestration. This helper performs the
-heavy PostgreSQL merge with psycopg2 `execute_values`, which is much safer for
-large AtomicCards loads than thousands of single-row prepared statement calls.
+The Dart sync keeps network/version orchestration. This helper streams
+AtomicCards one card entry at a time, `COPY`s card and legality rows into
+temporary staging tables while reading, and finishes with one set-based
+`INSERT ... ON CONFLICT` merge per table, so a full sync runs in bounded
+memory instead of materializing the whole file and every row first.
 
 It writes only operational progress to stderr and emits a single JSON object to
 stdout for the Dart caller.
@@ -16,19 +18,52 @@ import json
 import math
 import os
 import sys
+import tempfile
+import time
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
 from urllib.parse import quote, urlparse
 
 import psycopg2
-import psycopg2.extras
+
+try:
+    import resource
+except ImportError:  # Windows dev machines
+    resource = None
+
+
+READ_CHUNK_CHARS = 1 << 20
+CARD_COLUMNS = (
+    "scryfall_id",
+    "oracle_id",
+    "name",
+    "mana_cost",
+    "type_line",
+    "oracle_text",
+    "colors",
+    "color_identity",
+    "power",
+    "toughness",
+    "keywords",
+    "image_url",
+    "set_code",
+    "rarity",
+    "cmc",
+    "is_reserved",
+)
+LEGALITY_COLUMNS = ("oracle_id", "format", "status")
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fast full cards sync.")
     parser.add_argument("--atomic-cards", required=True)
-    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Rows between staging progress lines.",
+    )
     return parser.parse_args()
 
 
@@ -171,61 +206,229 @@ def normalized_cmc(value: Any) -> float | None:
     return cmc
 
 
-def parse_atomic_cards(path: Path) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
-    decoded = json.loads(path.read_text(encoding="utf-8"))
-    cards_map = decoded.get("data")
-    if not isinstance(cards_map, dict):
+class _JsonStream:
+    """Minimal pull reader for the top-level structure of a large JSON file."""
+
+    def __init__(self, handle: TextIO, chunk_chars: int) -> None:
+        self._handle = handle
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        chunk = self._handle.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def consume_if(self, char: str) -> bool:
+        if self.peek() != char:
+            return False
+        self._pos += 1
+        return True
+
+    def expect(self, char: str) -> None:
+        if not self.consume_if(char):
+            raise RuntimeError(f"AtomicCards.json: expected {char!r}, found {self.peek()!r}.")
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._eof or not self._fill():
+                    raise RuntimeError("AtomicCards.json is not valid JSON.") from exc
+                continue
+            # A bare number could continue in the next chunk.
+            if end >= len(self._buffer) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_atomic_cards(
+    path: Path, *, chunk_chars: int = READ_CHUNK_CHARS
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(card_name, printings)`` from AtomicCards' data object while reading."""
+
+    found_data = False
+    with path.open("r", encoding="utf-8") as handle:
+        stream = _JsonStream(handle, chunk_chars)
+        stream.expect("{")
+        while not stream.consume_if("}"):
+            key = stream.value()
+            stream.expect(":")
+            if key != "data":
+                stream.value()
+            elif stream.peek() != "{":
+                break
+            else:
+                found_data = True
+                stream.expect("{")
+                while not stream.consume_if("}"):
+                    card_name = stream.value()
+                    stream.expect(":")
+                    yield str(card_name), stream.value()
+                    stream.consume_if(",")
+            stream.consume_if(",")
+    if not found_data:
         raise RuntimeError("AtomicCards.json does not contain a data object.")
 
+
+def atomic_card_rows(
+    card_name: str, printings: Any
+) -> tuple[tuple[Any, ...], list[tuple[str, str, str]]] | None:
+    if not isinstance(printings, list):
+        return None
+    chosen = selected_printing(card_name, printings)
+    if not chosen:
+        return None
+    identifiers = chosen.get("identifiers") or {}
+    oracle_id = str(identifiers.get("scryfallOracleId") or "").strip()
+    if not oracle_id:
+        return None
+
+    name = str(chosen.get("name") or card_name)
+    set_code = normalize_set_code(
+        (chosen.get("printings") or [None])[0]
+        if isinstance(chosen.get("printings"), list)
+        else None
+    )
+    card_row = (
+        oracle_id,
+        oracle_id,
+        name,
+        chosen.get("manaCost"),
+        chosen.get("type"),
+        chosen.get("text"),
+        list_of_strings(chosen.get("colors")),
+        list_of_strings(chosen.get("colorIdentity")),
+        str(chosen["power"]) if chosen.get("power") is not None else None,
+        str(chosen["toughness"]) if chosen.get("toughness") is not None else None,
+        list_of_strings(chosen.get("keywords")),
+        scryfall_image_url(name, chosen, set_code),
+        set_code,
+        chosen.get("rarity"),
+        normalized_cmc(chosen.get("manaValue", chosen.get("convertedManaCost"))),
+        chosen.get("isReserved") is True,
+    )
+    legality_rows: list[tuple[str, str, str]] = []
+    legalities = chosen.get("legalities")
+    if isinstance(legalities, dict):
+        legality_rows = [
+            (oracle_id, str(fmt), str(status).lower())
+            for fmt, status in legalities.items()
+        ]
+    return card_row, legality_rows
+
+
+def parse_atomic_cards(path: Path) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+    """Deduplicated rows in memory; the sync itself streams through staging."""
+
     cards_by_oracle: dict[str, tuple[Any, ...]] = {}
     legalities_by_key: dict[tuple[str, str], tuple[str, str, str]] = {}
 
-    for card_name, printings in cards_map.items():
-        if not isinstance(printings, list):
-            continue
-        chosen = selected_printing(str(card_name), printings)
-        if not chosen:
-            continue
-        identifiers = chosen.get("identifiers") or {}
-        oracle_id = str(identifiers.get("scryfallOracleId") or "").strip()
-        if not oracle_id:
+    for card_name, printings in iter_atomic_cards(path):
+        rows = atomic_card_rows(card_name, printings)
+        if rows is None:
             continue
+        card_row, legality_rows = rows
+        cards_by_oracle[card_row[0]] = card_row
+        for legality in legality_rows:
+            legalities_by_key[(legality[0], legality[1])] = legality
 
-        name = str(chosen.get("name") or card_name)
-        set_code = normalize_set_code(
-            (chosen.get("printings") or [None])[0]
-            if isinstance(chosen.get("printings"), list)
-            else None
-        )
-        cards_by_oracle[oracle_id] = (
-            oracle_id,
-            oracle_id,
-            name,
-            chosen.get("manaCost"),
-            chosen.get("type"),
-            chosen.get("text"),
-            list_of_strings(chosen.get("colors")),
-            list_of_strings(chosen.get("colorIdentity")),
-            str(chosen["power"]) if chosen.get("power") is not None else None,
-            str(chosen["toughness"]) if chosen.get("toughness") is not None else None,
-            list_of_strings(chosen.get("keywords")),
-            scryfall_image_url(name, chosen, set_code),
-            set_code,
-            chosen.get("rarity"),
-            normalized_cmc(chosen.get("manaValue", chosen.get("convertedManaCost"))),
-            chosen.get("isReserved") is True,
-        )
+    return list(cards_by_oracle.values()), list(legalities_by_key.values())
 
-        legalities = chosen.get("legalities")
-        if isinstance(legalities, dict):
-            for fmt, status in legalities.items():
-                legalities_by_key[(oracle_id, str(fmt))] = (
-                    oracle_id,
-                    str(fmt),
-                    str(status).lower(),
-                )
 
-    return list(cards_by_oracle.values()), list(legalities_by_key.values())
+def _copy_escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_text_value(value: Any) -> str:
+    """One field in PostgreSQL COPY text format."""
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, list):
+        items = (
+            '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in value
+        )
+        return _copy_escape("{" + ",".join(items) + "}")
+    return _copy_escape(str(value))
+
+
+def copy_line(row: tuple[Any, ...]) -> str:
+    return "\t".join(copy_text_value(value) for value in row) + "\n"
+
+
+class CopyLineReader:
+    """File-like ``read`` over generated COPY lines for ``copy_expert``."""
+
+    def __init__(self, lines: Iterator[str]) -> None:
+        self._lines = lines
+        self._pending = ""
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._pending]
+        length = len(self._pending)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            parts.append(line)
+            length += len(line)
+        data = "".join(parts)
+        if size < 0:
+            self._pending = ""
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+
+class StagingProgress:
+    def __init__(self, every: int) -> None:
+        self.every = max(1, every)
+        self.cards = 0
+        self.legalities = 0
+
+    def card_lines(
+        self, path: Path, legality_spool: TextIO
+    ) -> Iterator[str]:
+        """COPY lines for cards; legality lines are spooled for the second COPY."""
+
+        for card_name, printings in iter_atomic_cards(path):
+            rows = atomic_card_rows(card_name, printings)
+            if rows is None:
+                continue
+            card_row, legality_rows = rows
+            for legality in legality_rows:
+                legality_spool.write(copy_line(legality))
+            self.legalities += len(legality_rows)
+            self.cards += 1
+            if self.cards % self.every == 0:
+                print(f"cards staged {self.cards}", file=sys.stderr, flush=True)
+            yield copy_line(card_row)
 
 
 def ensure_schema(conn) -> None:
@@ -246,112 +449,145 @@ def ensure_schema(conn) -> None:
     conn.commit()
 
 
-def upsert_cards(conn, rows: list[tuple[Any, ...]], batch_size: int) -> int:
-    total = 0
+def create_staging_tables(conn) -> None:
+    # Temporary tables are never WAL-logged and vanish with the transaction.
     with conn.cursor() as cur:
-        for index in range(0, len(rows), batch_size):
-            batch = rows[index : index + batch_size]
-            psycopg2.extras.execute_values(
-                cur,
-                """
-                INSERT INTO cards (
-                  scryfall_id, oracle_id, name, mana_cost, type_line, oracle_text,
-                  colors, color_identity, power, toughness, keywords,
-                  image_url, set_code, rarity, cmc, is_reserved
-                ) VALUES %s
-                ON CONFLICT (scryfall_id) DO UPDATE SET
-                  oracle_id = EXCLUDED.oracle_id,
-                  name = EXCLUDED.name,
-                  mana_cost = EXCLUDED.mana_cost,
-                  type_line = EXCLUDED.type_line,
-                  oracle_text = EXCLUDED.oracle_text,
-                  colors = EXCLUDED.colors,
-                  color_identity = EXCLUDED.color_identity,
-                  power = EXCLUDED.power,
-                  toughness = EXCLUDED.toughness,
-                  keywords = EXCLUDED.keywords,
-                  image_url = CASE
-                    WHEN EXCLUDED.image_url LIKE 'https://cards.scryfall.io/%'
-                      THEN EXCLUDED.image_url
-                    WHEN cards.image_url LIKE 'https://cards.scryfall.io/%'
-                      THEN cards.image_url
-                    ELSE EXCLUDED.image_url
-                  END,
-                  set_code = EXCLUDED.set_code,
-                  rarity = EXCLUDED.rarity,
-                  cmc = EXCLUDED.cmc,
-                  is_reserved = COALESCE(EXCLUDED.is_reserved, cards.is_reserved)
-                """,
-                batch,
-                template=(
-                    "(%s::uuid, %s::uuid, %s::text, %s::text, %s::text, %s::text, "
-                    "%s::text[], %s::text[], %s::text, %s::text, %s::text[], "
-                    "%s::text, %s::text, %s::text, %s::numeric, %s::boolean)"
-                ),
-                page_size=len(batch),
-            )
-            total += len(batch)
-            print(f"cards {total}/{len(rows)}", file=sys.stderr, flush=True)
-    return total
+        cur.execute(
+            """
+            CREATE TEMP TABLE staging_atomic_cards (
+              seq BIGSERIAL,
+              scryfall_id UUID,
+              oracle_id UUID,
+              name TEXT,
+              mana_cost TEXT,
+              type_line TEXT,
+              oracle_text TEXT,
+              colors TEXT[],
+              color_identity TEXT[],
+              power TEXT,
+              toughness TEXT,
+              keywords TEXT[],
+              image_url TEXT,
+              set_code TEXT,
+              rarity TEXT,
+              cmc NUMERIC,
+              is_reserved BOOLEAN
+            ) ON COMMIT DROP
+            """
+        )
+        cur.execute(
+            """
+            CREATE TEMP TABLE staging_atomic_legalities (
+              seq BIGSERIAL,
+              oracle_id UUID,
+              format TEXT,
+              status TEXT
+            ) ON COMMIT DROP
+            """
+        )
+
+
+def stage_atomic_cards(conn, path: Path, progress: StagingProgress) -> None:
+    with conn.cursor() as cur, tempfile.TemporaryFile(
+        "w+", encoding="utf-8"
+    ) as legality_spool:
+        cur.copy_expert(
+            f"COPY staging_atomic_cards ({', '.join(CARD_COLUMNS)}) FROM STDIN",
+            CopyLineReader(progress.card_lines(path, legality_spool)),
+        )
+        legality_spool.seek(0)
+        cur.copy_expert(
+            f"COPY staging_atomic_legalities ({', '.join(LEGALITY_COLUMNS)}) FROM STDIN",
+            legality_spool,
+        )
+    print(
+        f"staged cards={progress.cards} legalities={progress.legalities}",
+        file=sys.stderr,
+        flush=True,
+    )
 
 
-def load_card_ids(conn) -> dict[str, str]:
+def merge_cards(conn) -> int:
+    # The last entry per oracle id wins, as in the in-memory parser.
     with conn.cursor() as cur:
-        cur.execute("SELECT scryfall_id::text, id::text FROM cards")
-        return {row[0]: row[1] for row in cur.fetchall()}
-
-
-def upsert_legalities(
-    conn,
-    rows: list[tuple[str, str, str]],
-    card_ids: dict[str, str],
-    batch_size: int,
-) -> int:
-    resolved = [
-        (card_ids[oracle_id], fmt, status)
-        for oracle_id, fmt, status in rows
-        if oracle_id in card_ids
-    ]
-
-    total = 0
+        cur.execute(
+            f"""
+            INSERT INTO cards ({', '.join(CARD_COLUMNS)})
+            SELECT DISTINCT ON (scryfall_id) {', '.join(CARD_COLUMNS)}
+            FROM staging_atomic_cards
+            ORDER BY scryfall_id, seq DESC
+            ON CONFLICT (scryfall_id) DO UPDATE SET
+              oracle_id = EXCLUDED.oracle_id,
+              name = EXCLUDED.name,
+              mana_cost = EXCLUDED.mana_cost,
+              type_line = EXCLUDED.type_line,
+              oracle_text = EXCLUDED.oracle_text,
+              colors = EXCLUDED.colors,
+              color_identity = EXCLUDED.color_identity,
+              power = EXCLUDED.power,
+              toughness = EXCLUDED.toughness,
+              keywords = EXCLUDED.keywords,
+              image_url = CASE
+                WHEN EXCLUDED.image_url LIKE 'https://cards.scryfall.io/%'
+                  THEN EXCLUDED.image_url
+                WHEN cards.image_url LIKE 'https://cards.scryfall.io/%'
+                  THEN cards.image_url
+                ELSE EXCLUDED.image_url
+              END,
+              set_code = EXCLUDED.set_code,
+              rarity = EXCLUDED.rarity,
+              cmc = EXCLUDED.cmc,
+              is_reserved = COALESCE(EXCLUDED.is_reserved, cards.is_reserved)
+            """
+        )
+        total = cur.rowcount
+    print(f"cards merged {total}", file=sys.stderr, flush=True)
+    return total
+
+
+def merge_legalities(conn) -> int:
     with conn.cursor() as cur:
-        for index in range(0, len(resolved), batch_size):
-            batch = resolved[index : index + batch_size]
-            psycopg2.extras.execute_values(
-                cur,
-                """
-                INSERT INTO card_legalities (card_id, format, status)
-                VALUES %s
-                ON CONFLICT (card_id, format) DO UPDATE SET
-                  status = EXCLUDED.status
-                """,
-                batch,
-                template="(%s::uuid, %s::text, %s::text)",
-                page_size=len(batch),
-            )
-            total += len(batch)
-            print(f"legalities {total}/{len(resolved)}", file=sys.stderr, flush=True)
+        cur.execute(
+            """
+            INSERT INTO card_legalities (card_id, format, status)
+            SELECT DISTINCT ON (cards.id, staged.format)
+              cards.id, staged.format, staged.status
+            FROM staging_atomic_legalities AS staged
+            JOIN cards ON cards.scryfall_id = staged.oracle_id
+            ORDER BY cards.id, staged.format, staged.seq DESC
+            ON CONFLICT (card_id, format) DO UPDATE SET
+              status = EXCLUDED.status
+            """
+        )
+        total = cur.rowcount
+    print(f"legalities merged {total}", file=sys.stderr, flush=True)
     return total
 
 
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
 def main() -> None:
     args = parse_args()
     atomic_cards = Path(args.atomic_cards)
     if not atomic_cards.exists():
         raise SystemExit(f"AtomicCards.json not found: {atomic_cards}")
 
-    card_rows, legality_rows = parse_atomic_cards(atomic_cards)
+    started = time.monotonic()
+    progress = StagingProgress(args.batch_size)
     conn = connect()
     try:
         ensure_schema(conn)
-        processed_cards = upsert_cards(conn, card_rows, args.batch_size)
-        card_ids = load_card_ids(conn)
-        processed_legalities = upsert_legalities(
-            conn,
-            legality_rows,
-            card_ids,
-            args.batch_size,
-        )
+        create_staging_tables(conn)
+        stage_atomic_cards(conn, atomic_cards, progress)
+        processed_cards = merge_cards(conn)
+        processed_legalities = merge_legalities(conn)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -359,11 +595,19 @@ def main() -> None:
     finally:
         conn.close()
 
+    elapsed = max(time.monotonic() - started, 1e-9)
     print(
         json.dumps(
             {
                 "processed_cards": processed_cards,
                 "processed_legalities": processed_legalities,
+                "staged_cards": progress.cards,
+                "staged_legalities": progress.legalities,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(
+                    (progress.cards + progress.legalities) / elapsed, 1
+                ),
+                "peak_rss_mb": peak_rss_mb(),
             },
             ensure_ascii=True,
         )
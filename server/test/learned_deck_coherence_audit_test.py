@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -226,6 +227,122 @@ class LearnedDeckCoherenceAuditTest(unittest.TestCase):
         self.assertIn("FROM card_intelligence_snapshot", conn.cursors[0].query)
         self.assertNotIn("card_intelligence_snapshot", conn.cursors[1].query)
 
+    def test_cached_card_lookup_refetches_only_cards_whose_hash_changed(
+        self,
+    ) -> None:
+        snapshot = {
+            "card-1": {
+                "card_id": "card-1",
+                "canonical_name": "Lightning Bolt",
+                "oracle_id": "oracle-1",
+                "oracle_text": "Lightning Bolt deals 3 damage to any target.",
+                "type_line": "Instant",
+                "cmc": 1,
+                "color_identity": ["R"],
+                "legalities": {"commander": "legal"},
+                "function_tags": ["removal"],
+                "battle_rule_count": 1,
+                "verified_battle_rule_count": 1,
+                "source_coverage": {"oracle": True},
+            }
+        }
+        aliases = [
+            {
+                "card_id": "card-1",
+                "canonical_name": "Lightning Bolt",
+                "lookup_name": "Lightning Bolt",
+                "printed_name": "Relampago",
+                "match_priority": 0,
+            },
+            {
+                "card_id": "card-2",
+                "canonical_name": "Fire // Ice",
+                "lookup_name": "Fire // Ice",
+                "printed_name": None,
+                "match_priority": 0,
+            },
+        ]
+        hashes = {"card-1": "h1", "card-2": "h2"}
+
+        class FakeCursor:
+            def __init__(self, queries):
+                self.queries = queries
+                self.rows = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_args):
+                return False
+
+            def execute(self, query, params=None):
+                card_ids = None if params is None else set(params[0])
+                self.queries.append((query, card_ids))
+                if "md5(" in query:
+                    self.rows = list(hashes.items())
+                elif "FROM card_intelligence_snapshot" in query:
+                    self.rows = [
+                        row
+                        for card_id, row in snapshot.items()
+                        if card_ids is None or card_id in card_ids
+                    ]
+                else:
+                    self.rows = [
+                        row
+                        for row in aliases
+                        if card_ids is None or row["card_id"] in card_ids
+                    ]
+
+            def fetchall(self):
+                return self.rows
+
+        class FakeConnection:
+            def __init__(self):
+                self.queries = []
+
+            def cursor(self, **_kwargs):
+                return FakeCursor(self.queries)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store_path = Path(tmp) / "lookup.sqlite3"
+            first_conn = FakeConnection()
+            lookup, built = audit.load_cached_card_lookup(
+                first_conn,
+                store_path=store_path,
+            )
+            bolt = lookup[audit.normalize_name("Relampago")]
+            fire = lookup[audit.normalize_name("Fire")]
+            self.assertIs(bolt, lookup[audit.normalize_name("Lightning Bolt")])
+            lookup.close()
+
+            aliases[1]["printed_name"] = "Fuego // Hielo"
+            hashes["card-2"] = "h2b"
+            second_conn = FakeConnection()
+            lookup, refreshed = audit.load_cached_card_lookup(
+                second_conn,
+                store_path=store_path,
+            )
+            fuego = lookup.get(audit.normalize_name("Fuego"))
+            cached_bolt = lookup.get(audit.normalize_name("Lightning Bolt"))
+            lookup.close()
+
+        self.assertEqual(built["source"], "built")
+        self.assertEqual(len(first_conn.queries), 3)
+        self.assertEqual(bolt.oracle_id, "oracle-1")
+        self.assertEqual(bolt.color_identity, ["R"])
+        self.assertEqual(fire.canonical_name, "Fire // Ice")
+        self.assertEqual(fire.type_line, "")
+        self.assertEqual(refreshed["source"], "refreshed")
+        self.assertEqual(refreshed["changed_cards"], 1)
+        self.assertEqual(
+            [card_ids for _query, card_ids in second_conn.queries],
+            [None, {"card-2"}, {"card-2"}],
+        )
+        for query, _card_ids in second_conn.queries[1:]:
+            self.assertIn("card_id = ANY(%s::uuid[])", query)
+        self.assertEqual(fuego.card_id, "card-2")
+        self.assertEqual(cached_bolt.legalities, {"commander": "legal"})
+
     def test_lorehold_strategy_checks_package_minimums_and_forbidden_mox(self) -> None:
         cards = [
             "Lorehold, the Historian",
@@ -7,6 +7,7 @@ import os
 import sqlite3
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -284,6 +285,128 @@ class ManaLoomOpsDaemonTest(unittest.TestCase):
         self.assertFalse(module._matches_schedule(hourly.schedule, module.datetime(2026, 7, 15, 6, 5)))
         self.assertTrue(module._matches_schedule(nightly.schedule, module.datetime(2026, 7, 15, 6, 5)))
 
+    def test_job_metrics_line_is_kept_in_jobs_manifest(self) -> None:
+        module = _load_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "20260618_073627.log"
+            log_path.write_text(
+                "=== Pull deck_learning_events from PG ===\n"
+                "MANALOOM_JOB_METRICS not-json\n"
+                'MANALOOM_JOB_METRICS {"backlog_after": 0, "imported": 1200, "pages": 3}\n',
+                encoding="utf-8",
+            )
+            jobs_json = Path(tmp) / "jobs.json"
+            metrics = module._read_job_metrics(log_path)
+            original_jobs_json = module.JOBS_JSON
+            try:
+                module.JOBS_JSON = jobs_json
+                module._write_jobs_manifest(
+                    module.JOBS,
+                    {"pull_learning_events": {"last_status": "ok", "last_metrics": metrics}},
+                )
+                state = module._load_existing_state(module.JOBS)
+            finally:
+                module.JOBS_JSON = original_jobs_json
+
+        self.assertEqual(metrics, {"backlog_after": 0, "imported": 1200, "pages": 3})
+        self.assertEqual(state["pull_learning_events"]["last_metrics"], metrics)
+        self.assertIsNone(module._read_job_metrics(Path(tmp) / "missing.log"))
+
+    def test_scheduler_runs_by_priority_within_class_slots_and_dependencies(self) -> None:
+        module = _load_module()
+        classes = {
+            "battle": module.ResourceClass("battle", slots=1, priority=30),
+            "sync": module.ResourceClass("sync", slots=1, priority=10),
+            "report": module.ResourceClass("report", slots=2, priority=20),
+        }
+
+        def job(name: str, resource_class: str, **kwargs) -> object:
+            return module.Job(
+                name=name,
+                schedule="* * * * *",
+                lockfile=Path(f"/tmp/{name}.lock"),
+                command="true",
+                script_name=f"{name}.sh",
+                resource_class=resource_class,
+                **kwargs,
+            )
+
+        release = module.threading.Event()
+        started: list[str] = []
+        waits: dict[str, float] = {}
+        started_lock = module.threading.Lock()
+
+        def fake_run_job(job, env, state, *, queue_wait_seconds=None):
+            with started_lock:
+                started.append(job.name)
+                waits[job.name] = queue_wait_seconds
+            if job.name == "nightly_battle":
+                release.wait(5)
+
+        scheduler = module.JobScheduler(
+            {},
+            {},
+            resource_classes=classes,
+            run_job=fake_run_job,
+            lock_is_held=lambda path: path.name == "locked.lock",
+        )
+        self.assertTrue(scheduler.submit(job("nightly_battle", "battle")))
+        self.assertFalse(scheduler.submit(job("nightly_battle", "battle")))
+        self.assertTrue(scheduler.submit(job("hourly_battle", "battle")))
+        self.assertTrue(scheduler.submit(job("evidence", "battle", after=("hourly_battle",))))
+        self.assertTrue(scheduler.submit(job("pull", "sync", priority=0)))
+        self.assertFalse(scheduler.submit(job("locked", "report")))
+        self.assertTrue(self._wait_until(lambda: "pull" in started))
+        self.assertEqual(started, ["nightly_battle", "pull"])
+
+        release.set()
+        self.assertTrue(scheduler.wait_idle(timeout=5))
+        self.assertEqual(started, ["nightly_battle", "pull", "hourly_battle", "evidence"])
+        self.assertGreater(waits["hourly_battle"], waits["pull"])
+
+    def _wait_until(self, predicate, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return predicate()
+
+    def test_run_job_records_queue_wait_and_run_time_in_manifest(self) -> None:
+        module = _load_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            original = (module.JOBS_JSON, module.CRON_OUTPUT_DIR, module.REPO_ROOT)
+            try:
+                module.JOBS_JSON = Path(tmp) / "jobs.json"
+                module.CRON_OUTPUT_DIR = Path(tmp) / "output"
+                module.REPO_ROOT = Path(tmp)
+                job = module.Job(
+                    name="pull_learning_events",
+                    schedule="* * * * *",
+                    lockfile=Path(tmp) / "pull.lock",
+                    command="echo 'MANALOOM_JOB_METRICS {\"imported\": 2}'",
+                    script_name="pull_learning_events.sh",
+                    resource_class="sync",
+                    priority=0,
+                )
+                state: dict = {}
+                env = {"PATH": module.os.environ.get("PATH", ""), "HOME": tmp}
+                module._run_job(job, env, state, queue_wait_seconds=1.23456)
+                manifest = {
+                    row["name"]: row
+                    for row in json.loads(module.JOBS_JSON.read_text(encoding="utf-8"))
+                }
+            finally:
+                module.JOBS_JSON, module.CRON_OUTPUT_DIR, module.REPO_ROOT = original
+
+        row = manifest["pull_learning_events"]
+        self.assertEqual(row["last_status"], "ok")
+        self.assertEqual(row["last_queue_wait_seconds"], 1.235)
+        self.assertIsInstance(row["last_run_seconds"], float)
+        self.assertEqual(row["resource_class"], "sync")
+        self.assertEqual(row["priority"], 0)
+        self.assertEqual(row["last_metrics"], {"imported": 2})
+
 
 if __name__ == "__main__":
     unittest.main()
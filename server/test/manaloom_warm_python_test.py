@@ -0,0 +1,117 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "bin" / "manaloom_warm_python.py"
+CLIENT_PATH = SCRIPT_PATH.with_suffix(".sh")
+
+
+class ManaloomWarmPythonTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.socket_path = self.root / "warm.sock"
+        self.server = subprocess.Popen(
+            [
+                sys.executable,
+                str(SCRIPT_PATH),
+                "serve",
+                "--socket",
+                str(self.socket_path),
+                "--preload",
+                "json,missing_module_xyz",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        assert self.server.stdout is not None
+        self.ready = json.loads(self.server.stdout.readline())
+
+    def tearDown(self) -> None:
+        self.server.terminate()
+        self.server.wait(timeout=10)
+        self.server.stdout.close()
+        self.tmp.cleanup()
+
+    def _run_client(self, script: Path, *args: str, extra_env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "MANALOOM_WARM_RUNTIME_SOCKET": str(self.socket_path),
+            "MANALOOM_WARM_RUNTIME_PYTHON": sys.executable,
+            **(extra_env or {}),
+        }
+        return subprocess.run(
+            ["bash", str(CLIENT_PATH), str(script), *args],
+            cwd=self.root,
+            env=env,
+            input="from-stdin\n",
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+    def test_forkserver_runs_script_with_caller_env_cwd_stdio_and_exit_code(self) -> None:
+        script = self.root / "job.py"
+        script.write_text(
+            "import os, sys\n"
+            "print(sys.argv[1:], os.getcwd(), os.environ['JOB_FLAG'], sys.stdin.readline().strip())\n"
+            "raise SystemExit(int(sys.argv[1]))\n"
+        )
+
+        result = self._run_client(script, "3", "x", extra_env={"JOB_FLAG": "on"})
+
+        self.assertTrue(self.ready["ready"])
+        self.assertEqual(self.ready["preloaded"], ["json"])
+        self.assertIn("missing_module_xyz", self.ready["preload_failed"])
+        self.assertEqual(result.returncode, 3, result.stderr)
+        self.assertEqual(result.stdout, f"['3', 'x'] {self.root.resolve()} on from-stdin\n")
+        marker = [line for line in result.stderr.splitlines() if line.startswith("MANALOOM_WARM_RUNTIME ")]
+        self.assertEqual(len(marker), 1)
+        payload = json.loads(marker[0].split(" ", 1)[1])
+        self.assertEqual(payload["startup_saved_seconds"], self.ready["preload_seconds"])
+
+    def test_forked_job_joins_threads_and_runs_atexit_before_exit(self) -> None:
+        script = self.root / "job.py"
+        script.write_text(
+            "import atexit, logging, sys, threading, time\n"
+            "logging.basicConfig(stream=sys.stdout, format='%(message)s', level=logging.INFO)\n"
+            "def worker():\n"
+            "    time.sleep(0.2)\n"
+            "    print('thread finished', flush=True)\n"
+            "atexit.register(lambda: logging.info('atexit ran'))\n"
+            "threading.Thread(target=worker).start()\n"
+            "print('main done', flush=True)\n"
+        )
+
+        result = self._run_client(script)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "main done\nthread finished\natexit ran\n")
+
+    def test_non_script_invocations_and_missing_socket_fall_back_to_real_python(self) -> None:
+        script = self.root / "job.py"
+        script.write_text("print('cold')\n")
+        self.server.terminate()
+        self.server.wait(timeout=10)
+
+        result = self._run_client(script)
+        inline = subprocess.run(
+            ["bash", str(CLIENT_PATH), "-c", "print(6 * 7)"],
+            env={"PATH": os.environ.get("PATH", ""), "MANALOOM_WARM_RUNTIME_PYTHON": sys.executable},
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        self.assertEqual((result.returncode, result.stdout), (0, "cold\n"))
+        self.assertNotIn("MANALOOM_WARM_RUNTIME", result.stderr)
+        self.assertEqual(inline.stdout, "42\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import gzip
+import http.client
 import importlib.util
 import json
 import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from contextlib import closing
 from pathlib import Path
@@ -154,12 +158,118 @@ class NativeBattleSidecarTest(unittest.TestCase):
             "intrinsic_basic_land",
         )
 
+    def test_coverage_index_is_resident_until_the_db_generation_changes(self) -> None:
+        module = _load_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "knowledge.db"
+            _create_db(db)
+            status, health = module._runtime_health(db)
+            self.assertEqual(status, 200)
+            first_version = health["rule_index"]["version"]
+            self.assertEqual(health["rule_index"]["rule_count"], 2)
+
+            with mock.patch.object(
+                module.sqlite3, "connect", side_effect=AssertionError("DB reopened")
+            ):
+                report = module.card_coverage(
+                    {"cards": [{"name": "Aerialephant"}, {"name": "Sol Ring"}]},
+                    db_path=db,
+                )
+            self.assertEqual(report["unsupported_cards"][0]["name"], "Sol Ring")
+
+            with closing(sqlite3.connect(db)) as connection:
+                connection.execute(
+                    """
+                    INSERT INTO battle_card_rules VALUES (
+                      'sol ring', 'battle_rule_v1:sol_ring', 'Sol Ring',
+                      'active', 'executable', 'sol-hash', '{"effect":"mana"}'
+                    )
+                    """
+                )
+                connection.commit()
+            report = module.card_coverage({"cards": [{"name": "Sol Ring"}]}, db_path=db)
+            _, refreshed = module._runtime_health(db)
+
+        self.assertEqual(report["supported"], 1)
+        self.assertEqual(refreshed["verified_rule_count"], 3)
+        self.assertNotEqual(refreshed["rule_index"]["version"], first_version)
+
+    def test_unrelated_db_writes_keep_the_resident_coverage_index(self) -> None:
+        module = _load_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "knowledge.db"
+            _create_db(db)
+            first = module.coverage_index(db)
+
+            with closing(sqlite3.connect(db)) as connection:
+                connection.execute("CREATE TABLE telemetry (event TEXT)")
+                connection.executemany(
+                    "INSERT INTO telemetry VALUES (?)", [("battle",)] * 50
+                )
+                connection.commit()
+            with mock.patch.object(
+                module, "_build_coverage_index", side_effect=AssertionError("rebuilt")
+            ):
+                second = module.coverage_index(db)
+
+            with closing(sqlite3.connect(db)) as connection:
+                connection.execute(
+                    "UPDATE battle_card_rules SET oracle_hash = NULL "
+                    "WHERE normalized_name = 'aerialephant'"
+                )
+                connection.execute("DELETE FROM battle_card_rules WHERE normalized_name LIKE 'birgi%'")
+                connection.commit()
+            third = module.coverage_index(db)
+
+        self.assertIs(second, first)
+        self.assertIsNot(third, first)
+        self.assertEqual(third.rule_count, 0)
+
+    def test_in_place_updates_of_indexed_columns_rebuild_the_coverage_index(self) -> None:
+        module = _load_module()
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "knowledge.db"
+            _create_db(db)
+            with closing(sqlite3.connect(db)) as connection:
+                connection.execute(
+                    """
+                    INSERT INTO battle_card_rules VALUES (
+                      'sol ring', 'battle_rule_v1:sol_ring', 'Sol Ring',
+                      'active', 'executable', '', '{"effect":"mana"}'
+                    )
+                    """
+                )
+                connection.execute(
+                    "INSERT INTO card_oracle_cache VALUES ('wastes', 'Wastes', 'Land')"
+                )
+                connection.commit()
+            first = module.coverage_index(db)
+
+            # Backfills touch only oracle_hash / type_line, never the row count
+            # or rowid.
+            with closing(sqlite3.connect(db)) as connection:
+                connection.execute(
+                    "UPDATE battle_card_rules SET oracle_hash = 'sol-hash' "
+                    "WHERE normalized_name = 'sol ring'"
+                )
+                connection.execute(
+                    "UPDATE card_oracle_cache SET type_line = 'Basic Land' "
+                    "WHERE normalized_name = 'wastes'"
+                )
+                connection.commit()
+            second = module.coverage_index(db)
+
+        self.assertNotIn("sol ring", first.rules_by_name)
+        self.assertFalse(first.oracle_basic_land["wastes"])
+        self.assertEqual(second.rules_by_name["sol ring"], (("battle_rule_v1:sol_ring", "sol-hash"),))
+        self.assertTrue(second.oracle_basic_land["wastes"])
+
     def test_simulation_refuses_uncovered_required_rules_before_worker(self) -> None:
         module = _load_module()
         with tempfile.TemporaryDirectory() as tmp:
             db = Path(tmp) / "knowledge.db"
             _create_db(db)
-            with mock.patch.object(module.subprocess, "run") as run:
+            with mock.patch.object(module, "_run_worker") as run:
                 status, body = module._run_simulation(
                     {"required_rule_cards": [{"name": "Missing"}]},
                     db_path=db,
@@ -176,16 +286,10 @@ class NativeBattleSidecarTest(unittest.TestCase):
             "engine_contract": "native_reviewed_rules_execution",
             "winner": "Deck A",
         }
-        completed = subprocess.CompletedProcess(
-            args=["python"],
-            returncode=0,
-            stdout=json.dumps(worker_result),
-            stderr="",
-        )
         with tempfile.TemporaryDirectory() as tmp:
             db = Path(tmp) / "knowledge.db"
             _create_db(db)
-            with mock.patch.object(module.subprocess, "run", return_value=completed):
+            with mock.patch.object(module, "_run_worker", return_value=(0, worker_result)):
                 status, body = module._run_simulation(
                     {
                         "required_rule_cards": [{"name": "Aerialephant"}],
@@ -200,27 +304,86 @@ class NativeBattleSidecarTest(unittest.TestCase):
             ["battle_rule_v1:test"],
         )
 
-    def test_simulation_accepts_the_async_job_timeout_budget(self) -> None:
+    def test_worker_result_reassembles_compact_event_stream(self) -> None:
         module = _load_module()
-        completed = subprocess.CompletedProcess(
-            args=["python"],
-            returncode=0,
-            stdout=json.dumps(
-                {
-                    "status": "completed",
-                    "engine": "manaloom_native_reviewed",
-                    "engine_contract": "native_reviewed_rules_execution",
-                }
-            ),
-            stderr="",
+        stdout = "\n".join(
+            [
+                json.dumps(["e", {"event_type": "spell_cast", "card": "Sol Ring"}]),
+                json.dumps(["d", {"decision": "cast"}]),
+                json.dumps(["e", {"event_type": "turn_start"}]),
+                json.dumps(["r", {"status": "completed", "metrics": {"event_count": 2}}]),
+            ]
         )
+        result = module.worker_result(stdout)
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(
+            [row["event_type"] for row in result["events"]],
+            ["spell_cast", "turn_start"],
+        )
+        self.assertIs(result["game_log"], result["events"])
+        self.assertEqual(result["decision_trace"], [{"decision": "cast"}])
+
+        failure = module.worker_result(
+            json.dumps(["e", {"event_type": "spell_cast"}])
+            + "\n"
+            + json.dumps({"error": "native_runtime_failed", "message": "boom"})
+        )
+        self.assertEqual(failure["error"], "native_runtime_failed")
+        with self.assertRaises(json.JSONDecodeError):
+            module.worker_result(json.dumps(["e", {"event_type": "spell_cast"}]))
+
+    def test_worker_output_is_decoded_as_it_streams_under_the_run_deadline(self) -> None:
+        module = _load_module()
+        fake_worker = "\n".join(
+            [
+                "import json, sys, time",
+                "request = json.load(sys.stdin)",
+                "for turn in range(3):",
+                "    print(json.dumps(['e', {'event_type': 'turn_start', 'turn': turn}]), flush=True)",
+                "if request.get('hang'):",
+                "    time.sleep(30)",
+                "print(json.dumps(['r', {'status': 'completed', 'seed': request['seed']}]))",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            worker = Path(tmp) / "worker.py"
+            worker.write_text(fake_worker, encoding="utf-8")
+            decoded: list[str] = []
+            feed = module.WorkerResultDecoder.feed
+
+            def recording_feed(decoder, line):
+                decoded.append(line)
+                return feed(decoder, line)
+
+            with mock.patch.object(module, "WORKER", worker):
+                returncode, result = module._run_worker({"seed": 7}, env={}, timeout=10)
+                with mock.patch.object(module.WorkerResultDecoder, "feed", recording_feed):
+                    started = time.monotonic()
+                    with self.assertRaises(subprocess.TimeoutExpired):
+                        module._run_worker({"seed": 8, "hang": True}, env={}, timeout=1)
+                    elapsed = time.monotonic() - started
+
+        self.assertEqual(returncode, 0)
+        self.assertEqual(result["seed"], 7)
+        self.assertEqual([event["turn"] for event in result["events"]], [0, 1, 2])
+        # The hung worker's events were decoded before the deadline killed it.
+        self.assertEqual(len(decoded), 3)
+        self.assertLess(elapsed, 10)
+
+    def test_simulation_accepts_the_async_job_timeout_budget(self) -> None:
+        module = _load_module()
+        completed = {
+            "status": "completed",
+            "engine": "manaloom_native_reviewed",
+            "engine_contract": "native_reviewed_rules_execution",
+        }
         with tempfile.TemporaryDirectory() as tmp:
             db = Path(tmp) / "knowledge.db"
             _create_db(db)
             with mock.patch.object(
-                module.subprocess,
-                "run",
-                return_value=completed,
+                module,
+                "_run_worker",
+                return_value=(0, completed),
             ) as run:
                 status, _ = module._run_simulation(
                     {
@@ -237,5 +400,109 @@ class NativeBattleSidecarTest(unittest.TestCase):
         )
 
 
+    def test_batch_streams_ndjson_and_relaunches_after_a_timed_out_seed(self) -> None:
+        module = _load_module()
+        fake_worker = "\n".join(
+            [
+                "import json, sys, time",
+                "request = json.load(sys.stdin)",
+                "print(json.dumps({'type': 'prepared', 'deck_construction': {}}), flush=True)",
+                "for game in request['batch_games']:",
+                "    if game['seed'] == 12:",
+                "        time.sleep(30)",
+                "    if game['seed'] == 13:",
+                "        raise SystemExit(1)",
+                "    print(json.dumps({'type': 'game', 'index': game['index'],",
+                "                      'status': 'completed', 'winner': 'Deck A'}), flush=True)",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "knowledge.db"
+            _create_db(db)
+            worker = Path(tmp) / "worker.py"
+            worker.write_text(fake_worker, encoding="utf-8")
+            run_batch = module._run_simulation_batch
+            server = module.ThreadingHTTPServer(("127.0.0.1", 0), module.NativeBattleHandler)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+            try:
+                with mock.patch.object(module, "WORKER", worker), mock.patch.object(
+                    module,
+                    "_run_simulation_batch",
+                    side_effect=lambda payload: run_batch(payload, db_path=db),
+                ):
+                    connection.request(
+                        "POST",
+                        "/simulate/batch",
+                        body=json.dumps(
+                            {
+                                "required_rule_cards": [{"name": "Aerialephant"}],
+                                "seed_count": 4,
+                                "base_seed": 11,
+                                "timeout_ms": 1000,
+                            }
+                        ),
+                    )
+                    response = connection.getresponse()
+                    status = response.status
+                    content_type = response.getheader("content-type")
+                    rows = [json.loads(line) for line in response.read().splitlines()]
+            finally:
+                connection.close()
+                server.shutdown()
+                server.server_close()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(content_type, "application/x-ndjson")
+        self.assertEqual(rows[0], {"type": "started", "games": 4})
+        games = [row for row in rows if row["type"] == "game"]
+        self.assertEqual([11, 12, 13, 14], [row["seed"] for row in games])
+        self.assertEqual(
+            ["completed", "timeout", "failed", "completed"],
+            [row["status"] for row in games],
+        )
+        aggregate = rows[-1]
+        self.assertEqual(aggregate["type"], "aggregate")
+        self.assertEqual(aggregate["worker_launches"], 3)
+        self.assertEqual(aggregate["status"], "partial")
+        self.assertEqual(aggregate["native_rule_coverage"]["supported"], 1)
+
+
+    def test_http_keep_alive_accepts_gzip_request_bodies(self) -> None:
+        module = _load_module()
+        server = module.ThreadingHTTPServer(("127.0.0.1", 0), module.NativeBattleHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+        try:
+            connection.request("GET", "/missing")
+            first = connection.getresponse()
+            self.assertEqual(json.loads(first.read()), {"error": "not_found"})
+            self.assertEqual(first.getheader("accept-encoding"), "gzip")
+            self.assertTrue(first.getheader("server-timing").startswith("app;dur="))
+            socket_before = connection.sock
+
+            body = gzip.compress(json.dumps({"cards": [{"name": ""}]}).encode())
+            connection.request(
+                "POST",
+                "/cards/coverage",
+                body=body,
+                headers={"content-encoding": "gzip", "accept-encoding": "gzip"},
+            )
+            second = connection.getresponse()
+            payload = json.loads(second.read())
+            self.assertIs(connection.sock, socket_before)
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+
+        self.assertIsNotNone(socket_before)
+        self.assertEqual(second.status, 400)
+        self.assertEqual(payload["error"], "invalid_request")
+        self.assertIn("non-empty names", payload["message"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -135,5 +135,131 @@ class NativeBattleWorkerTest(unittest.TestCase):
         self.assertFalse(result["learning_contract"]["forced_access_diagnostic"])
 
 
+    def test_batch_builds_decks_once_and_isolates_game_failures(self) -> None:
+        module = _load_module()
+        commander = {"name": "Commander", "color_identity": []}
+        report = {"is_valid": True, "issues": []}
+        calls = 0
+        seen_libraries = []
+
+        def build_deck(connection, payload, deck_key):
+            nonlocal calls
+            calls += 1
+            return (
+                {"id": deck_key, "name": deck_key},
+                dict(commander),
+                [{"name": f"Card {deck_key}", "type_line": "Creature"}],
+                report,
+            )
+
+        def play_game(my_commander, my_deck, opponents, rng, game_id):
+            seen_libraries.append("tapped" in my_deck[0])
+            my_deck[0]["tapped"] = True
+            if len(seen_libraries) == 2:
+                raise RuntimeError("engine exploded")
+            return ("loss", 4, "test")
+
+        emitted = []
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "knowledge.db"
+            sqlite3.connect(db).close()
+            with (
+                mock.patch.dict(os.environ, {"MANALOOM_KNOWLEDGE_DB": str(db)}),
+                mock.patch.object(module, "_build_deck", side_effect=build_deck),
+                mock.patch.object(
+                    module.battle,
+                    "target_player_name_for_commander",
+                    return_value="Deck A",
+                ),
+                mock.patch.object(
+                    module.battle, "simulate_game_v8", side_effect=play_game
+                ),
+            ):
+                module.simulate_batch(
+                    {
+                        "deck_a": {},
+                        "deck_b": {},
+                        "batch_games": [
+                            {"index": 0, "seed": 5},
+                            {"index": 1, "seed": 6},
+                            {"index": 2, "seed": 7},
+                        ],
+                    },
+                    emitted.append,
+                )
+
+        self.assertEqual(calls, 2)
+        self.assertEqual(emitted[0]["type"], "prepared")
+        games = emitted[1:]
+        self.assertEqual([0, 1, 2], [row["index"] for row in games])
+        self.assertEqual([5, 6, 7], [row["seed"] for row in games])
+        self.assertEqual(
+            ["completed", "failed", "completed"], [row["status"] for row in games]
+        )
+        self.assertEqual(games[0]["winner_deck_id"], "deck_b")
+        self.assertEqual(games[1]["message"], "engine exploded")
+        self.assertEqual([False, False, False], seen_libraries)
+
+
+    def test_capture_stops_at_caps_and_streams_rows_to_the_sink(self) -> None:
+        module = _load_module()
+        commander = {"name": "Commander", "color_identity": []}
+        report = {"is_valid": True, "issues": []}
+        prepared = {
+            "deck_a": {"id": "deck-a", "name": "Deck A"},
+            "commander_a": dict(commander),
+            "cards_a": [],
+            "report_a": report,
+            "deck_b": {"id": "deck-b", "name": "Deck B"},
+            "commander_b": dict(commander),
+            "cards_b": [],
+            "report_b": report,
+        }
+
+        def play_game(my_commander, my_deck, opponents, rng, game_id):
+            for turn in range(250):
+                module.battle.REPLAY_EVENT_HANDLER("turn_start", {"turn": turn})
+                module.battle.DECISION_TRACE_HANDLER({"turn": turn})
+            return ("win", 3, "test")
+
+        streamed = []
+        with (
+            mock.patch.dict(
+                os.environ,
+                {
+                    "MANALOOM_NATIVE_MAX_EVENTS": "100",
+                    "MANALOOM_NATIVE_MAX_DECISIONS": "120",
+                },
+            ),
+            mock.patch.object(
+                module.battle,
+                "target_player_name_for_commander",
+                return_value="Deck A",
+            ),
+            mock.patch.object(module.battle, "simulate_game_v8", side_effect=play_game),
+            mock.patch.object(
+                module, "_native_replay_event", wraps=module._native_replay_event
+            ) as build_event,
+        ):
+            kept = module.play(prepared, {}, seed=1, started=0.0)
+            result = module.play(
+                prepared,
+                {},
+                seed=1,
+                started=0.0,
+                sink=lambda kind, row: streamed.append((kind, row["turn"])),
+            )
+
+        self.assertEqual(len(kept["events"]), 100)
+        self.assertEqual(len(kept["decision_trace"]), 120)
+        self.assertEqual(build_event.call_count, 200)
+        self.assertEqual(kept["metrics"]["events_dropped"], 150)
+        self.assertTrue(kept["metrics"]["decisions_truncated"])
+        self.assertNotIn("events", result)
+        self.assertEqual(sum(1 for kind, _ in streamed if kind == "e"), 100)
+        self.assertEqual(sum(1 for kind, _ in streamed if kind == "d"), 120)
+        self.assertEqual(result["metrics"]["decisions_dropped"], 130)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -106,5 +108,38 @@ class OracleTextBackfillPlanTest(unittest.TestCase):
         self.assertEqual(front_face["query"], "Emeria's Call")
 
 
+    def test_bulk_best_match_resolves_front_face_from_indexed_store(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_name:
+            bulk_path = Path(tmp_name) / "oracle-cards.json"
+            bulk_path.write_text(
+                json.dumps(
+                    [
+                        {
+                            "id": "print-id",
+                            "oracle_id": "oracle-id",
+                            "name": "Emeria's Call // Emeria, Shattered Skyclave",
+                            "layout": "modal_dfc",
+                            "card_faces": [
+                                {"name": "Emeria's Call", "oracle_text": "Create tokens."},
+                                {"name": "Emeria, Shattered Skyclave", "oracle_text": "{T}: Add {W}."},
+                            ],
+                        }
+                    ]
+                ),
+                encoding="utf-8",
+            )
+            with planner.bulk_cache.open_bulk_store(
+                bulk_path, cache_dir_path=Path(tmp_name) / "store"
+            ) as store:
+                match = planner.bulk_best_match(store, "1 Emeria's Call (ZNR)")
+                missing = planner.bulk_best_match(store, "Sol Ring")
+
+        self.assertIsNone(missing)
+        self.assertEqual(match["oracle_id"], "oracle-id")
+        self.assertEqual(match["lookup_mode"], "bulk_exact")
+        self.assertEqual(match["lookup_query"], "Emeria's Call")
+        self.assertTrue(match["oracle_text_present"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 import sqlite3
 import tempfile
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -114,6 +116,119 @@ class PullLearningEventsSchemaTest(unittest.TestCase):
             finally:
                 conn.close()
 
+    def test_event_page_is_applied_in_one_transaction_and_backfill_matches_classifier(
+        self,
+    ) -> None:
+        module = _load_module()
+        created_at = datetime(2026, 6, 18, tzinfo=timezone.utc)
+        events = [
+            {
+                "id": f"event-{index}",
+                "deck_id": f"deck-{index}",
+                "commander_name": commander,
+                "format": fmt,
+                "card_count": count,
+                "source": None,
+                "event_data": {"cards": list(range(300)), "nested": {"x": 1}},
+                "created_at": created_at,
+            }
+            for index, (commander, fmt, count) in enumerate(
+                [
+                    ("Talrand, Sky Summoner", "commander", 100),
+                    ("talrand, sky summoner", "Commander", 99),
+                    ("", "commander", 100),
+                    ("Atraxa, Praetors' Voice", "commander", 3),
+                    ("", "standard", 60),
+                    ("", None, None),
+                ]
+            )
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = sqlite3.connect(Path(tmp) / "knowledge.db")
+            try:
+                module._ensure_tables(conn)
+                statuses = module._apply_event_page(conn, events)
+                stored = {
+                    row[0]: (row[1], row[2], row[3])
+                    for row in conn.execute(
+                        """
+                        SELECT event_id, training_eligible, learning_status, learning_reason
+                        FROM user_learning_events
+                        """
+                    )
+                }
+                commanders = conn.execute("SELECT name FROM commanders ORDER BY id").fetchall()
+                event_data = conn.execute(
+                    "SELECT event_data FROM user_learning_events WHERE event_id = 'event-0'"
+                ).fetchone()[0]
+
+                conn.execute(
+                    "UPDATE user_learning_events SET learning_status = 'unknown', learning_reason = ''"
+                )
+                module._backfill_learning_classification(conn)
+                backfilled = {
+                    row[0]: (row[1], row[2], row[3])
+                    for row in conn.execute(
+                        """
+                        SELECT event_id, training_eligible, learning_status, learning_reason
+                        FROM user_learning_events
+                        """
+                    )
+                }
+            finally:
+                conn.close()
+
+        expected = {}
+        for event in events:
+            classification = module._classify_learning_event(
+                event["format"],
+                event["card_count"],
+                event["commander_name"],
+            )
+            expected[event["id"]] = (
+                1 if classification["training_eligible"] else 0,
+                classification["learning_status"],
+                classification["learning_reason"],
+            )
+        self.assertEqual(stored, expected)
+        self.assertEqual(backfilled, expected)
+        self.assertEqual(commanders, [("Talrand, Sky Summoner",), ("Atraxa, Praetors' Voice",)])
+        self.assertEqual(
+            statuses,
+            {
+                "trainable_commander_deck": 2,
+                "partial_telemetry": 2,
+                "non_commander_telemetry": 2,
+            },
+        )
+        self.assertEqual(len(json.loads(event_data)["cards"]), 200)
+
+    def test_event_pages_follow_the_created_at_id_keyset(self) -> None:
+        module = _load_module()
+
+        class FakeCursor:
+            def __init__(self) -> None:
+                self.calls = []
+
+            def execute(self, query, params=None):
+                self.calls.append((" ".join(query.split()), list(params or [])))
+
+            def fetchall(self):
+                return []
+
+        cursor = FakeCursor()
+        created_at = datetime(2026, 6, 18, tzinfo=timezone.utc)
+        module._fetch_event_page(cursor, None, 500)
+        module._fetch_event_page(cursor, (created_at, "event-9"), 500)
+
+        first_sql, first_params = cursor.calls[0]
+        second_sql, second_params = cursor.calls[1]
+        self.assertNotIn("(created_at, id) >", first_sql)
+        self.assertEqual(first_params, [500])
+        self.assertIn("AND (created_at, id) > (%s, %s)", second_sql)
+        self.assertIn("ORDER BY created_at ASC, id ASC LIMIT %s", second_sql)
+        self.assertEqual(second_params, [created_at, "event-9", 500])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -60,6 +60,16 @@ def test_default_bulk_index_accepts_only_matching_direct_images(
     }
     assert index.by_oracle == {ORACLE_ID: frozenset({DIRECT_URL})}
 
+    with MODULE.bulk_cache.open_bulk_store(
+        path, cache_dir_path=tmp_path / "store"
+    ) as store:
+        stored = MODULE.card_image_index_from_store(store)
+        assert stored.by_printing == index.by_printing
+        assert stored.by_oracle_set_collector == index.by_oracle_set_collector
+        assert stored.by_oracle_set == index.by_oracle_set
+        assert stored.by_oracle == index.by_oracle
+        assert stored.by_oracle.get("missing") is None
+
 
 def test_plan_updates_only_missing_or_legacy_api_urls() -> None:
     index = MODULE.CardImageIndex(
@@ -0,0 +1,99 @@
+import importlib.util
+import sqlite3
+from pathlib import Path
+import sys
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "bin" / "card_identity_lookup_store.py"
+SPEC = importlib.util.spec_from_file_location("card_identity_lookup_store", MODULE_PATH)
+assert SPEC and SPEC.loader
+MODULE = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+class FakeSource:
+    """Cards as the audit fetcher would return them, keyed by card_id."""
+
+    def __init__(self) -> None:
+        self.cards = {
+            "card-1": ("Lightning Bolt", [("lightning bolt", 0), ("bolt", 1), ("relampago", 1)]),
+            "card-2": ("Bolt Bend", [("bolt bend", 0), ("bolt", 0)]),
+        }
+        self.hashes = {"card-1": "h1", "card-2": "h2"}
+        self.fetches: list[list[str] | None] = []
+
+    def fetch(self, card_ids):
+        self.fetches.append(card_ids)
+        selected = self.cards if card_ids is None else {key: self.cards[key] for key in card_ids}
+        payloads = {
+            card_id: {"card_id": card_id, "canonical_name": name}
+            for card_id, (name, _aliases) in selected.items()
+        }
+        candidates = [
+            (alias, priority, name.lower(), card_id)
+            for card_id, (name, aliases) in selected.items()
+            for alias, priority in aliases
+        ]
+        return payloads, candidates
+
+    def load(self, store_path: Path):
+        return MODULE.load_lookup(store_path, dict(self.hashes), self.fetch, dict)
+
+
+def test_lookup_store_builds_once_then_refreshes_only_changed_cards(tmp_path: Path) -> None:
+    store_path = tmp_path / "lookup.sqlite3"
+    source = FakeSource()
+
+    lookup, built = source.load(store_path)
+    try:
+        assert built["source"] == "built"
+        assert source.fetches == [None]
+        assert lookup["bolt"]["canonical_name"] == "Bolt Bend"
+        assert lookup["relampago"] is lookup["lightning bolt"]
+        assert "missing" not in lookup
+        assert len(lookup) == 4
+    finally:
+        lookup.close()
+
+    lookup, cached = source.load(store_path)
+    lookup.close()
+    assert cached["source"] == "cache"
+    assert cached["watermark"] == built["watermark"]
+    assert source.fetches == [None]
+
+    del source.cards["card-2"], source.hashes["card-2"]
+    source.cards["card-1"] = ("Lightning Bolt", [("lightning bolt", 0), ("bolt", 1)])
+    source.cards["card-3"] = ("Chain Lightning", [("chain lightning", 0)])
+    source.hashes.update({"card-1": "h1b", "card-3": "h3"})
+    lookup, refreshed = source.load(store_path)
+    try:
+        assert refreshed["source"] == "refreshed"
+        assert (refreshed["changed_cards"], refreshed["removed_cards"]) == (2, 1)
+        assert source.fetches[-1] == ["card-1", "card-3"]
+        assert lookup["bolt"]["canonical_name"] == "Lightning Bolt"
+        assert lookup.get("relampago") is None
+        assert lookup.get("bolt bend") is None
+        assert lookup["chain lightning"]["card_id"] == "card-3"
+        assert refreshed["card_count"] == 2
+        assert refreshed["watermark"] != built["watermark"]
+    finally:
+        lookup.close()
+
+
+def test_lookup_store_rebuilds_on_schema_version_change(tmp_path: Path) -> None:
+    store_path = tmp_path / "lookup.sqlite3"
+    source = FakeSource()
+    lookup, _info = source.load(store_path)
+    lookup.close()
+
+    conn = sqlite3.connect(store_path)
+    with conn:
+        conn.execute("UPDATE meta SET value = 'old' WHERE key = 'schema_version'")
+    conn.close()
+
+    lookup, info = source.load(store_path)
+    lookup.close()
+    assert info["schema_rebuilt"] is True
+    assert info["source"] == "built"
+    assert source.fetches == [None, None]
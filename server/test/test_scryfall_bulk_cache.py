@@ -0,0 +1,76 @@
+import gzip
+import importlib.util
+import json
+import os
+from pathlib import Path
+import sys
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "bin" / "scryfall_bulk_cache.py"
+SPEC = importlib.util.spec_from_file_location("scryfall_bulk_cache", MODULE_PATH)
+assert SPEC and SPEC.loader
+MODULE = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+ORACLE_ID = "00000000-0000-4000-8000-000000000010"
+PRINTING_ID = "00000000-0000-4000-8000-000000000011"
+
+
+def oracle_cards() -> list[dict]:
+    return [
+        {
+            "id": PRINTING_ID,
+            "oracle_id": ORACLE_ID,
+            "name": "Emeria's Call // Emeria, Shattered Skyclave",
+            "card_faces": [
+                {"name": "Emeria's Call"},
+                {"name": "Emeria, Shattered Skyclave"},
+            ],
+        },
+        {
+            "id": "00000000-0000-4000-8000-000000000021",
+            "oracle_id": "00000000-0000-4000-8000-000000000020",
+            "name": "Sol Ring",
+        },
+        {
+            "id": "00000000-0000-4000-8000-000000000031",
+            "oracle_id": "00000000-0000-4000-8000-000000000030",
+            "name": "Sol  RING",
+        },
+    ]
+
+
+def test_store_indexes_names_faces_and_ids_from_gzipped_bulk(tmp_path: Path) -> None:
+    path = tmp_path / "oracle-cards.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        json.dump(oracle_cards(), handle)
+
+    with MODULE.open_bulk_store(path, cache_dir_path=tmp_path / "cache") as store:
+        assert store.source == "built"
+        assert len(store) == 3
+        assert store.by_name("emeria,  shattered skyclave")["oracle_id"] == ORACLE_ID
+        assert store.by_name("Emeria's Call")["id"] == PRINTING_ID
+        # The first card keeps a shared normalized name.
+        assert store.by_name("sol ring")["oracle_id"].endswith("20")
+        assert store.by_printing_id(PRINTING_ID.upper())["name"].startswith("Emeria")
+        assert [card["id"] for card in store.by_oracle_id(ORACLE_ID)] == [PRINTING_ID]
+        assert store.by_name("Missing Card") is None
+
+
+def test_store_converts_again_only_when_updated_at_changes(tmp_path: Path) -> None:
+    path = tmp_path / "oracle-cards.json"
+    path.write_text(json.dumps(oracle_cards()), encoding="utf-8")
+    store_path = tmp_path / "oracle-cards.sqlite3"
+
+    with MODULE.open_bulk_store(path, store_path=store_path, updated_at="a") as first:
+        assert first.source == "built"
+    path.write_text(json.dumps(oracle_cards()[:1]), encoding="utf-8")
+    with MODULE.open_bulk_store(path, store_path=store_path, updated_at="a") as cached:
+        assert (cached.source, len(cached)) == ("cache", 3)
+    assert MODULE.store_is_current(store_path, "a")
+    assert not MODULE.store_is_current(store_path, "b")
+    with MODULE.open_bulk_store(path, store_path=store_path, updated_at="b") as rebuilt:
+        assert (rebuilt.source, len(rebuilt)) == ("built", 1)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -100,3 +100,35 @@ def test_upsert_never_downgrades_a_direct_cdn_image() -> None:
         "WHEN cards.image_url LIKE 'https://cards.scryfall.io/%'"
         in source
     )
+
+
+def test_streaming_reader_matches_full_decode_across_chunk_boundaries(
+    tmp_path: Path,
+) -> None:
+    fixture = {
+        "meta": {"version": "5.3.0", "nested": [{"brace": "}"}]},
+        "data": {
+            f"Card {index}": [
+                {"name": f"Card {index}", "text": "{T}: Add {G}.\n\"Quoted\""}
+            ]
+            for index in range(25)
+        },
+    }
+    path = tmp_path / "AtomicCards.json"
+    path.write_text(json.dumps(fixture, indent=1), encoding="utf-8")
+
+    streamed = list(MODULE.iter_atomic_cards(path, chunk_chars=7))
+
+    assert streamed == list(fixture["data"].items())
+
+
+def test_copy_line_escapes_text_arrays_and_nulls() -> None:
+    line = MODULE.copy_line(
+        ("a\tb\nc\\d", ['say "hi"', "back\\slash"], None, True, 1.5)
+    )
+
+    assert line == (
+        "a\\tb\\nc\\\\d\t"
+        '{"say \\\\"hi\\\\"","back\\\\\\\\slash"}\t'
+        "\\N\tt\t1.5\n"
+    )
@@ -5,6 +5,11 @@ import forge.gui.GuiBase;
 import forge.util.MyRandom;
 import forge.view.SimulateMatch;
 
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.List;
 import java.util.Random;
 
 public final class SeededForgeMain {
@@ -22,6 +27,11 @@ public final class SeededForgeMain {
         GuiBase.setInterface(new GuiDesktop());
 
         try {
+            String batchValue = System.getProperty("manaloom.batch");
+            if (batchValue != null && !batchValue.isBlank()) {
+                runBatch(Files.readAllLines(Paths.get(batchValue), StandardCharsets.UTF_8));
+                System.exit(0);
+            }
             SimulateMatch.simulate(args);
             System.out.flush();
             System.err.flush();
@@ -32,4 +42,37 @@ public final class SeededForgeMain {
             System.exit(1);
         }
     }
+
+    /**
+     * Plays one game per manifest row (index, seed, deck A, deck B, clock
+     * seconds) in this JVM, so startup and the card database load are paid
+     * once. Begin/End marker lines let the sidecar split the shared log.
+     */
+    private static void runBatch(List<String> rows) throws IOException {
+        for (String row : rows) {
+            if (row.isBlank()) {
+                continue;
+            }
+            String[] fields = row.split("\t", -1);
+            if (fields.length != 5) {
+                throw new IOException("invalid batch manifest row: " + row);
+            }
+            String index = fields[0];
+            System.out.println("ManaLoom Batch Game Begin: " + index);
+            System.out.flush();
+            String status = "ok";
+            try {
+                MyRandom.setRandom(new Random(Long.parseLong(fields[1])));
+                SimulateMatch.simulate(new String[] {
+                        "sim", "-d", fields[2], fields[3],
+                        "-n", "1", "-f", "commander", "-c", fields[4]
+                });
+            } catch (Exception error) {
+                error.printStackTrace(System.out);
+                status = "error";
+            }
+            System.out.println("ManaLoom Batch Game End: " + index + " " + status);
+            System.out.flush();
+        }
+    }
 }
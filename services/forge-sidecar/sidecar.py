@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import base64
+import gzip
 import hashlib
 import json
 import math
 import os
+import queue
 import re
 import shlex
 import signal
@@ -16,20 +18,34 @@ import threading
 import time
 import unicodedata
 import uuid
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 
 MAX_REQUEST_BYTES = 8 * 1024 * 1024
+GZIP_RESPONSE_MIN_BYTES = 1024
+GZIP_RESPONSE_LEVEL = 5
 PROCESS_ID = str(uuid.uuid4())
 STARTED_AT = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 MAX_LOG_EVENTS = 20_000
+LOG_TAIL_LINES = 8
+PROCESS_OUTPUT_QUEUE_LINES = 1024
 PROCESS_TIMEOUT_GRACE_SECONDS = 5
+# After a decided game, late JVM exceptions still count as engine errors.
+STDERR_DRAIN_SECONDS = 0.25
 FORGE_VERSION = "2.0.14-SNAPSHOT"
-SIMULATION_LOCK = threading.Lock()
+DEFAULT_SLOT_MEMORY_MB = 2048
+MAX_BATCH_GAMES = 50
+BATCH_GAME_GRACE_SECONDS = 2
+CARD_INDEX_SCHEMA = "forge_card_index_v1"
+CARD_INDEX_WORKERS = 8
 EXECUTION_SCHEMA = "external_battle_execution_v2"
 REQUEST_SCHEMA = "external_battle_request_v2"
 DECK_HASH_SCHEMA = "external_battle_deck_hash_v1"
@@ -49,6 +65,8 @@ FORGE_TIMEOUT_MARKER = "Stopping slow match as draw"
 TURN_RESULT = re.compile(r"Game Outcome: Turn (?P<turn>\d+)")
 TURN_EVENT = re.compile(r"^Turn: Turn (?P<turn>\d+)\b", re.MULTILINE)
 UNSUPPORTED_CARD = re.compile(r'An unsupported card was requested: "(?P<name>.+?)"')
+BATCH_GAME_BEGIN = re.compile(r"^ManaLoom Batch Game Begin: (?P<index>\d+)$")
+BATCH_GAME_END = re.compile(r"^ManaLoom Batch Game End: (?P<index>\d+) (?P<status>ok|error)$")
 LIFE_CHANGE = re.compile(
     r"Life: Life: Ai\((?P<slot>[12])\)-.+? (?P<before>-?\d+) > (?P<after>-?\d+)$"
 )
@@ -78,7 +96,18 @@ def run_isolated_process(
     cwd: Path,
     timeout: float,
     env: dict[str, str],
+    line_handler: Callable[[str], bool] | None = None,
+    stderr_handler: Callable[[str], bool] | None = None,
 ) -> subprocess.CompletedProcess[str]:
+    if line_handler is not None:
+        return _stream_isolated_process(
+            command,
+            cwd=cwd,
+            timeout=timeout,
+            env=env,
+            line_handler=line_handler,
+            stderr_handler=stderr_handler,
+        )
     process = subprocess.Popen(
         command,
         cwd=cwd,
@@ -110,6 +139,122 @@ def run_isolated_process(
     )
 
 
+def _stream_isolated_process(
+    command: list[str],
+    *,
+    cwd: Path,
+    timeout: float,
+    env: dict[str, str],
+    line_handler: Callable[[str], bool],
+    stderr_handler: Callable[[str], bool] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Hand output lines to the handlers as the process writes them.
+
+    Stdout goes to ``line_handler`` and stderr (JVM and log4j noise) to
+    ``stderr_handler``; stderr is discarded when no handler is given. The
+    process group is killed once a handler returns True, so a decided game
+    never waits for JVM shutdown; stderr is still read for up to
+    ``STDERR_DRAIN_SECONDS`` first. Streamed output is not kept: the
+    returned streams are empty, and a process stopped by its handler reports
+    returncode 0.
+    """
+
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        start_new_session=True,
+    )
+    # Bounded so a verbose engine blocks on its pipe instead of growing memory.
+    output_lines: queue.Queue[tuple[bool, str | None]] = queue.Queue(
+        maxsize=PROCESS_OUTPUT_QUEUE_LINES
+    )
+    readers = _pump_process_output(process, output_lines)
+    deadline = time.monotonic() + timeout
+    open_streams = len(readers)
+    stderr_open = True
+    stopped = False
+    try:
+        while open_streams:
+            try:
+                is_stderr, line = output_lines.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(command, timeout) from None
+            if line is None:
+                open_streams -= 1
+                stderr_open = stderr_open and not is_stderr
+                continue
+            handler = stderr_handler if is_stderr else line_handler
+            if handler is not None and handler(line):
+                stopped = True
+                break
+        drain_until = time.monotonic() + STDERR_DRAIN_SECONDS
+        while stopped and stderr_open and stderr_handler is not None:
+            try:
+                is_stderr, line = output_lines.get(
+                    timeout=max(0.0, drain_until - time.monotonic())
+                )
+            except queue.Empty:
+                break
+            if line is None:
+                open_streams -= 1
+                stderr_open = stderr_open and not is_stderr
+            elif is_stderr:
+                stderr_handler(line)
+    finally:
+        if open_streams:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            while open_streams:
+                if output_lines.get()[1] is None:
+                    open_streams -= 1
+        process.wait()
+        for reader in readers:
+            reader.join()
+    return subprocess.CompletedProcess(
+        command,
+        0 if stopped else process.returncode,
+        stdout="",
+        stderr="",
+    )
+
+
+def _pump_process_output(
+    process: subprocess.Popen[str],
+    output_lines: queue.Queue[tuple[bool, str | None]],
+) -> list[threading.Thread]:
+    """Feed ``(is_stderr, line)`` pairs from both pipes into one queue.
+
+    Each stream ends with an ``(is_stderr, None)`` marker.
+    """
+
+    def pump(stream: Any, is_stderr: bool) -> None:
+        with stream:
+            for raw_line in stream:
+                output_lines.put((is_stderr, raw_line.rstrip("\n")))
+        output_lines.put((is_stderr, None))
+
+    readers = [
+        threading.Thread(
+            target=pump,
+            args=(stream, is_stderr),
+            name="forge-stderr" if is_stderr else "forge-output",
+            daemon=True,
+        )
+        for stream, is_stderr in ((process.stdout, False), (process.stderr, True))
+    ]
+    for reader in readers:
+        reader.start()
+    return readers
+
+
 def normalized_name(value: str) -> str:
     value = unicodedata.normalize("NFKC", value).strip().casefold()
     value = re.sub(r"\s+", " ", value)
@@ -123,26 +268,108 @@ def candidate_names(value: str) -> tuple[str, ...]:
     return tuple(dict.fromkeys(normalized_name(item) for item in candidates))
 
 
-def load_card_index(root: Path) -> dict[str, str]:
-    if not root.is_dir():
-        raise RuntimeError(f"Forge card script directory is unavailable: {root}")
-    result: dict[str, str] = {}
-    for path in root.rglob("*.txt"):
+def _card_script_names(paths: list[Path]) -> list[tuple[str, str]]:
+    names: list[tuple[str, str]] = []
+    for path in paths:
         try:
             with path.open("r", encoding="utf-8", errors="replace") as handle:
                 for line in handle:
                     if line.startswith("Name:"):
                         name = line[5:].strip()
                         if name:
-                            result.setdefault(normalized_name(name), name)
+                            names.append((normalized_name(name), name))
                         break
         except OSError:
             continue
+    return names
+
+
+def load_card_index(root: Path, *, workers: int = CARD_INDEX_WORKERS) -> dict[str, str]:
+    if not root.is_dir():
+        raise RuntimeError(f"Forge card script directory is unavailable: {root}")
+    paths = sorted(root.rglob("*.txt"))
+    chunk = max(1, math.ceil(len(paths) / max(1, workers * 4)))
+    chunks = [paths[start:start + chunk] for start in range(0, len(paths), chunk)]
+    result: dict[str, str] = {}
+    # File opens dominate; threads overlap the I/O. Chunks are merged in path
+    # order so the first script for a name wins deterministically.
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for names in executor.map(_card_script_names, chunks):
+            for key, name in names:
+                result.setdefault(key, name)
     if not result:
         raise RuntimeError(f"Forge card index is empty: {root}")
     return result
 
 
+def card_script_fingerprint(root: Path) -> str:
+    """Fingerprint the script tree from directory metadata only.
+
+    Adding, removing or renaming a script changes its directory's mtime, so
+    the fingerprint moves without opening or stat-ing every script file.
+    """
+
+    digest = hashlib.sha256()
+    for directory, subdirectories, _files in os.walk(root):
+        subdirectories.sort()
+        relative = Path(directory).relative_to(root).as_posix()
+        digest.update(f"{relative}\0{os.stat(directory).st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached_card_index(
+    root: Path,
+    *,
+    cache_path: Path,
+    forge_commit: str,
+) -> tuple[dict[str, str], dict[str, Any]]:
+    """Load the card index artifact for this commit and tree, or rebuild it."""
+
+    started = time.monotonic()
+    if not root.is_dir():
+        raise RuntimeError(f"Forge card script directory is unavailable: {root}")
+    fingerprint = card_script_fingerprint(root)
+    source = "built"
+    index: dict[str, str] | None = None
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as handle:
+            cached = json.load(handle)
+        if (
+            isinstance(cached, dict)
+            and cached.get("schema_version") == CARD_INDEX_SCHEMA
+            and cached.get("forge_commit") == forge_commit
+            and cached.get("fingerprint") == fingerprint
+            and isinstance(cached.get("cards"), dict)
+            and cached["cards"]
+        ):
+            index = cached["cards"]
+            source = "cache"
+    except (OSError, EOFError, ValueError):
+        index = None
+    if index is None:
+        index = load_card_index(root)
+        payload = {
+            "schema_version": CARD_INDEX_SCHEMA,
+            "forge_commit": forge_commit,
+            "fingerprint": fingerprint,
+            "cards": index,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=6) as handle:
+                json.dump(payload, handle, ensure_ascii=True, separators=(",", ":"))
+            temporary.replace(cache_path)
+        except OSError:
+            source = "built_uncached"
+    return index, {
+        "source": source,
+        "cache_path": str(cache_path),
+        "fingerprint": fingerprint,
+        "load_ms": round((time.monotonic() - started) * 1000),
+    }
+
+
 @dataclass(frozen=True)
 class CardInput:
     name: str
@@ -459,6 +686,114 @@ def request_metadata(
     }
 
 
+@dataclass(frozen=True)
+class PreparedGame:
+    deck_a: DeckInput
+    deck_b: DeckInput
+    contract: dict[str, Any]
+    deck_a_text: str
+    deck_b_text: str
+
+
+@dataclass(frozen=True)
+class ForgeSlot:
+    """One isolated Forge runtime: its own working directory and profile.
+
+    Forge reads ``forge.profile.properties`` from the process working directory
+    and keeps user, cache and deck state under the directories it names, so a
+    slot with its own copies can run a JVM concurrently with the others. The
+    desktop jar also resolves ``../forge-gui/res`` from its working directory,
+    so each slot mirrors the image's ``forge-gui``/``forge-gui-desktop`` pair.
+    """
+
+    index: int
+    home: Path
+    deck_dir: Path
+
+
+def prepare_slot(index: int, *, slot_root: Path, forge_home: Path) -> ForgeSlot:
+    slot_dir = slot_root / f"slot-{index}"
+    home = slot_dir / "forge-gui-desktop"
+    gui_dir = slot_dir / "forge-gui"
+    user_dir = slot_dir / "user"
+    deck_dir = user_dir / "decks" / "commander"
+    for directory in (home, gui_dir, user_dir / "cache", deck_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    resources_target = (forge_home / "res").resolve()
+    for resources in (home / "res", gui_dir / "res"):
+        if not resources.is_symlink():
+            resources.symlink_to(resources_target, target_is_directory=True)
+    gui_profile = gui_dir / "forge.profile.properties"
+    if not gui_profile.is_symlink():
+        gui_profile.symlink_to(home / "forge.profile.properties")
+    (home / "forge.profile.properties").write_text(
+        "\n".join(
+            (
+                f"userDir={user_dir}",
+                f"cacheDir={user_dir / 'cache'}",
+                f"decksDir={user_dir / 'decks'}",
+                "",
+            )
+        ),
+        encoding="utf-8",
+    )
+    return ForgeSlot(index=index, home=home, deck_dir=deck_dir)
+
+
+def slot_count(*, requested: int, memory_budget_mb: int, slot_memory_mb: int) -> int:
+    """Bound the requested slot count by the container memory budget."""
+
+    count = max(1, requested)
+    if memory_budget_mb > 0:
+        count = min(count, max(1, memory_budget_mb // max(1, slot_memory_mb)))
+    return count
+
+
+class ForgeSlotPool:
+    """Hands out isolated Forge slots; callers block while all are busy."""
+
+    def __init__(self, slots: list[ForgeSlot], *, slot_memory_mb: int) -> None:
+        if not slots:
+            raise RuntimeError("Forge slot pool requires at least one slot")
+        self.slots = tuple(slots)
+        self.slot_memory_mb = slot_memory_mb
+        self._idle = list(reversed(slots))
+        self._condition = threading.Condition()
+        self._waiting = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[ForgeSlot]:
+        with self._condition:
+            self._waiting += 1
+            try:
+                while not self._idle:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            slot = self._idle.pop()
+        try:
+            yield slot
+        finally:
+            with self._condition:
+                self._idle.append(slot)
+                self._condition.notify()
+
+    def occupancy(self) -> dict[str, Any]:
+        with self._condition:
+            idle = {slot.index for slot in self._idle}
+            waiting = self._waiting
+        return {
+            "total": len(self.slots),
+            "busy": len(self.slots) - len(idle),
+            "idle": len(idle),
+            "waiting_requests": waiting,
+            "slot_memory_mb": self.slot_memory_mb,
+            "busy_slots": sorted(
+                slot.index for slot in self.slots if slot.index not in idle
+            ),
+        }
+
+
 def sidecar_identity(forge_commit: str) -> dict[str, Any]:
     return {
         "schema_version": EXECUTION_SCHEMA,
@@ -487,6 +822,10 @@ class ForgeService:
         deck_dir: Path,
         card_index: dict[str, str],
         forge_commit: str,
+        card_index_source: dict[str, Any] | None = None,
+        slots: int = 1,
+        slot_root: Path | None = None,
+        slot_memory_mb: int = DEFAULT_SLOT_MEMORY_MB,
     ) -> None:
         self.forge_home = forge_home
         self.forge_jar = forge_jar
@@ -494,6 +833,7 @@ class ForgeService:
         self.java_command = java_command
         self.deck_dir = deck_dir
         self.card_index = card_index
+        self.card_index_source = card_index_source or {"source": "provided"}
         self.forge_commit = forge_commit
         if not self.forge_jar.is_file():
             raise RuntimeError(f"Forge runtime jar is unavailable: {self.forge_jar}")
@@ -502,6 +842,18 @@ class ForgeService:
         if not self.java_command:
             raise RuntimeError("FORGE_JAVA_COMMAND cannot be empty")
         self.deck_dir.mkdir(parents=True, exist_ok=True)
+        if slot_root is None or slots == 1:
+            if slots != 1:
+                raise RuntimeError("FORGE_SLOT_ROOT is required for more than one Forge slot")
+            # A single slot runs straight from the image layout, whose profile
+            # already points Forge at deck_dir.
+            pool_slots = [ForgeSlot(index=0, home=forge_home, deck_dir=self.deck_dir)]
+        else:
+            pool_slots = [
+                prepare_slot(index, slot_root=slot_root, forge_home=forge_home)
+                for index in range(slots)
+            ]
+        self.slot_pool = ForgeSlotPool(pool_slots, slot_memory_mb=slot_memory_mb)
 
     @classmethod
     def from_environment(cls) -> "ForgeService":
@@ -509,16 +861,35 @@ class ForgeService:
         commit_file = Path(os.getenv("FORGE_COMMIT_FILE", forge_home / "FORGE_COMMIT"))
         forge_commit = commit_file.read_text(encoding="ascii").strip()
         bootstrap_value = os.getenv("FORGE_BOOTSTRAP_JAR", "").strip()
+        slot_memory_mb = int(os.getenv("FORGE_SLOT_MEMORY_MB", str(DEFAULT_SLOT_MEMORY_MB)))
+        slots = slot_count(
+            requested=int(os.getenv("FORGE_SLOTS", "1")),
+            memory_budget_mb=int(os.getenv("FORGE_MEMORY_BUDGET_MB", "0")),
+            slot_memory_mb=slot_memory_mb,
+        )
+        slot_root_value = os.getenv("FORGE_SLOT_ROOT", "").strip()
+        card_index, card_index_source = load_cached_card_index(
+            Path(os.getenv("FORGE_CARD_SCRIPTS", forge_home / "res/cardsfolder")).resolve(),
+            cache_path=Path(
+                os.getenv(
+                    "FORGE_CARD_INDEX_CACHE",
+                    f"/tmp/forge/cache/card-index-{forge_commit}.json.gz",
+                )
+            ),
+            forge_commit=forge_commit,
+        )
         return cls(
             forge_home=forge_home,
             forge_jar=Path(os.getenv("FORGE_JAR", forge_home / "forge.jar")).resolve(),
             bootstrap_jar=Path(bootstrap_value).resolve() if bootstrap_value else None,
             java_command=tuple(shlex.split(os.getenv("FORGE_JAVA_COMMAND", "java"))),
             deck_dir=Path(os.getenv("FORGE_DECK_DIR", "/tmp/forge/decks/commander")).resolve(),
-            card_index=load_card_index(
-                Path(os.getenv("FORGE_CARD_SCRIPTS", forge_home / "res/cardsfolder")).resolve()
-            ),
+            card_index=card_index,
             forge_commit=forge_commit,
+            card_index_source=card_index_source,
+            slots=slots,
+            slot_root=Path(slot_root_value).resolve() if slot_root_value else None,
+            slot_memory_mb=slot_memory_mb,
         )
 
     def health(self) -> dict[str, Any]:
@@ -526,6 +897,8 @@ class ForgeService:
             **sidecar_identity(self.forge_commit),
             "status": "ok",
             "indexed_cards": len(self.card_index),
+            "card_index": self.card_index_source,
+            "slots": self.slot_pool.occupancy(),
         }
 
     def coverage(self, request: dict[str, Any]) -> dict[str, Any]:
@@ -564,7 +937,7 @@ class ForgeService:
             "unsupported_cards": unsupported,
         }
 
-    def simulate(self, request: dict[str, Any]) -> dict[str, Any]:
+    def _prepare_game(self, request: dict[str, Any]) -> PreparedGame:
         deck_a = DeckInput.parse(request.get("deck_a"), "deck_a")
         deck_b = DeckInput.parse(request.get("deck_b"), "deck_b")
         contract = parse_request_contract(
@@ -576,85 +949,474 @@ class ForgeService:
         coverage = self.coverage(request)
         if coverage["unsupported_cards"]:
             raise CoverageIncomplete(coverage["unsupported_cards"])
+        return PreparedGame(
+            deck_a=deck_a,
+            deck_b=deck_b,
+            contract=contract,
+            deck_a_text=deck_a.render(self.card_index),
+            deck_b_text=deck_b.render(self.card_index),
+        )
 
-        timeout_ms = contract["timeout_ms"]
-        seed = contract["seed"]
-        request_id = contract["request_id"]
-        deck_a_file = self.deck_dir / f"{request_id}-a.dck"
-        deck_b_file = self.deck_dir / f"{request_id}-b.dck"
-        deck_a_file.write_text(deck_a.render(self.card_index), encoding="utf-8")
-        deck_b_file.write_text(deck_b.render(self.card_index), encoding="utf-8")
-
+    def _launcher(self) -> tuple[str, str]:
         classpath = str(self.forge_jar)
         main_class = "forge.view.Main"
         if self.bootstrap_jar is not None:
             classpath = f"{self.bootstrap_jar}{os.pathsep}{classpath}"
             main_class = "com.manaloom.forge.SeededForgeMain"
+        return classpath, main_class
+
+    def _game_result(
+        self,
+        game: PreparedGame,
+        log: "ForgeLogParser",
+        *,
+        exit_failure: str | None,
+        duration_ms: int,
+        started_at: str,
+    ) -> dict[str, Any]:
+        timeout_ms = game.contract["timeout_ms"]
+        if log.unsupported_cards:
+            raise CoverageIncomplete(log.unsupported_cards)
+        if log.timed_out:
+            raise SimulationTimeout(f"Forge battle exceeded {timeout_ms} ms")
+        if exit_failure is not None:
+            raise SimulationFailed(f"{exit_failure}: {log.tail()}")
+        return simulation_result(
+            log,
+            request_id=game.contract["request_id"],
+            seed=game.contract["seed"],
+            deck_a=game.deck_a,
+            deck_b=game.deck_b,
+            duration_ms=duration_ms,
+            started_at=started_at,
+            forge_commit=self.forge_commit,
+            request_contract=game.contract,
+        )
+
+    def simulate(self, request: dict[str, Any]) -> dict[str, Any]:
+        game = self._prepare_game(request)
+        timeout_ms = game.contract["timeout_ms"]
+        request_id = game.contract["request_id"]
+        classpath, main_class = self._launcher()
+        with self.slot_pool.acquire() as slot:
+            deck_a_file = slot.deck_dir / f"{request_id}-a.dck"
+            deck_b_file = slot.deck_dir / f"{request_id}-b.dck"
+            deck_a_file.write_text(game.deck_a_text, encoding="utf-8")
+            deck_b_file.write_text(game.deck_b_text, encoding="utf-8")
+            command = [
+                *self.java_command,
+                f"-Dmanaloom.seed={game.contract['seed']}",
+                "-cp",
+                classpath,
+                main_class,
+                "sim",
+                "-d",
+                deck_a_file.name,
+                deck_b_file.name,
+                "-n",
+                "1",
+                "-f",
+                "commander",
+                "-c",
+                str(max(1, math.ceil(timeout_ms / 1000))),
+            ]
+            started = time.monotonic()
+            started_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            log = ForgeLogParser()
+            try:
+                completed = run_isolated_process(
+                    command,
+                    cwd=slot.home,
+                    timeout=(timeout_ms / 1000) + PROCESS_TIMEOUT_GRACE_SECONDS,
+                    env=os.environ.copy(),
+                    line_handler=log.feed,
+                    stderr_handler=log.feed_stderr,
+                )
+            except subprocess.TimeoutExpired as error:
+                process_budget_ms = timeout_ms + PROCESS_TIMEOUT_GRACE_SECONDS * 1000
+                raise SimulationTimeout(
+                    f"Forge battle exceeded {process_budget_ms} ms including startup"
+                ) from error
+            finally:
+                deck_a_file.unlink(missing_ok=True)
+                deck_b_file.unlink(missing_ok=True)
+
+        duration_ms = round((time.monotonic() - started) * 1000)
+        # Output the runner returned instead of streaming is parsed the same way.
+        for line in (completed.stdout or "").splitlines():
+            log.feed(line)
+        for line in (completed.stderr or "").splitlines():
+            log.feed_stderr(line)
+        return self._game_result(
+            game,
+            log,
+            exit_failure=(
+                f"Forge exited with code {completed.returncode}"
+                if completed.returncode != 0
+                else None
+            ),
+            duration_ms=duration_ms,
+            started_at=started_at,
+        )
+
+    def simulate_batch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Play several strict /simulate requests back to back in one JVM.
+
+        Each game keeps its own seed, decks, contract and timeout. A game that
+        times out or kills the JVM is reported on its own and the remaining
+        games are relaunched in a fresh JVM, so one failure never leaks into
+        another game's result.
+        """
+
+        rows = request.get("games")
+        if not isinstance(rows, list) or not rows:
+            raise InvalidRequest("games is required")
+        if len(rows) > MAX_BATCH_GAMES:
+            raise InvalidRequest(f"games is limited to {MAX_BATCH_GAMES} per batch")
+        if self.bootstrap_jar is None:
+            raise InvalidRequest("batch simulation requires FORGE_BOOTSTRAP_JAR")
+        started = time.monotonic()
+        results: list[dict[str, Any] | None] = [None] * len(rows)
+        pending: list[tuple[int, PreparedGame]] = []
+        request_ids: set[str] = set()
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                results[index] = batch_game_error(index, InvalidRequest("every game must be an object"))
+                continue
+            try:
+                game = self._prepare_game(row)
+                if game.contract["request_id"] in request_ids:
+                    raise InvalidRequest("request_id must be unique within a batch")
+            except (InvalidRequest, CoverageIncomplete) as error:
+                results[index] = batch_game_error(index, error, request=row, service=self)
+                continue
+            request_ids.add(game.contract["request_id"])
+            pending.append((index, game))
+
+        launches = 0
+        if pending:
+            with self.slot_pool.acquire() as slot:
+                while pending:
+                    launches += 1
+                    pending = self._run_batch_process(slot, pending, results)
+        finished = [result for result in results if result is not None]
+        status_counts: dict[str, int] = {}
+        for result in finished:
+            status = str(result.get("status") or "failed")
+            status_counts[status] = status_counts.get(status, 0) + 1
+        return {
+            **sidecar_identity(self.forge_commit),
+            "type": "battle_batch",
+            "status": "completed" if set(status_counts) <= {"completed", "censored"} else "partial",
+            "results": finished,
+            "aggregate": {
+                "games": len(rows),
+                "status_counts": dict(sorted(status_counts.items())),
+                "jvm_launches": launches,
+                "duration_ms": round((time.monotonic() - started) * 1000),
+            },
+        }
+
+    def _run_batch_process(
+        self,
+        slot: ForgeSlot,
+        games: list[tuple[int, PreparedGame]],
+        results: list[dict[str, Any] | None],
+    ) -> list[tuple[int, PreparedGame]]:
+        """Run games in one JVM; return the games left for a fresh JVM."""
+
+        classpath, main_class = self._launcher()
+        manifest = slot.deck_dir / f"batch-{uuid.uuid4().hex}.tsv"
+        deck_files: list[Path] = [manifest]
+        manifest_rows: list[str] = []
+        for index, game in games:
+            request_id = game.contract["request_id"]
+            deck_a_file = slot.deck_dir / f"{request_id}-a.dck"
+            deck_b_file = slot.deck_dir / f"{request_id}-b.dck"
+            deck_a_file.write_text(game.deck_a_text, encoding="utf-8")
+            deck_b_file.write_text(game.deck_b_text, encoding="utf-8")
+            deck_files.extend((deck_a_file, deck_b_file))
+            manifest_rows.append(
+                "\t".join(
+                    (
+                        str(index),
+                        str(game.contract["seed"]),
+                        deck_a_file.name,
+                        deck_b_file.name,
+                        str(max(1, math.ceil(game.contract["timeout_ms"] / 1000))),
+                    )
+                )
+            )
+        manifest.write_text("\n".join(manifest_rows) + "\n", encoding="utf-8")
         command = [
             *self.java_command,
-            f"-Dmanaloom.seed={seed}",
+            f"-Dmanaloom.batch={manifest}",
             "-cp",
             classpath,
             main_class,
-            "sim",
-            "-d",
-            deck_a_file.name,
-            deck_b_file.name,
-            "-n",
-            "1",
-            "-f",
-            "commander",
-            "-c",
-            str(max(1, math.ceil(timeout_ms / 1000))),
         ]
-        started = time.monotonic()
+        by_index = dict(games)
+        remaining = [index for index, _game in games]
+        current: int | None = None
+        log = ForgeLogParser()
+        game_started = time.monotonic()
         started_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # The first game also pays JVM and card-database startup.
+        deadline = game_started + games[0][1].contract["timeout_ms"] / 1000 + PROCESS_TIMEOUT_GRACE_SECONDS
+        process = subprocess.Popen(
+            command,
+            cwd=slot.home,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=os.environ.copy(),
+            start_new_session=True,
+        )
+        output_lines: queue.Queue[tuple[bool, str | None]] = queue.Queue()
+        _pump_process_output(process, output_lines)
+        open_streams = 2
         try:
-            with SIMULATION_LOCK:
-                completed = run_isolated_process(
-                    command,
-                    cwd=self.forge_home,
-                    timeout=(timeout_ms / 1000) + PROCESS_TIMEOUT_GRACE_SECONDS,
-                    env=os.environ.copy(),
-                )
-        except subprocess.TimeoutExpired as error:
-            process_budget_ms = timeout_ms + PROCESS_TIMEOUT_GRACE_SECONDS * 1000
-            raise SimulationTimeout(
-                f"Forge battle exceeded {process_budget_ms} ms including startup"
-            ) from error
+            while remaining:
+                try:
+                    is_stderr, line = output_lines.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    victim = current if current is not None else remaining[0]
+                    timeout_ms = by_index[victim].contract["timeout_ms"]
+                    results[victim] = batch_game_error(
+                        victim,
+                        SimulationTimeout(f"Forge battle exceeded {timeout_ms} ms in batch"),
+                        game=by_index[victim],
+                    )
+                    remaining.remove(victim)
+                    break
+                if line is None:
+                    open_streams -= 1
+                    if open_streams:
+                        continue
+                    victim = current if current is not None else remaining[0]
+                    tail = log.tail()
+                    results[victim] = batch_game_error(
+                        victim,
+                        SimulationFailed(
+                            f"Forge batch JVM exited with code {process.wait()}: {tail}"
+                        ),
+                        game=by_index[victim],
+                    )
+                    remaining.remove(victim)
+                    break
+                if is_stderr:
+                    log.feed_stderr(line)
+                    continue
+                begin = BATCH_GAME_BEGIN.match(line)
+                if begin is not None and int(begin.group("index")) in remaining:
+                    current = int(begin.group("index"))
+                    log = ForgeLogParser()
+                    game_started = time.monotonic()
+                    started_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                    deadline = game_started + by_index[current].contract["timeout_ms"] / 1000 + BATCH_GAME_GRACE_SECONDS
+                    continue
+                end = BATCH_GAME_END.match(line)
+                if end is not None and current is not None and int(end.group("index")) == current:
+                    game = by_index[current]
+                    try:
+                        results[current] = {
+                            "index": current,
+                            **self._game_result(
+                                game,
+                                log,
+                                exit_failure=(
+                                    "Forge game raised an error in batch"
+                                    if end.group("status") != "ok"
+                                    else None
+                                ),
+                                duration_ms=round((time.monotonic() - game_started) * 1000),
+                                started_at=started_at,
+                            ),
+                        }
+                    except (CoverageIncomplete, SimulationTimeout, SimulationFailed) as error:
+                        results[current] = batch_game_error(current, error, game=game)
+                    remaining.remove(current)
+                    current = None
+                    log = ForgeLogParser()
+                    if remaining:
+                        deadline = (
+                            time.monotonic()
+                            + by_index[remaining[0]].contract["timeout_ms"] / 1000
+                            + BATCH_GAME_GRACE_SECONDS
+                        )
+                    continue
+                log.feed(line)
         finally:
-            deck_a_file.unlink(missing_ok=True)
-            deck_b_file.unlink(missing_ok=True)
+            if process.poll() is None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            process.wait()
+            for path in deck_files:
+                path.unlink(missing_ok=True)
+        return [(index, by_index[index]) for index in remaining]
+
+
+def batch_game_error(
+    index: int,
+    error: Exception,
+    *,
+    game: PreparedGame | None = None,
+    request: dict[str, Any] | None = None,
+    service: ForgeService | None = None,
+) -> dict[str, Any]:
+    if isinstance(error, CoverageIncomplete):
+        status, code = "coverage_incomplete", "forge_coverage_incomplete"
+    elif isinstance(error, SimulationTimeout):
+        status, code = "timeout", "simulation_timeout"
+    elif isinstance(error, InvalidRequest):
+        status, code = "invalid_request", "invalid_request"
+    else:
+        status, code = "failed", "simulation_failed"
+    contract = game.contract if game is not None else None
+    if contract is None and request is not None and service is not None:
+        try:
+            contract = parse_request_contract(
+                request,
+                deck_a=DeckInput.parse(request.get("deck_a"), "deck_a"),
+                deck_b=DeckInput.parse(request.get("deck_b"), "deck_b"),
+                forge_commit=service.forge_commit,
+            )
+        except InvalidRequest:
+            contract = None
+    result: dict[str, Any] = {
+        "index": index,
+        "status": status,
+        "error": code,
+        "message": str(error),
+    }
+    if isinstance(error, CoverageIncomplete):
+        result["unsupported_cards"] = error.unsupported_cards
+    if contract is not None and status != "invalid_request":
+        result.update(request_metadata(contract, status=status))
+        result["status"] = status
+    return result
 
-        duration_ms = round((time.monotonic() - started) * 1000)
-        output = "\n".join(part for part in (completed.stdout, completed.stderr) if part)
-        unsupported_runtime = [
-            {
-                "name": match.group("name"),
-                "source": "forge",
-                "reason": "forge_runtime_rejected_card",
-            }
-            for match in UNSUPPORTED_CARD.finditer(output)
-        ]
-        if unsupported_runtime:
-            raise CoverageIncomplete(unsupported_runtime)
-        if FORGE_TIMEOUT_MARKER in output:
-            raise SimulationTimeout(f"Forge battle exceeded {timeout_ms} ms")
-        if completed.returncode != 0:
-            raise SimulationFailed(
-                f"Forge exited with code {completed.returncode}: {_last_lines(output)}"
+
+class ForgeLogParser:
+    """Build a Forge game log incrementally from engine output lines.
+
+    Only the capped event list and a short tail are retained, so verbose
+    engine output is never buffered whole. ``feed`` returns True once the
+    game is decided: at the ``Game Result`` line, or at the first card Forge
+    rejects at runtime.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self.unsupported_cards: list[dict[str, Any]] = []
+        self.win_match: re.Match[str] | None = None
+        self.draw_match: re.Match[str] | None = None
+        self.outcome_turn: int | None = None
+        self.event_turn: int | None = None
+        self.errors = 0
+        self.timed_out = False
+        self._in_game = False
+        self._events_closed = False
+        self._tail: deque[str] = deque(maxlen=LOG_TAIL_LINES)
+
+    @classmethod
+    def from_text(cls, output: str) -> "ForgeLogParser":
+        log = cls()
+        for line in output.splitlines():
+            log.feed(line)
+        return log
+
+    @property
+    def decided(self) -> bool:
+        return bool(self.unsupported_cards) or self.win_match is not None or self.draw_match is not None
+
+    @property
+    def turns(self) -> int:
+        if self.outcome_turn is not None:
+            return self.outcome_turn
+        return self.event_turn or 0
+
+    def tail(self) -> str:
+        return _last_lines("\n".join(self._tail))
+
+    def feed_stderr(self, line: str) -> bool:
+        """Take a JVM stderr line for the tail, markers and error count.
+
+        Stderr never enters the event window or decides the turn count.
+        """
+        if line.strip():
+            self._tail.append(line)
+        self._scan_markers(line)
+        return self.decided
+
+    def feed(self, line: str) -> bool:
+        if line.strip():
+            self._tail.append(line)
+        self._scan_markers(line)
+        for match in TURN_RESULT.finditer(line):
+            self.outcome_turn = int(match.group("turn"))
+        turn_event = TURN_EVENT.match(line)
+        if turn_event:
+            self.event_turn = int(turn_event.group("turn"))
+        if self.win_match is None:
+            self.win_match = GAME_RESULT_WIN.search(line)
+        if self.draw_match is None:
+            self.draw_match = GAME_RESULT_DRAW.search(line)
+        self._record_event(line)
+        return self.decided
+
+    def _scan_markers(self, line: str) -> None:
+        for match in UNSUPPORTED_CARD.finditer(line):
+            self.unsupported_cards.append(
+                {
+                    "name": match.group("name"),
+                    "source": "forge",
+                    "reason": "forge_runtime_rejected_card",
+                }
             )
-        return parse_simulation_output(
-            output,
-            request_id=request_id,
-            seed=seed,
-            deck_a=deck_a,
-            deck_b=deck_b,
-            duration_ms=duration_ms,
-            started_at=started_at,
-            forge_commit=self.forge_commit,
-            request_contract=contract,
-        )
+        if FORGE_TIMEOUT_MARKER in line:
+            self.timed_out = True
+        if "Exception" in line or "StackOverflowError" in line or line.startswith("Error:"):
+            self.errors += 1
+
+    def _record_event(self, line: str) -> None:
+        if self._events_closed:
+            return
+        if not self._in_game:
+            self._in_game = " - one game of Commander" in line
+            return
+        line = line.strip()
+        if not line:
+            return
+        if line.startswith("Game Result:") or len(self.events) >= MAX_LOG_EVENTS:
+            self._events_closed = True
+            return
+        prefix, separator, _ = line.partition(":")
+        event_type = re.sub(r"[^a-z0-9]+", "_", prefix.casefold()).strip("_") if separator else "message"
+        event: dict[str, Any] = {
+            "sequence": len(self.events) + 1,
+            "type": event_type,
+            "message": line,
+        }
+        actor = re.search(r"\bAi\s*\(\s*(?P<slot>[12])\s*\)", line, re.IGNORECASE)
+        if actor:
+            subject_deck_key = (
+                "deck_a" if actor.group("slot") == "1" else "deck_b"
+            )
+            event["actor"] = actor.group(0)
+            event["actor_side"] = subject_deck_key
+            event["subject_deck_key"] = subject_deck_key
+        turn = re.search(r"Turn (?P<turn>\d+)", line)
+        if turn:
+            event["turn"] = int(turn.group("turn"))
+        card_name = _card_name_from_event(line)
+        if card_name:
+            event["card_name"] = card_name
+        self.events.append(event)
 
 
 def parse_simulation_output(
@@ -668,6 +1430,31 @@ def parse_simulation_output(
     started_at: str,
     forge_commit: str,
     request_contract: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return simulation_result(
+        ForgeLogParser.from_text(output),
+        request_id=request_id,
+        seed=seed,
+        deck_a=deck_a,
+        deck_b=deck_b,
+        duration_ms=duration_ms,
+        started_at=started_at,
+        forge_commit=forge_commit,
+        request_contract=request_contract,
+    )
+
+
+def simulation_result(
+    log: ForgeLogParser,
+    *,
+    request_id: str,
+    seed: int,
+    deck_a: DeckInput,
+    deck_b: DeckInput,
+    duration_ms: int,
+    started_at: str,
+    forge_commit: str,
+    request_contract: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     if request_contract is None:
         request_contract = parse_request_contract(
@@ -676,10 +1463,10 @@ def parse_simulation_output(
             deck_b=deck_b,
             forge_commit=forge_commit,
         )
-    result_match = GAME_RESULT_WIN.search(output)
-    draw_match = GAME_RESULT_DRAW.search(output)
+    result_match = log.win_match
+    draw_match = log.draw_match
     if result_match is None and draw_match is None:
-        raise SimulationFailed(f"Forge returned no completed game result: {_last_lines(output)}")
+        raise SimulationFailed(f"Forge returned no completed game result: {log.tail()}")
 
     winner_key: str | None = None
     winner_deck: DeckInput | None = None
@@ -691,21 +1478,14 @@ def parse_simulation_output(
     else:
         engine_duration_ms = int(draw_match.group("duration"))
 
-    turn_matches = list(TURN_RESULT.finditer(output))
-    if not turn_matches:
-        turn_matches = list(TURN_EVENT.finditer(output))
-    turns = int(turn_matches[-1].group("turn")) if turn_matches else 0
+    turns = log.turns
     if turns <= 0:
         raise SimulationFailed(
             "Forge returned a completed result without positive turn evidence"
         )
-    events = _events_from_output(output)
+    events = log.events
     snapshots = _snapshots(events)
-    errors = sum(
-        1
-        for line in output.splitlines()
-        if "Exception" in line or "StackOverflowError" in line or line.startswith("Error:")
-    )
+    errors = log.errors
     if errors:
         raise SimulationFailed(f"Forge completed with {errors} engine errors")
     status = (
@@ -754,43 +1534,7 @@ def parse_simulation_output(
 
 
 def _events_from_output(output: str) -> list[dict[str, Any]]:
-    lines = output.splitlines()
-    start = next(
-        (index + 1 for index, line in enumerate(lines) if " - one game of Commander" in line),
-        len(lines),
-    )
-    events: list[dict[str, Any]] = []
-    for line in lines[start:]:
-        line = line.strip()
-        if not line:
-            continue
-        if line.startswith("Game Result:"):
-            break
-        if len(events) >= MAX_LOG_EVENTS:
-            break
-        prefix, separator, _ = line.partition(":")
-        event_type = re.sub(r"[^a-z0-9]+", "_", prefix.casefold()).strip("_") if separator else "message"
-        event: dict[str, Any] = {
-            "sequence": len(events) + 1,
-            "type": event_type,
-            "message": line,
-        }
-        actor = re.search(r"\bAi\s*\(\s*(?P<slot>[12])\s*\)", line, re.IGNORECASE)
-        if actor:
-            subject_deck_key = (
-                "deck_a" if actor.group("slot") == "1" else "deck_b"
-            )
-            event["actor"] = actor.group(0)
-            event["actor_side"] = subject_deck_key
-            event["subject_deck_key"] = subject_deck_key
-        turn = re.search(r"Turn (?P<turn>\d+)", line)
-        if turn:
-            event["turn"] = int(turn.group("turn"))
-        card_name = _card_name_from_event(line)
-        if card_name:
-            event["card_name"] = card_name
-        events.append(event)
-    return events
+    return ForgeLogParser.from_text(output).events
 
 
 def _card_name_from_event(line: str) -> str | None:
@@ -857,16 +1601,37 @@ def _last_lines(value: str, count: int = 8) -> str:
     return " | ".join(line.strip() for line in value.splitlines()[-count:] if line.strip())[:1600]
 
 
+def decode_request_body(raw: bytes, content_encoding: str | None) -> bytes:
+    """Undo a gzip request encoding without inflating past MAX_REQUEST_BYTES."""
+
+    encoding = str(content_encoding or "").strip().lower()
+    if encoding in {"", "identity"}:
+        return raw
+    if encoding != "gzip":
+        raise InvalidRequest(f"unsupported content-encoding: {encoding}")
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        body = decompressor.decompress(raw, MAX_REQUEST_BYTES + 1)
+    except zlib.error as error:
+        raise InvalidRequest("request body is not valid gzip") from error
+    if len(body) > MAX_REQUEST_BYTES or decompressor.unconsumed_tail:
+        raise InvalidRequest("request body must be between 1 byte and 8 MiB")
+    return body
+
+
 class ForgeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
     service: ForgeService
 
     def do_GET(self) -> None:  # noqa: N802
+        self._started = time.perf_counter()
         if self.path == "/health":
             self._send(200, self.service.health())
         else:
             self._send(404, {"error": "not_found"})
 
     def do_POST(self) -> None:  # noqa: N802
+        self._started = time.perf_counter()
         request: dict[str, Any] | None = None
         try:
             request = self._read_json()
@@ -876,6 +1641,8 @@ class ForgeHandler(BaseHTTPRequestHandler):
                 self._send(200, self.service.card_coverage(request))
             elif self.path == "/simulate":
                 self._send(200, self.service.simulate(request))
+            elif self.path == "/simulate/batch":
+                self._send(200, self.service.simulate_batch(request))
             else:
                 self._send(404, {"error": "not_found"})
         except CoverageIncomplete as error:
@@ -915,11 +1682,17 @@ class ForgeHandler(BaseHTTPRequestHandler):
         try:
             length = int(self.headers.get("content-length", "0"))
         except ValueError as error:
+            self.close_connection = True
             raise InvalidRequest("invalid content-length") from error
         if length < 1 or length > MAX_REQUEST_BYTES:
+            self.close_connection = True
             raise InvalidRequest("request body must be between 1 byte and 8 MiB")
+        raw = decode_request_body(
+            self.rfile.read(length),
+            self.headers.get("content-encoding"),
+        )
         try:
-            value = json.loads(self.rfile.read(length))
+            value = json.loads(raw)
         except (json.JSONDecodeError, UnicodeDecodeError) as error:
             raise InvalidRequest("request body must be valid JSON") from error
         if not isinstance(value, dict):
@@ -933,9 +1706,25 @@ class ForgeHandler(BaseHTTPRequestHandler):
             "fallback_reason": body.get("fallback_reason", "none"),
         }
         payload = json.dumps(response, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
+        headers = getattr(self, "headers", None)
+        accept_encoding = headers.get("accept-encoding", "") if headers is not None else ""
+        compressed = (
+            len(payload) >= GZIP_RESPONSE_MIN_BYTES
+            and "gzip" in str(accept_encoding).lower()
+        )
+        if compressed:
+            payload = gzip.compress(payload, compresslevel=GZIP_RESPONSE_LEVEL, mtime=0)
+        started = getattr(self, "_started", None)
         try:
             self.send_response(status)
             self.send_header("content-type", "application/json; charset=utf-8")
+            self.send_header("accept-encoding", "gzip")
+            self.send_header("vary", "accept-encoding")
+            if compressed:
+                self.send_header("content-encoding", "gzip")
+            if started is not None:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.send_header("server-timing", f"app;dur={elapsed_ms:.1f}")
             self.send_header("content-length", str(len(payload)))
             self.end_headers()
             self.wfile.write(payload)
@@ -973,7 +1762,8 @@ def main() -> None:
     server = ThreadingHTTPServer(("0.0.0.0", port), ForgeHandler)
     print(
         f"ManaLoom Forge sidecar listening on port {port}; "
-        f"commit={service.forge_commit}; indexed_cards={len(service.card_index)}",
+        f"commit={service.forge_commit}; indexed_cards={len(service.card_index)}; "
+        f"slots={len(service.slot_pool.slots)}",
         flush=True,
     )
     server.serve_forever()
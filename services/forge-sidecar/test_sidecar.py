@@ -1,3 +1,4 @@
+import gzip
 import importlib.util
 import sys
 import tempfile
@@ -31,6 +32,44 @@ class ForgeSidecarTest(unittest.TestCase):
             )
             self.assertEqual("Emeria's Call", card.resolve(index))
 
+    def test_card_index_artifact_is_keyed_by_commit_and_tree(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory) / "cardsfolder"
+            (root / "s").mkdir(parents=True)
+            (root / "s" / "sol_ring.txt").write_text("Name:Sol Ring\n", encoding="utf-8")
+            cache = Path(directory) / "cache" / "index.json.gz"
+
+            index, built = forge_sidecar.load_cached_card_index(
+                root, cache_path=cache, forge_commit="abc"
+            )
+            self.assertEqual({"sol ring": "Sol Ring"}, index)
+            self.assertEqual("built", built["source"])
+
+            with mock.patch.object(forge_sidecar, "load_card_index") as rebuild:
+                cached, loaded = forge_sidecar.load_cached_card_index(
+                    root, cache_path=cache, forge_commit="abc"
+                )
+            rebuild.assert_not_called()
+            self.assertEqual(index, cached)
+            self.assertEqual("cache", loaded["source"])
+            self.assertEqual(built["fingerprint"], loaded["fingerprint"])
+
+            _, other_commit = forge_sidecar.load_cached_card_index(
+                root, cache_path=cache, forge_commit="def"
+            )
+            self.assertEqual("built", other_commit["source"])
+
+            (root / "a").mkdir()
+            (root / "a" / "arcane_signet.txt").write_text(
+                "Name:Arcane Signet\n", encoding="utf-8"
+            )
+            grown, changed = forge_sidecar.load_cached_card_index(
+                root, cache_path=cache, forge_commit="def"
+            )
+            self.assertEqual("built", changed["source"])
+            self.assertNotEqual(other_commit["fingerprint"], changed["fingerprint"])
+            self.assertEqual("Arcane Signet", grown["arcane signet"])
+
     def test_deck_rejects_non_commander_cardinality(self):
         with self.assertRaisesRegex(
             forge_sidecar.InvalidRequest, "exactly 100 cards"
@@ -223,6 +262,172 @@ class ForgeSidecarTest(unittest.TestCase):
         killpg.assert_called_once_with(321, forge_sidecar.signal.SIGKILL)
         self.assertEqual(2, process.communicate.call_count)
 
+    def test_simulate_finalizes_at_game_result_without_waiting_for_exit(self):
+        fake_jvm = "\n".join(
+            [
+                "import sys, time",
+                "print('Ai(1)-Deck A vs Ai(2)-Deck B - one game of Commander')",
+                "print('Turn: Turn 1 (Ai(1)-Deck A)')",
+                "print('Add To Stack: Ai(1)-Deck A cast Sol Ring')",
+                "print('Game Outcome: Turn 4')",
+                "print('Game Result: Game 1 ended in 900 ms. Ai(1)-Deck A has won!', flush=True)",
+                "time.sleep(30)",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            script = root / "fake_jvm.py"
+            script.write_text(fake_jvm, encoding="utf-8")
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=None,
+                java_command=(sys.executable, str(script)),
+                deck_dir=root / "decks",
+                card_index={"commander": "Commander", "plains": "Plains"},
+                forge_commit="abc",
+            )
+            request = {
+                "timeout_ms": 20_000,
+                "deck_a": _deck_payload("deck-a", "Deck A"),
+                "deck_b": _deck_payload("deck-b", "Deck B"),
+            }
+            result = service.simulate(request)
+
+        self.assertEqual("completed", result["status"])
+        self.assertEqual("deck-a", result["winner_deck_id"])
+        self.assertEqual(4, result["turns"])
+        self.assertEqual("Sol Ring", result["events"][1]["card_name"])
+        self.assertLess(result["duration_ms"], 10_000)
+
+    def test_jvm_stderr_noise_is_not_parsed_as_game_errors_or_events(self):
+        fake_jvm = "\n".join(
+            [
+                "import sys, time",
+                "print('Ai(1)-Deck A vs Ai(2)-Deck B - one game of Commander', flush=True)",
+                "print('WARNING: An illegal reflective access operation has occurred', file=sys.stderr, flush=True)",
+                "time.sleep(0.2)",
+                "print('Turn: Turn 1 (Ai(1)-Deck A)')",
+                "print('Game Outcome: Turn 2')",
+                "print('Game Result: Game 1 ended in 900 ms. Ai(1)-Deck A has won!', flush=True)",
+                "time.sleep(30)",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            script = root / "fake_jvm.py"
+            script.write_text(fake_jvm, encoding="utf-8")
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=None,
+                java_command=(sys.executable, str(script)),
+                deck_dir=root / "decks",
+                card_index={"commander": "Commander", "plains": "Plains"},
+                forge_commit="abc",
+            )
+            request = {
+                "timeout_ms": 20_000,
+                "deck_a": _deck_payload("deck-a", "Deck A"),
+                "deck_b": _deck_payload("deck-b", "Deck B"),
+            }
+            result = service.simulate(request)
+
+        self.assertEqual("completed", result["status"])
+        self.assertEqual(
+            ["turn", "game_outcome"], [event["type"] for event in result["events"]]
+        )
+
+    def test_stderr_exception_after_game_result_fails_the_simulation(self):
+        fake_jvm = "\n".join(
+            [
+                "import sys, time",
+                "print('Ai(1)-Deck A vs Ai(2)-Deck B - one game of Commander')",
+                "print('Turn: Turn 1 (Ai(1)-Deck A)')",
+                "print('Game Result: Game 1 ended in 900 ms. Ai(1)-Deck A has won!', flush=True)",
+                "time.sleep(0.05)",
+                "print('Exception in thread \"Game\" java.lang.NullPointerException', file=sys.stderr, flush=True)",
+                "time.sleep(30)",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            script = root / "fake_jvm.py"
+            script.write_text(fake_jvm, encoding="utf-8")
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=None,
+                java_command=(sys.executable, str(script)),
+                deck_dir=root / "decks",
+                card_index={"commander": "Commander", "plains": "Plains"},
+                forge_commit="abc",
+            )
+            request = {
+                "timeout_ms": 20_000,
+                "deck_a": _deck_payload("deck-a", "Deck A"),
+                "deck_b": _deck_payload("deck-b", "Deck B"),
+            }
+            with self.assertRaisesRegex(
+                forge_sidecar.SimulationFailed, "1 engine errors"
+            ):
+                service.simulate(request)
+
+    def test_stderr_still_reports_runtime_rejected_card(self):
+        log = forge_sidecar.ForgeLogParser()
+        completed = forge_sidecar.run_isolated_process(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time\n"
+                "print('An unsupported card was requested: \"Mystery Card\"', file=sys.stderr, flush=True)\n"
+                "time.sleep(30)\n",
+            ],
+            cwd=Path("/tmp"),
+            timeout=20,
+            env={},
+            line_handler=log.feed,
+            stderr_handler=log.feed_stderr,
+        )
+
+        self.assertEqual(0, completed.returncode)
+        self.assertEqual("Mystery Card", log.unsupported_cards[0]["name"])
+        self.assertEqual(0, log.errors)
+
+    def test_streaming_parser_stops_at_first_runtime_rejected_card(self):
+        seen: list[str] = []
+        log = forge_sidecar.ForgeLogParser()
+
+        def handler(line):
+            seen.append(line)
+            return log.feed(line)
+
+        completed = forge_sidecar.run_isolated_process(
+            [
+                sys.executable,
+                "-c",
+                "import time\n"
+                "print('An unsupported card was requested: \"Mystery Card\"', flush=True)\n"
+                "time.sleep(30)\n"
+                "print('never reached')",
+            ],
+            cwd=Path("/tmp"),
+            timeout=20,
+            env={},
+            line_handler=handler,
+        )
+
+        self.assertEqual(0, completed.returncode)
+        self.assertEqual(1, len(seen))
+        self.assertEqual("Mystery Card", log.unsupported_cards[0]["name"])
+        self.assertTrue(log.decided)
+
     def test_process_timeout_uses_only_bounded_startup_grace(self):
         with tempfile.TemporaryDirectory() as directory:
             root = Path(directory)
@@ -254,6 +459,204 @@ class ForgeSidecarTest(unittest.TestCase):
 
             self.assertEqual(6, run.call_args.kwargs["timeout"])
 
+    def test_slot_count_is_bounded_by_memory_budget(self):
+        self.assertEqual(
+            3,
+            forge_sidecar.slot_count(
+                requested=4, memory_budget_mb=7000, slot_memory_mb=2048
+            ),
+        )
+        self.assertEqual(
+            4,
+            forge_sidecar.slot_count(
+                requested=4, memory_budget_mb=0, slot_memory_mb=2048
+            ),
+        )
+        self.assertEqual(
+            1,
+            forge_sidecar.slot_count(
+                requested=2, memory_budget_mb=1024, slot_memory_mb=2048
+            ),
+        )
+
+    def test_slots_isolate_forge_profile_and_report_occupancy(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / "res").mkdir()
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=None,
+                java_command=("java",),
+                deck_dir=root / "decks",
+                card_index={"commander": "Commander", "plains": "Plains"},
+                forge_commit="abc",
+                slots=2,
+                slot_root=root / "slots",
+            )
+            homes = [slot.home for slot in service.slot_pool.slots]
+            self.assertEqual(2, len(set(homes)))
+            for slot in service.slot_pool.slots:
+                profile = (slot.home / "forge.profile.properties").read_text(
+                    encoding="utf-8"
+                )
+                self.assertIn(f"decksDir={slot.deck_dir.parent}", profile)
+                self.assertTrue((slot.home / "res").is_symlink())
+
+            with service.slot_pool.acquire() as slot:
+                occupancy = service.health()["slots"]
+                self.assertEqual(1, occupancy["busy"])
+                self.assertEqual([slot.index], occupancy["busy_slots"])
+            self.assertEqual(2, service.health()["slots"]["idle"])
+
+            request = {
+                "timeout_ms": 1000,
+                "deck_a": _deck_payload("deck-a", "Deck A"),
+                "deck_b": _deck_payload("deck-b", "Deck B"),
+            }
+            with mock.patch.object(
+                forge_sidecar,
+                "run_isolated_process",
+                side_effect=forge_sidecar.subprocess.TimeoutExpired("forge", 6),
+            ) as run:
+                with self.assertRaises(forge_sidecar.SimulationTimeout):
+                    service.simulate(request)
+            self.assertIn(run.call_args.kwargs["cwd"], homes)
+
+    def test_slot_layout_mirrors_image_forge_gui_pair(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            (root / "app/res").mkdir(parents=True)
+            forge_home = root / "app/forge-gui-desktop"
+            forge_home.mkdir()
+            (forge_home / "res").symlink_to(root / "app/res")
+
+            slot = forge_sidecar.prepare_slot(
+                1, slot_root=root / "slots", forge_home=forge_home
+            )
+            again = forge_sidecar.prepare_slot(
+                1, slot_root=root / "slots", forge_home=forge_home
+            )
+
+            slot_dir = root / "slots/slot-1"
+            self.assertEqual(slot, again)
+            self.assertEqual(slot_dir / "forge-gui-desktop", slot.home)
+            self.assertEqual(slot_dir / "user/decks/commander", slot.deck_dir)
+            self.assertTrue(slot.deck_dir.is_dir())
+            self.assertTrue((slot_dir / "user/cache").is_dir())
+            for gui_dir in ("forge-gui", "forge-gui-desktop"):
+                self.assertEqual(
+                    (root / "app/res").resolve(),
+                    (slot_dir / gui_dir / "res").resolve(),
+                )
+                self.assertIn(
+                    f"decksDir={slot_dir / 'user/decks'}",
+                    (slot_dir / gui_dir / "forge.profile.properties").read_text(
+                        encoding="utf-8"
+                    ),
+                )
+            # The desktop jar resolves ../forge-gui/res from its cwd.
+            self.assertTrue((slot.home / "../forge-gui/res").resolve().is_dir())
+
+    def test_single_slot_keeps_image_layout_even_with_slot_root(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=None,
+                java_command=("java",),
+                deck_dir=root / "decks",
+                card_index={},
+                forge_commit="abc",
+                slots=1,
+                slot_root=root / "slots",
+            )
+            (slot,) = service.slot_pool.slots
+            self.assertEqual(root, slot.home)
+            self.assertEqual(root / "decks", slot.deck_dir)
+            self.assertFalse((root / "slots").exists())
+
+    def test_multiple_slots_require_a_slot_root(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            with self.assertRaisesRegex(RuntimeError, "FORGE_SLOT_ROOT"):
+                forge_sidecar.ForgeService(
+                    forge_home=root,
+                    forge_jar=forge_jar,
+                    bootstrap_jar=None,
+                    java_command=("java",),
+                    deck_dir=root / "decks",
+                    card_index={},
+                    forge_commit="abc",
+                    slots=2,
+                )
+
+    def test_batch_runs_games_in_one_jvm_and_relaunches_after_timeout(self):
+        fake_jvm = "\n".join(
+            [
+                "import sys, time",
+                "manifest = next(a for a in sys.argv if a.startswith('-Dmanaloom.batch='))",
+                "rows = open(manifest.split('=', 1)[1]).read().split()",
+                "for index, seed, deck_a, deck_b, clock in zip(*[iter(rows)] * 5):",
+                "    print('ManaLoom Batch Game Begin: ' + index, flush=True)",
+                "    if seed == '7':",
+                "        time.sleep(30)",
+                "    print('Ai(1)-Deck A vs Ai(2)-Deck B - one game of Commander')",
+                "    print('Turn: Turn 1 (Ai(1)-Deck A)')",
+                "    print('Game Outcome: Turn 3')",
+                "    print('Game Result: Game 1 ended in 900 ms. Ai(2)-Deck B has won!')",
+                "    print('ManaLoom Batch Game End: ' + index + ' ok', flush=True)",
+            ]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            forge_jar = root / "forge.jar"
+            forge_jar.touch()
+            bootstrap_jar = root / "forge-bootstrap.jar"
+            bootstrap_jar.touch()
+            script = root / "fake_jvm.py"
+            script.write_text(fake_jvm, encoding="utf-8")
+            service = forge_sidecar.ForgeService(
+                forge_home=root,
+                forge_jar=forge_jar,
+                bootstrap_jar=bootstrap_jar,
+                java_command=(sys.executable, str(script)),
+                deck_dir=root / "decks",
+                card_index={"commander": "Commander", "plains": "Plains"},
+                forge_commit="abc",
+            )
+            games = [
+                {
+                    "seed": seed,
+                    "timeout_ms": 1000,
+                    "deck_a": _deck_payload("deck-a", "Deck A"),
+                    "deck_b": _deck_payload("deck-b", "Deck B"),
+                }
+                for seed in (1, 7, 3)
+            ]
+            games.append({"seed": 4, "deck_a": {}, "deck_b": {}})
+            with mock.patch.object(forge_sidecar, "BATCH_GAME_GRACE_SECONDS", 0):
+                batch = service.simulate_batch({"games": games})
+            leftovers = list((root / "decks").iterdir())
+
+        self.assertEqual(
+            ["completed", "timeout", "completed", "invalid_request"],
+            [result["status"] for result in batch["results"]],
+        )
+        self.assertEqual([1, 7, 3], [result["seed"] for result in batch["results"][:3]])
+        self.assertEqual("deck-b", batch["results"][0]["winner_deck_id"])
+        self.assertEqual(3, batch["results"][2]["turns"])
+        self.assertEqual(2, batch["aggregate"]["jvm_launches"])
+        self.assertEqual("partial", batch["status"])
+        self.assertEqual([], leftovers)
+
     def test_v2_contract_validates_hash_identity_and_seed_semantics(self):
         forge_commit = Path(__file__).with_name("FORGE_COMMIT").read_text(
             encoding="utf-8"
@@ -340,6 +743,40 @@ class ForgeSidecarTest(unittest.TestCase):
         handler.wfile.write.assert_called_once()
 
 
+    def test_gzip_request_body_is_decoded_within_size_limit(self):
+        raw = b'{"seed": 42}'
+        self.assertEqual(raw, forge_sidecar.decode_request_body(raw, None))
+        self.assertEqual(
+            raw,
+            forge_sidecar.decode_request_body(gzip.compress(raw), "gzip"),
+        )
+        oversized = gzip.compress(b" " * (forge_sidecar.MAX_REQUEST_BYTES + 1))
+        with self.assertRaisesRegex(forge_sidecar.InvalidRequest, "8 MiB"):
+            forge_sidecar.decode_request_body(oversized, "gzip")
+        with self.assertRaisesRegex(forge_sidecar.InvalidRequest, "content-encoding"):
+            forge_sidecar.decode_request_body(raw, "br")
+
+    def test_send_compresses_for_gzip_clients_and_reports_server_time(self):
+        handler = forge_sidecar.ForgeHandler.__new__(forge_sidecar.ForgeHandler)
+        handler.send_response = mock.Mock()
+        handler.send_header = mock.Mock()
+        handler.end_headers = mock.Mock()
+        handler.wfile = mock.Mock()
+        handler.headers = {"accept-encoding": "gzip"}
+        handler.service = mock.Mock(forge_commit="abc")
+        handler._started = forge_sidecar.time.perf_counter()
+
+        handler._send(200, {"events": ["event"] * 500})
+
+        headers = dict(call.args for call in handler.send_header.call_args_list)
+        self.assertEqual("gzip", headers["content-encoding"])
+        self.assertEqual("gzip", headers["accept-encoding"])
+        self.assertTrue(headers["server-timing"].startswith("app;dur="))
+        payload = handler.wfile.write.call_args.args[0]
+        self.assertEqual(str(len(payload)), headers["content-length"])
+        self.assertIn(b'"events"', gzip.decompress(payload))
+
+
 def _deck(deck_id, name):
     return forge_sidecar.DeckInput(
         deck_id=deck_id,
@@ -4,6 +4,7 @@ import com.google.gson.Gson;
 import com.google.gson.JsonObject;
 import com.google.gson.JsonParser;
 import com.sun.net.httpserver.HttpExchange;
+import com.sun.net.httpserver.HttpHandler;
 import com.sun.net.httpserver.HttpServer;
 
 import java.io.ByteArrayOutputStream;
@@ -21,6 +22,8 @@ import java.util.concurrent.Future;
 import java.util.concurrent.TimeUnit;
 import java.util.concurrent.TimeoutException;
 import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
 import java.time.Instant;
 import java.util.UUID;
 
@@ -41,6 +44,8 @@ public final class SidecarMain {
 
     private static final Gson GSON = new Gson();
     static final int MAX_REQUEST_BYTES = 8 * 1024 * 1024;
+    static final int GZIP_RESPONSE_MIN_BYTES = 1024;
+    private static final String STARTED_NANOS_ATTRIBUTE = "manaloom.started_nanos";
     static final String PROCESS_ID = UUID.randomUUID().toString();
     static final String STARTED_AT = Instant.now().toString();
     private static final long DEFAULT_SIMULATION_TIMEOUT_MS = 120000L;
@@ -83,7 +88,7 @@ public final class SidecarMain {
                         : null;
 
         HttpServer server = HttpServer.create(new InetSocketAddress("0.0.0.0", httpPort), 32);
-        server.createContext("/health", exchange -> {
+        createTimedContext(server, "/health", exchange -> {
             if (!"GET".equals(exchange.getRequestMethod())) {
                 send(exchange, 405, singleton("error", "method_not_allowed"));
                 return;
@@ -151,17 +156,20 @@ public final class SidecarMain {
             send(exchange, 200, body);
         });
         if (coverageAvailable(runtimeMode)) {
-            server.createContext(
+            createTimedContext(
+                    server,
                     "/coverage",
                     exchange -> handleCoverage(exchange, battleService)
             );
         }
         if (batchSimulationAvailable(runtimeMode)) {
-            server.createContext(
+            createTimedContext(
+                    server,
                     "/cards/coverage",
                     exchange -> handleCardCoverage(exchange, battleService)
             );
-            server.createContext(
+            createTimedContext(
+                    server,
                     "/simulate",
                     exchange -> handleSimulation(
                             exchange,
@@ -169,12 +177,14 @@ public final class SidecarMain {
                             liveRegistry
                     )
             );
-            server.createContext(
+            createTimedContext(
+                    server,
                     "/live/",
                     exchange -> handleLive(exchange, liveRegistry)
             );
         } else {
-            server.createContext(
+            createTimedContext(
+                    server,
                     "/interactive/sessions",
                     exchange -> handleInteractive(
                             exchange,
@@ -524,8 +534,44 @@ public final class SidecarMain {
         }
     }
 
+    private static void createTimedContext(
+            HttpServer server,
+            String path,
+            HttpHandler handler
+    ) {
+        server.createContext(path, exchange -> {
+            exchange.setAttribute(STARTED_NANOS_ATTRIBUTE, System.nanoTime());
+            handler.handle(exchange);
+        });
+    }
+
+    private static InputStream requestStream(HttpExchange exchange) throws IOException {
+        String encoding = exchange.getRequestHeaders().getFirst("Content-Encoding");
+        if (encoding == null
+                || encoding.trim().isEmpty()
+                || "identity".equalsIgnoreCase(encoding.trim())) {
+            return exchange.getRequestBody();
+        }
+        if ("gzip".equalsIgnoreCase(encoding.trim())) {
+            return new GZIPInputStream(exchange.getRequestBody());
+        }
+        throw new IllegalArgumentException("unsupported content-encoding: " + encoding);
+    }
+
+    private static boolean acceptsGzip(HttpExchange exchange) {
+        for (String value : exchange.getRequestHeaders().getOrDefault(
+                "Accept-Encoding",
+                java.util.Collections.<String>emptyList()
+        )) {
+            if (value.toLowerCase(java.util.Locale.ROOT).contains("gzip")) {
+                return true;
+            }
+        }
+        return false;
+    }
+
     private static String readBody(HttpExchange exchange) throws IOException {
-        try (InputStream input = exchange.getRequestBody();
+        try (InputStream input = requestStream(exchange);
              ByteArrayOutputStream output = new ByteArrayOutputStream()) {
             byte[] buffer = new byte[8192];
             int total = 0;
@@ -544,6 +590,27 @@ public final class SidecarMain {
     private static void send(HttpExchange exchange, int status, Object body) throws IOException {
         byte[] payload = GSON.toJson(withProcessMetadata(body)).getBytes(StandardCharsets.UTF_8);
         exchange.getResponseHeaders().set("Content-Type", "application/json; charset=utf-8");
+        exchange.getResponseHeaders().set("Accept-Encoding", "gzip");
+        exchange.getResponseHeaders().set("Vary", "Accept-Encoding");
+        if (payload.length >= GZIP_RESPONSE_MIN_BYTES && acceptsGzip(exchange)) {
+            ByteArrayOutputStream compressed = new ByteArrayOutputStream(payload.length / 4);
+            try (GZIPOutputStream gzip = new GZIPOutputStream(compressed)) {
+                gzip.write(payload);
+            }
+            payload = compressed.toByteArray();
+            exchange.getResponseHeaders().set("Content-Encoding", "gzip");
+        }
+        Object started = exchange.getAttribute(STARTED_NANOS_ATTRIBUTE);
+        if (started instanceof Long) {
+            exchange.getResponseHeaders().set(
+                    "Server-Timing",
+                    String.format(
+                            java.util.Locale.ROOT,
+                            "app;dur=%.1f",
+                            (System.nanoTime() - (Long) started) / 1_000_000.0
+                    )
+            );
+        }
         exchange.sendResponseHeaders(status, payload.length);
         try (OutputStream output = exchange.getResponseBody()) {
             output.write(payload);